@@ -0,0 +1,110 @@
+"""Benchmark config size and downstream parse cost with externalized Helm blocks.
+
+Builds a fleet where many applications share a few multi-KB inline ``helm.values``
+blocks, migrates it with and without ``--externalize-blocks``, and reports the
+size of config.json and the time to parse it, as a repo-server render does.
+``load_configs`` (which inlines the sidecar blocks again) is timed as well.
+
+Usage:
+    python benchmarks/bench_externalize.py --apps 2000 --shared 20 --values-keys 300
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import yaml
+
+from argocd_migrator.pipeline import run_pipeline
+from argocd_migrator.sidecar import BlockStore, load_configs
+
+
+def write_fleet(root: Path, apps: int, shared: int, values_keys: int) -> None:
+    """Write ``apps`` Applications whose Helm values come from ``shared`` blocks."""
+    blocks = [
+        {f"component{b}.setting{k}": f"value-{b}-{k}" for k in range(values_keys)}
+        for b in range(shared)
+    ]
+    for i in range(apps):
+        app = {
+            "apiVersion": "argoproj.io/v1alpha1",
+            "kind": "Application",
+            "metadata": {"name": f"app-{i:05d}", "namespace": "argocd"},
+            "spec": {
+                "project": "default",
+                "source": {
+                    "repoURL": "https://github.com/example/charts.git",
+                    "targetRevision": "main",
+                    "path": f"charts/app-{i % 50}",
+                    "helm": {"values": yaml.safe_dump(blocks[i % shared])},
+                },
+                "destination": {
+                    "server": "https://kubernetes.default.svc",
+                    "namespace": f"ns-{i}",
+                },
+            },
+        }
+        path = root / f"team-{i % 10}" / f"app-{i:05d}.yaml"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(yaml.safe_dump(app))
+
+
+def best_of(repeat: int, fn: Callable[..., object], *args: object) -> float:
+    """Best wall-clock time of ``repeat`` calls."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--apps", type=int, default=2000, help="Number of applications")
+    parser.add_argument("--shared", type=int, default=20, help="Distinct Helm values blocks")
+    parser.add_argument("--values-keys", type=int, default=300, help="Keys per values block")
+    parser.add_argument("--threshold", type=int, default=1024, help="Block threshold in bytes")
+    parser.add_argument("--repeat", type=int, default=5, help="Parse runs (best kept)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        write_fleet(root / "apps", args.apps, args.shared, args.values_keys)
+
+        inline = root / "inline" / "config.json"
+        run_pipeline(root / "apps", inline, jobs=1)
+        external = root / "external" / "config.json"
+        blocks = BlockStore.for_output(external, args.threshold)
+        run_pipeline(root / "apps", external, jobs=1, blocks=blocks)
+        sidecar = sum(p.stat().st_size for p in blocks.directory.iterdir())
+
+        inline_bytes = inline.stat().st_size
+        external_bytes = external.stat().st_size
+        inline_parse = best_of(args.repeat, lambda: json.loads(inline.read_bytes()))
+        external_parse = best_of(args.repeat, lambda: json.loads(external.read_bytes()))
+        expand = best_of(args.repeat, load_configs, external)
+        assert load_configs(external) == json.loads(inline.read_bytes())
+
+        print(
+            f"{args.apps} apps, {args.shared} shared values blocks of {args.values_keys} keys, "
+            f"{blocks.refs} blocks externalized into {blocks.blocks_written} files"
+        )
+        print(f"{'':<22}{'inline':>12}{'externalized':>14}{'ratio':>8}")
+        print(
+            f"{'config.json bytes':<22}{inline_bytes:>12,}{external_bytes:>14,}"
+            f"{inline_bytes / external_bytes:>7.1f}x"
+        )
+        print(f"{'sidecar bytes':<22}{'':>12}{sidecar:>14,}")
+        print(
+            f"{'parse config.json ms':<22}{inline_parse * 1e3:>12.1f}"
+            f"{external_parse * 1e3:>14.1f}{inline_parse / external_parse:>7.1f}x"
+        )
+        print(f"{'load_configs ms':<22}{'':>12}{expand * 1e3:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
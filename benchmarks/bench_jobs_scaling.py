@@ -0,0 +1,94 @@
+"""Benchmark run_pipeline throughput across job counts and executor backends.
+
+Usage:
+    python benchmarks/bench_jobs_scaling.py --apps 5000 --jobs 1 2 4 8
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from argocd_migrator.executor import default_jobs
+from argocd_migrator.pipeline import run_pipeline
+
+APP_TEMPLATE = """\
+apiVersion: argoproj.io/v1alpha1
+kind: Application
+metadata:
+  name: app-{index}
+  namespace: argocd
+  annotations:
+    argocd.argoproj.io/sync-wave: "{wave}"
+  labels:
+    team: team-{team}
+spec:
+  project: default
+  source:
+    repoURL: https://github.com/example/repo-{team}.git
+    targetRevision: main
+    path: apps/app-{index}
+    helm:
+      valuesObject:
+{values}
+  destination:
+    server: https://cluster-{team}.example.com:6443
+    namespace: ns-{index}
+  syncPolicy:
+    automated:
+      prune: true
+"""
+
+
+def write_corpus(directory: Path, apps: int, values: int) -> None:
+    """Write a synthetic corpus of Application manifests."""
+    value_block = "\n".join(f"        key{i}: value-{i}" for i in range(values))
+    for index in range(apps):
+        team = index % 20
+        target = directory / f"team-{team}" / f"app-{index}.yaml"
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(
+            APP_TEMPLATE.format(index=index, wave=index % 10, team=team, values=value_block)
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--apps", type=int, default=2000, help="Number of applications")
+    parser.add_argument("--values", type=int, default=20, help="Inline Helm values per app")
+    parser.add_argument(
+        "--jobs", type=int, nargs="+", default=None, help="Job counts to measure"
+    )
+    parser.add_argument(
+        "--backends", nargs="+", default=["process", "thread"], help="Backends to measure"
+    )
+    args = parser.parse_args()
+
+    cpus = default_jobs()
+    job_counts = args.jobs or sorted({1, 2, 4, 8, 16, 32, cpus} & set(range(1, cpus + 1)))
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source_dir = Path(tmpdir) / "apps"
+        write_corpus(source_dir, args.apps, args.values)
+        output_file = Path(tmpdir) / "config.json"
+
+        print(f"{args.apps} apps, {cpus} CPUs available")
+        print(f"{'backend':<10}{'jobs':>6}{'seconds':>10}{'files/s':>10}{'speedup':>9}")
+
+        for backend in args.backends:
+            baseline: float | None = None
+            for jobs in job_counts:
+                start = time.perf_counter()
+                result = run_pipeline(source_dir, output_file, jobs=jobs, backend=backend)
+                elapsed = time.perf_counter() - start
+                assert result.successful == args.apps, "benchmark corpus failed to migrate"
+
+                baseline = baseline or elapsed
+                print(
+                    f"{backend:<10}{jobs:>6}{elapsed:>10.2f}"
+                    f"{args.apps / elapsed:>10.0f}{baseline / elapsed:>8.2f}x"
+                )
+
+
+if __name__ == "__main__":
+    main()
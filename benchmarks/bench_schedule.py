@@ -0,0 +1,103 @@
+"""Benchmark FIFO vs size-aware scheduling on a skewed corpus.
+
+A few applications carry huge inline Helm values. With equal-count chunks in scan
+order they can land in the last chunks and finish long after the other workers
+have gone idle. The size-aware schedule starts them first. This script reports the
+makespan and the idle tail: the time between the first worker running out of work
+and the last worker finishing.
+
+Usage:
+    python benchmarks/bench_schedule.py --apps 2000 --jobs 4
+    python benchmarks/bench_schedule.py --large-rate 0.002 --large-keys 50000 --backend thread
+"""
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from argocd_migrator.corpus import CorpusSpec, generate_corpus
+from argocd_migrator.executor import PipelineExecutor, create_executor, default_jobs
+from argocd_migrator.pipeline import transform_file
+from argocd_migrator.scanner import file_sizes, scan_directory
+
+
+def timed_transform(path: Path) -> tuple[str, float, float, bool]:
+    """Transform one file and report which worker ran it, and when."""
+    start = time.monotonic()
+    result = transform_file(path)
+    return f"{os.getpid()}-{threading.get_ident()}", start, time.monotonic(), result.success
+
+
+def run_once(
+    executor: PipelineExecutor, files: list[Path], sizes: list[int] | None
+) -> tuple[float, float]:
+    """
+    Map every file once.
+
+    Returns:
+        (makespan, idle tail) in seconds
+    """
+    started = time.monotonic()
+    finished: dict[str, float] = {}
+    for worker, _, end, success in executor.map(timed_transform, files, sizes=sizes):
+        assert success, "benchmark corpus failed to migrate"
+        finished[worker] = max(finished.get(worker, 0.0), end)
+    last = max(finished.values())
+    return last - started, last - min(finished.values())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--apps", type=int, default=2000, help="Number of applications")
+    parser.add_argument(
+        "--large-rate", type=float, default=0.003, help="Share of apps with huge values"
+    )
+    parser.add_argument(
+        "--large-keys", type=int, default=30000, help="Inline Helm values in huge apps"
+    )
+    parser.add_argument("--seed", type=int, default=11, help="Corpus seed")
+    parser.add_argument("--jobs", type=int, default=None, help="Workers (default: CPUs)")
+    parser.add_argument("--backend", default="process", help="Executor backend")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per schedule (best kept)")
+    args = parser.parse_args()
+    jobs = args.jobs or max(2, default_jobs())
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source_dir = Path(tmpdir) / "apps"
+        spec = CorpusSpec(
+            apps=args.apps,
+            seed=args.seed,
+            large_values_rate=args.large_rate,
+            large_values_keys=args.large_keys,
+        )
+        stats = generate_corpus(source_dir, spec)
+        files = scan_directory(source_dir)
+        sizes = file_sizes(files)
+        large = sum(size > 100 * 1024 for size in sizes)
+        print(
+            f"{stats.applications} apps ({large} over 100 KB, largest {max(sizes) / 1e6:.1f} MB), "
+            f"{jobs} {args.backend} workers, {default_jobs()} CPUs"
+        )
+        print(f"{'schedule':<10}{'makespan s':>12}{'idle tail s':>13}")
+
+        with create_executor(args.backend, jobs) as executor:
+            list(executor.map(timed_transform, files[:jobs]))  # Start the workers
+            best: dict[str, tuple[float, float]] = {}
+            for schedule, schedule_sizes in (("fifo", None), ("size", sizes)):
+                runs = [run_once(executor, files, schedule_sizes) for _ in range(args.repeat)]
+                best[schedule] = min(runs)
+                makespan, tail = best[schedule]
+                print(f"{schedule:<10}{makespan:>12.2f}{tail:>13.2f}")
+
+        fifo, size = best["fifo"], best["size"]
+        print(
+            f"\nsize vs fifo: makespan {size[0] / fifo[0] - 1:+.0%}, "
+            f"idle tail {size[1] / max(fifo[1], 1e-9) - 1:+.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Benchmark CLI start-up: import time per module and wall-clock per command.
+
+Usage:
+    python benchmarks/bench_startup.py --runs 10 --top 15
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+APP_YAML = """\
+apiVersion: argoproj.io/v1alpha1
+kind: Application
+metadata:
+  name: startup-app
+spec:
+  project: default
+  source:
+    repoURL: https://github.com/example/repo.git
+    targetRevision: main
+  destination:
+    server: https://kubernetes.default.svc
+    namespace: default
+"""
+
+
+def import_times(module: str) -> dict[str, tuple[int, int]]:
+    """
+    Import ``module`` in a fresh interpreter under ``-X importtime``.
+
+    Returns:
+        Mapping of imported module name to (self µs, cumulative µs)
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, tuple[int, int]] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def wall_clock(args: list[str], runs: int) -> list[float]:
+    """Run ``python -m argocd_migrator <args>`` ``runs`` times and return seconds."""
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "argocd_migrator", *args],
+            capture_output=True,
+            check=True,
+            env=env,
+        )
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="Runs per command")
+    parser.add_argument("--top", type=int, default=15, help="Slowest imports to list")
+    args = parser.parse_args()
+
+    times = import_times("argocd_migrator.cli")
+    print(f"import argocd_migrator.cli: {times['argocd_migrator.cli'][1] / 1000:.1f} ms")
+    print(f"{'self ms':>9}{'cum ms':>9}  module")
+    for name, (self_us, cumulative_us) in sorted(
+        times.items(), key=lambda kv: kv[1][0], reverse=True
+    )[: args.top]:
+        print(f"{self_us / 1000:>9.1f}{cumulative_us / 1000:>9.1f}  {name}")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source_dir = Path(tmpdir) / "apps"
+        source_dir.mkdir()
+        (source_dir / "app.yaml").write_text(APP_YAML)
+        commands = {
+            "version": ["version"],
+            "migrate (1 app)": [
+                "migrate", "-i", str(source_dir), "-o", str(Path(tmpdir) / "config.json"),
+                "-j", "1", "-q",
+            ],
+        }
+
+        print(f"\n{'command':<18}{'min ms':>9}{'median ms':>11}")
+        for label, command in commands.items():
+            timings = wall_clock(command, args.runs)
+            print(
+                f"{label:<18}{min(timings) * 1000:>9.1f}"
+                f"{statistics.median(timings) * 1000:>11.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
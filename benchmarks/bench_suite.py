@@ -0,0 +1,319 @@
+"""End-to-end benchmark suite with regression thresholds.
+
+Measures scan, parse, transform, validate, aggregate and the full pipeline on
+seeded synthetic corpora, records best-of-N time and peak traced memory per stage,
+and compares them against a stored baseline. Exits with status 1 when a stage is
+slower (or uses more memory) than the baseline by more than its tolerance, and with
+status 2 when the baseline comes from another platform or interpreter.
+
+Usage:
+    python benchmarks/bench_suite.py                       # 1k, 10k and 100k apps
+    python benchmarks/bench_suite.py --sizes 1000 --repeat 5
+    python benchmarks/bench_suite.py --update-baseline     # record a new baseline
+    python benchmarks/bench_suite.py --tolerance 0.15 --stage-tolerance scan=0.5
+    python benchmarks/bench_suite.py --force-compare       # compare across machines
+"""
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from argocd_migrator.aggregator import aggregate_configs
+from argocd_migrator.corpus import CorpusSpec, generate_corpus
+from argocd_migrator.parser import parse_yaml_file
+from argocd_migrator.pipeline import run_pipeline
+from argocd_migrator.scanner import scan_directory
+from argocd_migrator.transformer import transform_to_generator_config
+from argocd_migrator.validator import validate_json
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+DEFAULT_TOLERANCE = 0.20
+DEFAULT_MEMORY_TOLERANCE = 0.20
+# Short stages are re-run until this much time is spent, so the best run is stable
+MIN_MEASURE_SECONDS = 1.0
+# Slowdowns smaller than this are timer noise, whatever the relative change
+MIN_SLOWDOWN_SECONDS = 0.02
+CORPUS_SEED = 1
+STAGES = ("scan", "parse", "transform", "validate", "aggregate", "pipeline")
+
+
+def corpus_for(size: int, cache_dir: Path) -> Path:
+    """Return the corpus directory for ``size`` apps, generating it on first use."""
+    directory = cache_dir / f"apps-{size}-seed-{CORPUS_SEED}"
+    if not directory.is_dir():
+        partial = directory.with_name(directory.name + ".partial")
+        if partial.exists():
+            raise SystemExit(f"Remove the incomplete corpus {partial} and retry")
+        generate_corpus(partial, CorpusSpec(apps=size, seed=CORPUS_SEED, depth=3, fanout=6))
+        partial.rename(directory)
+    return directory
+
+
+def measure(fn: Callable[[], Any], repeat: int, memory: bool) -> dict[str, float]:
+    """
+    Return the best run's seconds and, optionally, peak traced bytes of ``fn``.
+
+    ``fn`` runs at least ``repeat`` times, and more while the runs total less than
+    MIN_MEASURE_SECONDS.
+    """
+    best = float("inf")
+    runs = 0
+    spent = 0.0
+    while runs < repeat or spent < MIN_MEASURE_SECONDS:
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        spent += elapsed
+        runs += 1
+
+    result = {"seconds": best}
+    if memory:
+        # A separate pass: tracing slows allocation-heavy code down several times
+        tracemalloc.start()
+        try:
+            fn()
+            result["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def run_size(corpus: Path, work_dir: Path, repeat: int, memory: bool) -> dict[str, Any]:
+    """Benchmark every stage on one corpus."""
+    files = scan_directory(corpus)
+    apps = [parse_yaml_file(path) for path in files]
+    configs = [transform_to_generator_config(app) for app in apps]
+    output = work_dir / "config.json"
+
+    def validate_all() -> None:
+        for app in apps:
+            validate_json(app)
+
+    def pipeline() -> None:
+        result = run_pipeline(corpus, output, jobs=1)
+        assert result.failed == 0, "benchmark corpus failed to migrate"
+
+    stages: dict[str, Callable[[], Any]] = {
+        "scan": lambda: scan_directory(corpus),
+        "parse": lambda: [parse_yaml_file(path) for path in files],
+        "transform": lambda: [transform_to_generator_config(app) for app in apps],
+        "validate": validate_all,
+        "aggregate": lambda: aggregate_configs(configs, output),
+        "pipeline": pipeline,
+    }
+    results: dict[str, Any] = {}
+    for name, fn in stages.items():
+        stats = measure(fn, repeat, memory)
+        stats["files_per_second"] = len(files) / stats["seconds"]
+        results[name] = stats
+        print(format_row(len(files), name, stats), flush=True)
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    tolerances: dict[str, float],
+    memory_tolerance: float,
+) -> list[str]:
+    """
+    Compare results with a baseline.
+
+    Returns:
+        One message per stage and size that regressed beyond its tolerance
+    """
+    regressions = []
+    for size, stages in results.items():
+        for stage, current in stages.items():
+            reference = baseline.get(size, {}).get(stage)
+            if reference is None:
+                continue
+            tolerance = tolerances.get(stage, tolerances["default"])
+            slowdown = current["seconds"] / reference["seconds"] - 1
+            slower_by = current["seconds"] - reference["seconds"]
+            if slowdown > tolerance and slower_by > MIN_SLOWDOWN_SECONDS:
+                regressions.append(
+                    f"{stage} @ {size} apps: {current['seconds']:.3f}s vs "
+                    f"{reference['seconds']:.3f}s baseline "
+                    f"({slowdown:+.0%}, tolerance {tolerance:.0%})"
+                )
+            if "peak_bytes" in current and reference.get("peak_bytes"):
+                growth = current["peak_bytes"] / reference["peak_bytes"] - 1
+                if growth > memory_tolerance:
+                    regressions.append(
+                        f"{stage} @ {size} apps: peak memory "
+                        f"{current['peak_bytes'] / 1e6:.1f} MB vs "
+                        f"{reference['peak_bytes'] / 1e6:.1f} MB baseline "
+                        f"({growth:+.0%}, tolerance {memory_tolerance:.0%})"
+                    )
+    return regressions
+
+
+def baseline_mismatch(stored: dict[str, Any], report: dict[str, Any]) -> str | None:
+    """
+    Describe why a baseline's timings are not comparable with this run.
+
+    Returns:
+        A message naming the differing platform or interpreter, or None if both match
+    """
+    differences = [
+        f"{key} {stored.get(key)} vs {report[key]}"
+        for key in ("platform", "python")
+        if stored.get(key) != report[key]
+    ]
+    if not differences:
+        return None
+    return f"baseline was recorded on another machine ({'; '.join(differences)})"
+
+
+def format_row(size: int, stage: str, stats: dict[str, float]) -> str:
+    """Format one result line."""
+    peak = stats.get("peak_bytes")
+    peak_text = f"{peak / 1e6:>9.1f}" if peak is not None else f"{'-':>9}"
+    return (
+        f"{size:>8}  {stage:<10}{stats['seconds']:>10.3f}"
+        f"{stats['files_per_second']:>12.0f}{peak_text}"
+    )
+
+
+def parse_stage_tolerances(values: list[str]) -> dict[str, float]:
+    """Parse ``stage=fraction`` arguments."""
+    tolerances = {}
+    for value in values:
+        stage, _, fraction = value.partition("=")
+        if stage not in STAGES:
+            raise SystemExit(f"Unknown stage {stage!r}; expected one of {', '.join(STAGES)}")
+        tolerances[stage] = float(fraction)
+    return tolerances
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Corpus sizes in apps"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per stage (best kept)")
+    parser.add_argument(
+        "--no-memory", action="store_true", help="Skip the traced peak-memory pass"
+    )
+    parser.add_argument(
+        "--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON file"
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Write these results as the new baseline instead of comparing",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=None,
+        help="Allowed slowdown as a fraction (default: the baseline's, else "
+        f"{DEFAULT_TOLERANCE})",
+    )
+    parser.add_argument(
+        "--stage-tolerance",
+        nargs="+",
+        default=[],
+        metavar="STAGE=FRACTION",
+        help="Per-stage slowdown tolerances",
+    )
+    parser.add_argument(
+        "--memory-tolerance",
+        type=float,
+        default=None,
+        help="Allowed peak-memory growth as a fraction (default: the baseline's, else "
+        f"{DEFAULT_MEMORY_TOLERANCE})",
+    )
+    parser.add_argument(
+        "--corpus-dir",
+        type=Path,
+        default=None,
+        help="Directory that keeps generated corpora between runs (default: temporary)",
+    )
+    parser.add_argument(
+        "--force-compare",
+        action="store_true",
+        help="Compare even if the baseline comes from another platform or interpreter",
+    )
+    parser.add_argument("--output", type=Path, default=None, help="Also write results here")
+    args = parser.parse_args()
+
+    stored: dict[str, Any] = {}
+    if args.baseline.exists():
+        stored = json.loads(args.baseline.read_text())
+
+    tolerances = {
+        "default": DEFAULT_TOLERANCE,
+        **stored.get("tolerances", {}),
+        **parse_stage_tolerances(args.stage_tolerance),
+    }
+    if args.tolerance is not None:
+        tolerances["default"] = args.tolerance
+    memory_tolerance = args.memory_tolerance
+    if memory_tolerance is None:
+        memory_tolerance = stored.get("memory_tolerance", DEFAULT_MEMORY_TOLERANCE)
+
+    print(f"{'apps':>8}  {'stage':<10}{'seconds':>10}{'files/s':>12}{'peak MB':>9}")
+    results: dict[str, dict[str, Any]] = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache_dir = args.corpus_dir or Path(tmpdir) / "corpora"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for size in args.sizes:
+            corpus = corpus_for(size, cache_dir)
+            results[str(size)] = run_size(corpus, Path(tmpdir), args.repeat, not args.no_memory)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "recorded": datetime.now(UTC).isoformat(timespec="seconds"),
+        "tolerances": tolerances,
+        "memory_tolerance": memory_tolerance,
+        "results": results,
+    }
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    if args.update_baseline:
+        # Keep sizes that were not re-run
+        report["results"] = {**stored.get("results", {}), **results}
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\nWrote baseline to {args.baseline}")
+        return
+
+    if not stored:
+        print(f"\nNo baseline at {args.baseline}; run with --update-baseline to record one")
+        return
+
+    mismatch = baseline_mismatch(stored, report)
+    if mismatch is not None:
+        if not args.force_compare:
+            print(
+                f"\nNot comparing: the {mismatch}. Timings from other machines are not "
+                "comparable; run with --update-baseline to record one here, or pass "
+                "--force-compare to compare anyway.",
+                file=sys.stderr,
+            )
+            sys.exit(2)
+        print(f"\nWarning: the {mismatch}; comparing anyway (--force-compare)")
+    regressions = compare(results, stored["results"], tolerances, memory_tolerance)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) against {args.baseline}:")
+        for message in regressions:
+            print(f"  ✗ {message}")
+        sys.exit(1)
+    print(f"\n✓ No regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,12 @@
 
 import json
 import logging
+import os
+import uuid
+from collections.abc import Iterable
 from pathlib import Path
-from typing import Any
+from types import TracebackType
+from typing import IO, Any, Self
 
 from argocd_migrator.exceptions import MigrationError
 
@@ -38,6 +42,233 @@ def aggregate_configs(configs: list[dict[str, Any]], output_file: str | Path) ->
         raise MigrationError(f"Error writing aggregated config to {output_file}: {e}") from e
 
 
+def serialize_config_fragment(config: dict[str, Any]) -> bytes:
+    """
+    Serialize one config exactly as it appears inside the aggregated JSON array.
+
+    The fragment carries the array's extra indentation level, so joining fragments
+    with ``write_config_fragments`` is byte-identical to ``aggregate_configs``.
+
+    Args:
+        config: Generator config dictionary
+
+    Returns:
+        UTF-8 encoded, pre-indented JSON fragment
+    """
+    # Structural newlines are the only raw newlines: json escapes them inside strings
+    text = json.dumps(config, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+    return text.encode("utf-8")
+
+
+def fragment_to_document(fragment: bytes) -> bytes:
+    """
+    Convert an array fragment back into a standalone JSON document.
+
+    Args:
+        fragment: Fragment produced by ``serialize_config_fragment``
+
+    Returns:
+        UTF-8 JSON document with a trailing newline
+    """
+    return fragment.replace(b"\n  ", b"\n") + b"\n"
+
+
+def serialize_config_line(config: dict[str, Any]) -> bytes:
+    """
+    Serialize one config as a compact NDJSON line.
+
+    Args:
+        config: Generator config dictionary
+
+    Returns:
+        UTF-8 encoded JSON object followed by a newline
+    """
+    text = json.dumps(config, ensure_ascii=False, separators=(",", ":"))
+    return text.encode("utf-8") + b"\n"
+
+
+class NdjsonWriter:
+    """
+    Write configs to a binary stream as newline-delimited JSON.
+
+    Each line is flushed as soon as it is written, so a downstream reader in a
+    Unix pipeline sees every config immediately.
+    """
+
+    def __init__(self, stream: IO[bytes]) -> None:
+        self.stream = stream
+        self.count = 0
+        self.bytes_written = 0
+
+    def write(self, config: dict[str, Any]) -> None:
+        """
+        Write one config as a line.
+
+        Args:
+            config: Generator config dictionary
+
+        Raises:
+            MigrationError: If writing fails
+        """
+        line = serialize_config_line(config)
+        try:
+            self.stream.write(line)
+            self.stream.flush()
+        except BrokenPipeError:
+            raise  # The reader went away; callers stop quietly, like other Unix tools
+        except OSError as e:
+            raise MigrationError(f"Error writing NDJSON output: {e}") from e
+        self.count += 1
+        self.bytes_written += len(line)
+
+
+def write_config_fragments(fragments: Iterable[bytes], output_file: str | Path) -> int:
+    """
+    Write pre-serialized config fragments as an aggregated JSON array file.
+
+    Args:
+        fragments: Fragments produced by ``serialize_config_fragment``, in output order
+        output_file: Path where aggregated config.json should be written
+
+    Returns:
+        Number of configs written
+
+    Raises:
+        MigrationError: If file writing fails
+    """
+    with AggregatedConfigWriter(output_file) as writer:
+        for fragment in fragments:
+            writer.write(fragment)
+        writer.commit()
+    return writer.count
+
+
+class AggregatedConfigWriter:
+    """
+    Incrementally write config fragments to an aggregated JSON array file.
+
+    Fragments are written to a temporary file next to the destination, which only
+    replaces the output on ``commit()``. Leaving the context without committing
+    discards the temporary file, so a failed run never leaves a partial config.
+    """
+
+    def __init__(self, output_file: str | Path) -> None:
+        self.output_file = Path(output_file)
+        self.count = 0
+        self.bytes_written = 0
+        self._file: IO[bytes] | None = None
+        self._tmp_path: Path | None = None
+
+    def write(self, fragment: bytes) -> None:
+        """
+        Append one fragment to the array.
+
+        Args:
+            fragment: Fragment produced by ``serialize_config_fragment``
+
+        Raises:
+            MigrationError: If writing fails
+        """
+        self._write(b",\n  " if self.count else b"[\n  ")
+        self._write(fragment)
+        self.count += 1
+
+    def commit(self) -> None:
+        """
+        Close the array and atomically move it into place.
+
+        Raises:
+            MigrationError: If writing or renaming fails
+        """
+        self._write(b"\n]\n" if self.count else b"[]\n")
+        file, tmp_path = self._file, self._tmp_path
+        if file is None or tmp_path is None:
+            raise MigrationError(f"Aggregated config writer for {self.output_file} is closed")
+
+        try:
+            file.close()
+            os.replace(tmp_path, self.output_file)
+            self._file = None
+            self._tmp_path = None
+        except Exception as e:
+            self.abort()
+            raise MigrationError(
+                f"Error writing aggregated config to {self.output_file}: {e}"
+            ) from e
+
+        logger.info(f"Aggregated {self.count} applications to {self.output_file}")
+
+    def abort(self) -> None:
+        """Discard everything written so far."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._tmp_path is not None:
+            self._tmp_path.unlink(missing_ok=True)
+            self._tmp_path = None
+
+    def _write(self, data: bytes) -> None:
+        try:
+            if self._file is None:
+                self.output_file.parent.mkdir(parents=True, exist_ok=True)
+                # Unlike mkstemp, exclusive open honours the umask for the final file
+                self._tmp_path = self.output_file.with_name(
+                    f".{self.output_file.name}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp"
+                )
+                self._file = open(self._tmp_path, "xb")
+            self._file.write(data)
+            self.bytes_written += len(data)
+        except Exception as e:
+            self.abort()
+            raise MigrationError(
+                f"Error writing aggregated config to {self.output_file}: {e}"
+            ) from e
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.abort()
+
+
+def write_error_report(
+    failures: list[tuple[Path, str]], total: int, output_file: str | Path
+) -> None:
+    """
+    Write a JSON report of failed files.
+
+    Args:
+        failures: (source file, error message) pairs, in input order
+        total: Number of files considered by the run
+        output_file: Path where the report should be written
+
+    Raises:
+        MigrationError: If file writing fails
+    """
+    path = Path(output_file)
+    report = {
+        "total": total,
+        "failed": len(failures),
+        "errors": [{"source_file": str(source), "error": error} for source, error in failures],
+    }
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+
+        logger.info(f"Wrote error report for {len(failures)} failures to {output_file}")
+
+    except Exception as e:
+        raise MigrationError(f"Error writing error report to {output_file}: {e}") from e
+
+
 def validate_aggregated_structure(configs: list[dict[str, Any]]) -> None:
     """
     Validate that aggregated config list has proper structure.
@@ -52,19 +283,37 @@ def validate_aggregated_structure(configs: list[dict[str, Any]]) -> None:
         raise MigrationError("Aggregated config must be a list")
 
     for idx, config in enumerate(configs):
-        if not isinstance(config, dict):
-            raise MigrationError(f"Config at index {idx} must be a dictionary")
+        validate_config_structure(config, idx)
 
-        # Check required fields
-        required_fields = ["metadata", "project", "source", "destination"]
-        for field in required_fields:
-            if field not in config:
-                name = config.get("metadata", {}).get("name", f"index {idx}")
-                raise MigrationError(f"Config '{name}' missing required field: {field}")
+    logger.debug(f"Validated {len(configs)} configs in aggregated structure")
 
-        # Validate metadata has name
-        metadata = config.get("metadata", {})
-        if not metadata.get("name"):
-            raise MigrationError(f"Config at index {idx} metadata missing required 'name' field")
 
-    logger.debug(f"Validated {len(configs)} configs in aggregated structure")
+def validate_config_structure(config: dict[str, Any], idx: int, label: str = "index") -> None:
+    """
+    Validate a single entry of the aggregated config list.
+
+    Args:
+        config: Generator config dictionary
+        idx: Position of the config (for error messages)
+        label: What ``idx`` counts, e.g. "scan index" when it is the file's
+            position in the scan rather than in the written list
+
+    Raises:
+        MigrationError: If structure is invalid
+    """
+    if not isinstance(config, dict):
+        raise MigrationError(f"Config at {label} {idx} must be a dictionary")
+
+    # Check required fields
+    required_fields = ["metadata", "project", "source", "destination"]
+    for field in required_fields:
+        if field not in config:
+            name = config.get("metadata", {}).get("name", f"{label} {idx}")
+            raise MigrationError(f"Config '{name}' missing required field: {field}")
+
+    # Validate metadata has name
+    metadata = config.get("metadata", {})
+    if not metadata.get("name"):
+        raise MigrationError(
+            f"Config at {label} {idx} metadata missing required 'name' field"
+        )
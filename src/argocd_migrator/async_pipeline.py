@@ -0,0 +1,429 @@
+"""Asyncio staged pipeline: overlapping scan, read, CPU processing and write."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from argocd_migrator.aggregator import (
+    AggregatedConfigWriter,
+    serialize_config_fragment,
+    validate_config_structure,
+    write_error_report,
+)
+from argocd_migrator.exceptions import MigratorError
+from argocd_migrator.executor import ExecutorBackend, PipelineExecutor, SerialExecutor
+from argocd_migrator.metrics import FileTimings, PipelineMetrics, timed, worker_peak_rss
+from argocd_migrator.parser import parse_yaml_content, read_yaml_file
+from argocd_migrator.pipeline import PipelineResult, TransformationResult, default_error_report
+from argocd_migrator.policy import ExecutionPolicy
+from argocd_migrator.progress import NULL_PROGRESS, ProgressReporter
+from argocd_migrator.scanner import iter_yaml_files
+from argocd_migrator.tracing import NULL_RECORDER, Span, TraceRecorder
+from argocd_migrator.transformer import transform_to_generator_config
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_SIZE = 64
+DEFAULT_READ_WORKERS = 8
+
+
+@dataclass
+class StageStats:
+    """Throughput and backpressure statistics for one pipeline stage."""
+
+    name: str
+    workers: int
+    items: int = 0
+    busy_seconds: float = 0.0
+    max_queue_depth: int = 0
+    queue_depth_sum: int = 0
+    queue_samples: int = 0
+    wall_seconds: float = 0.0
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of available worker time spent busy (0.0 - 1.0)."""
+        capacity = self.wall_seconds * self.workers
+        if capacity <= 0:
+            return 0.0
+        return min(1.0, self.busy_seconds / capacity)
+
+    @property
+    def mean_queue_depth(self) -> float:
+        """Average depth of this stage's input queue, sampled on every enqueue."""
+        if self.queue_samples == 0:
+            return 0.0
+        return self.queue_depth_sum / self.queue_samples
+
+
+@dataclass(slots=True)
+class StagedPipelineResult(PipelineResult):
+    """Result of a staged pipeline run, including per-stage statistics."""
+
+    stage_stats: list[StageStats] = field(default_factory=list)
+
+    def bottleneck(self) -> StageStats | None:
+        """Return the stage with the highest utilization."""
+        if not self.stage_stats:
+            return None
+        return max(self.stage_stats, key=lambda s: s.utilization)
+
+
+class _Item:
+    """A file moving through the stages."""
+
+    __slots__ = (
+        "index", "path", "content", "fragment", "app_name", "error", "skipped", "timings",
+        "bytes_read", "spans", "worker_rss_bytes",
+    )
+
+    def __init__(self, index: int, path: Path, trace: bool = False) -> None:
+        self.index = index
+        self.path = path
+        self.content: bytes | None = None
+        self.fragment: bytes | None = None
+        self.app_name: str | None = None
+        self.error: str | None = None
+        self.skipped = False
+        self.timings: FileTimings = {}
+        self.bytes_read = 0
+        self.spans: list[Span] | None = [] if trace else None
+        self.worker_rss_bytes = 0
+
+
+_DONE = object()
+
+
+class _Stage:
+    """An input queue plus the statistics of the workers draining it."""
+
+    def __init__(self, name: str, workers: int, queue_size: int) -> None:
+        self.name = name
+        self.workers = workers
+        self.queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=queue_size)
+        self.stats = StageStats(name=name, workers=workers)
+
+    async def put(self, item: Any) -> None:
+        await self.queue.put(item)
+        depth = self.queue.qsize()
+        self.stats.queue_depth_sum += depth
+        self.stats.queue_samples += 1
+        self.stats.max_queue_depth = max(self.stats.max_queue_depth, depth)
+
+    async def close(self) -> None:
+        for _ in range(self.workers):
+            await self.queue.put(_DONE)
+
+
+async def run_staged_pipeline(
+    source_dir: str | Path,
+    output_file: str | Path = "config.json",
+    validate: bool = True,
+    executor: PipelineExecutor | None = None,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    read_workers: int = DEFAULT_READ_WORKERS,
+    cpu_workers: int | None = None,
+    policy: ExecutionPolicy | None = None,
+    error_report: str | Path | None = None,
+    trace: TraceRecorder | None = None,
+    progress: ProgressReporter | None = None,
+) -> StagedPipelineResult:
+    """
+    Run the aggregated pipeline as concurrent stages connected by bounded queues.
+
+    Stages are scan → read → process → write. File reads and writes run on a
+    thread pool; the process stage parses, transforms, validates and serializes each
+    file in a single ``executor`` call, so file content crosses to a worker once and
+    only the JSON fragment comes back. I/O and CPU work overlap. Every queue is
+    bounded and the number of files in flight is capped, so a slow writer applies
+    backpressure all the way up to the scanner instead of letting memory grow.
+
+    A serial executor would run the CPU work inside the event loop and stall the
+    I/O stages, so it is replaced by one background thread. Per-file timeouts are
+    only enforced by a process executor.
+
+    The output is byte-identical to ``run_pipeline`` and follows the same error
+    policy: by default it is only written when every file succeeds. When the policy
+    stops the run, files not yet processed are skipped by every stage.
+
+    Args:
+        source_dir: Directory containing YAML files
+        output_file: Path where aggregated config.json should be written
+        validate: Whether to validate each config's structure (default: True)
+        executor: Executor for the process stage (default: one background thread)
+        queue_size: Capacity of each inter-stage queue
+        read_workers: Number of concurrent file reads
+        cpu_workers: Concurrent submissions to the process stage (default: executor
+            jobs)
+        policy: Error-handling policy (default: process everything, write nothing on
+            failure)
+        error_report: Where the ``continue`` policy writes its error report
+        trace: Recorder that receives a span per stage per file (default: disabled)
+        progress: Reporter updated as each file is written; its total grows as the
+            scanner finds files (default: disabled)
+
+    Returns:
+        StagedPipelineResult with summary statistics and per-stage statistics
+    """
+    source_path = Path(source_dir)
+    output_path = Path(output_file)
+    policy = policy or ExecutionPolicy()
+    trace = trace if trace is not None else NULL_RECORDER
+    progress = progress if progress is not None else NULL_PROGRESS
+    cpu_executor = executor or SerialExecutor()
+    cpu_workers = cpu_workers or cpu_executor.jobs
+    max_in_flight = queue_size * 4
+
+    read = _Stage("read", read_workers, queue_size)
+    process = _Stage("process", cpu_workers, queue_size)
+    write = _Stage("write", 1, queue_size)
+    scan_stats = StageStats(name="scan", workers=1)
+    in_flight = asyncio.Semaphore(max_in_flight)
+    stop = asyncio.Event()
+    results: dict[int, TransformationResult] = {}
+    metrics = PipelineMetrics()
+    metrics.start()
+
+    loop = asyncio.get_running_loop()
+    io_pool = ThreadPoolExecutor(max_workers=read_workers, thread_name_prefix="read")
+    cpu_thread: ThreadPoolExecutor | None = None
+    if cpu_executor.backend is ExecutorBackend.SERIAL:
+        cpu_thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cpu")
+
+    async def scan_stage() -> None:
+        paths = iter_yaml_files(source_path)
+        scan_timings: FileTimings = {}
+        scan_spans: list[Span] | None = [] if trace.enabled else None
+        next_path = partial(timed, scan_timings, "scan", next, paths, None, spans=scan_spans)
+        index = 0
+        try:
+            while True:
+                path = await loop.run_in_executor(io_pool, next_path)
+                wall, cpu = scan_timings["scan"]
+                scan_stats.busy_seconds += wall
+                metrics.add_stage_time("scan", wall, cpu)
+                if path is None:
+                    break
+                scan_stats.items += 1
+                if progress.enabled:
+                    progress.total += 1
+                if stop.is_set():
+                    continue  # Keep counting files so skipped work is reported
+                await in_flight.acquire()
+                await read.put(_Item(index, path, trace.enabled))
+                index += 1
+        finally:
+            trace.add_spans(scan_spans)
+            await read.close()
+
+    async def read_file(item: _Item) -> None:
+        item.content = await loop.run_in_executor(
+            io_pool,
+            partial(timed, item.timings, "read", read_yaml_file, item.path, spans=item.spans),
+        )
+        item.bytes_read = len(item.content or b"")
+
+    async def process_file(item: _Item) -> None:
+        assert item.content is not None
+        args = (item.content, item.path, item.index, validate, item.spans is not None)
+        item.content = None
+        if cpu_thread is not None:
+            outcome = await loop.run_in_executor(cpu_thread, _process_in_worker, *args)
+        else:
+            outcome = await asyncio.wrap_future(cpu_executor.submit(_process_in_worker, *args))
+        item.fragment, item.app_name, error, timings, spans, item.worker_rss_bytes = outcome
+        item.timings.update(timings)
+        if item.spans is not None and spans:
+            item.spans.extend(spans)
+        if error is not None:
+            raise error
+
+    writer = AggregatedConfigWriter(output_path)
+
+    async def write_stage() -> None:
+        pending: dict[int, _Item] = {}
+        next_index = 0
+        errors = 0
+        while (item := await write.queue.get()) is not _DONE:
+            pending[item.index] = item
+            while next_index in pending:
+                ready = pending.pop(next_index)
+                start = time.perf_counter()
+                if not ready.skipped and _record(ready, results):
+                    errors += 1
+                    if policy.should_stop(errors) and not stop.is_set():
+                        logger.error(f"Stopping after {errors} failed file(s) (policy: {policy})")
+                        stop.set()
+                writable = errors == 0 or policy.writes_partial_output
+                if writable and ready.fragment is not None:
+                    await loop.run_in_executor(
+                        io_pool,
+                        partial(
+                            timed, ready.timings, "write", writer.write, ready.fragment,
+                            spans=ready.spans,
+                        ),
+                    )
+                if not ready.skipped:
+                    metrics.record_file(
+                        ready.path, ready.timings, ready.bytes_read, ready.worker_rss_bytes
+                    )
+                    trace.add_spans(ready.spans, ready.path)
+                    progress.advance(ready.bytes_read, failed=ready.error is not None)
+                write.stats.busy_seconds += time.perf_counter() - start
+                write.stats.items += 1
+                next_index += 1
+                in_flight.release()
+
+    start = time.perf_counter()
+    progress.start()
+    try:
+        with writer:
+            await asyncio.gather(
+                scan_stage(),
+                _run_stage(read, process, read_file, stop),
+                _run_stage(process, write, process_file, stop),
+                write_stage(),
+            )
+
+            ordered = [results[i] for i in sorted(results)]
+            failed = sum(1 for r in ordered if not r.success)
+            if failed == 0 or policy.writes_partial_output:
+                with metrics.stage("write"):
+                    writer.commit()
+    finally:
+        io_pool.shutdown(wait=True)
+        if cpu_thread is not None:
+            cpu_thread.shutdown(wait=True)
+    progress.finish()
+    metrics.bytes_written = writer.bytes_written
+
+    wall = time.perf_counter() - start
+    stage_stats = [scan_stats, read.stats, process.stats, write.stats]
+    for stats in stage_stats:
+        stats.wall_seconds = wall
+
+    total = scan_stats.items
+    successful = len(ordered) - failed
+    metrics.finish()
+    metrics.files = len(ordered)
+    metrics.successful = successful
+    metrics.failed = failed
+    metrics.skipped = total - len(ordered)
+    if failed:
+        logger.error(f"Pipeline failed: {failed}/{total} transformations failed")
+    else:
+        logger.info(f"Pipeline complete: {successful}/{total} succeeded")
+
+    report_path: Path | None = None
+    if policy.writes_partial_output:
+        report_path = Path(error_report) if error_report else default_error_report(output_path)
+        try:
+            write_error_report(
+                [(r.source_file, r.error or "") for r in ordered if not r.success],
+                total,
+                report_path,
+            )
+        except MigratorError as e:
+            logger.error(f"Failed to write error report: {e}")
+            report_path = None
+
+    return StagedPipelineResult(
+        total=total,
+        successful=successful,
+        failed=failed,
+        output_file=output_path if failed == 0 or policy.writes_partial_output else None,
+        results=ordered,
+        skipped=total - len(ordered),
+        error_report=report_path,
+        metrics=metrics,
+        stage_stats=stage_stats,
+    )
+
+
+def run_staged_pipeline_sync(*args: Any, **kwargs: Any) -> StagedPipelineResult:
+    """Run ``run_staged_pipeline`` in a fresh event loop."""
+    return asyncio.run(run_staged_pipeline(*args, **kwargs))
+
+
+async def _run_stage(
+    stage: _Stage, downstream: _Stage, process: Callable[[_Item], Any], stop: asyncio.Event
+) -> None:
+    """Drain a stage's queue with its workers, forwarding items downstream."""
+
+    async def worker() -> None:
+        while (item := await stage.queue.get()) is not _DONE:
+            if stop.is_set() and item.error is None:
+                item.skipped = True
+            if item.error is None and not item.skipped:
+                start = time.perf_counter()
+                try:
+                    await process(item)
+                except MigratorError as e:
+                    item.error = str(e)
+                stage.stats.busy_seconds += time.perf_counter() - start
+                stage.stats.items += 1
+            await downstream.put(item)
+
+    try:
+        await asyncio.gather(*(worker() for _ in range(stage.workers)))
+    finally:
+        await downstream.close()
+
+
+def _record(item: _Item, results: dict[int, TransformationResult]) -> bool:
+    """Store the final result for an item; return True if it failed."""
+    if item.error is not None:
+        logger.error("Failed to transform %s: %s", item.path, item.error)
+        results[item.index] = TransformationResult(
+            source_file=item.path, success=False, error=item.error
+        )
+        return True
+
+    logger.debug("Successfully transformed %s", item.path)
+    results[item.index] = TransformationResult(
+        source_file=item.path, success=True, app_name=item.app_name
+    )
+    return False
+
+
+def _process_in_worker(
+    content: bytes, path: Path, index: int, validate: bool, trace: bool = False
+) -> tuple[bytes | None, str | None, MigratorError | None, FileTimings, list[Span] | None, int]:
+    """
+    Parse, transform, validate and serialize one file in an executor worker.
+
+    Returns the JSON fragment, the application name, the error (returned rather
+    than raised so failed files keep their timings), the timings, the spans and
+    the worker's peak RSS.
+    """
+    timings: FileTimings = {}
+    spans: list[Span] | None = [] if trace else None
+    try:
+        data = timed(timings, "parse", parse_yaml_content, content, path, spans=spans)
+        config = timed(timings, "transform", transform_to_generator_config, data, spans=spans)
+        if validate:
+            timed(
+                timings, "validate", validate_config_structure, config, index, "scan index",
+                spans=spans,
+            )
+        fragment = timed(timings, "serialize", serialize_config_fragment, config, spans=spans)
+    except MigratorError as e:
+        return None, None, e, timings, spans, worker_peak_rss()
+    return fragment, config["metadata"].get("name"), None, timings, spans, worker_peak_rss()
+
+
+def iter_stage_report(result: StagedPipelineResult) -> Iterator[str]:
+    """Yield human-readable lines describing each stage's load."""
+    yield f"{'stage':<11}{'items':>8}{'busy s':>9}{'util':>7}{'queue max':>11}{'queue avg':>11}"
+    for stats in result.stage_stats:
+        yield (
+            f"{stats.name:<11}{stats.items:>8}{stats.busy_seconds:>9.2f}"
+            f"{stats.utilization:>6.0%}{stats.max_queue_depth:>11}"
+            f"{stats.mean_queue_depth:>11.1f}"
+        )
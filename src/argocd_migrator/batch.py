@@ -0,0 +1,219 @@
+"""Batch mode: run many migration jobs in one process over a shared worker pool."""
+
+import logging
+import time
+import tomllib
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from argocd_migrator.exceptions import BatchConfigError, MigratorError
+from argocd_migrator.executor import ExecutorBackend, PipelineExecutor
+from argocd_migrator.pipeline import PipelineResult, run_pipeline
+from argocd_migrator.policy import ExecutionPolicy
+
+logger = logging.getLogger(__name__)
+
+_JOB_KEYS = {
+    "name",
+    "input_path",
+    "output_file",
+    "validate",
+    "on_error",
+    "error_report",
+    "per_file_dir",
+    "fsync",
+    "serialize_in_workers",
+}
+_TOP_LEVEL_KEYS = {"workers", "executor", "defaults", "job"}
+
+
+@dataclass
+class BatchJob:
+    """One migration job of a batch."""
+
+    name: str
+    input_path: Path
+    output_file: Path
+    validate: bool = True
+    policy: ExecutionPolicy = field(default_factory=ExecutionPolicy)
+    error_report: Path | None = None
+    per_file_dir: Path | None = None
+    fsync: bool = False
+    serialize_in_workers: bool = False
+
+
+@dataclass
+class BatchFile:
+    """Parsed batch job file."""
+
+    jobs: list[BatchJob]
+    workers: int | None = None
+    executor: ExecutorBackend = ExecutorBackend.PROCESS
+
+
+@dataclass
+class BatchJobResult:
+    """Outcome of one batch job."""
+
+    job: BatchJob
+    result: PipelineResult | None
+    error: str | None = None
+    seconds: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        """Whether the job wrote its output without any failed file or write."""
+        return (
+            self.result is not None
+            and self.result.failed == 0
+            and self.result.output_file is not None
+            and all(w.success for w in self.result.per_file_results)
+        )
+
+
+def load_batch_file(path: str | Path) -> BatchFile:
+    """
+    Load a TOML batch job file.
+
+    The file lists jobs as ``[[job]]`` tables. Each job needs ``input_path`` and
+    ``output_file`` and may set ``name``, ``validate``, ``on_error``,
+    ``error_report``, ``per_file_dir``, ``fsync`` and ``serialize_in_workers``.
+    A ``[defaults]`` table provides values for every job, and top-level
+    ``workers`` and ``executor`` configure the shared pool. Relative paths are
+    resolved against the batch file's directory.
+
+    Args:
+        path: Path to the batch file
+
+    Returns:
+        BatchFile with one BatchJob per ``[[job]]`` table
+
+    Raises:
+        BatchConfigError: If the file cannot be read or is invalid
+    """
+    batch_path = Path(path)
+    try:
+        with open(batch_path, "rb") as f:
+            data = tomllib.load(f)
+    except OSError as e:
+        raise BatchConfigError(f"Error reading batch file {path}: {e}") from e
+    except tomllib.TOMLDecodeError as e:
+        raise BatchConfigError(f"Invalid TOML in batch file {path}: {e}") from e
+
+    unknown = set(data) - _TOP_LEVEL_KEYS
+    if unknown:
+        raise BatchConfigError(f"Unknown keys in {path}: {', '.join(sorted(unknown))}")
+
+    defaults = data.get("defaults", {})
+    tables = data.get("job", [])
+    if not isinstance(defaults, dict) or not isinstance(tables, list):
+        raise BatchConfigError(f"{path}: expected a [defaults] table and [[job]] tables")
+    if not tables:
+        raise BatchConfigError(f"{path} defines no [[job]] tables")
+
+    base_dir = batch_path.parent
+    jobs = [
+        _parse_job({**defaults, **table}, index, base_dir)
+        for index, table in enumerate(tables)
+    ]
+
+    outputs = [job.output_file.resolve() for job in jobs]
+    duplicates = sorted({str(p) for p in outputs if outputs.count(p) > 1})
+    if duplicates:
+        raise BatchConfigError(f"Jobs in {path} share output files: {', '.join(duplicates)}")
+
+    workers = data.get("workers")
+    if workers is not None and (not isinstance(workers, int) or workers < 1):
+        raise BatchConfigError(f"{path}: workers must be a positive integer")
+    try:
+        executor = ExecutorBackend(data.get("executor", ExecutorBackend.PROCESS))
+    except ValueError as e:
+        raise BatchConfigError(f"{path}: {e}") from e
+
+    return BatchFile(jobs=jobs, workers=workers, executor=executor)
+
+
+def _parse_job(table: dict[str, Any], index: int, base_dir: Path) -> BatchJob:
+    """Build a BatchJob from a merged ``[[job]]`` table."""
+    label = f"job {index + 1}"
+    unknown = set(table) - _JOB_KEYS
+    if unknown:
+        raise BatchConfigError(f"Unknown keys in {label}: {', '.join(sorted(unknown))}")
+
+    def path_value(key: str, required: bool = False) -> Path | None:
+        value = table.get(key)
+        if value is None:
+            if required:
+                raise BatchConfigError(f"{label} is missing required key: {key}")
+            return None
+        if not isinstance(value, str):
+            raise BatchConfigError(f"{label}: {key} must be a string")
+        return base_dir / value
+
+    def bool_value(key: str, default: bool) -> bool:
+        value = table.get(key, default)
+        if not isinstance(value, bool):
+            raise BatchConfigError(f"{label}: {key} must be true or false")
+        return value
+
+    input_path = path_value("input_path", required=True)
+    output_file = path_value("output_file", required=True)
+    assert input_path is not None and output_file is not None
+
+    try:
+        policy = ExecutionPolicy.parse(str(table.get("on_error", "collect")))
+    except ValueError as e:
+        raise BatchConfigError(f"{label}: {e}") from e
+
+    return BatchJob(
+        name=str(table.get("name") or input_path.name),
+        input_path=input_path,
+        output_file=output_file,
+        validate=bool_value("validate", True),
+        policy=policy,
+        error_report=path_value("error_report"),
+        per_file_dir=path_value("per_file_dir"),
+        fsync=bool_value("fsync", False),
+        serialize_in_workers=bool_value("serialize_in_workers", False),
+    )
+
+
+def run_batch(jobs: list[BatchJob], executor: PipelineExecutor) -> Iterator[BatchJobResult]:
+    """
+    Run jobs one after another over a shared executor, yielding each outcome.
+
+    Every job fans its files out across the whole pool, so the workers, their
+    imports and their content caches stay warm from one job to the next.
+
+    Args:
+        jobs: Jobs to run, in order
+        executor: Shared executor (not shut down)
+
+    Returns:
+        Iterator over one BatchJobResult per job
+    """
+    for job in jobs:
+        logger.info(f"Batch job {job.name}: {job.input_path} -> {job.output_file}")
+        start = time.perf_counter()
+        try:
+            if not job.input_path.is_dir():
+                raise BatchConfigError(f"Input path is not a directory: {job.input_path}")
+            result = run_pipeline(
+                job.input_path,
+                job.output_file,
+                validate=job.validate,
+                per_file_dir=job.per_file_dir,
+                fsync=job.fsync,
+                executor=executor,
+                serialize_in_workers=job.serialize_in_workers,
+                policy=job.policy,
+                error_report=job.error_report,
+                content_cache=True,
+            )
+        except MigratorError as e:
+            logger.error(f"Batch job {job.name} failed: {e}")
+            yield BatchJobResult(job, None, str(e), time.perf_counter() - start)
+            continue
+        yield BatchJobResult(job, result, None, time.perf_counter() - start)
@@ -1,13 +1,53 @@
-"""CLI interface for ArgoCD migrator."""
+"""
+CLI interface for ArgoCD migrator.
+
+Only what the option declarations need is imported at module level; the pipeline,
+YAML, asyncio and instrumentation modules are imported inside the commands that
+use them, so ``version``/``--help`` and short runs start quickly.
+"""
 
 import logging
+import os
+import sys
+from contextlib import nullcontext
+from enum import StrEnum
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated, Any, NoReturn
 
 import typer
 
-from argocd_migrator.exceptions import MigratorError
-from argocd_migrator.pipeline import run_pipeline
+from argocd_migrator.exceptions import KubeApiError, MigratorError
+from argocd_migrator.executor import (
+    ExecutorBackend,
+    SchedulePolicy,
+    create_executor,
+    default_jobs,
+)
+from argocd_migrator.policy import ExecutionPolicy
+from argocd_migrator.sharding import Shard
+
+if TYPE_CHECKING:
+    from argocd_migrator.kube import KubeSource
+    from argocd_migrator.pipeline import PipelineResult
+    from argocd_migrator.profiling import PipelineProfiler
+    from argocd_migrator.sidecar import BlockStore
+
+# Default per-file processing limit; well-formed manifests take milliseconds
+DEFAULT_FILE_TIMEOUT = 60.0
+# Environment variable naming the daemon socket for `serve` and `client`
+SOCKET_ENVVAR = "ARGOCD_MIGRATOR_SOCKET"
+# Environment variable holding the bearer token for --kube-server
+KUBE_TOKEN_ENVVAR = "ARGOCD_MIGRATOR_KUBE_TOKEN"
+# Path value selecting stdin (--input-path) or stdout (--output-file)
+STDIO = Path("-")
+
+
+class PipelineEngine(StrEnum):
+    """Available pipeline engines."""
+
+    SEQUENTIAL = "sequential"
+    STAGED = "staged"
+
 
 app = typer.Typer(
     name="argocd-migrator",
@@ -16,6 +56,22 @@ app = typer.Typer(
 )
 
 
+def _parse_policy(value: str) -> ExecutionPolicy:
+    """Typer parser for --on-error."""
+    try:
+        return ExecutionPolicy.parse(value)
+    except ValueError as e:
+        raise typer.BadParameter(str(e)) from e
+
+
+def _parse_shard(value: str) -> Shard:
+    """Typer parser for --shard."""
+    try:
+        return Shard.parse(value)
+    except ValueError as e:
+        raise typer.BadParameter(str(e)) from e
+
+
 def setup_logging(verbose: bool, quiet: bool) -> None:
     """
     Configure logging based on verbosity flags.
@@ -38,25 +94,70 @@ def setup_logging(verbose: bool, quiet: bool) -> None:
     )
 
 
+def _warn_unenforced_timeout(
+    file_timeout: float, backend: ExecutorBackend | str, jobs: int, staged: bool = False
+) -> None:
+    """Warn when an explicit --file-timeout cannot be enforced because files run on threads."""
+    # The default limit is only a safety net, so it is not worth a warning on every run
+    if file_timeout in (0, DEFAULT_FILE_TIMEOUT):
+        return
+    backend = ExecutorBackend(backend)
+    threaded = backend is ExecutorBackend.THREAD and jobs > 1
+    # The staged engine moves serial CPU work onto a background thread
+    threaded = threaded or (staged and (backend is ExecutorBackend.SERIAL or jobs <= 1))
+    if threaded:
+        typer.echo("Warning: --file-timeout is not enforced on thread workers", err=True)
+
+
+def _report_profile(
+    profiler: "PipelineProfiler", base_path: Path, top: int | None, quiet: bool
+) -> None:
+    """Write profile files next to ``base_path`` and print the hottest functions."""
+    from argocd_migrator.profiling import DEFAULT_TOP_FUNCTIONS, iter_top_functions
+
+    top = DEFAULT_TOP_FUNCTIONS if top is None else top
+    pstats_file = base_path.with_suffix(".pstats")
+    collapsed_file = base_path.with_suffix(".collapsed.txt")
+    try:
+        profiler.write_pstats(pstats_file)
+        profiler.write_collapsed(collapsed_file)
+    except MigratorError as e:
+        typer.echo(f"Warning: {e}", err=True)
+        return
+
+    if quiet:
+        return
+    typer.echo(f"\nProfile written to {pstats_file} (collapsed stacks: {collapsed_file})")
+    if top:
+        typer.echo(f"Top {top} functions by self time:")
+        for line in iter_top_functions(profiler.stats(), top):
+            typer.echo(f"  {line}")
+
+
 @app.command()
 def migrate(
     input_path: Annotated[
-        Path,
+        Path | None,
         typer.Option(
             "--input-path",
             "-i",
-            help="Input directory containing ArgoCD Application YAML files",
+            help="Input directory containing ArgoCD Application YAML files, a .tar, "
+            ".tar.gz, .tgz or .zip archive of them, or - to read a YAML stream "
+            "(multi-document or a kubectl List) from stdin",
             exists=True,
-            file_okay=False,
+            file_okay=True,  # Archives and "-"; other files are rejected below
             dir_okay=True,
+            allow_dash=True,
+            show_default=False,
         ),
-    ],
+    ] = None,
     output_file: Annotated[
         Path,
         typer.Option(
             "--output-file",
             "-o",
-            help="Output file path for aggregated config.json",
+            help="Output file path for aggregated config.json, or - to write one config "
+            "per line (NDJSON) to stdout as each is transformed",
         ),
     ] = Path("config.json"),
     no_validate: Annotated[
@@ -66,6 +167,241 @@ def migrate(
             help="Skip aggregated config validation",
         ),
     ] = False,
+    per_file_dir: Annotated[
+        Path | None,
+        typer.Option(
+            "--per-file-dir",
+            help="Also write one JSON file per application into this directory",
+            file_okay=False,
+            dir_okay=True,
+        ),
+    ] = None,
+    fsync: Annotated[
+        bool,
+        typer.Option(
+            "--fsync",
+            help="Fsync per-file output for durability",
+        ),
+    ] = False,
+    jobs: Annotated[
+        int | None,
+        typer.Option(
+            "--jobs",
+            "-j",
+            help="Number of parallel workers (default: CPU count)",
+            min=1,
+        ),
+    ] = None,
+    executor: Annotated[
+        ExecutorBackend,
+        typer.Option(
+            "--executor",
+            help="Executor backend for parallel work",
+        ),
+    ] = ExecutorBackend.PROCESS,
+    schedule: Annotated[
+        SchedulePolicy,
+        typer.Option(
+            "--schedule",
+            help="How parallel workers receive files: size (largest first, in "
+            "byte-balanced chunks) or fifo (equal-count chunks in scan order). "
+            "Output is identical",
+        ),
+    ] = SchedulePolicy.SIZE,
+    shard: Annotated[
+        Shard | None,
+        typer.Option(
+            "--shard",
+            help="Process only shard i of N (e.g. 2/4), chosen by a stable hash of each "
+            "file's relative path, and write a partial result to --output-file for "
+            "'merge'",
+            parser=_parse_shard,
+            metavar="i/N",
+        ),
+    ] = None,
+    journal: Annotated[
+        Path | None,
+        typer.Option(
+            "--journal",
+            help="Record each completed file in this checkpoint journal so an "
+            "interrupted run can --resume (default with --resume: "
+            "<output stem>.journal.ndjson)",
+            dir_okay=False,
+        ),
+    ] = None,
+    resume: Annotated[
+        bool,
+        typer.Option(
+            "--resume",
+            help="Reuse journaled results of files whose content is unchanged and "
+            "process only the rest; the output is identical to a full run",
+        ),
+    ] = False,
+    externalize_blocks: Annotated[
+        bool,
+        typer.Option(
+            "--externalize-blocks",
+            help="Write helm/kustomize blocks larger than --block-threshold once, by "
+            "content hash, to <output stem>.blocks/ and reference them from the "
+            "config ('expand' restores the full configs)",
+        ),
+    ] = False,
+    block_threshold: Annotated[
+        int,
+        typer.Option(
+            "--block-threshold",
+            help="Smallest JSON size in bytes of an externalized block, exclusive",
+            min=0,
+        ),
+    ] = 1024,
+    file_timeout: Annotated[
+        float,
+        typer.Option(
+            "--file-timeout",
+            help="Fail a file whose processing takes longer than this many seconds "
+            "(0: no limit; enforced by the serial and process executors)",
+            min=0,
+        ),
+    ] = DEFAULT_FILE_TIMEOUT,
+    engine: Annotated[
+        PipelineEngine,
+        typer.Option(
+            "--engine",
+            help="Pipeline engine: sequential stages, or overlapping asyncio stages",
+        ),
+    ] = PipelineEngine.SEQUENTIAL,
+    on_error: Annotated[
+        ExecutionPolicy,
+        typer.Option(
+            "--on-error",
+            help="Error policy: collect, fail-fast, max-errors=N, or continue "
+            "(write successful configs plus an error report)",
+            parser=_parse_policy,
+            metavar="POLICY",
+        ),
+    ] = "collect",  # type: ignore[assignment]
+    error_report: Annotated[
+        Path | None,
+        typer.Option(
+            "--error-report",
+            help="Error report path for --on-error continue (default: <output stem>.errors.json)",
+        ),
+    ] = None,
+    serialize_in_workers: Annotated[
+        bool,
+        typer.Option(
+            "--serialize-in-workers",
+            help="Serialize configs to JSON inside workers and merge byte fragments",
+        ),
+    ] = False,
+    metrics_json: Annotated[
+        Path | None,
+        typer.Option(
+            "--metrics-json",
+            help="Write per-stage timing, throughput and resource metrics as JSON",
+        ),
+    ] = None,
+    metrics_prom: Annotated[
+        Path | None,
+        typer.Option(
+            "--metrics-prom",
+            help="Write metrics in Prometheus textfile collector format",
+        ),
+    ] = None,
+    trace_file: Annotated[
+        Path | None,
+        typer.Option(
+            "--trace",
+            help="Write a Chrome trace-event file with a span per stage per file "
+            "(open in Perfetto or about:tracing)",
+        ),
+    ] = None,
+    profile: Annotated[
+        bool,
+        typer.Option(
+            "--profile",
+            help="Profile the run with cProfile (including workers); writes .pstats "
+            "and collapsed-stack files and prints the hottest functions",
+        ),
+    ] = False,
+    profile_output: Annotated[
+        Path | None,
+        typer.Option(
+            "--profile-output",
+            help="Base path for profile files (default: the output file path)",
+        ),
+    ] = None,
+    profile_top: Annotated[
+        int | None,
+        typer.Option(
+            "--profile-top",
+            help="Number of hot functions to print with --profile (default: 20)",
+            min=0,
+        ),
+    ] = None,
+    memory_profile: Annotated[
+        Path | None,
+        typer.Option(
+            "--memory-profile",
+            help="Trace allocations with tracemalloc and write per-stage peak/retained "
+            "memory and top allocation sites to this JSON file",
+        ),
+    ] = None,
+    progress: Annotated[
+        bool | None,
+        typer.Option(
+            "--progress/--no-progress",
+            help="Show files done, throughput and ETA on stderr while running "
+            "(default: when stderr is a terminal and neither --quiet nor --verbose is set)",
+            show_default=False,
+        ),
+    ] = None,
+    kube_server: Annotated[
+        str | None,
+        typer.Option(
+            "--kube-server",
+            help="List Applications from this Kubernetes API server URL instead of "
+            "reading --input-path; 'in-cluster' uses the pod's service account",
+        ),
+    ] = None,
+    kube_token: Annotated[
+        str | None,
+        typer.Option(
+            "--kube-token",
+            envvar=KUBE_TOKEN_ENVVAR,
+            help="Bearer token for --kube-server",
+            show_default=False,
+        ),
+    ] = None,
+    kube_namespaces: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--kube-namespace",
+            "-N",
+            help="Namespace to list (repeatable; listed concurrently up to --jobs at a "
+            "time). Default: all namespaces in one listing",
+        ),
+    ] = None,
+    kube_page_size: Annotated[
+        int,
+        typer.Option("--kube-page-size", min=1, help="Applications per list request"),
+    ] = 500,
+    kube_ca: Annotated[
+        Path | None,
+        typer.Option(
+            "--kube-ca",
+            help="CA bundle for verifying --kube-server",
+            exists=True,
+            dir_okay=False,
+        ),
+    ] = None,
+    kube_insecure: Annotated[
+        bool,
+        typer.Option(
+            "--kube-insecure",
+            help="Do not verify the --kube-server TLS certificate",
+        ),
+    ] = False,
     verbose: Annotated[
         bool,
         typer.Option(
@@ -92,14 +428,171 @@ def migrate(
     """
     setup_logging(verbose, quiet)
 
+    from argocd_migrator.archive import is_archive
+
+    if (input_path is None) == (kube_server is None):
+        raise typer.BadParameter("Pass exactly one of --input-path and --kube-server")
+    source: Path | KubeSource
+    if kube_server is not None:
+        source = _kube_source(
+            kube_server, kube_token, kube_namespaces, kube_page_size, kube_ca, kube_insecure, jobs
+        )
+        archive = False
+    else:
+        assert input_path is not None
+        source = input_path
+        archive = input_path != STDIO and not input_path.is_dir()
+        if archive and not is_archive(input_path):
+            raise typer.BadParameter(
+                f"'{input_path}' is neither a directory nor a .tar, .tar.gz, .tgz or .zip "
+                "archive.",
+                param_hint="'--input-path' / '-i'",
+            )
+    if input_path is None or archive or STDIO in (input_path, output_file):
+        unsupported = {
+            "--per-file-dir": per_file_dir is not None,
+            "--engine staged": engine is PipelineEngine.STAGED,
+            "--serialize-in-workers": serialize_in_workers,
+            "--trace": trace_file is not None,
+            "--profile": profile,
+            "--memory-profile": memory_profile is not None,
+            "--shard": shard is not None,
+            "--journal": journal is not None,
+            "--resume": resume,
+            "--externalize-blocks": externalize_blocks,
+        }
+        for name, used in unsupported.items():
+            if used:
+                raise typer.BadParameter(
+                    f"{name} is not supported with archive, cluster or stdin/stdout streaming"
+                )
+        _migrate_stream(
+            source,
+            output_file,
+            validate=not no_validate,
+            policy=on_error,
+            error_report=error_report,
+            backend=executor,
+            jobs=jobs,
+            file_timeout=file_timeout,
+            metrics_json=metrics_json,
+            metrics_prom=metrics_prom,
+            quiet=quiet,
+        )
+
     try:
         typer.echo(f"Migrating ArgoCD Applications from {input_path} to {output_file}")
 
-        result = run_pipeline(
-            source_dir=input_path,
-            output_file=output_file,
-            validate=not no_validate,
+        if engine is PipelineEngine.STAGED and per_file_dir is not None:
+            raise typer.BadParameter("--per-file-dir is not supported by the staged engine")
+        if engine is PipelineEngine.STAGED and memory_profile is not None:
+            raise typer.BadParameter(
+                "--memory-profile is not supported by the staged engine (stages overlap)"
+            )
+        staged_unsupported = shard or journal or resume or externalize_blocks
+        if engine is PipelineEngine.STAGED and staged_unsupported:
+            raise typer.BadParameter(
+                "--shard, --journal, --resume and --externalize-blocks are not supported "
+                "by the staged engine"
+            )
+        if externalize_blocks and serialize_in_workers:
+            raise typer.BadParameter(
+                "--externalize-blocks is not supported with --serialize-in-workers"
+            )
+        if externalize_blocks and shard is not None:
+            raise typer.BadParameter(
+                "Pass --externalize-blocks to 'merge' rather than to each shard"
+            )
+        if resume and journal is None:
+            from argocd_migrator.journal import default_journal
+
+            journal = default_journal(output_file)
+
+        from argocd_migrator.pipeline import run_pipeline
+
+        jobs = jobs if jobs is not None else default_jobs()
+        if memory_profile is not None and executor is ExecutorBackend.PROCESS and jobs > 1:
+            # tracemalloc only sees this process, so worker allocations would be missed
+            typer.echo(
+                "Warning: --memory-profile only traces this process; running serially",
+                err=True,
+            )
+            executor = ExecutorBackend.SERIAL
+        _warn_unenforced_timeout(
+            file_timeout, executor, jobs, staged=engine is PipelineEngine.STAGED
         )
+        blocks = None
+        if externalize_blocks:
+            from argocd_migrator.sidecar import BlockStore
+
+            blocks = BlockStore.for_output(output_file, block_threshold)
+        trace = memory = profiler = None
+        if trace_file is not None:
+            from argocd_migrator.tracing import TraceRecorder
+
+            trace = TraceRecorder()
+        if profile:
+            from argocd_migrator.profiling import PipelineProfiler
+
+            profiler = PipelineProfiler()
+        if memory_profile is not None:
+            from argocd_migrator.memory import MemoryProfiler
+
+            memory = MemoryProfiler()
+        if progress is None:
+            progress = sys.stderr.isatty() and not quiet and not verbose
+        reporter = None
+        if progress:
+            from argocd_migrator.progress import ProgressReporter
+
+            reporter = ProgressReporter(sys.stderr)
+        result: PipelineResult
+        try:
+            with (
+                create_executor(executor, jobs, file_timeout or None) as pool,
+                profiler or nullcontext(),
+                memory or nullcontext(),
+            ):
+                if profiler is not None:
+                    profiler.attach(pool)
+                if engine is PipelineEngine.STAGED:
+                    from argocd_migrator.async_pipeline import run_staged_pipeline_sync
+
+                    result = run_staged_pipeline_sync(
+                        input_path,
+                        output_file,
+                        validate=not no_validate,
+                        executor=pool,
+                        policy=on_error,
+                        error_report=error_report,
+                        trace=trace,
+                        progress=reporter,
+                    )
+                else:
+                    result = run_pipeline(
+                        source_dir=input_path,
+                        output_file=output_file,
+                        validate=not no_validate,
+                        per_file_dir=per_file_dir,
+                        fsync=fsync,
+                        executor=pool,
+                        serialize_in_workers=serialize_in_workers,
+                        policy=on_error,
+                        error_report=error_report,
+                        trace=trace,
+                        memory=memory,
+                        progress=reporter,
+                        schedule=schedule,
+                        shard=shard,
+                        journal=journal,
+                        resume=resume,
+                        blocks=blocks,
+                    )
+            if profiler is not None:
+                _report_profile(profiler, profile_output or output_file, profile_top, quiet)
+        finally:
+            if profiler is not None:
+                profiler.cleanup()
 
         # Display summary
         if not quiet:
@@ -107,9 +600,56 @@ def migrate(
             typer.echo(f"  Total applications: {result.total}")
             typer.echo(f"  Successfully transformed: {result.successful}")
             typer.echo(f"  Failed: {result.failed}")
+            if result.skipped:
+                typer.echo(f"  Skipped (cancelled): {result.skipped}")
+            if result.resumed:
+                typer.echo(f"  Reused from journal: {result.resumed}")
             if result.total > 0:
                 typer.echo(f"  Success rate: {result.success_rate:.1f}%")
 
+        if engine is PipelineEngine.STAGED and not quiet:
+            from argocd_migrator.async_pipeline import StagedPipelineResult, iter_stage_report
+
+            assert isinstance(result, StagedPipelineResult)
+            typer.echo("\nStage statistics:")
+            for line in iter_stage_report(result):
+                typer.echo(f"  {line}")
+
+        if result.metrics is not None:
+            if verbose:
+                from argocd_migrator.metrics import iter_metrics_report
+
+                typer.echo("\nMetrics:")
+                for line in iter_metrics_report(result.metrics):
+                    typer.echo(f"  {line}")
+            try:
+                if metrics_json is not None:
+                    result.metrics.write_json(metrics_json)
+                if metrics_prom is not None:
+                    result.metrics.write_prometheus(metrics_prom)
+            except MigratorError as e:
+                typer.echo(f"Warning: {e}", err=True)
+
+        if memory is not None and memory_profile is not None:
+            if not quiet:
+                from argocd_migrator.memory import iter_memory_report
+
+                typer.echo("\nMemory by stage (traced Python allocations):")
+                for line in iter_memory_report(memory):
+                    typer.echo(f"  {line}")
+            try:
+                memory.write_json(memory_profile)
+            except MigratorError as e:
+                typer.echo(f"Warning: {e}", err=True)
+
+        if trace is not None and trace_file is not None:
+            try:
+                trace.write(trace_file)
+                if not quiet:
+                    typer.echo(f"\nTrace with {len(trace)} spans written to {trace_file}")
+            except MigratorError as e:
+                typer.echo(f"Warning: {e}", err=True)
+
         # Display failures
         if result.failed > 0 and not quiet:
             typer.echo("\nFailed transformations:")
@@ -117,13 +657,426 @@ def migrate(
                 if not r.success:
                     typer.echo(f"  ✗ {r.source_file}: {r.error}")
 
+        # Display per-file write failures
+        write_failures = [w for w in result.per_file_results if not w.success]
+        if write_failures and not quiet:
+            typer.echo("\nFailed per-file writes:")
+            for w in write_failures:
+                typer.echo(f"  ✗ {w.output_file}: {w.error}")
+
+        if result.error_report and not quiet:
+            typer.echo(f"\nError report written to {result.error_report}")
+        if blocks is not None and result.output_file and not quiet:
+            _report_blocks(blocks)
+
         # Exit with appropriate code
-        if result.failed > 0 or not result.output_file:
+        if result.failed > 0 or not result.output_file or write_failures:
             raise typer.Exit(code=1)
         else:
-            typer.echo(f"\n✓ Successfully generated {output_file}")
+            if shard is not None:
+                typer.echo(f"\n✓ Wrote shard {shard} partial result to {output_file}")
+            else:
+                typer.echo(f"\n✓ Successfully generated {output_file}")
             raise typer.Exit(code=0)
 
+    except (typer.Exit, typer.BadParameter):
+        raise
+    except MigratorError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1)
+    except Exception as e:
+        typer.echo(f"Unexpected error: {e}", err=True)
+        raise typer.Exit(code=2)
+
+
+def _report_blocks(blocks: "BlockStore") -> None:
+    """Print what --externalize-blocks moved into the sidecar directory."""
+    typer.echo(
+        f"\nExternalized {blocks.refs} blocks ({blocks.bytes_externalized:,} bytes) as "
+        f"{blocks.blocks_written} new files in {blocks.directory}"
+    )
+
+
+def _kube_source(
+    server: str,
+    token: str | None,
+    namespaces: list[str] | None,
+    page_size: int,
+    ca_file: Path | None,
+    insecure: bool,
+    jobs: int | None,
+) -> "KubeSource":
+    """Build the KubeSource for ``migrate --kube-server``."""
+    from argocd_migrator.kube import DEFAULT_CONCURRENCY, KubeSource
+
+    settings: dict[str, Any] = {
+        "namespaces": namespaces or [],
+        "page_size": page_size,
+        "concurrency": jobs if jobs is not None else DEFAULT_CONCURRENCY,
+        "insecure": insecure,
+    }
+    if ca_file is not None:
+        settings["ca_file"] = ca_file
+    if server != "in-cluster":
+        return KubeSource(server=server, token=token, **settings)
+    try:
+        source = KubeSource.in_cluster(**settings)
+    except KubeApiError as e:
+        raise typer.BadParameter(str(e), param_hint="'--kube-server'") from e
+    if token is not None:
+        source.token = token
+    return source
+
+
+def _migrate_stream(
+    input_path: "Path | KubeSource",
+    output_file: Path,
+    validate: bool,
+    policy: ExecutionPolicy,
+    error_report: Path | None,
+    backend: ExecutorBackend,
+    jobs: int | None,
+    file_timeout: float,
+    metrics_json: Path | None,
+    metrics_prom: Path | None,
+    quiet: bool,
+) -> NoReturn:
+    """
+    Run ``migrate`` on stdin, an archive or a cluster, and/or with NDJSON output on stdout.
+
+    Human-readable output goes to stderr so stdout carries only NDJSON.
+
+    Raises:
+        typer.Exit: Always, with the command's exit code
+    """
+    try:
+        from argocd_migrator.streaming import (
+            iter_archive,
+            iter_cluster,
+            iter_documents,
+            iter_pipeline,
+        )
+
+        ndjson = sys.stdout.buffer if output_file == STDIO else None
+        target = None if ndjson is not None else output_file
+        if not quiet:
+            source = "stdin" if input_path == STDIO else input_path
+            if not isinstance(input_path, Path):
+                source = input_path.server
+            sink = "stdout (NDJSON)" if ndjson is not None else output_file
+            typer.echo(f"Migrating ArgoCD Applications from {source} to {sink}", err=True)
+
+        if input_path == STDIO or not isinstance(input_path, Path):
+            if isinstance(input_path, Path):
+                documents = iter_documents(
+                    sys.stdin.buffer,
+                    target,
+                    ndjson,
+                    validate=validate,
+                    policy=policy,
+                    error_report=error_report,
+                )
+            else:
+                documents = iter_cluster(
+                    input_path,
+                    target,
+                    ndjson,
+                    validate=validate,
+                    policy=policy,
+                    error_report=error_report,
+                )
+            for _ in documents:
+                pass
+            result = documents.result
+        else:
+            workers = jobs if jobs is not None else default_jobs()
+            run = iter_archive if input_path.is_file() else iter_pipeline
+            _warn_unenforced_timeout(file_timeout, backend, workers)
+            with create_executor(backend, workers, file_timeout or None) as pool:
+                stream = run(
+                    input_path,
+                    target,
+                    validate=validate,
+                    executor=pool,
+                    policy=policy,
+                    error_report=error_report,
+                    keep_configs=False,
+                    ndjson=ndjson,
+                )
+                for _ in stream:
+                    pass
+            result = stream.result
+        assert result is not None
+
+        if not quiet:
+            typer.echo(
+                f"\nMigrated {result.successful}/{result.total} applications, "
+                f"{result.failed} failed",
+                err=True,
+            )
+            for r in result.results:
+                typer.echo(f"  ✗ {r.source_file}: {r.error}", err=True)
+            if result.error_report:
+                typer.echo(f"Error report written to {result.error_report}", err=True)
+        if result.metrics is not None:
+            try:
+                if metrics_json is not None:
+                    result.metrics.write_json(metrics_json)
+                if metrics_prom is not None:
+                    result.metrics.write_prometheus(metrics_prom)
+            except MigratorError as e:
+                typer.echo(f"Warning: {e}", err=True)
+
+        failed = result.failed > 0 or (target is not None and result.output_file is None)
+        raise typer.Exit(code=1 if failed else 0)
+
+    except typer.Exit:
+        raise
+    except BrokenPipeError:
+        # The reader closed stdout (e.g. `| head`); stop quietly like other Unix tools
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        raise typer.Exit(code=1)
+    except MigratorError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1)
+    except Exception as e:
+        typer.echo(f"Unexpected error: {e}", err=True)
+        raise typer.Exit(code=2)
+
+
+@app.command()
+def batch(
+    jobs_file: Annotated[
+        Path,
+        typer.Argument(
+            help="TOML file listing [[job]] tables with input_path and output_file",
+            exists=True,
+            file_okay=True,
+            dir_okay=False,
+        ),
+    ],
+    jobs: Annotated[
+        int | None,
+        typer.Option(
+            "--jobs",
+            "-j",
+            help="Number of parallel workers shared by all jobs "
+            "(default: the file's workers, else CPU count)",
+            min=1,
+        ),
+    ] = None,
+    executor: Annotated[
+        ExecutorBackend | None,
+        typer.Option(
+            "--executor",
+            help="Executor backend shared by all jobs (default: the file's executor)",
+        ),
+    ] = None,
+    file_timeout: Annotated[
+        float,
+        typer.Option(
+            "--file-timeout",
+            help="Fail a file whose processing takes longer than this many seconds "
+            "(0: no limit; enforced by the serial and process executors)",
+            min=0,
+        ),
+    ] = DEFAULT_FILE_TIMEOUT,
+    verbose: Annotated[
+        bool,
+        typer.Option(
+            "--verbose",
+            "-v",
+            help="Enable verbose output",
+        ),
+    ] = False,
+    quiet: Annotated[
+        bool,
+        typer.Option(
+            "--quiet",
+            "-q",
+            help="Suppress all output except errors",
+        ),
+    ] = False,
+) -> None:
+    """
+    Run many migration jobs in one process.
+
+    All jobs share one worker pool and its per-process content caches, so
+    repeated files and later jobs skip parsing and start-up costs.
+    """
+    setup_logging(verbose, quiet)
+
+    try:
+        from argocd_migrator.batch import load_batch_file, run_batch
+
+        batch_file = load_batch_file(jobs_file)
+        backend = executor if executor is not None else batch_file.executor
+        workers = jobs or batch_file.workers or default_jobs()
+        if not quiet:
+            typer.echo(f"Running {len(batch_file.jobs)} jobs from {jobs_file} ({workers} workers)")
+
+        _warn_unenforced_timeout(file_timeout, backend, workers)
+        failed_jobs = 0
+        with create_executor(backend, workers, file_timeout or None) as pool:
+            for outcome in run_batch(batch_file.jobs, pool):
+                if not outcome.success:
+                    failed_jobs += 1
+                if quiet and outcome.success:
+                    continue
+                mark = "✓" if outcome.success else "✗"
+                if outcome.result is None:
+                    detail = f"error: {outcome.error}"
+                else:
+                    detail = (
+                        f"{outcome.result.successful}/{outcome.result.total} succeeded, "
+                        f"{outcome.result.failed} failed"
+                    )
+                    if outcome.result.output_file is not None:
+                        detail += f" -> {outcome.result.output_file}"
+                typer.echo(f"  {mark} {outcome.job.name}: {detail} ({outcome.seconds:.2f}s)")
+
+        if failed_jobs:
+            typer.echo(f"\n{failed_jobs}/{len(batch_file.jobs)} jobs failed", err=True)
+            raise typer.Exit(code=1)
+        if not quiet:
+            typer.echo(f"\n✓ All {len(batch_file.jobs)} jobs succeeded")
+
+    except typer.Exit:
+        raise
+    except MigratorError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1)
+    except Exception as e:
+        typer.echo(f"Unexpected error: {e}", err=True)
+        raise typer.Exit(code=2)
+
+
+@app.command()
+def merge(
+    partials: Annotated[
+        list[Path],
+        typer.Argument(
+            help="Partial result files written by 'migrate --shard', one per shard",
+            exists=True,
+            dir_okay=False,
+        ),
+    ],
+    output_file: Annotated[
+        Path,
+        typer.Option(
+            "--output-file",
+            "-o",
+            help="Output file path for aggregated config.json",
+        ),
+    ] = Path("config.json"),
+    no_validate: Annotated[
+        bool,
+        typer.Option(
+            "--no-validate",
+            help="Skip aggregated config validation",
+        ),
+    ] = False,
+    on_error: Annotated[
+        ExecutionPolicy,
+        typer.Option(
+            "--on-error",
+            help="Error policy: continue writes successful configs plus an error "
+            "report; any other policy writes nothing if a shard recorded failures",
+            parser=_parse_policy,
+            metavar="POLICY",
+        ),
+    ] = "collect",  # type: ignore[assignment]
+    error_report: Annotated[
+        Path | None,
+        typer.Option(
+            "--error-report",
+            help="Error report path for --on-error continue (default: <output stem>.errors.json)",
+        ),
+    ] = None,
+    externalize_blocks: Annotated[
+        bool,
+        typer.Option(
+            "--externalize-blocks",
+            help="Write helm/kustomize blocks larger than --block-threshold once, by "
+            "content hash, to <output stem>.blocks/ and reference them from the "
+            "config ('expand' restores the full configs)",
+        ),
+    ] = False,
+    block_threshold: Annotated[
+        int,
+        typer.Option(
+            "--block-threshold",
+            help="Smallest JSON size in bytes of an externalized block, exclusive",
+            min=0,
+        ),
+    ] = 1024,
+    verbose: Annotated[
+        bool,
+        typer.Option(
+            "--verbose",
+            "-v",
+            help="Enable verbose output",
+        ),
+    ] = False,
+    quiet: Annotated[
+        bool,
+        typer.Option(
+            "--quiet",
+            "-q",
+            help="Suppress all output except errors",
+        ),
+    ] = False,
+) -> None:
+    """
+    Merge the partial results of a sharded run into one config.json.
+
+    Every shard of the run must be given. The output is byte-identical to running
+    'migrate' on the whole directory on one node.
+    """
+    setup_logging(verbose, quiet)
+
+    try:
+        from argocd_migrator.pipeline import merge_shards
+
+        if not quiet:
+            typer.echo(f"Merging {len(partials)} shard partials into {output_file}")
+        blocks = None
+        if externalize_blocks:
+            from argocd_migrator.sidecar import BlockStore
+
+            blocks = BlockStore.for_output(output_file, block_threshold)
+        result = merge_shards(
+            partials,
+            output_file,
+            validate=not no_validate,
+            policy=on_error,
+            error_report=error_report,
+            blocks=blocks,
+        )
+
+        if not quiet:
+            typer.echo("\nMerge Summary:")
+            typer.echo(f"  Total applications: {result.total}")
+            typer.echo(f"  Successfully transformed: {result.successful}")
+            typer.echo(f"  Failed: {result.failed}")
+            if result.skipped:
+                typer.echo(f"  Skipped (cancelled): {result.skipped}")
+            if result.failed > 0:
+                typer.echo("\nFailed transformations:")
+                for r in result.results:
+                    if not r.success:
+                        typer.echo(f"  ✗ {r.source_file}: {r.error}")
+            if result.error_report:
+                typer.echo(f"\nError report written to {result.error_report}")
+            if blocks is not None and result.output_file:
+                _report_blocks(blocks)
+
+        if result.failed > 0 or result.skipped or not result.output_file:
+            raise typer.Exit(code=1)
+        if not quiet:
+            typer.echo(f"\n✓ Successfully generated {output_file}")
+
     except typer.Exit:
         raise
     except MigratorError as e:
@@ -134,6 +1087,452 @@ def migrate(
         raise typer.Exit(code=2)
 
 
+@app.command()
+def expand(
+    config_file: Annotated[
+        Path,
+        typer.Argument(
+            help="config.json written with --externalize-blocks",
+            exists=True,
+            dir_okay=False,
+        ),
+    ],
+    output_file: Annotated[
+        Path,
+        typer.Option(
+            "--output-file",
+            "-o",
+            help="Where to write the full config.json",
+        ),
+    ],
+    quiet: Annotated[
+        bool,
+        typer.Option(
+            "--quiet",
+            "-q",
+            help="Suppress all output except errors",
+        ),
+    ] = False,
+) -> None:
+    """
+    Inline the sidecar blocks referenced by an externalized config.json.
+
+    The result is byte-identical to running 'migrate' without --externalize-blocks.
+    """
+    setup_logging(False, quiet)
+
+    try:
+        from argocd_migrator.aggregator import serialize_config_fragment, write_config_fragments
+        from argocd_migrator.sidecar import load_configs
+
+        configs = load_configs(config_file)
+        write_config_fragments((serialize_config_fragment(c) for c in configs), output_file)
+        if not quiet:
+            typer.echo(f"✓ Expanded {len(configs)} configs to {output_file}")
+
+    except MigratorError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1)
+    except Exception as e:
+        typer.echo(f"Unexpected error: {e}", err=True)
+        raise typer.Exit(code=2)
+
+
+@app.command("gen-corpus")
+def gen_corpus(
+    output_dir: Annotated[
+        Path,
+        typer.Argument(help="Directory to create (must be missing or empty)"),
+    ],
+    apps: Annotated[
+        int,
+        typer.Option("--apps", "-n", help="Number of Applications to generate", min=0),
+    ] = 1000,
+    seed: Annotated[
+        int,
+        typer.Option("--seed", help="Random seed; the same seed and options give identical files"),
+    ] = 0,
+    depth: Annotated[
+        int,
+        typer.Option("--depth", help="Directory levels below the output directory", min=0),
+    ] = 2,
+    fanout: Annotated[
+        int,
+        typer.Option("--fanout", help="Subdirectories per directory level", min=1),
+    ] = 8,
+    mix: Annotated[
+        str,
+        typer.Option("--mix", help="Relative weights of source kinds"),
+    ] = "helm=5,kustomize=3,directory=2",
+    labels: Annotated[
+        str,
+        typer.Option("--labels", help="Extra labels per app, as N or LOW-HIGH"),
+    ] = "1-6",
+    annotations: Annotated[
+        str,
+        typer.Option("--annotations", help="Annotations per app, as N or LOW-HIGH"),
+    ] = "0-4",
+    values_keys: Annotated[
+        str,
+        typer.Option("--values-keys", help="Inline Helm values keys per app, as N or LOW-HIGH"),
+    ] = "0-40",
+    large_values_rate: Annotated[
+        float,
+        typer.Option(
+            "--large-values-rate",
+            help="Fraction of Helm apps with --large-values-keys values instead",
+            min=0,
+            max=1,
+        ),
+    ] = 0.0,
+    large_values_keys: Annotated[
+        int,
+        typer.Option("--large-values-keys", help="Values keys of a large Helm app", min=0),
+    ] = 5000,
+    bundle_rate: Annotated[
+        float,
+        typer.Option(
+            "--bundle-rate",
+            help="Fraction of apps written into multi-document bundles",
+            min=0,
+            max=1,
+        ),
+    ] = 0.0,
+    bundle_size: Annotated[
+        int,
+        typer.Option("--bundle-size", help="Documents per bundle", min=2),
+    ] = 5,
+    noise_rate: Annotated[
+        float,
+        typer.Option(
+            "--noise-rate", help="Non-Application manifests per Application", min=0
+        ),
+    ] = 0.0,
+    duplicate_rate: Annotated[
+        float,
+        typer.Option(
+            "--duplicate-rate",
+            help="Fraction of apps written as byte-identical copies of earlier files",
+            min=0,
+            max=1,
+        ),
+    ] = 0.0,
+    quiet: Annotated[
+        bool,
+        typer.Option(
+            "--quiet",
+            "-q",
+            help="Suppress all output except errors",
+        ),
+    ] = False,
+) -> None:
+    """
+    Generate a deterministic synthetic corpus of Applications for scale testing.
+
+    Bundles and noise files are reported as failed files by migrate, so run
+    corpora that contain them with --on-error continue.
+    """
+    setup_logging(False, quiet)
+
+    try:
+        from argocd_migrator.corpus import CorpusSpec, generate_corpus, parse_mix, parse_range
+
+        spec = CorpusSpec(
+            apps=apps,
+            seed=seed,
+            depth=depth,
+            fanout=fanout,
+            source_mix=parse_mix(mix),
+            labels=parse_range(labels),
+            annotations=parse_range(annotations),
+            values_keys=parse_range(values_keys),
+            large_values_rate=large_values_rate,
+            large_values_keys=large_values_keys,
+            bundle_rate=bundle_rate,
+            bundle_size=bundle_size,
+            noise_rate=noise_rate,
+            duplicate_rate=duplicate_rate,
+        )
+        stats = generate_corpus(output_dir, spec)
+
+        if not quiet:
+            sources = ", ".join(f"{count} {kind}" for kind, count in stats.sources.items())
+            typer.echo(f"\nGenerated corpus in {output_dir} (seed {seed}):")
+            typer.echo(f"  Files: {stats.files} ({stats.bytes_written / 1_000_000:.1f} MB)")
+            typer.echo(f"  Applications: {stats.applications} ({sources})")
+            typer.echo(f"  Duplicates: {stats.duplicates}")
+            typer.echo(f"  Bundles: {stats.bundles}")
+            typer.echo(f"  Noise files: {stats.noise_files}")
+            if stats.expected_failures:
+                typer.echo(
+                    f"  Expected failed files: {stats.expected_failures} "
+                    "(use --on-error continue)"
+                )
+
+    except MigratorError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1)
+    except Exception as e:
+        typer.echo(f"Unexpected error: {e}", err=True)
+        raise typer.Exit(code=2)
+
+
+@app.command()
+def serve(
+    socket_path: Annotated[
+        Path,
+        typer.Option(
+            "--socket",
+            "-s",
+            help="Unix socket to listen on",
+            envvar=SOCKET_ENVVAR,
+        ),
+    ],
+    jobs: Annotated[
+        int | None,
+        typer.Option(
+            "--jobs",
+            "-j",
+            help="Number of parallel workers kept warm (default: CPU count)",
+            min=1,
+        ),
+    ] = None,
+    executor: Annotated[
+        ExecutorBackend,
+        typer.Option(
+            "--executor",
+            help="Executor backend for parallel work",
+        ),
+    ] = ExecutorBackend.PROCESS,
+    file_timeout: Annotated[
+        float,
+        typer.Option(
+            "--file-timeout",
+            help="Fail a file whose processing takes longer than this many seconds "
+            "(0: no limit; enforced by the serial and process executors)",
+            min=0,
+        ),
+    ] = DEFAULT_FILE_TIMEOUT,
+    verbose: Annotated[
+        bool,
+        typer.Option(
+            "--verbose",
+            "-v",
+            help="Enable verbose output",
+        ),
+    ] = False,
+    quiet: Annotated[
+        bool,
+        typer.Option(
+            "--quiet",
+            "-q",
+            help="Suppress all output except errors",
+        ),
+    ] = False,
+) -> None:
+    """
+    Run a warm migration daemon on a Unix socket.
+
+    The interpreter, worker pool and content caches stay loaded between requests.
+    Send requests with the ``client`` commands; ``client stop`` shuts the daemon
+    down.
+    """
+    setup_logging(verbose, quiet)
+
+    try:
+        from argocd_migrator.daemon import serve as serve_daemon
+
+        workers = jobs if jobs is not None else default_jobs()
+        _warn_unenforced_timeout(file_timeout, executor, workers)
+        with create_executor(executor, workers, file_timeout or None) as pool:
+            daemon = serve_daemon(socket_path, pool)
+        if not quiet:
+            typer.echo(f"Daemon stopped after {daemon.requests} requests")
+
+    except KeyboardInterrupt:
+        raise typer.Exit(code=130)
+    except MigratorError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1)
+    except Exception as e:
+        typer.echo(f"Unexpected error: {e}", err=True)
+        raise typer.Exit(code=2)
+
+
+client_app = typer.Typer(
+    help="Send requests to a daemon started with `serve`",
+    no_args_is_help=True,
+)
+app.add_typer(client_app, name="client")
+
+_SocketOption = Annotated[
+    Path,
+    typer.Option(
+        "--socket",
+        "-s",
+        help="Unix socket of the daemon",
+        envvar=SOCKET_ENVVAR,
+    ),
+]
+_InputPathOption = Annotated[
+    Path,
+    typer.Option(
+        "--input-path",
+        "-i",
+        help="Input directory containing ArgoCD Application YAML files",
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+    ),
+]
+_OutputFileOption = Annotated[
+    Path,
+    typer.Option(
+        "--output-file",
+        "-o",
+        help="Output file path for aggregated config.json",
+    ),
+]
+_NoValidateOption = Annotated[
+    bool,
+    typer.Option(
+        "--no-validate",
+        help="Skip aggregated config validation",
+    ),
+]
+
+
+def _send(socket_path: Path, command: str, params: dict[str, Any] | None = None) -> Any:
+    """Send a daemon request, turning failures into a CLI error exit."""
+    from argocd_migrator.client import request
+
+    try:
+        return request(socket_path, command, params)
+    except MigratorError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1)
+
+
+def _echo_remote_summary(result: dict[str, Any], quiet: bool) -> None:
+    """Print the summary and failures of a daemon pipeline result."""
+    if not quiet:
+        typer.echo(
+            f"{result['successful']}/{result['total']} succeeded, {result['failed']} failed "
+            f"({result['seconds'] * 1000:.0f} ms)"
+        )
+        for failure in result["failures"]:
+            typer.echo(f"  ✗ {failure['file']}: {failure['error']}")
+
+
+@client_app.command("migrate")
+def client_migrate(
+    socket_path: _SocketOption,
+    input_path: _InputPathOption,
+    output_file: _OutputFileOption = Path("config.json"),
+    no_validate: _NoValidateOption = False,
+    on_error: Annotated[
+        str,
+        typer.Option(
+            "--on-error",
+            help="Error policy: collect, fail-fast, max-errors=N, or continue",
+            metavar="POLICY",
+        ),
+    ] = "collect",
+    error_report: Annotated[
+        Path | None,
+        typer.Option(
+            "--error-report",
+            help="Error report path for --on-error continue",
+        ),
+    ] = None,
+    serialize_in_workers: Annotated[
+        bool,
+        typer.Option(
+            "--serialize-in-workers",
+            help="Serialize configs to JSON inside workers and merge byte fragments",
+        ),
+    ] = False,
+    quiet: Annotated[
+        bool,
+        typer.Option(
+            "--quiet",
+            "-q",
+            help="Suppress all output except errors",
+        ),
+    ] = False,
+) -> None:
+    """Migrate a directory through the daemon."""
+    result = _send(
+        socket_path,
+        "migrate",
+        {
+            "input_path": str(input_path.resolve()),
+            "output_file": str(output_file.resolve()),
+            "validate": not no_validate,
+            "on_error": on_error,
+            "error_report": str(error_report.resolve()) if error_report else None,
+            "serialize_in_workers": serialize_in_workers,
+        },
+    )
+    _echo_remote_summary(result, quiet)
+    if result["failed"] or not result["output_file"]:
+        raise typer.Exit(code=1)
+    if not quiet:
+        typer.echo(f"✓ Successfully generated {result['output_file']}")
+
+
+@client_app.command("validate")
+def client_validate(socket_path: _SocketOption, input_path: _InputPathOption) -> None:
+    """Check that every file in a directory migrates cleanly, writing nothing."""
+    result = _send(socket_path, "validate", {"input_path": str(input_path.resolve())})
+    _echo_remote_summary(result, quiet=False)
+    if result["failed"]:
+        raise typer.Exit(code=1)
+
+
+@client_app.command("diff")
+def client_diff(
+    socket_path: _SocketOption,
+    input_path: _InputPathOption,
+    output_file: _OutputFileOption = Path("config.json"),
+    no_validate: _NoValidateOption = False,
+) -> None:
+    """Show how a fresh migration differs from the existing output file."""
+    result = _send(
+        socket_path,
+        "diff",
+        {
+            "input_path": str(input_path.resolve()),
+            "output_file": str(output_file.resolve()),
+            "validate": not no_validate,
+        },
+    )
+    if result["failed"] or "changed" not in result:
+        _echo_remote_summary(result, quiet=False)
+        raise typer.Exit(code=1)
+    if result["changed"]:
+        typer.echo(result["diff"], nl=False)
+        raise typer.Exit(code=1)
+
+
+@client_app.command("ping")
+def client_ping(socket_path: _SocketOption) -> None:
+    """Show the daemon's status."""
+    result = _send(socket_path, "ping")
+    typer.echo(
+        f"argocd-migrator {result['version']} daemon (pid {result['pid']}): "
+        f"{result['requests']} requests, {result['jobs']} {result['executor']} workers, "
+        f"up {result['uptime_seconds']:.0f}s"
+    )
+
+
+@client_app.command("stop")
+def client_stop(socket_path: _SocketOption) -> None:
+    """Shut the daemon down."""
+    result = _send(socket_path, "shutdown")
+    typer.echo(f"Stopped daemon (pid {result['pid']})")
+
+
 @app.command()
 def version() -> None:
     """Display version information."""
@@ -0,0 +1,61 @@
+"""
+Client for the migration daemon (see ``argocd_migrator.daemon``).
+
+Kept free of pipeline imports so client invocations start quickly.
+"""
+
+import json
+import socket
+from pathlib import Path
+from typing import Any
+
+from argocd_migrator.exceptions import DaemonError
+
+# Largest request the daemon accepts
+MAX_REQUEST_BYTES = 1024 * 1024
+DEFAULT_CLIENT_TIMEOUT = 300.0
+
+
+def request(
+    socket_path: str | Path,
+    command: str,
+    params: dict[str, Any] | None = None,
+    timeout: float | None = DEFAULT_CLIENT_TIMEOUT,
+) -> dict[str, Any]:
+    """
+    Send one request to a daemon and return its result.
+
+    Args:
+        socket_path: Path of the daemon's Unix socket
+        command: Command name
+        params: Command parameters (paths must be absolute)
+        timeout: Seconds to wait for the response (None: wait indefinitely)
+
+    Returns:
+        The ``result`` object of a successful response
+
+    Raises:
+        DaemonError: If the daemon is unreachable, the response is malformed, or
+            the request failed
+    """
+    payload = json.dumps({"command": command, "params": params or {}}).encode("utf-8")
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(socket_path))
+            sock.sendall(payload + b"\n")
+            with sock.makefile("rb") as f:
+                line = f.readline()
+    except OSError as e:
+        raise DaemonError(f"Cannot reach daemon at {socket_path}: {e}") from e
+
+    try:
+        response = json.loads(line)
+    except ValueError as e:
+        raise DaemonError(f"Invalid response from daemon at {socket_path}: {e}") from e
+    if not isinstance(response, dict):
+        raise DaemonError(f"Invalid response from daemon at {socket_path}")
+    if not response.get("ok"):
+        raise DaemonError(str(response.get("error", "Request failed")))
+    result: dict[str, Any] = response.get("result", {})
+    return result
@@ -0,0 +1,326 @@
+"""
+Seeded synthetic corpus generator for scale testing.
+
+Every choice is drawn from one ``random.Random(seed)`` in a fixed order and the
+YAML is written from templates, so the same spec produces byte-identical files on
+every machine, which keeps benchmark inputs comparable across hosts and commits.
+"""
+
+import logging
+import random
+import shutil
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from argocd_migrator.exceptions import CorpusError
+
+logger = logging.getLogger(__name__)
+
+SOURCE_KINDS = ("helm", "kustomize", "directory")
+
+_CLUSTERS = (
+    "https://kubernetes.default.svc",
+    "https://prod-eu-1.example.com:6443",
+    "https://prod-us-1.example.com:6443",
+    "https://staging.example.com:6443",
+)
+_REVISIONS = ("main", "HEAD", "v1.4.2", "release-2024.06")
+_NOISE_KINDS = ("ConfigMap", "Secret")
+
+
+@dataclass
+class CorpusSpec:
+    """
+    Shape of a synthetic corpus.
+
+    Ranges are inclusive ``(low, high)`` pairs sampled uniformly per application.
+    Rates are probabilities in ``[0, 1]``, except ``noise_rate``, which is the
+    number of noise files per application.
+    """
+
+    apps: int = 1000
+    seed: int = 0
+    depth: int = 2
+    fanout: int = 8
+    source_mix: dict[str, float] = field(
+        default_factory=lambda: {"helm": 0.5, "kustomize": 0.3, "directory": 0.2}
+    )
+    labels: tuple[int, int] = (1, 6)
+    annotations: tuple[int, int] = (0, 4)
+    values_keys: tuple[int, int] = (0, 40)
+    large_values_rate: float = 0.0
+    large_values_keys: int = 5000
+    bundle_rate: float = 0.0
+    bundle_size: int = 5
+    noise_rate: float = 0.0
+    duplicate_rate: float = 0.0
+
+    def check(self) -> None:
+        """
+        Validate the spec.
+
+        Raises:
+            CorpusError: If a count, range, rate or source kind is invalid
+        """
+        if self.apps < 0 or self.depth < 0 or self.fanout < 1 or self.bundle_size < 2:
+            raise CorpusError("apps and depth must be >= 0, fanout >= 1 and bundle size >= 2")
+        for name in ("labels", "annotations", "values_keys"):
+            low, high = getattr(self, name)
+            if not 0 <= low <= high:
+                raise CorpusError(f"Invalid {name} range: {low}-{high}")
+        for name in ("large_values_rate", "bundle_rate", "duplicate_rate"):
+            if not 0.0 <= getattr(self, name) <= 1.0:
+                raise CorpusError(f"{name} must be between 0 and 1")
+        if self.noise_rate < 0 or self.large_values_keys < 0:
+            raise CorpusError("noise_rate and large_values_keys must be >= 0")
+        unknown = set(self.source_mix) - set(SOURCE_KINDS)
+        if unknown:
+            raise CorpusError(f"Unknown source kinds: {', '.join(sorted(unknown))}")
+        if any(w < 0 for w in self.source_mix.values()) or sum(self.source_mix.values()) <= 0:
+            raise CorpusError("Source mix weights must be >= 0 and not all zero")
+
+
+@dataclass
+class CorpusStats:
+    """Summary of a generated corpus."""
+
+    files: int = 0
+    applications: int = 0
+    bundles: int = 0
+    noise_files: int = 0
+    duplicates: int = 0
+    bytes_written: int = 0
+    sources: dict[str, int] = field(default_factory=lambda: dict.fromkeys(SOURCE_KINDS, 0))
+
+    @property
+    def expected_failures(self) -> int:
+        """Files the pipeline reports as failed: bundles and noise files."""
+        return self.bundles + self.noise_files
+
+
+def parse_range(value: str) -> tuple[int, int]:
+    """
+    Parse ``"N"`` or ``"LOW-HIGH"`` into an inclusive range.
+
+    Args:
+        value: Range text
+
+    Returns:
+        ``(low, high)`` tuple
+
+    Raises:
+        CorpusError: If the text is not a valid range
+    """
+    low, _, high = value.partition("-")
+    try:
+        bounds = (int(low), int(high or low))
+    except ValueError as e:
+        raise CorpusError(f"Invalid range {value!r}: expected N or LOW-HIGH") from e
+    if not 0 <= bounds[0] <= bounds[1]:
+        raise CorpusError(f"Invalid range {value!r}: expected 0 <= LOW <= HIGH")
+    return bounds
+
+
+def parse_mix(value: str) -> dict[str, float]:
+    """
+    Parse a source mix such as ``"helm=5,kustomize=3,directory=2"``.
+
+    Args:
+        value: Comma-separated ``kind=weight`` pairs
+
+    Returns:
+        Mapping of source kind to weight
+
+    Raises:
+        CorpusError: If a pair is malformed
+    """
+    mix: dict[str, float] = {}
+    for pair in value.split(","):
+        kind, sep, weight = pair.strip().partition("=")
+        try:
+            if not sep:
+                raise ValueError
+            mix[kind] = float(weight)
+        except ValueError as e:
+            raise CorpusError(f"Invalid source mix entry {pair!r}: expected kind=weight") from e
+    return mix
+
+
+def generate_corpus(output_dir: str | Path, spec: CorpusSpec) -> CorpusStats:
+    """
+    Write a synthetic corpus of Application manifests.
+
+    Applications are spread over ``fanout ** depth`` leaf directories. Depending on
+    the spec, some are written as byte-identical copies of earlier files, some are
+    grouped into multi-document bundles, and unrelated Kubernetes manifests are
+    added as noise. The pipeline reports bundles and noise files as failed files,
+    so run corpora that contain them with ``--on-error continue``.
+
+    Args:
+        output_dir: Directory to create; must be missing or empty
+        spec: Corpus shape
+
+    Returns:
+        CorpusStats describing what was written
+
+    Raises:
+        CorpusError: If the spec is invalid or the directory is not empty or writable
+    """
+    spec.check()
+    root = Path(output_dir)
+    if root.exists() and (not root.is_dir() or any(root.iterdir())):
+        raise CorpusError(f"Output directory is not empty: {output_dir}")
+
+    rng = random.Random(spec.seed)
+    directories = _leaf_directories(spec.depth, spec.fanout)
+    kinds = list(spec.source_mix)
+    weights = [spec.source_mix[kind] for kind in kinds]
+    stats = CorpusStats()
+    singles: list[Path] = []
+    bundle: list[str] = []
+
+    def write(relative: Path, text: str) -> Path:
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = text.encode("utf-8")
+        path.write_bytes(data)
+        stats.files += 1
+        stats.bytes_written += len(data)
+        return path
+
+    def flush_bundle(directory: Path) -> None:
+        write(directory / f"bundle-{stats.bundles:06d}.yaml", "---\n".join(bundle))
+        stats.bundles += 1
+        bundle.clear()
+
+    try:
+        for index in range(spec.apps):
+            directory = directories[rng.randrange(len(directories))]
+            stats.applications += 1
+
+            if singles and rng.random() < spec.duplicate_rate:
+                original = singles[rng.randrange(len(singles))]
+                target = root / directory / f"app-{index:06d}.yaml"
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(original, target)
+                stats.files += 1
+                stats.duplicates += 1
+                stats.bytes_written += target.stat().st_size
+                continue
+
+            kind = rng.choices(kinds, weights)[0]
+            stats.sources[kind] += 1
+            text = _application(rng, index, kind, spec)
+            if rng.random() < spec.bundle_rate:
+                bundle.append(text)
+                if len(bundle) == spec.bundle_size:
+                    flush_bundle(directory)
+                continue
+            singles.append(write(directory / f"app-{index:06d}.yaml", text))
+
+        if bundle:
+            flush_bundle(directories[rng.randrange(len(directories))])
+
+        for index in range(round(spec.noise_rate * spec.apps)):
+            directory = directories[rng.randrange(len(directories))]
+            write(directory / f"noise-{index:06d}.yaml", _noise(rng, index))
+            stats.noise_files += 1
+    except OSError as e:
+        raise CorpusError(f"Error writing corpus to {output_dir}: {e}") from e
+
+    logger.info(
+        f"Generated {stats.applications} applications in {stats.files} files "
+        f"({stats.bytes_written} bytes) under {output_dir}"
+    )
+    return stats
+
+
+def _leaf_directories(depth: int, fanout: int) -> list[Path]:
+    """Return the ``fanout ** depth`` leaf directories of the corpus tree."""
+    directories = [Path()]
+    for level in range(depth):
+        directories = [
+            parent / f"{'group' if level == 0 else 'dir'}-{child:02d}"
+            for parent in directories
+            for child in range(fanout)
+        ]
+    return directories
+
+
+def _token(rng: random.Random) -> str:
+    """Return a random lowercase identifier fragment."""
+    return f"{rng.getrandbits(32):08x}"
+
+
+def _application(rng: random.Random, index: int, kind: str, spec: CorpusSpec) -> str:
+    """Render one Application manifest."""
+    name = f"app-{index:06d}"
+    team = f"team-{rng.randrange(24):02d}"
+    lines = [
+        "apiVersion: argoproj.io/v1alpha1",
+        "kind: Application",
+        "metadata:",
+        f"  name: {name}",
+        "  namespace: argocd",
+        "  labels:",
+        f"    team: {team}",
+    ]
+    lines += [f"    label-{i}: value-{_token(rng)}" for i in range(rng.randint(*spec.labels))]
+
+    annotations = rng.randint(*spec.annotations)
+    if annotations:
+        lines.append("  annotations:")
+        lines.append(f'    argocd.argoproj.io/sync-wave: "{rng.randrange(-5, 10)}"')
+        lines += [
+            f'    example.com/note-{i}: "generated note {_token(rng)}"'
+            for i in range(annotations - 1)
+        ]
+
+    lines += [
+        "spec:",
+        f"  project: {team}",
+        "  source:",
+        f"    repoURL: https://git.example.com/{team}/repo-{rng.randrange(50):02d}.git",
+        f"    targetRevision: {rng.choice(_REVISIONS)}",
+        f"    path: apps/{name}",
+    ]
+    if kind == "helm":
+        lines += ["    helm:", f"      releaseName: {name}"]
+        keys = (
+            spec.large_values_keys
+            if rng.random() < spec.large_values_rate
+            else rng.randint(*spec.values_keys)
+        )
+        if keys:
+            lines.append("      valuesObject:")
+            lines += [f'        key{i}: "value-{_token(rng)}"' for i in range(keys)]
+    elif kind == "kustomize":
+        lines += [
+            "    kustomize:",
+            f"      namePrefix: {team}-",
+            "      images:",
+            f"        - registry.example.com/{name}:{rng.randrange(1, 200)}.{rng.randrange(10)}",
+        ]
+    else:
+        lines += ["    directory:", "      recurse: true"]
+
+    lines += [
+        "  destination:",
+        f"    server: {rng.choice(_CLUSTERS)}",
+        f"    namespace: ns-{rng.randrange(500):03d}",
+    ]
+    if rng.random() < 0.5:
+        lines += ["  syncPolicy:", "    automated:", "      prune: true"]
+    return "\n".join(lines) + "\n"
+
+
+def _noise(rng: random.Random, index: int) -> str:
+    """Render a non-Application Kubernetes manifest."""
+    return (
+        "apiVersion: v1\n"
+        f"kind: {rng.choice(_NOISE_KINDS)}\n"
+        "metadata:\n"
+        f"  name: noise-{index:06d}\n"
+        "data:\n"
+        f"  key: value-{_token(rng)}\n"
+    )
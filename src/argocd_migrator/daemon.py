@@ -0,0 +1,283 @@
+"""
+Warm migration daemon serving requests over a Unix socket.
+
+Protocol: a client connects, sends one JSON object terminated by a newline and
+reads one JSON object back, after which the connection is closed::
+
+    -> {"command": "migrate", "params": {"input_path": "/src/apps", "output_file": "/out.json"}}
+    <- {"ok": true, "result": {"total": 3, "successful": 3, "failed": 0, ...}}
+    <- {"ok": false, "error": "Input path is not a directory: /src/apps"}
+
+Commands are ``migrate``, ``validate`` (dry run, nothing written), ``diff``
+(compare a fresh migration with an existing output file), ``ping`` and
+``shutdown``. Paths must be absolute because the daemon's working directory is
+unrelated to the client's. Requests are handled one at a time on a shared worker
+pool, so the interpreter, worker processes and content caches stay warm between
+requests.
+"""
+
+import difflib
+import json
+import logging
+import os
+import socketserver
+import stat
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from argocd_migrator import __version__
+from argocd_migrator.client import MAX_REQUEST_BYTES, request
+from argocd_migrator.exceptions import DaemonError, MigratorError
+from argocd_migrator.executor import PipelineExecutor
+from argocd_migrator.pipeline import PipelineResult, run_pipeline
+from argocd_migrator.policy import ExecutionPolicy
+from argocd_migrator.streaming import iter_pipeline
+
+logger = logging.getLogger(__name__)
+
+
+class MigrationDaemon:
+    """
+    Handle daemon requests against a shared executor.
+
+    Request handling is independent of the socket, so it can be driven directly.
+    """
+
+    def __init__(self, executor: PipelineExecutor) -> None:
+        self.executor = executor
+        self.started = time.monotonic()
+        self.requests = 0
+        self.stopping = False
+        self._handlers: dict[str, Callable[[dict[str, Any]], dict[str, Any]]] = {
+            "migrate": self.migrate,
+            "validate": self.validate,
+            "diff": self.diff,
+            "ping": self.ping,
+            "shutdown": self.shutdown,
+        }
+
+    def handle(self, request: Any) -> dict[str, Any]:
+        """
+        Dispatch one decoded request.
+
+        Args:
+            request: Decoded JSON request
+
+        Returns:
+            Response with ``ok`` and either ``result`` or ``error``
+        """
+        self.requests += 1
+        if not isinstance(request, dict) or not isinstance(request.get("params", {}), dict):
+            return {"ok": False, "error": "Request must be an object with a params object"}
+
+        command = request.get("command")
+        handler = self._handlers.get(str(command))
+        if handler is None:
+            return {"ok": False, "error": f"Unknown command: {command}"}
+
+        try:
+            return {"ok": True, "result": handler(request.get("params", {}))}
+        except (MigratorError, ValueError) as e:
+            return {"ok": False, "error": str(e)}
+        except Exception as e:
+            logger.exception("Unexpected error handling %s request", command)
+            return {"ok": False, "error": f"Internal error: {type(e).__name__}: {e}"}
+
+    def migrate(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Run the aggregated pipeline and write its output."""
+        start = time.perf_counter()
+        result = run_pipeline(
+            _input_dir(params),
+            _required_path(params, "output_file"),
+            validate=_bool_param(params, "validate", True),
+            executor=self.executor,
+            serialize_in_workers=_bool_param(params, "serialize_in_workers", False),
+            policy=ExecutionPolicy.parse(str(params.get("on_error", "collect"))),
+            error_report=_path_param(params, "error_report"),
+            content_cache=True,
+        )
+        return _summary(result, time.perf_counter() - start)
+
+    def validate(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Parse, transform and validate every file without writing anything."""
+        start = time.perf_counter()
+        stream = iter_pipeline(
+            _input_dir(params),
+            output_file=None,
+            executor=self.executor,
+            keep_configs=False,
+        )
+        for _ in stream:
+            pass
+        assert stream.result is not None
+        return _summary(stream.result, time.perf_counter() - start)
+
+    def diff(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Migrate to a temporary file and compare it with the existing output file."""
+        start = time.perf_counter()
+        output_file = _required_path(params, "output_file")
+        with tempfile.TemporaryDirectory(prefix="argocd-migrator-diff-") as tmpdir:
+            result = run_pipeline(
+                _input_dir(params),
+                Path(tmpdir) / output_file.name,
+                validate=_bool_param(params, "validate", True),
+                executor=self.executor,
+                content_cache=True,
+            )
+            summary = _summary(result, time.perf_counter() - start)
+            if result.output_file is None:
+                return summary
+            new_text = result.output_file.read_text(encoding="utf-8")
+
+        try:
+            old_text = output_file.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            old_text = ""
+        except OSError as e:
+            raise DaemonError(f"Error reading {output_file}: {e}") from e
+
+        summary["changed"] = old_text != new_text
+        summary["diff"] = "".join(
+            difflib.unified_diff(
+                old_text.splitlines(keepends=True),
+                new_text.splitlines(keepends=True),
+                fromfile=str(output_file),
+                tofile=f"{output_file} (migrated)",
+            )
+        )
+        return summary
+
+    def ping(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Report daemon status."""
+        return {
+            "pid": os.getpid(),
+            "version": __version__,
+            "uptime_seconds": round(time.monotonic() - self.started, 3),
+            "requests": self.requests,
+            "jobs": self.executor.jobs,
+            "executor": str(self.executor.backend),
+        }
+
+    def shutdown(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Stop serving after this request."""
+        self.stopping = True
+        return {"pid": os.getpid()}
+
+
+def _input_dir(params: dict[str, Any]) -> Path:
+    path = _required_path(params, "input_path")
+    if not path.is_dir():
+        raise DaemonError(f"Input path is not a directory: {path}")
+    return path
+
+
+def _required_path(params: dict[str, Any], key: str) -> Path:
+    path = _path_param(params, key)
+    if path is None:
+        raise DaemonError(f"Missing required parameter: {key}")
+    return path
+
+
+def _path_param(params: dict[str, Any], key: str) -> Path | None:
+    value = params.get(key)
+    if value is None:
+        return None
+    path = Path(str(value))
+    if not path.is_absolute():
+        raise DaemonError(f"Parameter {key} must be an absolute path: {value}")
+    return path
+
+
+def _bool_param(params: dict[str, Any], key: str, default: bool) -> bool:
+    value = params.get(key, default)
+    if not isinstance(value, bool):
+        raise ValueError(f"Parameter {key} must be a boolean: {value!r}")
+    return value
+
+
+def _summary(result: PipelineResult, seconds: float) -> dict[str, Any]:
+    return {
+        "total": result.total,
+        "successful": result.successful,
+        "failed": result.failed,
+        "skipped": result.skipped,
+        "output_file": str(result.output_file) if result.output_file else None,
+        "error_report": str(result.error_report) if result.error_report else None,
+        "failures": [
+            {"file": str(r.source_file), "error": r.error} for r in result.results if not r.success
+        ],
+        "seconds": round(seconds, 6),
+    }
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: "_DaemonServer"
+
+    def handle(self) -> None:
+        line = self.rfile.readline(MAX_REQUEST_BYTES + 1)
+        try:
+            if len(line) > MAX_REQUEST_BYTES:
+                raise ValueError(f"Request larger than {MAX_REQUEST_BYTES} bytes")
+            response = self.server.daemon.handle(json.loads(line))
+        except ValueError as e:
+            response = {"ok": False, "error": f"Invalid request: {e}"}
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+class _DaemonServer(socketserver.UnixStreamServer):
+    def __init__(self, socket_path: Path, daemon: MigrationDaemon) -> None:
+        self.daemon = daemon
+        super().__init__(str(socket_path), _RequestHandler)
+
+
+def serve(socket_path: str | Path, executor: PipelineExecutor) -> MigrationDaemon:
+    """
+    Serve requests on a Unix socket until a ``shutdown`` request arrives.
+
+    The socket is created with owner-only permissions. A stale socket file left by
+    a crashed daemon is replaced; a live daemon on the same path, or an existing
+    path that is not a socket, is an error.
+
+    Args:
+        socket_path: Path of the Unix socket to create
+        executor: Shared executor used by every request (not shut down)
+
+    Returns:
+        The daemon, with request statistics, once it has stopped
+
+    Raises:
+        DaemonError: If another daemon is listening, the path is taken by something
+            other than a socket, or the socket cannot be created
+    """
+    path = Path(socket_path)
+    if path.exists():
+        if not stat.S_ISSOCK(path.lstat().st_mode):
+            raise DaemonError(f"{path} exists and is not a socket")
+        try:
+            request(path, "ping", timeout=1.0)
+        except DaemonError:
+            path.unlink()
+        else:
+            raise DaemonError(f"A daemon is already listening on {path}")
+
+    daemon = MigrationDaemon(executor)
+    previous_umask = os.umask(0o177)
+    try:
+        server = _DaemonServer(path, daemon)
+    except OSError as e:
+        raise DaemonError(f"Cannot listen on {path}: {e}") from e
+    finally:
+        os.umask(previous_umask)
+
+    logger.info(f"Serving on {path} (pid {os.getpid()})")
+    try:
+        with server:
+            while not daemon.stopping:
+                server.handle_request()
+    finally:
+        path.unlink(missing_ok=True)
+    logger.info(f"Stopped after {daemon.requests} requests")
+    return daemon
@@ -29,3 +29,45 @@ class ValidationError(MigratorError):
     """Exception raised during JSON Schema validation."""
 
     pass
+
+
+class BatchConfigError(MigratorError):
+    """Exception raised for invalid batch job files."""
+
+    pass
+
+
+class FileTimeoutError(MigratorError):
+    """Exception raised when processing a single file exceeds its time limit."""
+
+    pass
+
+
+class DaemonError(MigratorError):
+    """Exception raised for migration daemon connection and protocol errors."""
+
+    pass
+
+
+class CorpusError(MigratorError):
+    """Exception raised for invalid synthetic corpus settings or output."""
+
+    pass
+
+
+class KubeApiError(MigratorError):
+    """Exception raised when listing Applications from a Kubernetes API server fails."""
+
+    pass
+
+
+class ShardError(MigratorError):
+    """Exception raised for invalid shard settings or partial result files."""
+
+    pass
+
+
+class JournalError(MigratorError):
+    """Exception raised when a checkpoint journal cannot be read or written."""
+
+    pass
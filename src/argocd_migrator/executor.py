@@ -0,0 +1,576 @@
+"""
+Executor backends for running per-file pipeline work serially or in parallel.
+
+Pool, multiprocessing and profiler modules are imported when first used, so
+importing this module (e.g. for the CLI's option types) stays cheap.
+"""
+
+import logging
+import math
+import os
+import signal
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable, Generator, Sequence
+from concurrent.futures import Executor, Future, as_completed
+from contextlib import closing
+from enum import StrEnum
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Protocol, Self, TypeVar
+
+from argocd_migrator.exceptions import FileTimeoutError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Number of chunks submitted per worker; more chunks balance load, fewer reduce IPC
+CHUNKS_PER_WORKER = 4
+
+# Size-aware chunks never go below this many bytes of input, so small files are
+# still batched to amortize IPC
+MIN_CHUNK_BYTES = 64 * 1024
+
+
+class _CancelFlag(Protocol):
+    def is_set(self) -> bool: ...
+
+    def set(self) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+# Cancellation flag inherited by process-pool workers through the pool initializer
+_worker_cancel_flag: _CancelFlag | None = None
+
+
+class ExecutorBackend(StrEnum):
+    """Available executor backends."""
+
+    SERIAL = "serial"
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+def default_jobs() -> int:
+    """Return the number of CPUs usable by this process."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # pragma: no cover - non-Linux platforms
+        return os.cpu_count() or 1
+
+
+class SchedulePolicy(StrEnum):
+    """Order in which pool executors hand out work."""
+
+    FIFO = "fifo"
+    SIZE = "size"
+
+
+def plan_chunks(sizes: Sequence[int], jobs: int) -> list[list[int]]:
+    """
+    Split item indices into byte-balanced chunks, largest items first.
+
+    Items are sorted by size, descending (ties keep input order). Each chunk is
+    filled up to ``remaining bytes / (jobs * CHUNKS_PER_WORKER)``, but never less
+    than MIN_CHUNK_BYTES, so early chunks are large and the tail is fine-grained.
+    Huge items therefore start first and get chunks of their own, and the small
+    items at the end keep every worker busy until the queue is empty.
+
+    Args:
+        sizes: Size in bytes of each item
+        jobs: Number of workers
+
+    Returns:
+        Chunks of item indices in submission order
+    """
+    order = sorted(range(len(sizes)), key=lambda i: -sizes[i])
+    remaining = sum(sizes)
+    divisor = max(1, jobs) * CHUNKS_PER_WORKER
+    chunks: list[list[int]] = []
+    chunk: list[int] = []
+    chunk_bytes = 0
+    target = 0.0
+    for index in order:
+        if not chunk:
+            target = max(remaining / divisor, MIN_CHUNK_BYTES)
+        chunk.append(index)
+        chunk_bytes += sizes[index]
+        if chunk_bytes >= target:
+            chunks.append(chunk)
+            remaining -= chunk_bytes
+            chunk, chunk_bytes = [], 0
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+class PipelineExecutor(ABC):
+    """
+    Runs a function over a sequence of items and yields results in input order.
+
+    Executors are context managers; leaving the context shuts down any worker pool.
+    When ``profile_dir`` is set, pool workers profile each chunk of ``map`` and dump
+    the stats there. When ``timeout`` is set, each call that runs longer raises
+    FileTimeoutError inside it (see ``call_with_timeout``).
+    """
+
+    backend: ExecutorBackend
+
+    def __init__(self, jobs: int = 1, timeout: float | None = None) -> None:
+        self.jobs = max(1, jobs)
+        self.timeout = timeout
+        self.profile_dir: Path | None = None
+
+    @abstractmethod
+    def map(
+        self,
+        fn: Callable[[T], R],
+        items: Sequence[T],
+        chunksize: int | None = None,
+        sizes: Sequence[int] | None = None,
+        on_timeout: Callable[[T, FileTimeoutError], R] | None = None,
+    ) -> Generator[R, None, None]:
+        """
+        Apply ``fn`` to every item, yielding results in the order of ``items``.
+
+        Args:
+            fn: Picklable top-level function for process backends
+            items: Work items
+            chunksize: Items per submitted batch (default: derived from jobs)
+            sizes: Input bytes per item; when given, pool executors schedule the
+                largest items first in byte-balanced chunks (see ``plan_chunks``)
+                instead of fixed-count chunks in input order. Results are still
+                yielded in input order, so completed results are buffered until
+                all earlier items are done.
+            on_timeout: Picklable function building the result for an item whose
+                FileTimeoutError escaped ``fn`` (e.g. an alarm arriving just as
+                ``fn`` returned); without it the error aborts the whole map
+
+        Returns:
+            Generator over results in input order; closing it cancels outstanding work
+        """
+
+    def map_completed(
+        self,
+        fn: Callable[[T], R],
+        items: Sequence[T],
+        chunksize: int | None = None,
+        sizes: Sequence[int] | None = None,
+        on_timeout: Callable[[T, FileTimeoutError], R] | None = None,
+    ) -> Generator[tuple[int, R], None, None]:
+        """
+        Apply ``fn`` to every item, yielding ``(index, result)`` as chunks complete.
+
+        Unlike ``map``, results of a chunk are yielded as soon as it finishes rather
+        than after every earlier item, so a consumer that stops on failures sees
+        them when they happen even under the ``size`` schedule. Each chunk's results
+        are yielded in input order; callers needing overall input order put them
+        back in place by index. Without ``sizes`` the order is the input order.
+
+        Args:
+            fn: Picklable top-level function for process backends
+            items: Work items
+            chunksize: Items per submitted batch (default: derived from jobs)
+            sizes: Input bytes per item (see ``map``)
+            on_timeout: Builds the result for an item whose FileTimeoutError
+                escaped ``fn`` (see ``map``)
+
+        Returns:
+            Generator over (index in ``items``, result) pairs; closing it cancels
+            outstanding work
+        """
+        yield from enumerate(self.map(fn, items, chunksize, sizes, on_timeout))
+
+    @abstractmethod
+    def submit(self, fn: Callable[..., R], *args: Any) -> Future[R]:
+        """
+        Schedule a single call and return its future.
+
+        Args:
+            fn: Picklable top-level function for process backends
+            *args: Arguments passed to ``fn``
+
+        Returns:
+            Future resolving to the call's result
+        """
+
+    def cancel(self) -> None:
+        """
+        Cancel outstanding work of the current ``map`` call.
+
+        Queued chunks are dropped and running chunks stop before their next item.
+        """
+
+    def shutdown(self) -> None:
+        """Release worker resources."""
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.shutdown()
+
+
+class SerialExecutor(PipelineExecutor):
+    """Runs every item in the calling thread."""
+
+    backend = ExecutorBackend.SERIAL
+
+    def __init__(self, jobs: int = 1, timeout: float | None = None) -> None:
+        super().__init__(1, timeout)
+
+    def map(
+        self,
+        fn: Callable[[T], R],
+        items: Sequence[T],
+        chunksize: int | None = None,
+        sizes: Sequence[int] | None = None,
+        on_timeout: Callable[[T, FileTimeoutError], R] | None = None,
+    ) -> Generator[R, None, None]:
+        for item in items:
+            yield _call_item(fn, item, self.timeout, on_timeout)
+
+    def submit(self, fn: Callable[..., R], *args: Any) -> Future[R]:
+        future: Future[R] = Future()
+        try:
+            future.set_result(call_with_timeout(self.timeout, fn, *args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+class _PoolExecutor(PipelineExecutor):
+    """Submits chunked batches to a concurrent.futures pool."""
+
+    def __init__(self, jobs: int = 1, timeout: float | None = None) -> None:
+        super().__init__(jobs, timeout)
+        self._pool: Executor | None = None
+        self._cancel_flag: _CancelFlag = threading.Event()
+        self._pending: deque[Future[list[Any]]] = deque()
+
+    @abstractmethod
+    def _create_pool(self) -> Executor:
+        """Create the underlying concurrent.futures executor."""
+
+    @property
+    def pool(self) -> Executor:
+        """The lazily created worker pool."""
+        if self._pool is None:
+            self._pool = self._create_pool()
+        return self._pool
+
+    def map(
+        self,
+        fn: Callable[[T], R],
+        items: Sequence[T],
+        chunksize: int | None = None,
+        sizes: Sequence[int] | None = None,
+        on_timeout: Callable[[T, FileTimeoutError], R] | None = None,
+    ) -> Generator[R, None, None]:
+        if sizes is not None:
+            done: dict[int, R] = {}
+            next_index = 0
+            with closing(self._map_by_size(fn, items, sizes, on_timeout)) as completed:
+                for index, result in completed:
+                    done[index] = result
+                    while next_index in done:
+                        yield done.pop(next_index)
+                        next_index += 1
+            return
+        if chunksize is None:
+            chunksize = max(1, math.ceil(len(items) / (self.jobs * CHUNKS_PER_WORKER)))
+
+        pool = self.pool
+        self._cancel_flag.clear()
+        flag = self._chunk_cancel_flag()
+        profile_dir = str(self.profile_dir) if self.profile_dir is not None else None
+        futures: deque[Future[list[R]]] = deque(
+            pool.submit(
+                _run_chunk,
+                fn,
+                items[start:start + chunksize],
+                flag,
+                profile_dir,
+                self.timeout,
+                on_timeout,
+            )
+            for start in range(0, len(items), chunksize)
+        )
+        self._pending = futures
+        logger.debug(
+            f"Submitted {len(futures)} chunks of up to {chunksize} items "
+            f"to {self.jobs} {self.backend} workers"
+        )
+
+        completed = False
+        try:
+            while futures:
+                yield from futures.popleft().result()
+            completed = True
+        finally:
+            if not completed:
+                # The consumer stopped early: stop running chunks, drop queued ones
+                self.cancel()
+
+    def map_completed(
+        self,
+        fn: Callable[[T], R],
+        items: Sequence[T],
+        chunksize: int | None = None,
+        sizes: Sequence[int] | None = None,
+        on_timeout: Callable[[T, FileTimeoutError], R] | None = None,
+    ) -> Generator[tuple[int, R], None, None]:
+        if sizes is None:
+            yield from super().map_completed(fn, items, chunksize, None, on_timeout)
+            return
+        yield from self._map_by_size(fn, items, sizes, on_timeout)
+
+    def _map_by_size(
+        self,
+        fn: Callable[[T], R],
+        items: Sequence[T],
+        sizes: Sequence[int],
+        on_timeout: Callable[[T, FileTimeoutError], R] | None = None,
+    ) -> Generator[tuple[int, R], None, None]:
+        """
+        Run byte-balanced chunks largest-first, yielding ``(index, result)`` per chunk.
+
+        All chunks go onto the pool's shared queue at once, so whichever worker
+        becomes idle takes the next one: no worker sits on a backlog while others
+        wait, and the fine-grained tail spreads evenly across workers.
+        """
+        if len(sizes) != len(items):
+            raise ValueError("sizes must have one entry per item")
+        chunks = plan_chunks(sizes, self.jobs)
+
+        pool = self.pool
+        self._cancel_flag.clear()
+        flag = self._chunk_cancel_flag()
+        profile_dir = str(self.profile_dir) if self.profile_dir is not None else None
+        futures: dict[Future[list[R]], list[int]] = {
+            pool.submit(
+                _run_chunk,
+                fn,
+                [items[i] for i in chunk],
+                flag,
+                profile_dir,
+                self.timeout,
+                on_timeout,
+            ): chunk
+            for chunk in chunks
+        }
+        self._pending = deque(futures)
+        logger.debug(
+            f"Submitted {len(chunks)} size-balanced chunks, largest first, "
+            f"to {self.jobs} {self.backend} workers"
+        )
+
+        completed = False
+        try:
+            for future in as_completed(futures):
+                # A chunk is reported in input order; one stopped by cancel()
+                # returns fewer results than items
+                pairs = zip(futures[future], future.result(), strict=False)
+                yield from sorted(pairs, key=lambda pair: pair[0])
+            completed = True
+        finally:
+            if not completed:
+                self.cancel()
+
+    def cancel(self) -> None:
+        self._cancel_flag.set()
+        for future in self._pending:
+            future.cancel()
+
+    def _chunk_cancel_flag(self) -> _CancelFlag | None:
+        """Flag passed with each chunk (None: workers use the inherited flag)."""
+        return self._cancel_flag
+
+    def submit(self, fn: Callable[..., R], *args: Any) -> Future[R]:
+        if self.timeout:
+            return self.pool.submit(call_with_timeout, self.timeout, fn, *args)
+        return self.pool.submit(fn, *args)
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+
+class ThreadExecutor(_PoolExecutor):
+    """Runs chunks on a thread pool (useful when work releases the GIL)."""
+
+    backend = ExecutorBackend.THREAD
+
+    def __init__(self, jobs: int = 1, timeout: float | None = None) -> None:
+        super().__init__(jobs, timeout)
+        if timeout:
+            logger.debug("Per-file timeouts are not enforced by the thread executor")
+
+    def _create_pool(self) -> Executor:
+        from concurrent.futures import ThreadPoolExecutor
+
+        return ThreadPoolExecutor(max_workers=self.jobs)
+
+
+class ProcessExecutor(_PoolExecutor):
+    """Runs chunks on a process pool for CPU-bound work."""
+
+    backend = ExecutorBackend.PROCESS
+
+    def __init__(self, jobs: int = 1, timeout: float | None = None) -> None:
+        import multiprocessing
+
+        super().__init__(jobs, timeout)
+        self._context = multiprocessing.get_context()
+        self._cancel_flag = self._context.Event()
+
+    def _create_pool(self) -> Executor:
+        from concurrent.futures import ProcessPoolExecutor
+
+        return ProcessPoolExecutor(
+            max_workers=self.jobs,
+            mp_context=self._context,
+            initializer=_init_process_worker,
+            initargs=(self._cancel_flag,),
+        )
+
+    def _chunk_cancel_flag(self) -> _CancelFlag | None:
+        # Multiprocessing events cannot be pickled per task; workers inherit it instead
+        return None
+
+
+def create_executor(
+    backend: ExecutorBackend | str = ExecutorBackend.PROCESS,
+    jobs: int | None = None,
+    timeout: float | None = None,
+) -> PipelineExecutor:
+    """
+    Create an executor for the given backend.
+
+    A single job always runs serially, since a one-worker pool only adds overhead.
+
+    Args:
+        backend: Executor backend name
+        jobs: Number of workers (default: number of usable CPUs)
+        timeout: Wall-clock limit in seconds for each call (default: none)
+
+    Returns:
+        PipelineExecutor instance
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    backend = ExecutorBackend(backend)
+    jobs = default_jobs() if jobs is None else jobs
+
+    if backend is ExecutorBackend.SERIAL or jobs <= 1:
+        return SerialExecutor(timeout=timeout)
+    if backend is ExecutorBackend.THREAD:
+        return ThreadExecutor(jobs, timeout)
+    return ProcessExecutor(jobs, timeout)
+
+
+def call_with_timeout(timeout: float | None, fn: Callable[..., Any], *args: Any) -> Any:
+    """
+    Call ``fn``, raising FileTimeoutError inside it once ``timeout`` seconds pass.
+
+    The deadline uses a SIGALRM interval timer, so it is only enforced in a
+    process's main thread: serial runs and process-pool workers. Elsewhere, or
+    without a timeout, ``fn`` runs unbounded.
+
+    Args:
+        timeout: Wall-clock limit in seconds (None or 0: no limit)
+        fn: Function to call
+        *args: Arguments passed to ``fn``
+
+    Returns:
+        The result of ``fn``
+
+    Raises:
+        FileTimeoutError: If the call runs past the deadline and does not handle it
+    """
+    if (
+        not timeout
+        or not hasattr(signal, "setitimer")
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        return fn(*args)
+
+    def on_alarm(signum: int, frame: Any) -> None:
+        raise FileTimeoutError(f"Processing timed out after {timeout:g}s")
+
+    previous = signal.signal(signal.SIGALRM, on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return fn(*args)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _call_item(
+    fn: Callable[[Any], Any],
+    item: Any,
+    timeout: float | None,
+    on_timeout: Callable[[Any, FileTimeoutError], Any] | None,
+) -> Any:
+    """Call ``fn`` on one item, turning an escaped timeout into that item's result."""
+    try:
+        return call_with_timeout(timeout, fn, item)
+    except FileTimeoutError as e:
+        if on_timeout is None:
+            raise
+        return on_timeout(item, e)
+
+
+def _init_process_worker(cancel_flag: _CancelFlag) -> None:
+    """Process-pool initializer: remember the shared cancellation flag."""
+    global _worker_cancel_flag
+    _worker_cancel_flag = cancel_flag
+
+
+def _run_chunk(
+    fn: Callable[[Any], Any],
+    chunk: Sequence[Any],
+    cancel_flag: _CancelFlag | None = None,
+    profile_dir: str | None = None,
+    timeout: float | None = None,
+    on_timeout: Callable[[Any, FileTimeoutError], Any] | None = None,
+) -> list[Any]:
+    """Worker entry point: apply fn to each item of a chunk until cancelled."""
+    flag = cancel_flag if cancel_flag is not None else _worker_cancel_flag
+    profiler = None
+    if profile_dir is not None:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Python 3.12+ profiles every thread from one profiler; with the parent's
+            # profiler already active, worker threads are covered by it
+            profiler = None
+
+    results = []
+    try:
+        for item in chunk:
+            if flag is not None and flag.is_set():
+                break
+            results.append(_call_item(fn, item, timeout, on_timeout))
+    finally:
+        if profiler is not None and profile_dir is not None:
+            profiler.disable()
+            name = f"chunk-{os.getpid()}-{threading.get_ident()}-{uuid.uuid4().hex[:8]}.pstats"
+            profiler.dump_stats(os.path.join(profile_dir, name))
+    return results
@@ -0,0 +1,213 @@
+"""
+Checkpoint journal: an append-only record of completed files for resuming runs.
+
+Each line of the journal is one JSON record: the file's path relative to the
+input directory, the SHA-256 of the content that was processed, and either the
+generator config or the error. Records are buffered and flushed in batches, so a
+killed run loses at most one batch. Later records for a path win, so resumed
+runs simply append.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Any, Self
+
+from argocd_migrator.exceptions import JournalError
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_FORMAT = "argocd-migrator-journal/1"
+# Records buffered before they are written and fsynced
+JOURNAL_BATCH_SIZE = 256
+
+
+@dataclass(slots=True)
+class JournalEntry:
+    """A completed file: its config on success, else its error."""
+
+    path: str
+    content_digest: str
+    config: dict[str, Any] | None = None
+    error: str | None = None
+
+
+def content_digest(path: Path) -> str | None:
+    """
+    Return the SHA-256 hex digest of a file's content, or None if it cannot be read.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest, matching ``TransformationResult.content_digest``
+    """
+    try:
+        with open(path, "rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+    except OSError:
+        return None
+
+
+def load_journal(journal_file: str | Path) -> dict[str, JournalEntry]:
+    """
+    Read a checkpoint journal.
+
+    A missing journal is empty. A torn last line, left by a run killed mid-write,
+    is ignored; that file is simply processed again.
+
+    Args:
+        journal_file: Journal path
+
+    Returns:
+        Latest entry per relative path
+
+    Raises:
+        JournalError: If the file is not a journal or cannot be read
+    """
+    path = Path(journal_file)
+    entries: dict[str, JournalEntry] = {}
+    try:
+        with open(path, "rb") as f:
+            lines = f.read().split(b"\n")
+    except FileNotFoundError:
+        return entries
+    except OSError as e:
+        raise JournalError(f"Error reading journal {journal_file}: {e}") from e
+
+    for number, line in enumerate(lines, 1):
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+            if number == 1:
+                if record.get("format") != JOURNAL_FORMAT:
+                    raise JournalError(f"{journal_file} is not a checkpoint journal")
+                continue
+            entry = JournalEntry(
+                str(record["path"]),
+                str(record["sha256"]),
+                record.get("config"),
+                record.get("error"),
+            )
+        except JournalError:
+            raise
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            if number == 1:
+                raise JournalError(f"{journal_file} is not a checkpoint journal") from e
+            logger.warning("Ignoring unreadable journal record %s:%d", journal_file, number)
+            continue
+        entries[entry.path] = entry
+
+    logger.info(f"Loaded {len(entries)} journaled files from {journal_file}")
+    return entries
+
+
+class JournalWriter:
+    """
+    Append records to a checkpoint journal in batches.
+
+    Records are buffered and written, then fsynced, every ``batch_size`` records and
+    on ``flush()``/exit, so the journal costs one sync per batch rather than per file.
+    """
+
+    def __init__(
+        self, journal_file: str | Path, append: bool = False, batch_size: int = JOURNAL_BATCH_SIZE
+    ) -> None:
+        self.journal_file = Path(journal_file)
+        self.batch_size = batch_size
+        self.count = 0
+        self._pending: list[bytes] = []
+        try:
+            self.journal_file.parent.mkdir(parents=True, exist_ok=True)
+            self._file: IO[bytes] = open(self.journal_file, "ab" if append else "wb")
+            if self._file.tell() == 0:
+                self._pending.append(_line({"format": JOURNAL_FORMAT}))
+            elif not _ends_with_newline(self.journal_file):
+                # Terminate a record torn by a killed run so the next one starts clean
+                self._pending.append(b"\n")
+        except OSError as e:
+            raise JournalError(f"Error opening journal {journal_file}: {e}") from e
+
+    def record(self, entry: JournalEntry) -> None:
+        """
+        Queue one completed file, flushing when a batch is full.
+
+        Args:
+            entry: Completed file
+
+        Raises:
+            JournalError: If flushing fails
+        """
+        record: dict[str, Any] = {"path": entry.path, "sha256": entry.content_digest}
+        if entry.error is None:
+            record["config"] = entry.config
+        else:
+            record["error"] = entry.error
+        self._pending.append(_line(record))
+        self.count += 1
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Write and fsync the queued records.
+
+        Raises:
+            JournalError: If writing fails
+        """
+        if not self._pending:
+            return
+        try:
+            self._file.write(b"".join(self._pending))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        except OSError as e:
+            raise JournalError(f"Error writing journal {self.journal_file}: {e}") from e
+        self._pending.clear()
+
+    def close(self) -> None:
+        """Flush the queued records and close the journal."""
+        try:
+            self.flush()
+        finally:
+            self._file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def _line(record: dict[str, Any]) -> bytes:
+    text = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+    return text.encode("utf-8") + b"\n"
+
+
+def _ends_with_newline(path: Path) -> bool:
+    with open(path, "rb") as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b"\n"
+
+
+def default_journal(output_file: Path) -> Path:
+    """
+    Default checkpoint journal location.
+
+    Args:
+        output_file: Aggregated config output path
+
+    Returns:
+        ``<output stem>.journal.ndjson`` next to the output file
+    """
+    return output_file.with_name(f"{output_file.stem}.journal.ndjson")
@@ -0,0 +1,341 @@
+"""
+Kubernetes API input: list ``applications.argoproj.io`` objects from a cluster.
+
+Uses only the standard library: pages are requested with ``limit``/``continue``
+over pooled keep-alive connections, namespaces are listed concurrently, and
+Applications are yielded in a deterministic order as their pages arrive.
+"""
+
+import http.client
+import json
+import logging
+import os
+import queue
+import ssl
+import threading
+from collections.abc import Generator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from urllib.parse import quote, urlencode, urlsplit
+
+from argocd_migrator.exceptions import KubeApiError
+
+logger = logging.getLogger(__name__)
+
+API_GROUP_VERSION = "argoproj.io/v1alpha1"
+DEFAULT_PAGE_SIZE = 500
+DEFAULT_CONCURRENCY = 4
+DEFAULT_TIMEOUT = 30.0
+# Pages fetched ahead per namespace while an earlier namespace is being consumed
+PREFETCH_PAGES = 2
+
+# In-cluster service account files, used by KubeSource.in_cluster()
+_SERVICE_ACCOUNT = Path("/var/run/secrets/kubernetes.io/serviceaccount")
+
+# Sentinel a fetcher puts on its queue after the last page
+_DONE = object()
+
+
+@dataclass
+class KubeSource:
+    """
+    Where and how to list Applications.
+
+    ``namespaces`` empty means one cluster-wide listing; otherwise each namespace
+    is listed separately and concurrently, and results follow the given order.
+    """
+
+    server: str
+    token: str | None = None
+    namespaces: list[str] = field(default_factory=list)
+    page_size: int = DEFAULT_PAGE_SIZE
+    concurrency: int = DEFAULT_CONCURRENCY
+    ca_file: str | Path | None = None
+    insecure: bool = False
+    timeout: float = DEFAULT_TIMEOUT
+
+    @classmethod
+    def in_cluster(cls, **kwargs: Any) -> "KubeSource":
+        """
+        Build a source from the pod's service account, as when running in a cluster.
+
+        Raises:
+            KubeApiError: If the service account token cannot be read
+        """
+        host = os.environ.get("KUBERNETES_SERVICE_HOST")
+        port = os.environ.get("KUBERNETES_SERVICE_PORT", "443")
+        try:
+            token = (_SERVICE_ACCOUNT / "token").read_text().strip()
+        except OSError as e:
+            raise KubeApiError(f"Not running in a cluster: {e}") from e
+        if not host:
+            raise KubeApiError("Not running in a cluster: KUBERNETES_SERVICE_HOST is not set")
+        kwargs.setdefault("ca_file", _SERVICE_ACCOUNT / "ca.crt")
+        return cls(server=f"https://{host}:{port}", token=token, **kwargs)
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of keep-alive HTTP(S) connections to one server.
+
+    Each request borrows an idle connection or opens a new one and returns it once
+    the response has been read in full, so sequential pages reuse one socket.
+    ``connections_opened`` counts the sockets opened so far.
+    """
+
+    def __init__(
+        self,
+        server: str,
+        size: int = DEFAULT_CONCURRENCY,
+        timeout: float = DEFAULT_TIMEOUT,
+        ssl_context: ssl.SSLContext | None = None,
+    ) -> None:
+        url = urlsplit(server)
+        if url.scheme not in ("http", "https") or not url.hostname:
+            raise KubeApiError(f"Invalid API server URL: {server}")
+        self.scheme = url.scheme
+        self.host = url.hostname
+        self.port = url.port
+        self.base_path = url.path.rstrip("/")
+        self.size = size
+        self.timeout = timeout
+        self.ssl_context = ssl_context
+        self.connections_opened = 0
+        self._idle: queue.LifoQueue[http.client.HTTPConnection] = queue.LifoQueue()
+        self._lock = threading.Lock()
+
+    def _connect(self) -> http.client.HTTPConnection:
+        with self._lock:
+            self.connections_opened += 1
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(
+                self.host, self.port, timeout=self.timeout, context=self.ssl_context
+            )
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def _acquire(self) -> tuple[http.client.HTTPConnection, bool]:
+        """Return an idle connection, or a new one, and whether it was reused."""
+        try:
+            return self._idle.get_nowait(), True
+        except queue.Empty:
+            return self._connect(), False
+
+    def _release(self, conn: http.client.HTTPConnection) -> None:
+        if self._idle.qsize() < self.size:
+            self._idle.put(conn)
+        else:
+            conn.close()
+
+    def get_json(self, path: str, params: dict[str, Any], headers: dict[str, str]) -> Any:
+        """
+        Send a GET request and decode its JSON response.
+
+        A request on a reused connection that the server has meanwhile closed is
+        retried once on a new connection.
+
+        Args:
+            path: Request path below the server URL
+            params: Query parameters
+            headers: Request headers
+
+        Returns:
+            The decoded response body
+
+        Raises:
+            KubeApiError: On connection errors, non-200 responses or invalid JSON
+        """
+        target = f"{self.base_path}{path}?{urlencode(params)}"
+        for attempt in range(2):
+            conn, reused = self._acquire()
+            try:
+                conn.request("GET", target, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as e:
+                conn.close()
+                if reused and attempt == 0:
+                    logger.debug("Stale pooled connection for %s; retrying", path)
+                    continue
+                raise KubeApiError(f"Connection to {self.host} closed during GET {path}") from e
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                raise KubeApiError(f"GET {path} failed: {e}") from e
+            except BaseException:
+                conn.close()
+                raise
+            if response.will_close:
+                conn.close()
+            else:
+                self._release(conn)
+            break
+
+        if response.status != 200:
+            raise KubeApiError(
+                f"GET {path} returned HTTP {response.status}: {_status_message(body)}"
+            )
+        try:
+            return json.loads(body)
+        except ValueError as e:
+            raise KubeApiError(f"GET {path} returned invalid JSON: {e}") from e
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+def _status_message(body: bytes) -> str:
+    """Extract the ``message`` of a Kubernetes Status response, or the raw body."""
+    try:
+        status = json.loads(body)
+    except ValueError:
+        status = None
+    if isinstance(status, dict) and status.get("message"):
+        return str(status["message"])
+    return body[:200].decode("utf-8", "replace")
+
+
+class ApplicationLister:
+    """Lists Applications page by page over a ConnectionPool."""
+
+    def __init__(self, source: KubeSource, pool: ConnectionPool | None = None) -> None:
+        if source.page_size < 1 or source.concurrency < 1:
+            raise KubeApiError("page_size and concurrency must be >= 1")
+        self.source = source
+        self.pool = pool or ConnectionPool(
+            source.server, source.concurrency, source.timeout, _ssl_context(source)
+        )
+        self.headers = {"Accept": "application/json"}
+        if source.token:
+            self.headers["Authorization"] = f"Bearer {source.token}"
+
+    def pages(self, namespace: str | None) -> Iterator[list[dict[str, Any]]]:
+        """
+        Yield the items of each page of one listing.
+
+        Args:
+            namespace: Namespace to list (None: all namespaces)
+
+        Raises:
+            KubeApiError: If a request fails or the continue token has expired
+        """
+        path = f"/apis/{API_GROUP_VERSION}/applications"
+        if namespace is not None:
+            path = f"/apis/{API_GROUP_VERSION}/namespaces/{quote(namespace, safe='')}/applications"
+        params: dict[str, Any] = {"limit": self.source.page_size}
+        while True:
+            page = self.pool.get_json(path, params, self.headers)
+            if not isinstance(page, dict):
+                raise KubeApiError(f"GET {path} did not return a list")
+            items = page.get("items") or []
+            logger.debug("Listed %d applications from %s", len(items), path)
+            yield items
+            token = (page.get("metadata") or {}).get("continue")
+            if not token:
+                return
+            params = {"limit": self.source.page_size, "continue": token}
+
+    def applications(self) -> Generator[tuple[str, dict[str, Any]], None, None]:
+        """
+        Yield ``(label, application)`` pairs from every configured namespace.
+
+        Namespaces are fetched concurrently, up to ``concurrency`` at a time, each
+        keeping at most PREFETCH_PAGES pages ahead of the consumer. Applications are
+        yielded in namespace order, then in server order, so runs are deterministic.
+        Labels look like ``k8s:<namespace>/<name>``. Closing the generator stops the
+        fetchers.
+
+        Raises:
+            KubeApiError: If a request fails
+        """
+        scopes: list[str | None] = list(self.source.namespaces) or [None]
+        queues: list[queue.Queue[Any]] = [queue.Queue(PREFETCH_PAGES) for _ in scopes]
+        stop = threading.Event()
+
+        def put(q: queue.Queue[Any], item: Any) -> bool:
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def fetch(scope: str | None, q: queue.Queue[Any]) -> None:
+            try:
+                for items in self.pages(scope):
+                    if not put(q, items):
+                        return
+                put(q, _DONE)
+            except BaseException as e:
+                put(q, e)
+
+        # Submission order is consumption order, so a blocked fetcher never waits
+        # on a namespace that has not started
+        workers = ThreadPoolExecutor(
+            max_workers=min(self.source.concurrency, len(scopes)),
+            thread_name_prefix="kube-list",
+        )
+        try:
+            for scope, q in zip(scopes, queues, strict=True):
+                workers.submit(fetch, scope, q)
+            for q in queues:
+                while (item := q.get()) is not _DONE:
+                    if isinstance(item, BaseException):
+                        raise item
+                    for app in item:
+                        yield _label(app), _as_application(app)
+        finally:
+            stop.set()
+            workers.shutdown(wait=True, cancel_futures=True)
+            self.pool.close()
+
+
+def _ssl_context(source: KubeSource) -> ssl.SSLContext | None:
+    if not source.server.startswith("https"):
+        return None
+    if source.insecure:
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        return context
+    return ssl.create_default_context(
+        cafile=str(source.ca_file) if source.ca_file is not None else None
+    )
+
+
+def _label(app: Any) -> str:
+    metadata = app.get("metadata") if isinstance(app, dict) else None
+    if not isinstance(metadata, dict):
+        return "k8s:<unnamed>"
+    return f"k8s:{metadata.get('namespace', '')}/{metadata.get('name', '<unnamed>')}"
+
+
+def _as_application(app: Any) -> Any:
+    """List items may omit apiVersion and kind; fill them in for validation."""
+    if isinstance(app, dict):
+        app.setdefault("apiVersion", API_GROUP_VERSION)
+        app.setdefault("kind", "Application")
+    return app
+
+
+def list_applications(source: KubeSource) -> Generator[tuple[str, dict[str, Any]], None, None]:
+    """
+    List Applications from a Kubernetes API server.
+
+    Args:
+        source: Server, credentials, namespaces and paging settings
+
+    Returns:
+        Generator of ``(label, application)`` pairs (see
+        ``ApplicationLister.applications``)
+
+    Raises:
+        KubeApiError: If the source is invalid or, while iterating, a request fails
+    """
+    return ApplicationLister(source).applications()
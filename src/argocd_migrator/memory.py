@@ -0,0 +1,213 @@
+"""tracemalloc-based memory attribution per pipeline stage."""
+
+import json
+import logging
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Self
+
+from argocd_migrator.exceptions import MigrationError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOP_SITES = 10
+
+_IGNORED_FILES = (tracemalloc.__file__, __file__, "<frozen importlib._bootstrap>", "<unknown>")
+
+
+@dataclass
+class AllocationSite:
+    """Memory held by one source line at the end of a stage."""
+
+    site: str
+    size_bytes: int
+    size_diff_bytes: int
+    count_diff: int
+
+
+@dataclass
+class StageMemory:
+    """Traced Python memory for one pipeline stage."""
+
+    name: str
+    start_bytes: int
+    end_bytes: int
+    peak_bytes: int
+    top_sites: list[AllocationSite] = field(default_factory=list)
+
+    @property
+    def retained_bytes(self) -> int:
+        """Memory still held when the stage finished, relative to its start."""
+        return self.end_bytes - self.start_bytes
+
+    @property
+    def peak_increase_bytes(self) -> int:
+        """Highest memory reached during the stage, relative to its start."""
+        return self.peak_bytes - self.start_bytes
+
+
+class MemoryProfiler:
+    """
+    Attribute traced Python allocations to pipeline stages.
+
+    While active, tracemalloc traces every allocation in this process. Each stage
+    records memory at its start and end, the peak reached in between, and the source
+    lines whose allocations grew the most. Worker processes are not traced, so use a
+    serial or thread executor to include parsing in the attribution.
+    """
+
+    enabled = True
+
+    def __init__(self, frames: int = 1, top: int = DEFAULT_TOP_SITES) -> None:
+        self.frames = frames
+        self.top = top
+        self.stages: list[StageMemory] = []
+        self.overhead_bytes = 0
+        self._started_tracing = False
+        self._site_totals: dict[str, tuple[int, int]] | None = None
+
+    def __enter__(self) -> Self:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracing = True
+        self._site_totals = _site_totals()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.overhead_bytes = tracemalloc.get_tracemalloc_memory()
+        self._site_totals = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Measure the memory of a stage running inside the block."""
+        if self._site_totals is None:
+            yield
+            return
+
+        start_bytes, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            end_bytes, peak_bytes = tracemalloc.get_traced_memory()
+            # Only per-line totals are kept between stages: a full snapshot holds one
+            # object per live allocation and would distort the next stage
+            previous, current = self._site_totals, _site_totals()
+            self._site_totals = current
+            grown: list[AllocationSite] = []
+            for site, (size, count) in current.items():
+                previous_size, previous_count = previous.get(site, (0, 0))
+                grown.append(
+                    AllocationSite(site, size, size - previous_size, count - previous_count)
+                )
+            grown.sort(key=lambda s: s.size_diff_bytes, reverse=True)
+            self.stages.append(
+                StageMemory(
+                    name=name,
+                    start_bytes=start_bytes,
+                    end_bytes=end_bytes,
+                    peak_bytes=max(peak_bytes, start_bytes),
+                    top_sites=[s for s in grown[: self.top] if s.size_diff_bytes > 0],
+                )
+            )
+
+    @property
+    def peak_bytes(self) -> int:
+        """Highest traced memory across all stages."""
+        return max((s.peak_bytes for s in self.stages), default=0)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "peak_bytes": self.peak_bytes,
+            "tracemalloc_overhead_bytes": self.overhead_bytes,
+            "stages": [
+                {
+                    "name": s.name,
+                    "start_bytes": s.start_bytes,
+                    "end_bytes": s.end_bytes,
+                    "peak_bytes": s.peak_bytes,
+                    "retained_bytes": s.retained_bytes,
+                    "peak_increase_bytes": s.peak_increase_bytes,
+                    "top_sites": [
+                        {
+                            "site": site.site,
+                            "size_bytes": site.size_bytes,
+                            "size_diff_bytes": site.size_diff_bytes,
+                            "count_diff": site.count_diff,
+                        }
+                        for site in s.top_sites
+                    ],
+                }
+                for s in self.stages
+            ],
+        }
+
+    def write_json(self, output_file: str | Path) -> None:
+        """
+        Write the memory report as JSON.
+
+        Args:
+            output_file: Destination path
+
+        Raises:
+            MigrationError: If file writing fails
+        """
+        path = Path(output_file)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self.to_dict(), f, indent=2)
+                f.write("\n")
+        except OSError as e:
+            raise MigrationError(f"Error writing memory report to {output_file}: {e}") from e
+        logger.info(f"Wrote memory report to {output_file}")
+
+
+class NullMemoryProfiler(MemoryProfiler):
+    """Profiler used when memory profiling is disabled; stages are not measured."""
+
+    enabled = False
+
+    def stage(self, name: str) -> Any:
+        return nullcontext()
+
+
+NULL_MEMORY_PROFILER = NullMemoryProfiler()
+
+
+def _site_totals() -> dict[str, tuple[int, int]]:
+    """Return traced (bytes, blocks) per allocating source line."""
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        [tracemalloc.Filter(False, pattern) for pattern in _IGNORED_FILES]
+    )
+    totals: dict[str, tuple[int, int]] = {}
+    for stat in snapshot.statistics("lineno"):
+        frame = stat.traceback[0]
+        totals[f"{frame.filename}:{frame.lineno}"] = (stat.size, stat.count)
+    return totals
+
+
+def iter_memory_report(profiler: MemoryProfiler, sites: int = 3) -> Iterator[str]:
+    """Yield human-readable lines with per-stage memory and top allocation sites."""
+    yield f"{'stage':<11}{'peak +MiB':>11}{'retained MiB':>14}"
+    for stage in profiler.stages:
+        yield (
+            f"{stage.name:<11}{stage.peak_increase_bytes / 2**20:>11.1f}"
+            f"{stage.retained_bytes / 2**20:>14.1f}"
+        )
+        for site in stage.top_sites[:sites]:
+            yield f"  {site.size_diff_bytes / 1024:>+10.1f} KiB  {site.site}"
+    yield f"peak traced memory: {profiler.peak_bytes / 2**20:.1f} MiB"
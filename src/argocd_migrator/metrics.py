@@ -0,0 +1,429 @@
+"""Per-stage timing, throughput and resource metrics for pipeline runs."""
+
+import bisect
+import heapq
+import json
+import logging
+import math
+import os
+import sys
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from argocd_migrator.exceptions import MigrationError
+from argocd_migrator.tracing import Span, current_span
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("scan", "read", "parse", "transform", "validate", "serialize", "write")
+
+# Per-file stage timings: stage name -> (wall seconds, CPU seconds)
+FileTimings = dict[str, tuple[float, float]]
+
+# Histogram buckets grow by ~10%, so percentiles are accurate to within ~5%
+_BUCKET_GROWTH = 1.1
+_BUCKET_MIN_SECONDS = 1e-6
+_BUCKET_COUNT = 250
+_BUCKET_BOUNDS = [_BUCKET_MIN_SECONDS * _BUCKET_GROWTH**i for i in range(_BUCKET_COUNT)]
+
+SLOWEST_FILES = 10
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+def timed(
+    timings: FileTimings,
+    stage: str,
+    fn: Callable[..., Any],
+    *args: Any,
+    spans: list[Span] | None = None,
+) -> Any:
+    """
+    Call ``fn`` and record its wall-clock and CPU time under ``stage``.
+
+    Args:
+        timings: Per-file timings to update
+        stage: Stage name the call is attributed to
+        fn: Function to call
+        *args: Arguments passed to ``fn``
+        spans: When given, a trace span for the call is appended here
+
+    Returns:
+        Result of ``fn``
+    """
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    try:
+        return fn(*args)
+    finally:
+        wall = time.perf_counter() - wall_start
+        timings[stage] = (wall, time.thread_time() - cpu_start)
+        if spans is not None:
+            spans.append(current_span(stage, wall_start, wall))
+
+
+class LatencyHistogram:
+    """Fixed-size, log-bucketed latency histogram with approximate percentiles."""
+
+    def __init__(self) -> None:
+        self.counts = [0] * (_BUCKET_COUNT + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add one observation."""
+        self.counts[bisect.bisect_left(_BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, quantile: float) -> float:
+        """
+        Estimate a percentile.
+
+        Args:
+            quantile: Quantile between 0 and 1 (e.g. 0.95)
+
+        Returns:
+            Upper bound of the bucket containing the quantile, capped at the maximum
+        """
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(quantile * self.count))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                bound = _BUCKET_BOUNDS[index] if index < _BUCKET_COUNT else self.max
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> dict[str, float]:
+        """Summarize as count, sum, max and standard percentiles."""
+        summary: dict[str, float] = {"count": self.count, "sum": self.total, "max": self.max}
+        for quantile in QUANTILES:
+            summary[f"p{round(quantile * 100)}"] = self.percentile(quantile)
+        return summary
+
+
+@dataclass
+class StageTiming:
+    """Accumulated wall-clock and CPU time for one stage."""
+
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    calls: int = 0
+
+    def add(self, wall: float, cpu: float) -> None:
+        """Accumulate one measurement."""
+        self.wall_seconds += wall
+        self.cpu_seconds += cpu
+        self.calls += 1
+
+
+@dataclass
+class PipelineMetrics:
+    """
+    Metrics for one pipeline run.
+
+    Stage times are summed across files and workers, so with parallel execution a
+    stage's wall time can exceed the run's wall time.
+
+    Peak RSS values are lifetime peaks (``ru_maxrss``), not per-run peaks: the main
+    process's includes anything it did before the run (in the daemon, earlier
+    requests), and the workers' includes earlier runs on a reused pool. Process
+    workers report their peak with each result, so it is known while the pool is
+    still running; exited children are added when the run finishes.
+    """
+
+    stages: dict[str, StageTiming] = field(
+        default_factory=lambda: {name: StageTiming() for name in STAGES}
+    )
+    files: int = 0
+    successful: int = 0
+    failed: int = 0
+    skipped: int = 0
+    bytes_read: int = 0
+    bytes_written: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    peak_rss_bytes: int = 0
+    peak_worker_rss_bytes: int = 0
+    file_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    stage_latency: dict[str, LatencyHistogram] = field(default_factory=dict)
+    slowest_files: list[tuple[float, str]] = field(default_factory=list)
+    _started: tuple[float, float] | None = field(default=None, repr=False)
+
+    def start(self) -> None:
+        """Mark the start of the run."""
+        self._started = (time.perf_counter(), time.process_time())
+
+    def finish(self) -> None:
+        """Mark the end of the run and capture resource usage."""
+        if self._started is not None:
+            wall_start, cpu_start = self._started
+            self.wall_seconds = time.perf_counter() - wall_start
+            self.cpu_seconds = time.process_time() - cpu_start
+        own, children = _peak_rss()
+        self.peak_rss_bytes = own
+        self.peak_worker_rss_bytes = max(self.peak_worker_rss_bytes, children)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a block of work in the calling thread and attribute it to a stage."""
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield
+        finally:
+            self.add_stage_time(
+                name, time.perf_counter() - wall_start, time.thread_time() - cpu_start
+            )
+
+    def add_stage_time(self, name: str, wall: float, cpu: float) -> None:
+        """Attribute a measured duration to a stage."""
+        self.stages.setdefault(name, StageTiming()).add(wall, cpu)
+
+    def record_file(
+        self,
+        source: str | Path,
+        timings: FileTimings,
+        bytes_read: int = 0,
+        worker_rss_bytes: int = 0,
+    ) -> None:
+        """
+        Record per-file stage timings measured by a worker.
+
+        Args:
+            source: Source the timings belong to
+            timings: Stage name -> (wall seconds, CPU seconds)
+            bytes_read: Number of input bytes read for the file
+            worker_rss_bytes: Peak RSS of the process worker that handled the file
+                (see ``worker_peak_rss``; 0 when it ran in this process)
+        """
+        total = 0.0
+        for name, (wall, cpu) in timings.items():
+            self.add_stage_time(name, wall, cpu)
+            self.stage_latency.setdefault(name, LatencyHistogram()).record(wall)
+            total += wall
+
+        self.bytes_read += bytes_read
+        self.peak_worker_rss_bytes = max(self.peak_worker_rss_bytes, worker_rss_bytes)
+        self.file_latency.record(total)
+
+        entry = (total, str(source))
+        if len(self.slowest_files) < SLOWEST_FILES:
+            heapq.heappush(self.slowest_files, entry)
+        elif entry > self.slowest_files[0]:
+            heapq.heapreplace(self.slowest_files, entry)
+
+    @property
+    def files_per_second(self) -> float:
+        """Processed files per wall-clock second."""
+        return self.files / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        """Input megabytes (10^6 bytes) read per wall-clock second."""
+        return self.bytes_read / 1e6 / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "files": {
+                "total": self.files,
+                "successful": self.successful,
+                "failed": self.failed,
+                "skipped": self.skipped,
+            },
+            "wall_seconds": self.wall_seconds,
+            "cpu_seconds": self.cpu_seconds,
+            "bytes_read": self.bytes_read,
+            "bytes_written": self.bytes_written,
+            "files_per_second": self.files_per_second,
+            "megabytes_per_second": self.megabytes_per_second,
+            "peak_rss_bytes": self.peak_rss_bytes,
+            "peak_worker_rss_bytes": self.peak_worker_rss_bytes,
+            "stages": {
+                name: {
+                    "wall_seconds": timing.wall_seconds,
+                    "cpu_seconds": timing.cpu_seconds,
+                    "calls": timing.calls,
+                }
+                for name, timing in self.stages.items()
+            },
+            "file_latency_seconds": self.file_latency.to_dict(),
+            "stage_latency_seconds": {
+                name: histogram.to_dict() for name, histogram in self.stage_latency.items()
+            },
+            "slowest_files": [
+                {"source": source, "seconds": seconds}
+                for seconds, source in sorted(self.slowest_files, reverse=True)
+            ],
+        }
+
+    def write_json(self, output_file: str | Path) -> None:
+        """
+        Write metrics as a JSON document.
+
+        Args:
+            output_file: Destination path
+
+        Raises:
+            MigrationError: If file writing fails
+        """
+        content = json.dumps(self.to_dict(), indent=2, ensure_ascii=False) + "\n"
+        _write_atomic(Path(output_file), content)
+        logger.info(f"Wrote metrics to {output_file}")
+
+    def to_prometheus(self, prefix: str = "argocd_migrator") -> str:
+        """
+        Render metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix: Metric name prefix
+
+        Returns:
+            Text suitable for the node_exporter textfile collector
+        """
+        lines: list[str] = []
+
+        def metric(name: str, kind: str, help_text: str, samples: list[tuple[str, float]]) -> None:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            for labels, value in samples:
+                lines.append(f"{prefix}_{name}{labels} {_format_value(value)}")
+
+        metric("files", "gauge", "Files processed by the last run, by outcome.", [
+            ('{status="successful"}', self.successful),
+            ('{status="failed"}', self.failed),
+            ('{status="skipped"}', self.skipped),
+        ])
+        metric("run_duration_seconds", "gauge", "Wall-clock duration of the last run.", [
+            ("", self.wall_seconds),
+        ])
+        metric("run_cpu_seconds", "gauge", "CPU time of the main process in the last run.", [
+            ("", self.cpu_seconds),
+        ])
+        metric("stage_wall_seconds", "gauge", "Wall-clock time per stage, summed over files.", [
+            (f'{{stage="{name}"}}', t.wall_seconds) for name, t in self.stages.items()
+        ])
+        metric("stage_cpu_seconds", "gauge", "CPU time per stage, summed over files.", [
+            (f'{{stage="{name}"}}', t.cpu_seconds) for name, t in self.stages.items()
+        ])
+        metric("bytes_read", "gauge", "Input bytes read by the last run.", [
+            ("", self.bytes_read),
+        ])
+        metric("bytes_written", "gauge", "Output bytes written by the last run.", [
+            ("", self.bytes_written),
+        ])
+        metric("files_per_second", "gauge", "File throughput of the last run.", [
+            ("", self.files_per_second),
+        ])
+        metric("megabytes_per_second", "gauge", "Input throughput of the last run.", [
+            ("", self.megabytes_per_second),
+        ])
+        metric("peak_rss_bytes", "gauge", "Peak resident set size.", [
+            ('{process="main"}', self.peak_rss_bytes),
+            ('{process="workers"}', self.peak_worker_rss_bytes),
+        ])
+        metric("file_latency_seconds", "summary", "Per-file processing latency.", [
+            *((f'{{quantile="{q}"}}', self.file_latency.percentile(q)) for q in QUANTILES),
+        ])
+        lines.append(f"{prefix}_file_latency_seconds_sum {_format_value(self.file_latency.total)}")
+        lines.append(f"{prefix}_file_latency_seconds_count {self.file_latency.count}")
+        metric("last_run_timestamp_seconds", "gauge", "Unix time the last run finished.", [
+            ("", time.time()),
+        ])
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, output_file: str | Path) -> None:
+        """
+        Atomically write metrics for the Prometheus textfile collector.
+
+        Args:
+            output_file: Destination ``.prom`` path
+
+        Raises:
+            MigrationError: If file writing fails
+        """
+        _write_atomic(Path(output_file), self.to_prometheus())
+        logger.info(f"Wrote Prometheus metrics to {output_file}")
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def worker_peak_rss() -> int:
+    """
+    Return this process's peak RSS in bytes if it is a pool worker, else 0.
+
+    ``RUSAGE_CHILDREN`` only covers children that have exited, so process workers
+    call this after each file and send the value back with their result.
+    """
+    import multiprocessing
+
+    if resource is None or multiprocessing.parent_process() is None:
+        return 0
+    return _max_rss(resource.RUSAGE_SELF)
+
+
+def _peak_rss() -> tuple[int, int]:
+    """Return lifetime peak RSS in bytes for this process and its exited children."""
+    if resource is None:
+        return 0, 0
+    return _max_rss(resource.RUSAGE_SELF), _max_rss(resource.RUSAGE_CHILDREN)
+
+
+def _max_rss(who: int) -> int:
+    # ru_maxrss is reported in kilobytes on Linux and in bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    return int(resource.getrusage(who).ru_maxrss) * scale
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        raise MigrationError(f"Error writing metrics to {path}: {e}") from e
+
+
+def iter_metrics_report(metrics: PipelineMetrics) -> Iterator[str]:
+    """Yield human-readable lines summarizing stage times, latency and resources."""
+    yield (
+        f"{metrics.files} files in {metrics.wall_seconds:.2f}s: "
+        f"{metrics.files_per_second:.0f} files/s, {metrics.megabytes_per_second:.1f} MB/s"
+    )
+    yield f"{'stage':<11}{'wall s':>9}{'cpu s':>9}{'calls':>8}"
+    for name, timing in metrics.stages.items():
+        if timing.calls:
+            yield (
+                f"{name:<11}{timing.wall_seconds:>9.2f}{timing.cpu_seconds:>9.2f}"
+                f"{timing.calls:>8}"
+            )
+    latency = metrics.file_latency
+    yield (
+        f"per-file latency: p50 {latency.percentile(0.5) * 1000:.1f}ms, "
+        f"p95 {latency.percentile(0.95) * 1000:.1f}ms, "
+        f"p99 {latency.percentile(0.99) * 1000:.1f}ms, max {latency.max * 1000:.1f}ms"
+    )
+    yield (
+        f"peak RSS: {metrics.peak_rss_bytes / 2**20:.0f} MiB "
+        f"(workers {metrics.peak_worker_rss_bytes / 2**20:.0f} MiB)"
+    )
@@ -1,14 +1,34 @@
 """JSON format migrator for converting YAML to JSON."""
 
+import io
 import json
 import logging
+import os
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
+
+import yaml
 
 from argocd_migrator.exceptions import MigrationError
+from argocd_migrator.transcoder import UnsupportedYAMLError, transcode_yaml_to_json
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_WRITE_WORKERS = 8
+
+
+@dataclass
+class WriteResult:
+    """Result of writing a single JSON file."""
+
+    output_file: Path
+    success: bool
+    error: str | None = None
+
 
 def migrate_to_json(data: dict[str, Any], output_path: str | Path) -> None:
     """
@@ -32,18 +52,180 @@ def migrate_to_json(data: dict[str, Any], output_path: str | Path) -> None:
             json.dump(data, f, indent=2, ensure_ascii=False)
             f.write("\n")  # Add trailing newline
 
-        logger.info(f"Migrated to JSON: {output_path}")
+        logger.debug("Migrated to JSON: %s", output_path)
 
     except Exception as e:
         raise MigrationError(f"Error writing JSON to {output_path}: {e}") from e
 
 
-def convert_yaml_to_json(yaml_data: dict[str, Any]) -> str:
+def migrate_many_to_json(
+    items: Iterable[tuple[dict[str, Any] | bytes, str | Path]],
+    max_workers: int = DEFAULT_WRITE_WORKERS,
+    fsync: bool = False,
+) -> list[WriteResult]:
+    """
+    Write many JSON files through a bounded thread pool.
+
+    Each distinct parent directory is created once, no matter how many files it
+    receives. At most ``2 * max_workers`` writes are in flight, so ``items`` may be
+    a lazy iterable. With ``fsync`` enabled, the file fsyncs are deferred until
+    every file is written and then issued together through the pool, so the
+    filesystem can fold them into a few journal commits instead of one per write.
+    Each distinct directory is then fsynced once. A file whose fsync fails is
+    reported as failed.
+
+    Args:
+        items: Iterable of (data, output_path) pairs; bytes data is written as-is
+            (already-serialized JSON)
+        max_workers: Number of writer threads
+        fsync: Whether to fsync files and directories for durability
+
+    Returns:
+        One WriteResult per item, in input order
+    """
+    results: list[WriteResult] = []
+    created_dirs: dict[Path, str | None] = {}
+    pending: deque[tuple[Path, Future[None]]] = deque()
+    max_pending = max(1, max_workers) * 2
+
+    def drain(limit: int) -> None:
+        while len(pending) > limit:
+            path, future = pending.popleft()
+            try:
+                future.result()
+                results.append(WriteResult(output_file=path, success=True))
+            except Exception as e:
+                logger.error("Failed to write %s: %s", path, e)
+                results.append(WriteResult(output_file=path, success=False, error=str(e)))
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        for data, output_path in items:
+            path = Path(output_path)
+            parent = path.parent
+
+            if parent not in created_dirs:
+                try:
+                    parent.mkdir(parents=True, exist_ok=True)
+                    created_dirs[parent] = None
+                except OSError as e:
+                    created_dirs[parent] = f"Error creating directory {parent}: {e}"
+
+            dir_error = created_dirs[parent]
+            if dir_error is not None:
+                drain(0)
+                results.append(WriteResult(output_file=path, success=False, error=dir_error))
+                continue
+
+            pending.append((path, executor.submit(_write_json_file, data, path)))
+            drain(max_pending)
+
+        drain(0)
+
+        if fsync:
+            syncs = [
+                (index, result.output_file, executor.submit(_fsync_file, result.output_file))
+                for index, result in enumerate(results)
+                if result.success
+            ]
+            for index, path, future in syncs:
+                try:
+                    future.result()
+                except OSError as e:
+                    logger.error("Failed to fsync %s: %s", path, e)
+                    results[index] = WriteResult(
+                        output_file=path, success=False, error=f"Error syncing {path}: {e}"
+                    )
+
+    if fsync:
+        for directory, error in created_dirs.items():
+            if error is None:
+                _fsync_directory(directory)
+
+    succeeded = sum(1 for r in results if r.success)
+    logger.info(f"Wrote {succeeded}/{len(results)} JSON files")
+    return results
+
+
+def _write_json_file(data: dict[str, Any] | bytes, path: Path) -> None:
+    """Serialize data and write it to an existing directory."""
+    if isinstance(data, bytes):
+        content = data
+    else:
+        content = (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(content)
+
+
+def _fsync_file(path: Path) -> None:
+    """Flush a written file's data to disk."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Flush a directory's entries to disk (no-op where unsupported)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def migrate_yaml_file_to_json(source_path: str | Path, output_path: str | Path) -> None:
+    """
+    Stream a YAML file straight to a JSON file without loading it into memory.
+
+    Uses the event-based transcoder, so memory stays flat regardless of document
+    size. Documents that use merge keys fall back to a full load.
+
+    Args:
+        source_path: Path to the YAML file to convert
+        output_path: Path where JSON file should be written
+
+    Raises:
+        MigrationError: If conversion or file writing fails
+    """
+    path = Path(output_path)
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(source_path, "rb") as src, open(path, "w", encoding="utf-8") as f:
+            try:
+                transcode_yaml_to_json(src, f, indent=2)
+            except UnsupportedYAMLError:
+                logger.debug("Falling back to full YAML load for %s", source_path)
+                src.seek(0)
+                f.seek(0)
+                f.truncate()
+                json.dump(yaml.safe_load(src), f, indent=2, ensure_ascii=False)
+            f.write("\n")  # Add trailing newline
+
+        logger.debug("Migrated to JSON: %s", output_path)
+
+    except MigrationError:
+        raise
+    except Exception as e:
+        raise MigrationError(f"Error converting {source_path} to {output_path}: {e}") from e
+
+
+def convert_yaml_to_json(yaml_data: dict[str, Any] | str | bytes | IO[str] | IO[bytes]) -> str:
     """
     Convert YAML data to JSON string.
 
+    Parsed dictionaries are dumped directly. Raw YAML text, bytes, or streams are
+    transcoded from the YAML event stream without building an intermediate dict.
+
     Args:
-        yaml_data: Dictionary from parsed YAML
+        yaml_data: Dictionary from parsed YAML, or raw YAML content
 
     Returns:
         JSON string representation
@@ -51,6 +233,16 @@ def convert_yaml_to_json(yaml_data: dict[str, Any]) -> str:
     Raises:
         MigrationError: If conversion fails
     """
+    if not isinstance(yaml_data, dict):
+        buffer = io.StringIO()
+        try:
+            transcode_yaml_to_json(yaml_data, buffer, indent=2)
+        except UnsupportedYAMLError:
+            if not isinstance(yaml_data, str | bytes):
+                raise
+            return convert_yaml_to_json(yaml.safe_load(yaml_data))
+        return buffer.getvalue()
+
     try:
         return json.dumps(yaml_data, indent=2, ensure_ascii=False)
     except Exception as e:
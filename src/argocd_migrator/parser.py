@@ -1,8 +1,11 @@
 """YAML parser for ArgoCD Application manifests."""
 
 import logging
+import stat
+from collections.abc import Generator
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 import yaml
 
@@ -11,12 +14,214 @@ from argocd_migrator.exceptions import ParserError
 logger = logging.getLogger(__name__)
 
 
-def parse_yaml_file(file_path: str | Path) -> dict[str, Any]:
+@dataclass(frozen=True)
+class ParserLimits:
+    """Resource limits applied to every YAML file before and while parsing."""
+
+    max_file_bytes: int = 16 * 1024 * 1024
+    max_depth: int = 128
+    max_aliases: int = 1_000
+    max_nodes: int = 1_000_000
+
+
+DEFAULT_LIMITS = ParserLimits()
+
+
+class _LimitExceeded(yaml.YAMLError):
+    """Raised by the guarded loader when a document exceeds a parser limit."""
+
+
+class _GuardedLoader(yaml.SafeLoader):
+    """SafeLoader that bounds nesting depth and alias use while composing nodes."""
+
+    def __init__(self, stream: str | IO[bytes] | IO[str], limits: ParserLimits) -> None:
+        super().__init__(stream)
+        self.limits = limits
+        self._depth = 0
+        self._aliases = 0
+
+    def next_event(self) -> Any:
+        """Consume and return the next parser event."""
+        return self.get_event()  # type: ignore[no-untyped-call]
+
+    def mapping_tag(self, start: Any) -> str:
+        """Resolve the tag of the mapping that ``start`` (a MappingStartEvent) opens."""
+        if start.tag is None or start.tag == "!":
+            return str(self.resolve(yaml.MappingNode, None, start.implicit))  # type: ignore[no-untyped-call]
+        return str(start.tag)
+
+    def compose_node(self, parent: Any, index: Any) -> Any:
+        if self.check_event(yaml.AliasEvent):
+            self._aliases += 1
+            if self._aliases > self.limits.max_aliases:
+                raise _LimitExceeded(f"more than {self.limits.max_aliases} aliases")
+            return super().compose_node(parent, index)
+
+        self._depth += 1
+        try:
+            if self._depth > self.limits.max_depth:
+                raise _LimitExceeded(f"nesting deeper than {self.limits.max_depth} levels")
+            return super().compose_node(parent, index)
+        finally:
+            self._depth -= 1
+
+
+def _check_expanded_size(root: yaml.Node, max_nodes: int) -> None:
+    """
+    Reject node graphs whose aliases would expand past ``max_nodes`` nodes.
+
+    Aliases share nodes, so a small document can describe an exponentially large
+    tree ("billion laughs"); sizes are computed per shared node without expanding.
+    """
+    sizes: dict[int, int] = {}
+    active: set[int] = set()
+
+    def size(node: yaml.Node) -> int:
+        key = id(node)
+        if key in sizes:
+            return sizes[key]
+        if key in active:
+            raise _LimitExceeded("recursive alias")
+        active.add(key)
+        total = 1
+        if isinstance(node, yaml.SequenceNode):
+            children = node.value
+        elif isinstance(node, yaml.MappingNode):
+            children = [child for pair in node.value for child in pair]
+        else:
+            children = []
+        for child in children:
+            total += size(child)
+            if total > max_nodes:
+                raise _LimitExceeded(f"aliases expand to more than {max_nodes} nodes")
+        active.discard(key)
+        sizes[key] = total
+        return total
+
+    size(root)
+
+
+def _load_guarded(content: str, limits: ParserLimits) -> Any:
+    """``yaml.safe_load`` with the composed node graph checked against ``limits``."""
+    loader = _GuardedLoader(content, limits)
+    try:
+        node = loader.get_single_node()
+        if node is None:
+            return None
+        _check_expanded_size(node, limits.max_nodes)
+        return loader.construct_document(node)
+    finally:
+        loader.dispose()
+
+
+def iter_yaml_documents(
+    stream: IO[bytes] | IO[str], source: str = "<stdin>", limits: ParserLimits = DEFAULT_LIMITS
+) -> Generator[tuple[str, Any], None, None]:
+    """
+    Incrementally parse a multi-document YAML stream.
+
+    Documents are composed one at a time as the stream is read, so memory is bounded
+    by the largest document rather than the stream. A document whose top-level
+    mapping holds an ``items`` sequence (a kubectl ``List``, e.g. from
+    ``kubectl get applications -A -o yaml``) is expanded: each item is yielded as
+    soon as it has been read, and the list's other keys are discarded. The depth,
+    alias and node limits apply to each document or item.
+
+    Args:
+        stream: Binary or text stream, e.g. ``sys.stdin.buffer``
+        source: Name of the stream used in labels and error messages
+        limits: Nesting and alias limits (``max_file_bytes`` does not apply)
+
+    Yields:
+        ``(label, data)`` pairs, labelled ``<source>#<document>`` or
+        ``<source>#<document>.items[<index>]``
+
+    Raises:
+        ParserError: If the stream is not valid YAML or a document exceeds the limits;
+            the stream cannot be read past the error
+    """
+    loader = _GuardedLoader(stream, limits)
+
+    def construct(node: yaml.Node) -> Any:
+        _check_expanded_size(node, limits.max_nodes)
+        loader._aliases = 0
+        return loader.construct_document(node)
+
+    document = 0
+    try:
+        loader.next_event()  # StreamStartEvent
+        while not loader.check_event(yaml.StreamEndEvent):
+            loader.next_event()  # DocumentStartEvent
+            document += 1
+            label = f"{source}#{document}"
+            if not loader.check_event(yaml.MappingStartEvent):
+                data = construct(loader.compose_node(None, None))
+                if data is not None:
+                    yield label, data
+            else:
+                # Compose the top-level mapping pair by pair to spot an items list
+                start = loader.next_event()
+                node = yaml.MappingNode(
+                    loader.mapping_tag(start), [], start.start_mark, None, start.flow_style
+                )
+                if start.anchor is not None:
+                    loader.anchors[start.anchor] = node
+                is_list = False
+                while not loader.check_event(yaml.MappingEndEvent):
+                    key = loader.compose_node(node, None)
+                    if key.value == "items" and loader.check_event(yaml.SequenceStartEvent):
+                        is_list = True
+                        loader.next_event()
+                        index = 0
+                        while not loader.check_event(yaml.SequenceEndEvent):
+                            item = construct(loader.compose_node(None, None))
+                            yield f"{label}.items[{index}]", item
+                            index += 1
+                        loader.next_event()
+                    else:
+                        node.value.append((key, loader.compose_node(node, key)))
+                node.end_mark = loader.next_event().end_mark
+                if not is_list:
+                    yield label, construct(node)
+            loader.next_event()  # DocumentEndEvent
+            loader.anchors = {}
+    except _LimitExceeded as e:
+        raise ParserError(f"YAML in {source}#{document} exceeds parser limits: {e}") from e
+    except yaml.YAMLError as e:
+        raise ParserError(f"YAML syntax error in {source}: {e}") from e
+    finally:
+        loader.dispose()
+
+
+def validate_application(data: Any, source: str | Path) -> dict[str, Any]:
+    """
+    Check that parsed YAML is an ArgoCD Application.
+
+    Args:
+        data: Parsed YAML document
+        source: Path or label the document came from (for error messages)
+
+    Returns:
+        The document, typed as a dictionary
+
+    Raises:
+        ParserError: If the document is not a dictionary or not a valid Application
+    """
+    if not isinstance(data, dict):
+        raise ParserError(f"YAML file {source} does not contain a dictionary")
+    _validate_argocd_application(data, source)
+    return data
+
+
+def parse_yaml_file(
+    file_path: str | Path, limits: ParserLimits = DEFAULT_LIMITS
+) -> dict[str, Any]:
     """
     Parse a YAML file and validate it as an ArgoCD Application.
 
     Args:
         file_path: Path to the YAML file to parse
+        limits: Size, nesting and alias limits (default: DEFAULT_LIMITS)
 
     Returns:
         Dictionary containing the parsed ArgoCD Application
@@ -24,30 +229,94 @@ def parse_yaml_file(file_path: str | Path) -> dict[str, Any]:
     Raises:
         ParserError: If file cannot be parsed or is not a valid ArgoCD Application
     """
+    return parse_yaml_content(
+        read_yaml_file(file_path, limits.max_file_bytes), file_path, limits
+    )
+
+
+def read_yaml_file(
+    file_path: str | Path, max_bytes: int = DEFAULT_LIMITS.max_file_bytes
+) -> bytes:
+    """
+    Read the raw bytes of a YAML file.
+
+    The size is checked with a stat before reading, and at most ``max_bytes + 1``
+    bytes are read in case the file grows in between.
+
+    Args:
+        file_path: Path to the YAML file to read
+        max_bytes: Largest accepted file size
+
+    Returns:
+        File content as bytes
+
+    Raises:
+        ParserError: If the path is missing, not a file, too large, or cannot be read
+    """
     path = Path(file_path)
 
-    if not path.exists():
-        raise ParserError(f"File does not exist: {file_path}")
+    try:
+        st = path.stat()
+    except FileNotFoundError as e:
+        raise ParserError(f"File does not exist: {file_path}") from e
+    except OSError as e:
+        raise ParserError(f"Error reading file {file_path}: {e}") from e
 
-    if not path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         raise ParserError(f"Path is not a file: {file_path}")
 
+    if st.st_size > max_bytes:
+        raise ParserError(
+            f"File {file_path} is {st.st_size} bytes, over the {max_bytes}-byte limit"
+        )
+
     try:
-        with open(path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        with open(path, "rb") as f:
+            content = f.read(max_bytes + 1)
+    except Exception as e:
+        raise ParserError(f"Error reading file {file_path}: {e}") from e
+
+    if len(content) > max_bytes:
+        raise ParserError(f"File {file_path} is over the {max_bytes}-byte limit")
+    return content
 
+
+def parse_yaml_content(
+    content: str | bytes, file_path: str | Path, limits: ParserLimits = DEFAULT_LIMITS
+) -> dict[str, Any]:
+    """
+    Parse YAML content and validate it as an ArgoCD Application.
+
+    Nesting depth, alias count and the alias-expanded document size are bounded by
+    ``limits`` so alias bombs and deeply nested documents fail fast.
+
+    Args:
+        content: Raw YAML text or UTF-8 bytes
+        file_path: Path the content was read from (for error messages)
+        limits: Nesting and alias limits (default: DEFAULT_LIMITS)
+
+    Returns:
+        Dictionary containing the parsed ArgoCD Application
+
+    Raises:
+        ParserError: If content cannot be parsed or is not a valid ArgoCD Application
+    """
+    try:
+        if isinstance(content, bytes):
+            content = content.decode("utf-8")
+        data = _load_guarded(content, limits)
+
+    except _LimitExceeded as e:
+        raise ParserError(f"YAML in {file_path} exceeds parser limits: {e}") from e
     except yaml.YAMLError as e:
         raise ParserError(f"YAML syntax error in {file_path}: {e}") from e
     except Exception as e:
         raise ParserError(f"Error reading file {file_path}: {e}") from e
 
-    if not isinstance(data, dict):
-        raise ParserError(f"YAML file {file_path} does not contain a dictionary")
-
     # Validate required ArgoCD Application fields
-    _validate_argocd_application(data, file_path)
+    data = validate_application(data, file_path)
 
-    logger.info(f"Parsed {file_path}: {data.get('metadata', {}).get('name', 'unknown')}")
+    logger.debug("Parsed %s: %s", file_path, data["metadata"].get("name"))
     return data
 
 
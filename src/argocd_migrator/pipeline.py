@@ -1,30 +1,88 @@
 """Pipeline orchestrator for coordinating migration stages."""
 
+import hashlib
+import json
 import logging
-from dataclasses import dataclass
+import pickle
+from collections.abc import Callable, Sequence
+from contextlib import closing, nullcontext
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
 from typing import Any
 
-from argocd_migrator.aggregator import aggregate_configs, validate_aggregated_structure
-from argocd_migrator.exceptions import MigratorError
-from argocd_migrator.parser import parse_yaml_file
-from argocd_migrator.scanner import scan_directory
+from argocd_migrator.aggregator import (
+    AggregatedConfigWriter,
+    aggregate_configs,
+    fragment_to_document,
+    serialize_config_fragment,
+    validate_aggregated_structure,
+    validate_config_structure,
+    write_error_report,
+)
+from argocd_migrator.cache import get_content_cache
+from argocd_migrator.exceptions import FileTimeoutError, MigratorError
+from argocd_migrator.executor import (
+    ExecutorBackend,
+    PipelineExecutor,
+    SchedulePolicy,
+    create_executor,
+)
+from argocd_migrator.journal import JournalEntry, JournalWriter, content_digest, load_journal
+from argocd_migrator.memory import NULL_MEMORY_PROFILER, MemoryProfiler
+from argocd_migrator.metrics import FileTimings, PipelineMetrics, timed, worker_peak_rss
+from argocd_migrator.migrator import WriteResult, migrate_many_to_json
+from argocd_migrator.parser import parse_yaml_content, read_yaml_file
+from argocd_migrator.policy import ExecutionPolicy
+from argocd_migrator.progress import NULL_PROGRESS, ProgressReporter
+from argocd_migrator.scanner import file_sizes, scan_directory
+from argocd_migrator.sharding import (
+    Shard,
+    ShardEntry,
+    ShardPartial,
+    combine_partials,
+    read_partial,
+    write_partial,
+)
+from argocd_migrator.sidecar import BlockStore
+from argocd_migrator.tracing import NULL_RECORDER, Span, TraceRecorder
 from argocd_migrator.transformer import transform_to_generator_config
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
+class FileStats:
+    """Per-file measurements carried from a worker until the run records them."""
+
+    timings: FileTimings = field(default_factory=dict)
+    spans: list[Span] | None = None
+    worker_rss_bytes: int = 0
+
+
+@dataclass(slots=True)
 class TransformationResult:
-    """Result of transforming a single ArgoCD Application."""
+    """
+    Result of transforming a single ArgoCD Application.
+
+    ``stats`` is cleared once the run has recorded it (see ``record_result``), and
+    ``run_pipeline`` releases ``transformed_config`` and ``fragment`` once they are
+    written unless asked to keep them, so retained results stay small.
+    """
 
     source_file: Path
     success: bool
     transformed_config: dict[str, Any] | None = None
     error: str | None = None
+    app_name: str | None = None
+    fragment: bytes | None = None
+    config_digest: str | None = None
+    content_digest: str | None = None
+    bytes_read: int = 0
+    stats: FileStats | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineResult:
     """Result of aggregated pipeline execution."""
 
@@ -33,6 +91,11 @@ class PipelineResult:
     failed: int
     output_file: Path | None
     results: list[TransformationResult]
+    per_file_results: list[WriteResult] = field(default_factory=list)
+    skipped: int = 0
+    resumed: int = 0
+    error_report: Path | None = None
+    metrics: PipelineMetrics | None = None
 
     @property
     def success_rate(self) -> float:
@@ -42,45 +105,306 @@ class PipelineResult:
         return (self.successful / self.total) * 100
 
 
-def transform_file(source_file: Path) -> TransformationResult:
+def transform_file(
+    source_file: Path, trace: bool = False, cache: bool = False, checksum: bool = False
+) -> TransformationResult:
     """
     Parse and transform a single YAML file to generator config format.
 
     Args:
         source_file: Path to source YAML file
+        trace: Whether to record a trace span per stage
+        cache: Whether to reuse configs of identical content transformed earlier in
+            this process
+        checksum: Whether to set ``content_digest`` for the checkpoint journal
 
     Returns:
-        TransformationResult with outcome details
+        TransformationResult with outcome details and per-stage timings
     """
+    timings: FileTimings = {}
+    spans: list[Span] | None = [] if trace else None
     try:
-        # Stage 2: Parse YAML
-        logger.debug(f"Parsing {source_file}")
-        argocd_app = parse_yaml_file(source_file)
+        # Stage 2: Read and parse YAML
+        logger.debug("Parsing %s", source_file)
+        content = timed(timings, "read", read_yaml_file, source_file, spans=spans)
+    except MigratorError as e:
+        logger.error("Failed to transform %s: %s", source_file, e)
+        return TransformationResult(
+            source_file=source_file,
+            success=False,
+            error=str(e),
+            stats=_file_stats(timings, spans),
+        )
+    return _transform_content(source_file, content, timings, spans, cache, checksum)
 
-        # Stage 3: Transform to generator config
-        logger.debug(f"Transforming {source_file}")
-        config = transform_to_generator_config(argocd_app)
 
-        logger.info(f"Successfully transformed {source_file}")
+def transform_content(
+    item: tuple[Path, bytes], trace: bool = False, cache: bool = False, checksum: bool = False
+) -> TransformationResult:
+    """
+    Parse and transform YAML content that was read elsewhere, e.g. an archive member.
+
+    Args:
+        item: (label used in place of a file path, raw YAML content)
+        trace: Whether to record a trace span per stage
+        cache: Whether to reuse configs of identical content (see ``transform_file``)
+        checksum: Whether to set ``content_digest`` for the checkpoint journal
+
+    Returns:
+        TransformationResult with outcome details and per-stage timings
+    """
+    source_file, content = item
+    return _transform_content(source_file, content, {}, [] if trace else None, cache, checksum)
+
+
+def _transform_content(
+    source_file: Path,
+    content: bytes,
+    timings: FileTimings,
+    spans: list[Span] | None,
+    cache: bool,
+    checksum: bool = False,
+) -> TransformationResult:
+    bytes_read = len(content)
+    digest: bytes | None = None
+    try:
+        digest = hashlib.sha256(content).digest() if cache or checksum else None
+        cached = get_content_cache().get(digest) if cache and digest is not None else None
+
+        if cached is not None:
+            logger.debug("Content cache hit for %s", source_file)
+            config = timed(timings, "cache", pickle.loads, cached, spans=spans)
+        else:
+            argocd_app = timed(
+                timings, "parse", parse_yaml_content, content, source_file, spans=spans
+            )
+
+            # Stage 3: Transform to generator config
+            logger.debug("Transforming %s", source_file)
+            config = timed(
+                timings, "transform", transform_to_generator_config, argocd_app, spans=spans
+            )
+            if cache and digest is not None:
+                get_content_cache().put(digest, pickle.dumps(config, pickle.HIGHEST_PROTOCOL))
+
+        logger.debug("Successfully transformed %s", source_file)
         return TransformationResult(
             source_file=source_file,
             success=True,
-            transformed_config=config
+            transformed_config=config,
+            app_name=config["metadata"].get("name"),
+            content_digest=digest.hex() if checksum and digest is not None else None,
+            bytes_read=bytes_read,
+            stats=_file_stats(timings, spans),
         )
 
     except MigratorError as e:
-        logger.error(f"Failed to transform {source_file}: {e}")
+        logger.error("Failed to transform %s: %s", source_file, e)
+        # A timeout says nothing about the content, so it must not be journaled
+        journaled = checksum and digest is not None and not isinstance(e, FileTimeoutError)
+        return TransformationResult(
+            source_file=source_file,
+            success=False,
+            error=str(e),
+            content_digest=digest.hex() if journaled and digest is not None else None,
+            bytes_read=bytes_read,
+            stats=_file_stats(timings, spans),
+        )
+
+
+def transform_file_to_fragment(
+    item: tuple[int, Path],
+    validate: bool = True,
+    trace: bool = False,
+    cache: bool = False,
+    checksum: bool = False,
+) -> TransformationResult:
+    """
+    Parse, transform, validate and serialize a single file inside a worker.
+
+    The returned result carries the pre-indented JSON fragment for the aggregated
+    array instead of the config dictionary, so process workers send back compact
+    bytes rather than pickled dict trees.
+
+    Args:
+        item: (index in the aggregated array, path to source YAML file)
+        validate: Whether to validate the config structure
+        trace: Whether to record a trace span per stage
+        cache: Whether to reuse configs of identical content (see ``transform_file``)
+        checksum: Whether to set ``content_digest`` for the checkpoint journal
+
+    Returns:
+        TransformationResult with ``fragment`` and ``config_digest`` set on success
+    """
+    index, source_file = item
+    result = transform_file(source_file, trace=trace, cache=cache, checksum=checksum)
+    config = result.transformed_config
+    if not result.success or config is None:
+        return result
+
+    stats = result.stats if result.stats is not None else FileStats()
+    timings, spans = stats.timings, stats.spans
+    try:
+        if validate:
+            timed(
+                timings, "validate", validate_config_structure, config, index, "scan index",
+                spans=spans,
+            )
+        fragment = timed(timings, "serialize", serialize_config_fragment, config, spans=spans)
+    except MigratorError as e:
+        logger.error("Failed to serialize %s: %s", source_file, e)
         return TransformationResult(
             source_file=source_file,
             success=False,
-            error=str(e)
+            error=str(e),
+            content_digest=None if isinstance(e, FileTimeoutError) else result.content_digest,
+            bytes_read=result.bytes_read,
+            stats=_file_stats(timings, spans),
         )
 
+    return TransformationResult(
+        source_file=source_file,
+        success=True,
+        app_name=result.app_name,
+        fragment=fragment,
+        config_digest=hashlib.sha256(fragment).hexdigest(),
+        content_digest=result.content_digest,
+        bytes_read=result.bytes_read,
+        stats=_file_stats(timings, spans),
+    )
+
+
+def _file_stats(timings: FileTimings, spans: list[Span] | None) -> FileStats:
+    return FileStats(timings, spans, worker_peak_rss())
+
+
+def record_result(
+    result: TransformationResult, metrics: PipelineMetrics, trace: TraceRecorder = NULL_RECORDER
+) -> None:
+    """
+    Hand a result's per-file measurements to the run's metrics and trace.
+
+    The result's ``stats`` are released afterwards, so results kept until the end
+    of the run do not hold timings and spans for every file.
+
+    Args:
+        result: Result returned by a worker
+        metrics: Metrics of the run
+        trace: Recorder receiving the result's spans
+    """
+    stats = result.stats
+    if stats is None:
+        metrics.record_file(result.source_file, {}, result.bytes_read)
+        return
+    metrics.record_file(
+        result.source_file, stats.timings, result.bytes_read, stats.worker_rss_bytes
+    )
+    trace.add_spans(stats.spans, result.source_file)
+    result.stats = None
+
+
+def timeout_result(
+    item: Path | tuple[int, Path] | tuple[Path, bytes], error: FileTimeoutError
+) -> TransformationResult:
+    """
+    Build the failed result for a work item whose timeout escaped its transform call.
+
+    Passed as ``on_timeout`` to ``PipelineExecutor.map`` for the items taken by
+    ``transform_file``, ``transform_file_to_fragment`` and ``transform_content``.
+    The result carries no content digest, so the file is retried on resume.
+    """
+    if isinstance(item, Path):
+        source_file = item
+    else:
+        source_file = item[1] if isinstance(item[0], int) else item[0]
+    logger.error("Failed to transform %s: %s", source_file, error)
+    return TransformationResult(source_file=source_file, success=False, error=str(error))
+
+
+def write_per_file_output(
+    results: list[TransformationResult],
+    source_dir: Path,
+    output_dir: Path,
+    fsync: bool = False,
+) -> list[WriteResult]:
+    """
+    Write each successful transformation to its own JSON file.
+
+    Output paths mirror the source layout under ``output_dir`` with a ``.json``
+    suffix, e.g. ``team-a/app.yaml`` becomes ``<output_dir>/team-a/app.json``.
+    Sources that map to the same output path, such as ``app.yaml`` next to
+    ``app.yml``, are not written and are reported as failed.
+
+    Args:
+        results: Transformation results from the pipeline
+        source_dir: Directory the source files were scanned from
+        output_dir: Directory receiving the per-file JSON output
+        fsync: Whether to fsync written files and directories
+
+    Returns:
+        One WriteResult per successful transformation
+    """
+    planned = [
+        (r, _per_file_path(r.source_file, source_dir, output_dir))
+        for r in results
+        if r.success and (r.transformed_config is not None or r.fragment is not None)
+    ]
+    sources: dict[Path, list[Path]] = {}
+    for r, path in planned:
+        sources.setdefault(path, []).append(r.source_file)
+
+    items = (
+        (
+            r.transformed_config
+            if r.transformed_config is not None
+            else fragment_to_document(r.fragment or b""),
+            path,
+        )
+        for r, path in planned
+        if len(sources[path]) == 1
+    )
+    written = iter(migrate_many_to_json(items, fsync=fsync))
+
+    write_results: list[WriteResult] = []
+    for r, path in planned:
+        if len(sources[path]) == 1:
+            write_results.append(next(written))
+            continue
+        names = ", ".join(str(source) for source in sources[path])
+        error = f"Output path {path} would be written by several sources: {names}"
+        logger.error("Failed to write %s: %s", path, error)
+        write_results.append(WriteResult(output_file=path, success=False, error=error))
+    return write_results
+
+
+def _per_file_path(source_file: Path, source_dir: Path, output_dir: Path) -> Path:
+    """Map a source YAML path to its per-file JSON output path."""
+    return (output_dir / source_file.relative_to(source_dir)).with_suffix(".json")
+
 
 def run_pipeline(
     source_dir: str | Path,
     output_file: str | Path = "config.json",
-    validate: bool = True
+    validate: bool = True,
+    per_file_dir: str | Path | None = None,
+    fsync: bool = False,
+    jobs: int = 1,
+    backend: ExecutorBackend | str = ExecutorBackend.PROCESS,
+    executor: PipelineExecutor | None = None,
+    timeout: float | None = None,
+    serialize_in_workers: bool = False,
+    policy: ExecutionPolicy | None = None,
+    error_report: str | Path | None = None,
+    trace: TraceRecorder | None = None,
+    memory: MemoryProfiler | None = None,
+    content_cache: bool = False,
+    progress: ProgressReporter | None = None,
+    schedule: SchedulePolicy | str = SchedulePolicy.SIZE,
+    shard: Shard | None = None,
+    journal: str | Path | None = None,
+    resume: bool = False,
+    blocks: BlockStore | None = None,
+    keep_configs: bool = False,
 ) -> PipelineResult:
     """
     Run the full aggregated migration pipeline on a directory.
@@ -88,19 +412,141 @@ def run_pipeline(
     Args:
         source_dir: Directory containing YAML files
         output_file: Path where aggregated config.json should be written
-        validate: Whether to validate aggregated config (default: True)
+        validate: Whether to validate each config; an invalid config fails its file
+            like a transform error (default: True)
+        per_file_dir: Optional directory that additionally receives one JSON file per
+            application, mirroring the source layout
+        fsync: Whether per-file output should be fsynced for durability
+        jobs: Number of parallel workers for parsing and transformation (default: 1)
+        backend: Executor backend used when jobs > 1
+        executor: Existing executor to use instead of creating one (not shut down)
+        timeout: Wall-clock limit in seconds for each file on the executor the
+            pipeline creates; a file that exceeds it fails like a transform error.
+            Thread workers cannot interrupt a running file, so the ``thread``
+            backend does not enforce it (default: none)
+        serialize_in_workers: Validate and serialize each config inside the worker and
+            merge the returned byte fragments (output is byte-identical)
+        policy: Error-handling policy (default: process everything, write nothing on
+            failure)
+        error_report: Where the ``continue`` policy writes its error report
+            (default: ``<output stem>.errors.json`` next to the output file)
+        trace: Recorder that receives a span per stage per file (default: disabled)
+        memory: Active memory profiler that measures each stage (default: disabled)
+        content_cache: Reuse configs of byte-identical files seen earlier by the same
+            worker process, e.g. across the jobs of a batch
+        progress: Reporter updated as each file completes (default: disabled)
+        schedule: How parallel workers receive files: ``size`` hands out the largest
+            files first in byte-balanced chunks so a few huge files do not finish
+            last on one worker; ``fifo`` uses equal-count chunks in scan order. The
+            output is identical either way.
+        shard: Process only this shard's files and write its partial result
+            (configs and errors) to ``output_file`` instead of the aggregated config;
+            ``merge_shards`` combines the partials of all shards
+        journal: Checkpoint journal that records each completed file (content hash
+            plus config or error) in batches as the run progresses
+        resume: Reuse the journal's results for files whose content hash is
+            unchanged and only process the rest; without it the journal is
+            started afresh. Output is byte-identical to an uninterrupted run.
+        blocks: Store that receives large ``helm``/``kustomize`` blocks once by
+            content hash; the written configs reference them instead of embedding
+            them (see ``sidecar.load_configs``)
+        keep_configs: Keep each result's ``transformed_config`` and ``fragment``
+            after they are written instead of releasing them
 
     Returns:
-        PipelineResult with summary statistics
+        PipelineResult with summary statistics and run metrics
+
+    Raises:
+        ValueError: If ``blocks`` is combined with ``serialize_in_workers``, or
+            ``timeout`` with an existing ``executor``
     """
-    source_path = Path(source_dir)
-    output_path = Path(output_file)
+    if blocks is not None and serialize_in_workers:
+        raise ValueError("Sidecar blocks need configs, not serialized fragments")
+    if timeout is not None and executor is not None:
+        raise ValueError("Set the timeout on the given executor instead")
+    metrics = PipelineMetrics()
+    metrics.start()
+    result = _run_pipeline(
+        Path(source_dir),
+        Path(output_file),
+        validate=validate,
+        per_file_dir=per_file_dir,
+        fsync=fsync,
+        jobs=jobs,
+        backend=backend,
+        executor=executor,
+        timeout=timeout,
+        serialize_in_workers=serialize_in_workers,
+        policy=policy or ExecutionPolicy(),
+        error_report=error_report,
+        metrics=metrics,
+        trace=trace if trace is not None else NULL_RECORDER,
+        memory=memory if memory is not None else NULL_MEMORY_PROFILER,
+        content_cache=content_cache,
+        progress=progress if progress is not None else NULL_PROGRESS,
+        schedule=SchedulePolicy(schedule),
+        shard=shard,
+        journal=Path(journal) if journal is not None else None,
+        resume=resume,
+        blocks=blocks,
+    )
+    metrics.finish()
+    if not keep_configs:
+        for file_result in result.results:
+            file_result.transformed_config = None
+            file_result.fragment = None
+    metrics.files = len(result.results)
+    metrics.successful = result.successful
+    metrics.failed = result.failed
+    metrics.skipped = result.skipped
+    result.metrics = metrics
+    return result
+
+
+def _run_pipeline(
+    source_path: Path,
+    output_path: Path,
+    validate: bool,
+    per_file_dir: str | Path | None,
+    fsync: bool,
+    jobs: int,
+    backend: ExecutorBackend | str,
+    executor: PipelineExecutor | None,
+    timeout: float | None,
+    serialize_in_workers: bool,
+    policy: ExecutionPolicy,
+    error_report: str | Path | None,
+    metrics: PipelineMetrics,
+    trace: TraceRecorder,
+    memory: MemoryProfiler,
+    content_cache: bool,
+    progress: ProgressReporter,
+    schedule: SchedulePolicy,
+    shard: Shard | None,
+    journal: Path | None,
+    resume: bool,
+    blocks: BlockStore | None,
+) -> PipelineResult:
+    source_dir = source_path
+    parallel = (executor.jobs if executor else jobs) > 1
 
     # Stage 1: Scan for YAML files
     logger.info(f"Scanning directory: {source_dir}")
-    yaml_files = scan_directory(source_path)
-
-    if not yaml_files:
+    with metrics.stage("scan"), trace.span("scan"), memory.stage("scan"):
+        yaml_files = scan_directory(source_path)
+        scanned = len(yaml_files)
+        if shard is not None:
+            yaml_files = shard.select(yaml_files, source_path)
+            logger.info(f"Shard {shard} selected {len(yaml_files)}/{scanned} files")
+        reused: dict[int, TransformationResult] = {}
+        if journal is not None and resume:
+            reused = _resume_from_journal(yaml_files, source_path, journal)
+        todo = [(i, f) for i, f in enumerate(yaml_files) if i not in reused]
+        sizes = None
+        if parallel and schedule is SchedulePolicy.SIZE:
+            sizes = file_sizes([f for _, f in todo])
+
+    if not yaml_files and shard is None:
         logger.warning(f"No YAML files found in {source_dir}")
         # Write empty array for empty input
         try:
@@ -124,69 +570,405 @@ def run_pipeline(
 
     logger.info(f"Found {len(yaml_files)} YAML files to process")
 
-    # Stage 2 & 3: Parse and transform each file
-    results: list[TransformationResult] = []
-    transformed_configs: list[dict[str, Any]] = []
-
-    for yaml_file in yaml_files:
-        result = transform_file(yaml_file)
-        results.append(result)
+    # Stage 2 & 3: Parse and transform each file not reused from the journal
+    fresh: dict[int, TransformationResult] = {}
+    checksum = journal is not None
+
+    work: Callable[[Any], TransformationResult] = partial(
+        transform_file, trace=trace.enabled, cache=content_cache, checksum=checksum
+    )
+    items: Sequence[Any] = [f for _, f in todo]
+    if serialize_in_workers:
+        work = partial(
+            transform_file_to_fragment,
+            validate=validate,
+            trace=trace.enabled,
+            cache=content_cache,
+            checksum=checksum,
+        )
+        items = todo
 
-        if result.success and result.transformed_config:
-            transformed_configs.append(result.transformed_config)
+    # Configs are validated per file on both paths, so an invalid config fails its
+    # own file the same way with or without serialize_in_workers
+    if validate:
+        for index, result in reused.items():
+            reused[index] = _validate_result(result, index)
+    failed = sum(not r.success for r in reused.values())
+    if failed and policy.should_stop(failed):
+        logger.error(f"Stopping after {failed} journaled failure(s) (policy: {policy})")
+        items, sizes = [], None
+    progress.start(len(items))
+    # Results arrive as chunks complete (largest files first under the size
+    # schedule), so the policy sees each failure when it happens rather than once
+    # every earlier file is done; they are put back in scan order below
+    with (
+        memory.stage("transform"),
+        JournalWriter(journal, append=resume) if journal is not None else nullcontext()
+        as journal_writer,
+        nullcontext(executor) if executor else create_executor(backend, jobs, timeout) as pool,
+        closing(
+            pool.map_completed(work, items, sizes=sizes, on_timeout=timeout_result)
+        ) as mapped,
+    ):
+        for position, result in mapped:
+            index = todo[position][0]
+            if validate and not serialize_in_workers:
+                result = _validate_result(result, index)
+            fresh[index] = result
+            record_result(result, metrics, trace)
+            progress.advance(result.bytes_read, failed=not result.success)
+            if journal_writer is not None and result.content_digest is not None:
+                journal_writer.record(_journal_entry(result, source_path))
+
+            if not result.success:
+                failed += 1
+                if policy.should_stop(failed):
+                    logger.error(f"Stopping after {failed} failed file(s) (policy: {policy})")
+                    break
+    progress.finish()
+
+    # Put journaled and fresh results back in scan order
+    completed = reused | fresh
+    results = [completed[index] for index in sorted(completed)]
+    written = [
+        r
+        for r in results
+        if r.success and (r.transformed_config or r.fragment is not None)
+    ]
 
     # Calculate statistics
-    successful = sum(1 for r in results if r.success)
-    failed = sum(1 for r in results if not r.success)
+    total = len(yaml_files)
+    successful = len(results) - failed
+    skipped = total - len(results)
+
+    # A shard hands its configs and errors to the merge step, which applies the
+    # failure policy and validation across all shards
+    if shard is not None:
+        shard_result = _write_shard_output(
+            results,
+            shard,
+            source_path,
+            scanned,
+            skipped,
+            output_path,
+            per_file_dir,
+            fsync,
+            metrics,
+        )
+        shard_result.resumed = len(reused)
+        return shard_result
 
     # If any transformation failed, don't proceed with aggregation
-    if failed > 0:
-        logger.error(f"Pipeline failed: {failed}/{len(results)} transformations failed")
+    if failed > 0 and not policy.writes_partial_output:
+        logger.error(f"Pipeline failed: {failed}/{total} transformations failed")
         return PipelineResult(
-            total=len(results),
+            total=total,
             successful=successful,
             failed=failed,
             output_file=None,
-            results=results
+            results=results,
+            resumed=len(reused),
+            skipped=skipped,
         )
 
-    # Stage 4: Validate aggregated structure
-    if validate:
+    report_path: Path | None = None
+    if policy.writes_partial_output:
+        report_path = Path(error_report) if error_report else default_error_report(output_path)
         try:
-            logger.debug("Validating aggregated config structure")
-            validate_aggregated_structure(transformed_configs)
-        except MigratorError as e:
-            logger.error(f"Aggregated config validation failed: {e}")
-            return PipelineResult(
-                total=len(results),
-                successful=0,
-                failed=len(results),
-                output_file=None,
-                results=results
+            write_error_report(
+                [(r.source_file, r.error or "") for r in results if not r.success],
+                total,
+                report_path,
             )
+        except MigratorError as e:
+            logger.error(f"Failed to write error report: {e}")
+            report_path = None
 
-    # Stage 5: Write aggregated config
+    # Stage 4: Write aggregated config
     try:
-        aggregate_configs(transformed_configs, output_path)
+        with memory.stage("write"), AggregatedConfigWriter(output_path) as writer:
+            for r in written:
+                fragment = r.fragment
+                if fragment is None:
+                    with metrics.stage("serialize"), trace.span("serialize", r.source_file):
+                        config = r.transformed_config or {}
+                        if blocks is not None:
+                            config = blocks.externalize(config)
+                        fragment = serialize_config_fragment(config)
+                with metrics.stage("write"), trace.span("write", r.source_file):
+                    writer.write(fragment)
+            with metrics.stage("write"), trace.span("commit"):
+                writer.commit()
+        metrics.bytes_written = writer.bytes_written
         logger.info(
-            f"Pipeline complete: {successful}/{len(results)} succeeded "
-            f"({(successful/len(results))*100:.1f}% success rate)"
+            f"Pipeline complete: {successful}/{total} succeeded "
+            f"({(successful/total)*100:.1f}% success rate)"
         )
 
+        # Stage 5: Optionally write one JSON file per application
+        per_file_results: list[WriteResult] = []
+        if per_file_dir is not None:
+            with memory.stage("per-file"):
+                per_file_results = write_per_file_output(
+                    results, source_path, Path(per_file_dir), fsync=fsync
+                )
+
         return PipelineResult(
-            total=len(results),
+            total=total,
             successful=successful,
             failed=failed,
             output_file=output_path,
-            results=results
+            results=results,
+            resumed=len(reused),
+            per_file_results=per_file_results,
+            error_report=report_path,
         )
 
     except MigratorError as e:
         logger.error(f"Failed to write aggregated config: {e}")
         return PipelineResult(
-            total=len(results),
+            total=total,
             successful=0,
             failed=len(results),
             output_file=None,
-            results=results
+            results=results,
+            resumed=len(reused),
+            error_report=report_path,
+        )
+
+
+def _validate_result(result: TransformationResult, index: int) -> TransformationResult:
+    """Validate a config in the main process, failing its file as a worker would."""
+    config = result.transformed_config
+    if not result.success or config is None:
+        return result
+    stats = result.stats if result.stats is not None else FileStats()
+    try:
+        timed(
+            stats.timings, "validate", validate_config_structure, config, index, "scan index",
+            spans=stats.spans,
         )
+    except MigratorError as e:
+        logger.error("Failed to validate %s: %s", result.source_file, e)
+        return TransformationResult(
+            source_file=result.source_file,
+            success=False,
+            error=str(e),
+            content_digest=result.content_digest,
+            bytes_read=result.bytes_read,
+            stats=result.stats,
+        )
+    return result
+
+
+def _resume_from_journal(
+    yaml_files: list[Path], source_path: Path, journal: Path
+) -> dict[int, TransformationResult]:
+    """Return the journaled results of files whose content is unchanged, by scan index."""
+    entries = load_journal(journal)
+    reused: dict[int, TransformationResult] = {}
+    for index, path in enumerate(yaml_files):
+        entry = entries.get(path.relative_to(source_path).as_posix())
+        if entry is None or content_digest(path) != entry.content_digest:
+            continue
+        reused[index] = TransformationResult(
+            source_file=path,
+            success=entry.error is None,
+            transformed_config=entry.config,
+            error=entry.error,
+            app_name=(entry.config or {}).get("metadata", {}).get("name"),
+            content_digest=entry.content_digest,
+        )
+    logger.info(f"Resuming: {len(reused)}/{len(yaml_files)} files unchanged since journaled")
+    return reused
+
+
+def _journal_entry(result: TransformationResult, source_path: Path) -> JournalEntry:
+    """Build the journal record of a freshly processed file."""
+    path = result.source_file.relative_to(source_path).as_posix()
+    if not result.success:
+        return JournalEntry(path, result.content_digest or "", error=result.error or "")
+    config = result.transformed_config
+    if config is None:
+        config = json.loads(result.fragment or b"{}")
+    return JournalEntry(path, result.content_digest or "", config=config)
+
+
+def _write_shard_output(
+    results: list[TransformationResult],
+    shard: Shard,
+    source_path: Path,
+    scanned: int,
+    skipped: int,
+    output_path: Path,
+    per_file_dir: str | Path | None,
+    fsync: bool,
+    metrics: PipelineMetrics,
+) -> PipelineResult:
+    """Write a shard's partial result and, optionally, its per-file output."""
+    entries = []
+    for r in results:
+        path = r.source_file.relative_to(source_path).as_posix()
+        if not r.success:
+            entries.append(ShardEntry(path, error=r.error or ""))
+        elif r.fragment is not None:
+            entries.append(ShardEntry(path, config=json.loads(r.fragment)))
+        elif r.transformed_config is not None:
+            entries.append(ShardEntry(path, config=r.transformed_config))
+    partial = ShardPartial(shard, str(source_path), scanned, entries, skipped)
+    failed = sum(not r.success for r in results)
+    total = len(results) + skipped
+
+    try:
+        with metrics.stage("write"):
+            write_partial(partial, output_path)
+    except MigratorError as e:
+        logger.error(f"Failed to write shard partial: {e}")
+        return PipelineResult(
+            total=total,
+            successful=0,
+            failed=len(results),
+            output_file=None,
+            results=results,
+            skipped=skipped,
+        )
+
+    per_file_results: list[WriteResult] = []
+    if per_file_dir is not None:
+        per_file_results = write_per_file_output(
+            results, source_path, Path(per_file_dir), fsync=fsync
+        )
+    return PipelineResult(
+        total=total,
+        successful=len(results) - failed,
+        failed=failed,
+        output_file=output_path,
+        results=results,
+        per_file_results=per_file_results,
+        skipped=skipped,
+    )
+
+
+def merge_shards(
+    partial_files: Sequence[str | Path],
+    output_file: str | Path = "config.json",
+    validate: bool = True,
+    policy: ExecutionPolicy | None = None,
+    error_report: str | Path | None = None,
+    blocks: BlockStore | None = None,
+) -> PipelineResult:
+    """
+    Combine the partial results of ``run_pipeline(..., shard=...)`` into config.json.
+
+    All shards of the run must be given, in any order. Configs are written in scan
+    order and go through the same failure policy and validation as a single-node
+    run, so the output is byte-identical to running without shards.
+
+    Args:
+        partial_files: One partial result file per shard
+        output_file: Path where aggregated config.json should be written
+        validate: Whether to validate aggregated config (default: True)
+        policy: Error-handling policy; with ``continue`` the successful configs and
+            an error report are written, otherwise any failure writes nothing
+        error_report: Where the ``continue`` policy writes its error report
+            (default: ``<output stem>.errors.json`` next to the output file)
+        blocks: Store for large ``helm``/``kustomize`` blocks (see ``run_pipeline``)
+
+    Returns:
+        PipelineResult with summary statistics over all shards
+
+    Raises:
+        ShardError: If a partial is unreadable or the partials do not form one
+            complete run
+    """
+    policy = policy or ExecutionPolicy()
+    output_path = Path(output_file)
+    partials = [read_partial(path) for path in partial_files]
+    source_dir, entries = combine_partials(partials)
+    skipped = sum(p.skipped for p in partials)
+    logger.info(f"Merging {len(partials)} shards with {len(entries)} files")
+
+    results = [
+        TransformationResult(
+            source_file=source_dir / e.path,
+            success=e.error is None,
+            transformed_config=e.config,
+            error=e.error,
+            app_name=(e.config or {}).get("metadata", {}).get("name"),
+        )
+        for e in entries
+    ]
+    total = len(results) + skipped
+    failed = sum(not r.success for r in results)
+    successful = len(results) - failed
+    written = [r for r in results if r.success and r.transformed_config]
+
+    if failed > 0 and not policy.writes_partial_output:
+        logger.error(f"Merge failed: {failed}/{total} transformations failed")
+        return PipelineResult(
+            total=total,
+            successful=successful,
+            failed=failed,
+            output_file=None,
+            results=results,
+            skipped=skipped,
+        )
+
+    report_path: Path | None = None
+    if policy.writes_partial_output:
+        report_path = Path(error_report) if error_report else default_error_report(output_path)
+        try:
+            write_error_report(
+                [(r.source_file, r.error or "") for r in results if not r.success],
+                total,
+                report_path,
+            )
+        except MigratorError as e:
+            logger.error(f"Failed to write error report: {e}")
+            report_path = None
+
+    try:
+        if validate:
+            validate_aggregated_structure(
+                [r.transformed_config for r in written if r.transformed_config]
+            )
+        with AggregatedConfigWriter(output_path) as writer:
+            for r in written:
+                config = r.transformed_config or {}
+                if blocks is not None:
+                    config = blocks.externalize(config)
+                writer.write(serialize_config_fragment(config))
+            writer.commit()
+    except MigratorError as e:
+        logger.error(f"Failed to merge shards: {e}")
+        return PipelineResult(
+            total=total,
+            successful=0,
+            failed=len(results),
+            output_file=None,
+            results=results,
+            error_report=report_path,
+        )
+
+    return PipelineResult(
+        total=total,
+        successful=successful,
+        failed=failed,
+        output_file=output_path,
+        results=results,
+        skipped=skipped,
+        error_report=report_path,
+    )
+
+
+def default_error_report(output_file: Path) -> Path:
+    """
+    Default error report location for the ``continue`` policy.
+
+    Args:
+        output_file: Aggregated config output path
+
+    Returns:
+        ``<output stem>.errors.json`` next to the output file
+    """
+    return output_file.with_name(f"{output_file.stem}.errors.json")
@@ -0,0 +1,88 @@
+"""Error-handling policies that decide when a pipeline run stops early."""
+
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Self
+
+
+class ErrorMode(StrEnum):
+    """How the pipeline reacts to failed files."""
+
+    COLLECT = "collect"
+    FAIL_FAST = "fail-fast"
+    MAX_ERRORS = "max-errors"
+    CONTINUE = "continue"
+
+
+@dataclass(frozen=True)
+class ExecutionPolicy:
+    """
+    Error-handling policy for a pipeline run.
+
+    - ``collect`` (default): process every file; write no output if any file fails.
+    - ``fail-fast``: cancel outstanding work at the first failure; write no output.
+    - ``max-errors=N``: cancel outstanding work after N failures; write no output.
+    - ``continue``: process every file; write the successful configs plus an
+      error report.
+    """
+
+    mode: ErrorMode = ErrorMode.COLLECT
+    max_errors: int | None = None
+
+    @classmethod
+    def parse(cls, value: str) -> Self:
+        """
+        Parse a policy from its CLI spelling.
+
+        Args:
+            value: One of ``collect``, ``fail-fast``, ``continue`` or ``max-errors=N``
+
+        Returns:
+            ExecutionPolicy instance
+
+        Raises:
+            ValueError: If the value is not a valid policy
+        """
+        name, _, argument = value.strip().partition("=")
+        try:
+            mode = ErrorMode(name)
+        except ValueError:
+            choices = ", ".join(m.value for m in ErrorMode if m is not ErrorMode.MAX_ERRORS)
+            raise ValueError(
+                f"Unknown error policy '{value}' (expected {choices} or max-errors=N)"
+            ) from None
+
+        if mode is ErrorMode.MAX_ERRORS:
+            if not argument.isdigit() or int(argument) < 1:
+                raise ValueError(f"Invalid error policy '{value}': N must be a positive integer")
+            return cls(mode, int(argument))
+
+        if argument:
+            raise ValueError(f"Error policy '{name}' does not take a value")
+        return cls(mode)
+
+    @property
+    def writes_partial_output(self) -> bool:
+        """Whether successful configs are written even when some files fail."""
+        return self.mode is ErrorMode.CONTINUE
+
+    def should_stop(self, errors: int) -> bool:
+        """
+        Decide whether outstanding work should be cancelled.
+
+        Args:
+            errors: Number of failed files so far
+
+        Returns:
+            True if the run should stop now
+        """
+        if self.mode is ErrorMode.FAIL_FAST:
+            return errors >= 1
+        if self.mode is ErrorMode.MAX_ERRORS and self.max_errors is not None:
+            return errors >= self.max_errors
+        return False
+
+    def __str__(self) -> str:
+        if self.mode is ErrorMode.MAX_ERRORS:
+            return f"{self.mode}={self.max_errors}"
+        return str(self.mode)
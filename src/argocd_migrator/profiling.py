@@ -0,0 +1,207 @@
+"""cProfile integration: profile a run, merge worker profiles and export results."""
+
+import cProfile
+import logging
+import os
+import pstats
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Self
+
+from argocd_migrator.exceptions import MigrationError
+from argocd_migrator.executor import PipelineExecutor
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOP_FUNCTIONS = 20
+
+# Collapsed stacks are reconstructed from caller/callee edges; stop at this depth
+_MAX_STACK_DEPTH = 64
+# Paths contributing less than this fraction of the total time are dropped, which
+# bounds the output to roughly 1 / fraction lines
+_MIN_STACK_FRACTION = 1e-5
+
+# pstats function key: (filename, line number, function name)
+FunctionKey = tuple[str, int, str]
+
+
+class PipelineProfiler:
+    """
+    Profile a pipeline run with cProfile, including pool workers.
+
+    The calling thread is profiled while the profiler is active. Executors attached
+    with ``attach`` profile each ``map`` chunk in their workers and dump the stats to
+    a temporary directory; ``stats`` merges them with the main profile.
+    """
+
+    def __init__(self) -> None:
+        self._profile = cProfile.Profile()
+        self._worker_dir = tempfile.TemporaryDirectory(prefix="argocd-migrator-profile-")
+        self._stats: pstats.Stats | None = None
+
+    def attach(self, executor: PipelineExecutor) -> PipelineExecutor:
+        """
+        Make an executor's workers write their profiles for merging.
+
+        Args:
+            executor: Executor used by the profiled run
+
+        Returns:
+            The same executor
+        """
+        executor.profile_dir = Path(self._worker_dir.name)
+        return executor
+
+    def __enter__(self) -> Self:
+        self._profile.enable()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self._profile.disable()
+
+    @property
+    def worker_profiles(self) -> list[Path]:
+        """Profile files written by pool workers."""
+        return sorted(Path(self._worker_dir.name).glob("*.pstats"))
+
+    def stats(self) -> pstats.Stats:
+        """
+        Merge the main profile with every worker profile.
+
+        Returns:
+            Combined pstats.Stats
+        """
+        if self._stats is None:
+            stats = pstats.Stats(self._profile)
+            for path in self.worker_profiles:
+                stats.add(str(path))
+            self._stats = stats
+        return self._stats
+
+    def write_pstats(self, output_file: str | Path) -> None:
+        """
+        Write the merged profile in pstats format (readable by ``pstats``/snakeviz).
+
+        Args:
+            output_file: Destination ``.pstats`` path
+
+        Raises:
+            MigrationError: If file writing fails
+        """
+        try:
+            Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+            self.stats().dump_stats(str(output_file))
+        except OSError as e:
+            raise MigrationError(f"Error writing profile to {output_file}: {e}") from e
+        logger.info(f"Wrote profile to {output_file}")
+
+    def write_collapsed(self, output_file: str | Path) -> None:
+        """
+        Write the merged profile as collapsed stacks for flamegraph tools.
+
+        Args:
+            output_file: Destination path
+
+        Raises:
+            MigrationError: If file writing fails
+        """
+        try:
+            Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+            with open(output_file, "w", encoding="utf-8") as f:
+                for line in iter_collapsed_stacks(self.stats()):
+                    f.write(line + "\n")
+        except OSError as e:
+            raise MigrationError(f"Error writing collapsed stacks to {output_file}: {e}") from e
+        logger.info(f"Wrote collapsed stacks to {output_file}")
+
+    def cleanup(self) -> None:
+        """Remove the temporary worker profile directory."""
+        self._worker_dir.cleanup()
+
+
+def _stats_table(stats: pstats.Stats) -> dict[FunctionKey, Any]:
+    # pstats exposes its table as an undocumented attribute
+    table: dict[FunctionKey, Any] = stats.stats  # type: ignore[attr-defined]
+    return table
+
+
+def function_label(key: FunctionKey) -> str:
+    """
+    Format a pstats function key for display.
+
+    Args:
+        key: (filename, line number, function name)
+
+    Returns:
+        ``name (file.py:line)``, or just the name for built-ins
+    """
+    filename, line, name = key
+    if filename == "~":
+        return name
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+def iter_top_functions(stats: pstats.Stats, limit: int = DEFAULT_TOP_FUNCTIONS) -> Iterator[str]:
+    """
+    Yield a table of the functions with the most self time.
+
+    Args:
+        stats: Profile statistics
+        limit: Number of functions to list
+
+    Returns:
+        Iterator over table lines, header first
+    """
+    table = _stats_table(stats)
+    ranked = sorted(table.items(), key=lambda kv: kv[1][2], reverse=True)[:limit]
+    yield f"{'calls':>10}{'self s':>10}{'cum s':>10}  function"
+    for key, (_, ncalls, tottime, cumtime, _) in ranked:
+        yield f"{ncalls:>10}{tottime:>10.3f}{cumtime:>10.3f}  {function_label(key)}"
+
+
+def iter_collapsed_stacks(stats: pstats.Stats) -> Iterator[str]:
+    """
+    Yield ``frame;frame;frame microseconds`` lines approximating the call stacks.
+
+    cProfile only records caller/callee edges, so each function's time is split
+    across its callers in proportion to the time each caller spent in it.
+
+    Args:
+        stats: Profile statistics
+
+    Returns:
+        Iterator over collapsed-stack lines
+    """
+    table = _stats_table(stats)
+    children: dict[FunctionKey, list[tuple[FunctionKey, float]]] = {}
+    for callee, (_, _, _, _, callers) in table.items():
+        for caller, edge in callers.items():
+            children.setdefault(caller, []).append((callee, edge[3]))
+
+    labels = {key: function_label(key).replace(";", ":") for key in table}
+    roots = [key for key, entry in table.items() if not entry[4]]
+    min_seconds = max(1e-6, sum(entry[2] for entry in table.values()) * _MIN_STACK_FRACTION)
+
+    def walk(key: FunctionKey, stack: list[str], scale: float) -> Iterator[str]:
+        frames = [*stack, labels[key]]
+        self_time = table[key][2] * scale
+        if self_time >= min_seconds:
+            yield f"{';'.join(frames)} {round(self_time * 1e6)}"
+        if len(frames) >= _MAX_STACK_DEPTH:
+            return
+        for callee, edge_cumtime in children.get(key, ()):
+            callee_cumtime = table[callee][3]
+            if callee_cumtime <= 0 or labels[callee] in frames:
+                continue  # Skip recursion; its time is already in the caller's frame
+            if edge_cumtime * scale >= min_seconds:
+                yield from walk(callee, frames, scale * edge_cumtime / callee_cumtime)
+
+    for root in roots:
+        yield from walk(root, [], 1.0)
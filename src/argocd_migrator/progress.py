@@ -0,0 +1,161 @@
+"""Throttled progress reporting with live throughput and ETA."""
+
+import sys
+import time
+from collections.abc import Callable
+from typing import TextIO
+
+# Minimum seconds between two progress updates on a terminal
+DEFAULT_INTERVAL = 0.25
+
+# Minimum seconds between two progress lines when output is not a terminal (logs, CI)
+NON_TTY_INTERVAL = 10.0
+
+
+class ProgressReporter:
+    """
+    Report files done/total, files/s, MB/s and ETA while a pipeline runs.
+
+    Updates are throttled to at most one every ``interval`` seconds, however many
+    files complete in between, so reporting costs a clock read per file. On a
+    terminal the line is redrawn in place; otherwise one full line is written per
+    update. Call ``advance`` from the thread consuming results (the pipeline does so
+    for every executor backend).
+    """
+
+    enabled = True
+
+    def __init__(
+        self,
+        stream: TextIO | None = None,
+        interval: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.stream = stream if stream is not None else sys.stderr
+        isatty = getattr(self.stream, "isatty", None)
+        self.tty = bool(isatty and isatty())
+        self.interval = interval if interval is not None else (
+            DEFAULT_INTERVAL if self.tty else NON_TTY_INTERVAL
+        )
+        self.clock = clock
+        self.total = 0
+        self.done = 0
+        self.failed = 0
+        self.bytes_read = 0
+        self._started = 0.0
+        self._last_render: float | None = None
+        self._width = 0
+
+    def start(self, total: int = 0) -> None:
+        """
+        Start timing a run.
+
+        Args:
+            total: Number of files expected (may grow later through ``total``)
+        """
+        self.total = total
+        self.done = 0
+        self.failed = 0
+        self.bytes_read = 0
+        self._started = self.clock()
+        self._last_render = None
+
+    def advance(self, bytes_read: int = 0, failed: bool = False) -> None:
+        """
+        Record one finished file and redraw if the throttle interval has passed.
+
+        Args:
+            bytes_read: Size of the file's source content
+            failed: Whether the file failed
+        """
+        self.done += 1
+        self.bytes_read += bytes_read
+        if failed:
+            self.failed += 1
+
+        now = self.clock()
+        if self._last_render is None or now - self._last_render >= self.interval:
+            self._render(now)
+
+    def finish(self) -> None:
+        """Write the final progress line."""
+        self._render(self.clock())
+        if self.tty:
+            self.stream.write("\n")
+            self.stream.flush()
+
+    def format_line(self, now: float) -> str:
+        """
+        Format the progress line for the current counters.
+
+        Args:
+            now: Current clock reading
+
+        Returns:
+            Line such as ``120/500 files (1 failed) | 85.3 files/s | 1.2 MB/s | ETA 4s``
+        """
+        elapsed = max(now - self._started, 1e-9)
+        files_per_second = self.done / elapsed
+        parts = [f"{self.done}/{self.total} files"]
+        if self.failed:
+            parts[0] += f" ({self.failed} failed)"
+        parts.append(f"{files_per_second:.1f} files/s")
+        parts.append(f"{self.bytes_read / elapsed / 1_000_000:.1f} MB/s")
+
+        remaining = self.total - self.done
+        if remaining <= 0:
+            parts.append(f"done in {format_duration(elapsed)}")
+        elif files_per_second > 0:
+            parts.append(f"ETA {format_duration(remaining / files_per_second)}")
+        else:
+            parts.append("ETA --")
+        return " | ".join(parts)
+
+    def _render(self, now: float) -> None:
+        self._last_render = now
+        line = self.format_line(now)
+        if self.tty:
+            # Pad to overwrite a longer previous line
+            self.stream.write("\r" + line.ljust(self._width))
+            self._width = len(line)
+        else:
+            self.stream.write(line + "\n")
+        self.stream.flush()
+
+
+class NullProgressReporter(ProgressReporter):
+    """Reporter used when progress is disabled; nothing is counted or written."""
+
+    enabled = False
+
+    def start(self, total: int = 0) -> None:
+        pass
+
+    def advance(self, bytes_read: int = 0, failed: bool = False) -> None:
+        pass
+
+    def finish(self) -> None:
+        pass
+
+
+NULL_PROGRESS = NullProgressReporter()
+
+
+def format_duration(seconds: float) -> str:
+    """
+    Format a duration as ``42s``, ``3m05s`` or ``1h02m``.
+
+    Args:
+        seconds: Duration in seconds
+
+    Returns:
+        Compact human-readable duration
+    """
+    seconds = max(0, round(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes}m{seconds:02d}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m"
@@ -1,12 +1,16 @@
 """File scanner for discovering YAML files."""
 
 import logging
+import os
+from collections.abc import Iterator, Sequence
 from pathlib import Path
 
 from argocd_migrator.exceptions import ScannerError
 
 logger = logging.getLogger(__name__)
 
+YAML_SUFFIXES = (".yaml", ".yml")
+
 
 def scan_directory(directory: str | Path) -> list[Path]:
     """
@@ -46,3 +50,67 @@ def scan_directory(directory: str | Path) -> list[Path]:
         raise ScannerError(f"Permission denied accessing directory: {directory}") from e
     except Exception as e:
         raise ScannerError(f"Error scanning directory {directory}: {e}") from e
+
+
+def file_sizes(paths: Sequence[Path]) -> list[int]:
+    """
+    Return the size in bytes of each scanned file.
+
+    Files that cannot be stat'ed count as 0 bytes; reading them reports the error.
+
+    Args:
+        paths: Files returned by ``scan_directory``
+
+    Returns:
+        Sizes in the order of ``paths``
+    """
+    sizes = []
+    for path in paths:
+        try:
+            sizes.append(os.stat(path).st_size)
+        except OSError:
+            sizes.append(0)
+    return sizes
+
+
+def iter_yaml_files(directory: str | Path) -> Iterator[Path]:
+    """
+    Lazily yield YAML files under a directory in the same order as ``scan_directory``.
+
+    Entries are visited depth-first in sorted name order, which matches sorting the
+    full path list, so consumers can start work before the walk finishes.
+
+    Args:
+        directory: Path to the directory to scan
+
+    Yields:
+        Path objects for discovered YAML files
+
+    Raises:
+        ScannerError: If directory does not exist or cannot be accessed
+    """
+    dir_path = Path(directory)
+
+    if not dir_path.exists():
+        raise ScannerError(f"Directory does not exist: {directory}")
+
+    if not dir_path.is_dir():
+        raise ScannerError(f"Path is not a directory: {directory}")
+
+    try:
+        yield from _walk_sorted(dir_path)
+    except PermissionError as e:
+        raise ScannerError(f"Permission denied accessing directory: {directory}") from e
+    except OSError as e:
+        raise ScannerError(f"Error scanning directory {directory}: {e}") from e
+
+
+def _walk_sorted(dir_path: Path) -> Iterator[Path]:
+    with os.scandir(dir_path) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+
+    for entry in entries:
+        if entry.is_dir():
+            yield from _walk_sorted(dir_path / entry.name)
+        elif entry.name.endswith(YAML_SUFFIXES) and entry.is_file():
+            yield dir_path / entry.name
@@ -0,0 +1,249 @@
+"""
+Sharded execution: split one scan across nodes and merge their partial results.
+
+Every node scans the same directory and keeps the files whose relative path hashes
+to its shard, so shards are disjoint, cover the scan, and need no coordination.
+Each shard writes a partial result file; ``merge`` restores scan order so the
+final config is byte-identical to a single-node run.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path, PurePath
+from typing import Any, Self
+
+from argocd_migrator.exceptions import MigrationError, ShardError
+
+logger = logging.getLogger(__name__)
+
+PARTIAL_FORMAT = "argocd-migrator-shard/1"
+
+
+@dataclass(frozen=True)
+class Shard:
+    """Shard ``index`` of ``count``, numbered from 1 (``--shard 2/4``)."""
+
+    index: int
+    count: int
+
+    def __post_init__(self) -> None:
+        if self.count < 1 or not 1 <= self.index <= self.count:
+            raise ValueError(f"Invalid shard {self.index}/{self.count}: expected 1 <= i <= N")
+
+    @classmethod
+    def parse(cls, value: str) -> Self:
+        """
+        Parse a shard from its CLI spelling.
+
+        Args:
+            value: ``i/N``, e.g. ``2/4``
+
+        Returns:
+            Shard instance
+
+        Raises:
+            ValueError: If the value is not a valid shard
+        """
+        index, sep, count = value.strip().partition("/")
+        if not sep or not index.isdigit() or not count.isdigit():
+            raise ValueError(f"Invalid shard '{value}' (expected i/N, e.g. 2/4)")
+        return cls(int(index), int(count))
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+
+    def select(self, files: Sequence[Path], root: Path) -> list[Path]:
+        """
+        Keep the scanned files that belong to this shard, in scan order.
+
+        Args:
+            files: Files found by ``scan_directory(root)``
+            root: Directory the files were scanned from
+
+        Returns:
+            This shard's files
+        """
+        return [f for f in files if shard_of(f.relative_to(root), self.count) == self.index]
+
+
+def shard_of(relative_path: str | PurePath, count: int) -> int:
+    """
+    Return the shard (1..count) a file belongs to.
+
+    The hash covers only the POSIX spelling of the path relative to the scanned
+    directory, so every node agrees regardless of where the tree is checked out.
+
+    Args:
+        relative_path: File path relative to the scanned directory
+        count: Number of shards
+
+    Returns:
+        Shard index, numbered from 1
+    """
+    key = PurePath(relative_path).as_posix().encode("utf-8")
+    digest = hashlib.sha256(key).digest()
+    return int.from_bytes(digest[:8], "big") % count + 1
+
+
+@dataclass(slots=True)
+class ShardEntry:
+    """Outcome for one file of a shard: its config on success, else its error."""
+
+    path: str
+    config: dict[str, Any] | None = None
+    error: str | None = None
+
+
+@dataclass
+class ShardPartial:
+    """
+    Partial result written by one shard.
+
+    ``source`` is the directory as the shard was given it and ``scanned`` the
+    number of files in the full scan, which every shard of a run must agree on.
+    ``skipped`` counts files an error policy cancelled before they ran.
+    """
+
+    shard: Shard
+    source: str
+    scanned: int
+    entries: list[ShardEntry] = field(default_factory=list)
+    skipped: int = 0
+
+
+def write_partial(partial: ShardPartial, output_file: str | Path) -> None:
+    """
+    Write a shard's partial result file.
+
+    The file is written next to its destination and renamed into place, so a
+    killed shard never leaves a truncated partial behind.
+
+    Args:
+        partial: Partial result to write
+        output_file: Destination path
+
+    Raises:
+        MigrationError: If file writing fails
+    """
+    path = Path(output_file)
+    document = {
+        "format": PARTIAL_FORMAT,
+        "shard": partial.shard.index,
+        "count": partial.shard.count,
+        "source": partial.source,
+        "scanned": partial.scanned,
+        "skipped": partial.skipped,
+        "files": [
+            {"path": e.path, "config": e.config}
+            if e.error is None
+            else {"path": e.path, "error": e.error}
+            for e in partial.entries
+        ],
+    }
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "x", encoding="utf-8") as f:
+            json.dump(document, f, ensure_ascii=False, separators=(",", ":"))
+            f.write("\n")
+        os.replace(tmp_path, path)
+    except Exception as e:
+        tmp_path.unlink(missing_ok=True)
+        raise MigrationError(f"Error writing shard partial to {output_file}: {e}") from e
+
+    logger.info(
+        f"Wrote shard {partial.shard} partial with {len(partial.entries)} files to {output_file}"
+    )
+
+
+def read_partial(partial_file: str | Path) -> ShardPartial:
+    """
+    Read a partial result file written by ``write_partial``.
+
+    Args:
+        partial_file: Path to the partial
+
+    Returns:
+        ShardPartial instance
+
+    Raises:
+        ShardError: If the file cannot be read or is not a shard partial
+    """
+    try:
+        with open(partial_file, encoding="utf-8") as f:
+            document = json.load(f)
+    except (OSError, ValueError) as e:
+        raise ShardError(f"Error reading shard partial {partial_file}: {e}") from e
+
+    if not isinstance(document, dict) or document.get("format") != PARTIAL_FORMAT:
+        raise ShardError(f"{partial_file} is not a shard partial ({PARTIAL_FORMAT})")
+    try:
+        entries = [
+            ShardEntry(str(item["path"]), item.get("config"), item.get("error"))
+            for item in document["files"]
+        ]
+        return ShardPartial(
+            shard=Shard(int(document["shard"]), int(document["count"])),
+            source=str(document["source"]),
+            scanned=int(document["scanned"]),
+            entries=entries,
+            skipped=int(document.get("skipped", 0)),
+        )
+    except (KeyError, TypeError, ValueError) as e:
+        raise ShardError(f"Malformed shard partial {partial_file}: {e}") from e
+
+
+def combine_partials(partials: Sequence[ShardPartial]) -> tuple[Path, list[ShardEntry]]:
+    """
+    Check that partials form one complete run and put their entries in scan order.
+
+    Args:
+        partials: One partial per shard, in any order
+
+    Returns:
+        (source directory of the run, entries of all shards in scan order)
+
+    Raises:
+        ShardError: If shards are missing, duplicated, from runs of different sizes,
+            or do not add up to the scanned file count
+    """
+    if not partials:
+        raise ShardError("No shard partials to merge")
+
+    count = partials[0].shard.count
+    seen: dict[int, ShardPartial] = {}
+    for partial in partials:
+        if partial.shard.count != count:
+            raise ShardError(
+                f"Cannot merge shard {partial.shard} with shards of a {count}-way run"
+            )
+        if partial.shard.index in seen:
+            raise ShardError(f"Shard {partial.shard} was given more than once")
+        if partial.scanned != partials[0].scanned:
+            raise ShardError(
+                f"Shard {partial.shard} scanned {partial.scanned} files but shard "
+                f"{partials[0].shard} scanned {partials[0].scanned}; were they run on "
+                "the same tree?"
+            )
+        seen[partial.shard.index] = partial
+
+    missing = [str(i) for i in range(1, count + 1) if i not in seen]
+    if missing:
+        raise ShardError(f"Missing shard(s) {', '.join(missing)} of {count}")
+
+    entries = [entry for partial in partials for entry in partial.entries]
+    covered = len(entries) + sum(p.skipped for p in partials)
+    if covered != partials[0].scanned:
+        raise ShardError(
+            f"Shards cover {covered} files but the scan found {partials[0].scanned}"
+        )
+
+    # Same key as scan_directory's sort, so the merged order matches a single node
+    source = Path(seen[1].source)
+    entries.sort(key=lambda e: source / e.path)
+    return source, entries
@@ -0,0 +1,206 @@
+"""
+Content-addressed sidecar for large ``helm`` and ``kustomize`` source blocks.
+
+Fleets often repeat the same multi-KB inline Helm values across hundreds of
+applications. With a BlockStore, every such block whose JSON encoding is larger
+than a threshold is written once to ``<sidecar>/<sha256>.json``. The config
+entry carries ``{"$ref": "<path relative to config.json>"}`` in its place.
+``load_configs`` reconstitutes the full configs.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import uuid
+from pathlib import Path, PurePosixPath
+from typing import Any
+
+from argocd_migrator.exceptions import MigrationError
+
+logger = logging.getLogger(__name__)
+
+SIDECAR_KEYS = ("helm", "kustomize")
+DEFAULT_BLOCK_THRESHOLD = 1024
+REF_KEY = "$ref"
+
+_DIGEST_NAME = re.compile(r"[0-9a-f]{64}\.json")
+
+
+def default_blocks_dir(output_file: Path) -> Path:
+    """
+    Default sidecar directory for externalized blocks.
+
+    Args:
+        output_file: Aggregated config output path
+
+    Returns:
+        ``<output stem>.blocks`` next to the output file
+    """
+    return output_file.with_name(f"{output_file.stem}.blocks")
+
+
+class BlockStore:
+    """
+    Write large source blocks once, by content hash, and hand out references.
+
+    Blocks whose compact JSON encoding is larger than ``threshold`` bytes go to
+    ``directory``; references are relative to ``config_dir``, the directory of
+    the config file. ``blocks_written`` counts files created by this store,
+    ``refs`` the blocks replaced by references and ``bytes_externalized`` the
+    JSON bytes they held.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        config_dir: str | Path,
+        threshold: int = DEFAULT_BLOCK_THRESHOLD,
+    ) -> None:
+        self.directory = Path(directory)
+        self.prefix = PurePosixPath(Path(os.path.relpath(self.directory, config_dir)).as_posix())
+        self.threshold = threshold
+        self.blocks_written = 0
+        self.refs = 0
+        self.bytes_externalized = 0
+        self._stored: set[str] = set()
+
+    @classmethod
+    def for_output(
+        cls, output_file: str | Path, threshold: int = DEFAULT_BLOCK_THRESHOLD
+    ) -> "BlockStore":
+        """Create a store in the default sidecar directory of ``output_file``."""
+        path = Path(output_file)
+        return cls(default_blocks_dir(path), path.parent, threshold)
+
+    def externalize(self, config: dict[str, Any]) -> dict[str, Any]:
+        """
+        Return ``config`` with its large ``helm``/``kustomize`` blocks replaced by references.
+
+        The input is not modified; only the config and its ``source`` are copied.
+
+        Args:
+            config: Generator config dictionary
+
+        Returns:
+            The config to write
+
+        Raises:
+            MigrationError: If a block cannot be written
+        """
+        source = config.get("source")
+        if not isinstance(source, dict):
+            return config
+
+        replaced: dict[str, Any] = {}
+        for key in SIDECAR_KEYS:
+            block = source.get(key)
+            if not isinstance(block, dict):
+                continue
+            data = _encode(block)
+            if len(data) > self.threshold:
+                replaced[key] = {REF_KEY: self._put(data)}
+                self.refs += 1
+                self.bytes_externalized += len(data)
+
+        if not replaced:
+            return config
+        return {**config, "source": {**source, **replaced}}
+
+    def _put(self, data: bytes) -> str:
+        name = f"{hashlib.sha256(data).hexdigest()}.json"
+        path = self.directory / name
+        if name not in self._stored and not path.exists():
+            # Same-content writers race harmlessly: each renames an identical file
+            tmp_path = self.directory / f".{name}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp"
+            try:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                tmp_path.unlink(missing_ok=True)
+                raise MigrationError(f"Error writing sidecar block {path}: {e}") from e
+            self.blocks_written += 1
+            logger.debug("Wrote sidecar block %s (%d bytes)", path, len(data))
+        self._stored.add(name)
+        return str(self.prefix / name)
+
+
+def _encode(block: dict[str, Any]) -> bytes:
+    """Compact JSON encoding that is both the stored form and the hashed content."""
+    return json.dumps(block, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def resolve_config(
+    config: dict[str, Any], config_dir: str | Path, cache: dict[str, bytes] | None = None
+) -> dict[str, Any]:
+    """
+    Replace the sidecar references of one config with the blocks they point to.
+
+    Args:
+        config: Config as read from an externalized config file (modified in place)
+        config_dir: Directory of that config file
+        cache: Verified block bytes already read, by reference; each block is read
+            and hash-checked once, and every config gets its own decoded copy
+
+    Returns:
+        The full config
+
+    Raises:
+        MigrationError: If a block is missing, corrupt or outside the sidecar format
+    """
+    source = config.get("source")
+    if not isinstance(source, dict):
+        return config
+    cache = cache if cache is not None else {}
+    for key in SIDECAR_KEYS:
+        value = source.get(key)
+        if not isinstance(value, dict) or set(value) != {REF_KEY}:
+            continue
+        ref = value[REF_KEY]
+        if ref not in cache:
+            cache[ref] = _load_block(Path(config_dir), ref)
+        source[key] = json.loads(cache[ref])
+    return config
+
+
+def _load_block(config_dir: Path, ref: Any) -> bytes:
+    if not isinstance(ref, str) or not _DIGEST_NAME.fullmatch(PurePosixPath(ref).name):
+        raise MigrationError(f"Invalid sidecar reference: {ref!r}")
+    path = config_dir / ref
+    try:
+        data = path.read_bytes()
+    except OSError as e:
+        raise MigrationError(f"Error reading sidecar block {path}: {e}") from e
+    if f"{hashlib.sha256(data).hexdigest()}.json" != path.name:
+        raise MigrationError(f"Sidecar block {path} does not match its content hash")
+    return data
+
+
+def load_configs(config_file: str | Path) -> list[dict[str, Any]]:
+    """
+    Read an aggregated config file written with a BlockStore, with blocks inlined.
+
+    Args:
+        config_file: Path to config.json
+
+    Returns:
+        Full generator configs, as they would have been written without a sidecar
+
+    Raises:
+        MigrationError: If the config or a referenced block cannot be read
+    """
+    path = Path(config_file)
+    try:
+        with open(path, encoding="utf-8") as f:
+            configs = json.load(f)
+    except (OSError, ValueError) as e:
+        raise MigrationError(f"Error reading config {config_file}: {e}") from e
+    if not isinstance(configs, list):
+        raise MigrationError(f"Config {config_file} is not a JSON array")
+
+    cache: dict[str, bytes] = {}
+    resolved = [resolve_config(c, path.parent, cache) for c in configs]
+    logger.info(f"Loaded {len(resolved)} configs with {len(cache)} sidecar blocks from {path}")
+    return resolved
@@ -0,0 +1,646 @@
+"""Streaming pipeline API that yields results as they complete."""
+
+import logging
+from collections.abc import Callable, Generator, Iterator, Sequence
+from contextlib import closing, nullcontext
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import IO, Any
+
+from argocd_migrator.aggregator import (
+    AggregatedConfigWriter,
+    NdjsonWriter,
+    serialize_config_fragment,
+    validate_config_structure,
+    write_error_report,
+)
+from argocd_migrator.archive import iter_archive_members, member_label
+from argocd_migrator.exceptions import MigratorError, ParserError
+from argocd_migrator.executor import ExecutorBackend, PipelineExecutor, create_executor
+from argocd_migrator.kube import KubeSource, list_applications
+from argocd_migrator.metrics import FileTimings, PipelineMetrics, timed
+from argocd_migrator.parser import (
+    DEFAULT_LIMITS,
+    ParserLimits,
+    iter_yaml_documents,
+    validate_application,
+)
+from argocd_migrator.pipeline import (
+    FileStats,
+    PipelineResult,
+    TransformationResult,
+    default_error_report,
+    record_result,
+    timeout_result,
+    transform_content,
+    transform_file,
+    transform_file_to_fragment,
+)
+from argocd_migrator.policy import ExecutionPolicy
+from argocd_migrator.scanner import scan_directory
+from argocd_migrator.transformer import transform_to_generator_config
+
+logger = logging.getLogger(__name__)
+
+# Archive members read ahead and handed to the executor at a time
+ARCHIVE_BATCH_SIZE = 256
+
+
+class PipelineStream:
+    """
+    Iterable pipeline run that yields one TransformationResult per processed file.
+
+    Each successful config is validated, serialized and appended to the output file
+    as soon as its result arrives, so nothing but counters and failed results is
+    retained. Iterate the stream to drive the run; ``result`` holds the summary
+    once iteration has finished. Stopping iteration early abandons the output file
+    and cancels outstanding work.
+    """
+
+    def __init__(
+        self,
+        source_dir: Path,
+        output_file: Path | None,
+        validate: bool,
+        jobs: int,
+        backend: ExecutorBackend | str,
+        executor: PipelineExecutor | None,
+        serialize_in_workers: bool,
+        policy: ExecutionPolicy,
+        error_report: str | Path | None,
+        keep_configs: bool,
+        ndjson: IO[bytes] | None = None,
+    ) -> None:
+        self.source_dir = source_dir
+        self.output_file = output_file
+        self.validate = validate
+        self.jobs = jobs
+        self.backend = backend
+        self.executor = executor
+        self.serialize_in_workers = serialize_in_workers
+        self.policy = policy
+        self.error_report = error_report
+        self.keep_configs = keep_configs
+        self.ndjson = ndjson
+        self.total = 0
+        self.successful = 0
+        self.failed = 0
+        self.failures: list[TransformationResult] = []
+        self.metrics = PipelineMetrics()
+        self.result: PipelineResult | None = None
+        self._started = False
+
+    def __iter__(self) -> Iterator[TransformationResult]:
+        if self._started:
+            raise RuntimeError("A PipelineStream can only be iterated once")
+        self._started = True
+        return self._run()
+
+    def _run(self) -> Iterator[TransformationResult]:
+        metrics = self.metrics
+        policy = self.policy
+        metrics.start()
+
+        writer = AggregatedConfigWriter(self.output_file) if self.output_file else None
+        lines = NdjsonWriter(self.ndjson) if self.ndjson is not None else None
+        pool_context = (
+            nullcontext(self.executor)
+            if self.executor
+            else create_executor(self.backend, self.jobs)
+        )
+        output_path: Path | None = None
+        with (
+            writer or nullcontext(),
+            pool_context as pool,
+            closing(self._results(pool)) as mapped,
+        ):
+            for result in mapped:
+                record_result(result, metrics)
+                result = self._serialize(result)
+
+                if result.success:
+                    self.successful += 1
+                    if writer is not None and result.fragment is not None:
+                        if self.failed == 0 or policy.writes_partial_output:
+                            with metrics.stage("write"):
+                                writer.write(result.fragment)
+                    if lines is not None and result.transformed_config is not None:
+                        with metrics.stage("write"):
+                            lines.write(result.transformed_config)
+                else:
+                    self.failed += 1
+                    self.failures.append(result)
+
+                if not self.keep_configs:
+                    result.transformed_config = None
+                    result.fragment = None
+                yield result
+
+                if not result.success and policy.should_stop(self.failed):
+                    logger.error(f"Stopping after {self.failed} failed file(s) (policy: {policy})")
+                    break
+
+            if writer is not None and (self.failed == 0 or policy.writes_partial_output):
+                with metrics.stage("write"):
+                    writer.commit()
+                metrics.bytes_written = writer.bytes_written
+                output_path = writer.output_file
+        if lines is not None:
+            metrics.bytes_written += lines.bytes_written
+
+        self.result = _summarize(
+            metrics,
+            self.total,
+            self.successful,
+            self.failures,
+            output_path,
+            policy,
+            self.output_file,
+            self.error_report,
+        )
+
+    def _results(self, pool: PipelineExecutor) -> Generator[TransformationResult, None, None]:
+        """Scan the source directory and yield each file's result in scan order."""
+        logger.info(f"Scanning directory: {self.source_dir}")
+        with self.metrics.stage("scan"):
+            yaml_files = scan_directory(self.source_dir)
+        self.total = len(yaml_files)
+        logger.info(f"Found {self.total} YAML files to process")
+
+        work: Callable[[Any], TransformationResult] = transform_file
+        items: Sequence[Any] = yaml_files
+        if self.serialize_in_workers:
+            work = partial(transform_file_to_fragment, validate=self.validate)
+            items = list(enumerate(yaml_files))
+        yield from pool.map(work, items, on_timeout=timeout_result)
+
+    def _serialize(self, result: TransformationResult) -> TransformationResult:
+        """Validate and serialize a config that the worker returned as a dictionary."""
+        config = result.transformed_config
+        if not result.success or result.fragment is not None or config is None:
+            return result
+
+        try:
+            if self.validate:
+                with self.metrics.stage("validate"):
+                    validate_config_structure(config, self.successful)
+            with self.metrics.stage("serialize"):
+                result.fragment = serialize_config_fragment(config)
+        except MigratorError as e:
+            logger.error("Failed to serialize %s: %s", result.source_file, e)
+            return TransformationResult(
+                source_file=result.source_file,
+                success=False,
+                error=str(e),
+                bytes_read=result.bytes_read,
+            )
+        return result
+
+
+def iter_pipeline(
+    source_dir: str | Path,
+    output_file: str | Path | None = "config.json",
+    validate: bool = True,
+    jobs: int = 1,
+    backend: ExecutorBackend | str = ExecutorBackend.PROCESS,
+    executor: PipelineExecutor | None = None,
+    serialize_in_workers: bool = False,
+    policy: ExecutionPolicy | None = None,
+    error_report: str | Path | None = None,
+    keep_configs: bool = True,
+    ndjson: IO[bytes] | None = None,
+) -> PipelineStream:
+    """
+    Run the aggregated pipeline as a stream of per-file results.
+
+    Unlike ``run_pipeline``, configs are written as they arrive and are not
+    retained, so memory stays flat regardless of the number of applications.
+    The output is byte-identical to ``run_pipeline``.
+
+    Example::
+
+        stream = iter_pipeline("apps/", "config.json")
+        for result in stream:
+            handle(result)
+        print(stream.result.successful)
+
+    Args:
+        source_dir: Directory containing YAML files
+        output_file: Path where aggregated config.json should be written (None: only
+            yield results)
+        validate: Whether to validate each config's structure (default: True)
+        jobs: Number of parallel workers (default: 1)
+        backend: Executor backend used when jobs > 1
+        executor: Existing executor to use instead of creating one (not shut down)
+        serialize_in_workers: Validate and serialize configs inside the workers
+        policy: Error-handling policy (default: process everything, write nothing on
+            failure)
+        error_report: Where the ``continue`` policy writes its error report
+        keep_configs: Whether yielded results keep ``transformed_config`` and
+            ``fragment``; pass False to drop them as soon as they are written
+        ndjson: Binary stream that receives each successful config as an NDJSON line
+            as soon as it arrives (not with ``serialize_in_workers``)
+
+    Returns:
+        PipelineStream to iterate; its ``result`` lists only failed files
+
+    Raises:
+        ValueError: If ``ndjson`` is combined with ``serialize_in_workers``
+    """
+    if ndjson is not None and serialize_in_workers:
+        raise ValueError("NDJSON output needs configs, not serialized fragments")
+    return PipelineStream(
+        Path(source_dir),
+        Path(output_file) if output_file is not None else None,
+        validate=validate,
+        jobs=jobs,
+        backend=backend,
+        executor=executor,
+        serialize_in_workers=serialize_in_workers,
+        policy=policy or ExecutionPolicy(),
+        error_report=error_report,
+        keep_configs=keep_configs,
+        ndjson=ndjson,
+    )
+
+
+class ArchiveStream(PipelineStream):
+    """
+    PipelineStream over the YAML members of a tar or zip archive.
+
+    Members are read in batches of ``ARCHIVE_BATCH_SIZE`` while the archive is
+    decompressed, and each batch is transformed by the executor before the next is
+    read, so only one batch of member contents is held in memory. Results are
+    labelled ``<archive>:<member>`` in place of file paths and follow archive order.
+    """
+
+    def _results(self, pool: PipelineExecutor) -> Generator[TransformationResult, None, None]:
+        archive = self.source_dir
+        max_bytes = DEFAULT_LIMITS.max_file_bytes
+        logger.info(f"Reading archive: {archive}")
+        members = iter_archive_members(archive, max_bytes)
+        with closing(members):
+            while True:
+                with self.metrics.stage("read"):
+                    batch = list(islice(members, ARCHIVE_BATCH_SIZE))
+                if not batch:
+                    break
+                self.total += len(batch)
+                items = [
+                    (member_label(archive, m.name), m.content)
+                    for m in batch
+                    if m.content is not None
+                ]
+                with closing(
+                    pool.map(transform_content, items, on_timeout=timeout_result)
+                ) as mapped:
+                    for member in batch:
+                        if member.content is not None:
+                            yield next(mapped)
+                            continue
+                        # Too large to read; reported like an oversized file
+                        label = member_label(archive, member.name)
+                        error = (
+                            f"File {label} is {member.size} bytes, "
+                            f"over the {max_bytes}-byte limit"
+                        )
+                        logger.error("Failed to transform %s: %s", label, error)
+                        yield TransformationResult(source_file=label, success=False, error=error)
+        logger.info(f"Read {self.total} YAML members from {archive}")
+
+
+def iter_archive(
+    archive: str | Path,
+    output_file: str | Path | None = "config.json",
+    validate: bool = True,
+    jobs: int = 1,
+    backend: ExecutorBackend | str = ExecutorBackend.PROCESS,
+    executor: PipelineExecutor | None = None,
+    policy: ExecutionPolicy | None = None,
+    error_report: str | Path | None = None,
+    keep_configs: bool = True,
+    ndjson: IO[bytes] | None = None,
+) -> ArchiveStream:
+    """
+    Run the aggregated pipeline on the YAML members of a tar or zip archive.
+
+    ``.tar``, ``.tar.gz``/``.tgz`` and ``.zip`` archives are read without extracting
+    them; member bytes go straight to the parser. Output is the same as for a
+    directory whose files are scanned in the archive's member order, so a tarball
+    created with ``tar --sort=name`` gives byte-identical output to its extracted
+    directory.
+
+    Args:
+        archive: Path to the archive
+        output_file: Path where aggregated config.json should be written (None: only
+            yield results)
+        validate: Whether to validate each config's structure (default: True)
+        jobs: Number of parallel workers (default: 1)
+        backend: Executor backend used when jobs > 1
+        executor: Existing executor to use instead of creating one (not shut down)
+        policy: Error-handling policy (default: process everything, write nothing on
+            failure)
+        error_report: Where the ``continue`` policy writes its error report
+        keep_configs: Whether yielded results keep ``transformed_config`` and
+            ``fragment``; pass False to drop them as soon as they are written
+        ndjson: Binary stream that receives each successful config as an NDJSON line
+
+    Returns:
+        ArchiveStream to iterate; its ``result`` lists only failed members
+
+    Raises:
+        ScannerError: While iterating, if the archive is missing, unsupported or
+            corrupt
+    """
+    return ArchiveStream(
+        Path(archive),
+        Path(output_file) if output_file is not None else None,
+        validate=validate,
+        jobs=jobs,
+        backend=backend,
+        executor=executor,
+        serialize_in_workers=False,
+        policy=policy or ExecutionPolicy(),
+        error_report=error_report,
+        keep_configs=keep_configs,
+        ndjson=ndjson,
+    )
+
+
+class DocumentStream:
+    """
+    Iterable run over a sequence of parsed documents, such as a YAML stream on stdin.
+
+    Documents are transformed, validated and written one at a time as the
+    ``documents`` generator produces them (see ``iter_yaml_documents``), so memory
+    stays flat and each NDJSON line is emitted as soon as its document is complete.
+    A ParserError from the generator ends the run, since a stream cannot be read
+    past a syntax error. NDJSON lines cannot be retracted: the error policy decides
+    when to stop, but lines written before a failure stay written.
+    """
+
+    def __init__(
+        self,
+        documents: Generator[tuple[str, Any], None, None],
+        source: str,
+        output_file: Path | None,
+        ndjson: IO[bytes] | None,
+        validate: bool,
+        policy: ExecutionPolicy,
+        error_report: str | Path | None,
+    ) -> None:
+        self.documents = documents
+        self.source = source
+        self.output_file = output_file
+        self.ndjson = ndjson
+        self.validate = validate
+        self.policy = policy
+        self.error_report = error_report
+        self.total = 0
+        self.successful = 0
+        self.failed = 0
+        self.failures: list[TransformationResult] = []
+        self.metrics = PipelineMetrics()
+        self.result: PipelineResult | None = None
+        self._started = False
+
+    def __iter__(self) -> Iterator[TransformationResult]:
+        if self._started:
+            raise RuntimeError("A DocumentStream can only be iterated once")
+        self._started = True
+        return self._run()
+
+    def _run(self) -> Iterator[TransformationResult]:
+        metrics = self.metrics
+        policy = self.policy
+        metrics.start()
+        logger.info(f"Reading documents from {self.source}")
+
+        writer = AggregatedConfigWriter(self.output_file) if self.output_file else None
+        lines = NdjsonWriter(self.ndjson) if self.ndjson is not None else None
+        documents = self.documents
+        output_path: Path | None = None
+        with writer or nullcontext(), closing(documents):
+            unreadable = False
+            while not unreadable:
+                timings: FileTimings = {}
+                try:
+                    document = timed(timings, "parse", next, documents, None)
+                except ParserError as e:
+                    # Nothing after a syntax error can be parsed
+                    unreadable = True
+                    result = self._failure(Path(self.source), e, timings)
+                else:
+                    if document is None:
+                        break
+                    label, data = document
+                    result = self._transform(label, data, timings)
+                self.total += 1
+                record_result(result, metrics)
+
+                if result.success:
+                    self.successful += 1
+                    writable = self.failed == 0 or policy.writes_partial_output
+                    with metrics.stage("write"):
+                        if writer is not None and writable and result.fragment is not None:
+                            writer.write(result.fragment)
+                        if lines is not None and result.transformed_config is not None:
+                            lines.write(result.transformed_config)
+                else:
+                    self.failed += 1
+                    self.failures.append(result)
+                yield result
+
+                if not result.success and policy.should_stop(self.failed):
+                    logger.error(f"Stopping after {self.failed} failed file(s) (policy: {policy})")
+                    break
+
+            if writer is not None and (self.failed == 0 or policy.writes_partial_output):
+                with metrics.stage("write"):
+                    writer.commit()
+                metrics.bytes_written = writer.bytes_written
+                output_path = writer.output_file
+        if lines is not None:
+            metrics.bytes_written += lines.bytes_written
+
+        self.result = _summarize(
+            metrics,
+            self.total,
+            self.successful,
+            self.failures,
+            output_path,
+            policy,
+            self.output_file,
+            self.error_report,
+        )
+
+    def _transform(self, label: str, data: Any, timings: FileTimings) -> TransformationResult:
+        """Validate, transform and serialize one parsed document."""
+        source = Path(label)
+        try:
+            app = timed(timings, "parse", validate_application, data, label)
+            config = timed(timings, "transform", transform_to_generator_config, app)
+            if self.validate:
+                timed(timings, "validate", validate_config_structure, config, self.successful)
+            fragment = None
+            if self.output_file is not None:
+                fragment = timed(timings, "serialize", serialize_config_fragment, config)
+        except MigratorError as e:
+            return self._failure(source, e, timings)
+        logger.debug("Successfully transformed %s", label)
+        return TransformationResult(
+            source_file=source,
+            success=True,
+            transformed_config=config,
+            app_name=config["metadata"].get("name"),
+            fragment=fragment,
+            stats=FileStats(timings),
+        )
+
+    def _failure(
+        self, source: Path, error: MigratorError, timings: FileTimings
+    ) -> TransformationResult:
+        logger.error("Failed to transform %s: %s", source, error)
+        return TransformationResult(
+            source_file=source, success=False, error=str(error), stats=FileStats(timings)
+        )
+
+
+def iter_documents(
+    stream: IO[bytes],
+    output_file: str | Path | None = None,
+    ndjson: IO[bytes] | None = None,
+    validate: bool = True,
+    policy: ExecutionPolicy | None = None,
+    error_report: str | Path | None = None,
+    source: str = "<stdin>",
+    limits: ParserLimits = DEFAULT_LIMITS,
+) -> DocumentStream:
+    """
+    Migrate the Application documents of a YAML stream as they are read.
+
+    Multi-document streams and kubectl ``List`` documents are both accepted, so the
+    output of ``kubectl get applications -A -o yaml`` can be piped in directly.
+    Results are labelled ``<source>#<document>`` or
+    ``<source>#<document>.items[<index>]`` in place of file paths.
+
+    Example::
+
+        stream = iter_documents(sys.stdin.buffer, ndjson=sys.stdout.buffer)
+        for result in stream:
+            pass
+        print(stream.result.failed)
+
+    Args:
+        stream: Binary YAML stream, e.g. ``sys.stdin.buffer``
+        output_file: Path where aggregated config.json should be written (None: none)
+        ndjson: Binary stream that receives each successful config as an NDJSON line
+        validate: Whether to validate each config's structure (default: True)
+        policy: Error-handling policy (default: process everything, write no
+            aggregated output on failure)
+        error_report: Where the ``continue`` policy writes its error report
+        source: Name of the stream in labels and error messages
+        limits: Nesting and alias limits applied to each document
+
+    Returns:
+        DocumentStream to iterate; its ``result`` lists only failed documents
+    """
+    return DocumentStream(
+        iter_yaml_documents(stream, source, limits),
+        source,
+        Path(output_file) if output_file is not None else None,
+        ndjson,
+        validate=validate,
+        policy=policy or ExecutionPolicy(),
+        error_report=error_report,
+    )
+
+
+def iter_cluster(
+    source: KubeSource,
+    output_file: str | Path | None = "config.json",
+    ndjson: IO[bytes] | None = None,
+    validate: bool = True,
+    policy: ExecutionPolicy | None = None,
+    error_report: str | Path | None = None,
+) -> DocumentStream:
+    """
+    Migrate the Applications listed from a Kubernetes API server as pages arrive.
+
+    Pages are fetched with ``limit``/``continue`` over pooled keep-alive
+    connections, and namespaces are listed concurrently (see
+    ``argocd_migrator.kube``). Each Application is transformed as soon as its page
+    is decoded, so nothing is exported to disk first. Results are labelled
+    ``k8s:<namespace>/<name>``.
+
+    Args:
+        source: API server, credentials, namespaces and paging settings
+        output_file: Path where aggregated config.json should be written (None: none)
+        ndjson: Binary stream that receives each successful config as an NDJSON line
+        validate: Whether to validate each config's structure (default: True)
+        policy: Error-handling policy (default: process everything, write no
+            aggregated output on failure)
+        error_report: Where the ``continue`` policy writes its error report
+
+    Returns:
+        DocumentStream to iterate; its ``result`` lists only failed Applications
+
+    Raises:
+        KubeApiError: If the source is invalid or, while iterating, a request fails
+    """
+    return DocumentStream(
+        list_applications(source),
+        source.server,
+        Path(output_file) if output_file is not None else None,
+        ndjson,
+        validate=validate,
+        policy=policy or ExecutionPolicy(),
+        error_report=error_report,
+    )
+
+
+def _summarize(
+    metrics: PipelineMetrics,
+    total: int,
+    successful: int,
+    failures: list[TransformationResult],
+    output_path: Path | None,
+    policy: ExecutionPolicy,
+    output_file: Path | None,
+    error_report: str | Path | None,
+) -> PipelineResult:
+    """Log the outcome, write the error report if the policy asks for one and summarize."""
+    failed = len(failures)
+    processed = successful + failed
+    if failed:
+        logger.error(f"Pipeline failed: {failed}/{total} transformations failed")
+    else:
+        logger.info(f"Pipeline complete: {successful}/{total} succeeded")
+
+    report_path: Path | None = None
+    if policy.writes_partial_output and output_file is not None:
+        report_path = Path(error_report) if error_report else default_error_report(output_file)
+        try:
+            write_error_report(
+                [(r.source_file, r.error or "") for r in failures], total, report_path
+            )
+        except MigratorError as e:
+            logger.error(f"Failed to write error report: {e}")
+            report_path = None
+
+    metrics.finish()
+    metrics.files = processed
+    metrics.successful = successful
+    metrics.failed = failed
+    metrics.skipped = total - processed
+    return PipelineResult(
+        total=total,
+        successful=successful,
+        failed=failed,
+        output_file=output_path,
+        results=failures,
+        skipped=total - processed,
+        error_report=report_path,
+        metrics=metrics,
+    )
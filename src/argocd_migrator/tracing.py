@@ -0,0 +1,151 @@
+"""Per-file span recording with Chrome trace-event (Perfetto) export."""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any
+
+from argocd_migrator.exceptions import MigrationError
+
+logger = logging.getLogger(__name__)
+
+# A span measured by a worker: (stage, start perf_counter seconds, duration seconds, pid, tid)
+Span = tuple[str, float, float, int, int]
+
+
+def current_span(stage: str, start: float, duration: float) -> Span:
+    """
+    Build a span for work that ran in the calling thread.
+
+    Args:
+        stage: Stage name
+        start: Start time from ``time.perf_counter()``
+        duration: Duration in seconds
+
+    Returns:
+        Span tagged with the current process and native thread id
+    """
+    return (stage, start, duration, os.getpid(), threading.get_native_id())
+
+
+class TraceRecorder:
+    """
+    Buffer spans in memory and export them as Chrome trace-event JSON.
+
+    Spans use ``time.perf_counter()`` timestamps, which come from the system-wide
+    monotonic clock, so spans recorded in worker processes line up with the parent.
+    """
+
+    enabled = True
+
+    def __init__(self) -> None:
+        self._events: list[tuple[str, float, float, int, int, str | None]] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def add(self, span: Span, path: str | Path | None = None) -> None:
+        """
+        Record one span.
+
+        Args:
+            span: Span to record
+            path: Source file the span belongs to
+        """
+        with self._lock:
+            self._events.append((*span, None if path is None else str(path)))
+
+    def add_spans(self, spans: Iterable[Span] | None, path: str | Path | None = None) -> None:
+        """Record spans measured for one source file."""
+        if spans:
+            for span in spans:
+                self.add(span, path)
+
+    @contextmanager
+    def span(self, stage: str, path: str | Path | None = None) -> Iterator[None]:
+        """Record a span around a block of work in the calling thread."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(current_span(stage, start, time.perf_counter() - start), path)
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """
+        Convert recorded spans into a Chrome trace-event document.
+
+        Returns:
+            Dictionary with ``traceEvents`` of complete (``"X"``) events in microseconds
+        """
+        with self._lock:
+            events = sorted(self._events, key=lambda e: e[1])
+
+        origin = events[0][1] if events else 0.0
+        main_pid = os.getpid()
+        trace_events: list[dict[str, Any]] = []
+        for pid in sorted({e[3] for e in events}):
+            name = "main" if pid == main_pid else f"worker {pid}"
+            trace_events.append(
+                {"name": "process_name", "ph": "M", "pid": pid, "args": {"name": name}}
+            )
+
+        for stage, start, duration, pid, tid, path in events:
+            event: dict[str, Any] = {
+                "name": stage,
+                "cat": "pipeline",
+                "ph": "X",
+                "ts": round((start - origin) * 1e6, 3),
+                "dur": round(duration * 1e6, 3),
+                "pid": pid,
+                "tid": tid,
+            }
+            if path is not None:
+                event["args"] = {"path": path}
+            trace_events.append(event)
+
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def write(self, output_file: str | Path) -> None:
+        """
+        Write the trace as JSON loadable by Perfetto or about:tracing.
+
+        Args:
+            output_file: Destination path
+
+        Raises:
+            MigrationError: If file writing fails
+        """
+        path = Path(output_file)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.to_chrome_trace(), f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            raise MigrationError(f"Error writing trace to {output_file}: {e}") from e
+        logger.info(f"Wrote {len(self)} trace spans to {output_file}")
+
+
+class NullTraceRecorder(TraceRecorder):
+    """Recorder used when tracing is disabled; every method is a no-op."""
+
+    enabled = False
+
+    def add(self, span: Span, path: str | Path | None = None) -> None:
+        pass
+
+    def add_spans(self, spans: Iterable[Span] | None, path: str | Path | None = None) -> None:
+        pass
+
+    def span(self, stage: str, path: str | Path | None = None) -> Any:
+        return nullcontext()
+
+
+NULL_RECORDER = NullTraceRecorder()
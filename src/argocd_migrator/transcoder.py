@@ -0,0 +1,289 @@
+"""Streaming YAML-to-JSON transcoder built on PyYAML's event API."""
+
+import json
+import logging
+from collections.abc import Callable, Iterator
+from typing import IO, Any
+
+import yaml
+from yaml.constructor import SafeConstructor
+from yaml.events import (
+    AliasEvent,
+    DocumentStartEvent,
+    Event,
+    MappingEndEvent,
+    MappingStartEvent,
+    ScalarEvent,
+    SequenceEndEvent,
+    SequenceStartEvent,
+    StreamEndEvent,
+)
+from yaml.nodes import ScalarNode
+from yaml.resolver import Resolver
+
+from argocd_migrator.exceptions import MigrationError
+
+try:
+    from yaml import CSafeLoader as _EventLoader
+except ImportError:  # pragma: no cover - depends on libyaml availability
+    from yaml import SafeLoader as _EventLoader  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+_STR_TAG = "tag:yaml.org,2002:str"
+_MERGE_TAG = "tag:yaml.org,2002:merge"
+_MAPPING_TAGS = {"tag:yaml.org,2002:map", "tag:yaml.org,2002:set"}
+_SEQUENCE_TAGS = {"tag:yaml.org,2002:seq", "tag:yaml.org,2002:omap", "tag:yaml.org,2002:pairs"}
+
+_RESOLVER = Resolver()
+_CONSTRUCTOR = SafeConstructor()
+
+
+class UnsupportedYAMLError(MigrationError):
+    """Raised when a document uses a construct the streaming transcoder cannot express."""
+
+    pass
+
+
+def transcode_yaml_to_json(
+    stream: str | bytes | IO[str] | IO[bytes],
+    output: IO[str],
+    indent: int | None = 2,
+) -> None:
+    """
+    Transcode a single YAML document to JSON without building a Python object graph.
+
+    Consumes PyYAML's event stream and writes JSON tokens directly to ``output``.
+    The result is byte-identical to ``json.dumps(yaml.safe_load(stream), indent=indent,
+    ensure_ascii=False)`` for documents made of JSON-compatible values, with these
+    differences:
+
+    - Timestamps and binary scalars are written as the original scalar text
+      (``json.dumps`` cannot encode them at all).
+    - Duplicate mapping keys are written as-is instead of keeping the last value.
+    - Merge keys (``<<``) raise UnsupportedYAMLError, since resolving them requires
+      buffering the whole enclosing mapping.
+
+    Only anchored nodes are buffered (so their aliases can be replayed); everything
+    else is written as soon as its events are parsed.
+
+    Args:
+        stream: YAML text, bytes, or a readable file object
+        output: Writable text stream that receives the JSON document
+        indent: JSON indentation (None for compact single-line output)
+
+    Raises:
+        UnsupportedYAMLError: If the document uses merge keys or complex mapping keys
+        MigrationError: If the YAML is malformed or uses unsupported tags
+    """
+    try:
+        events = yaml.parse(stream, Loader=_EventLoader)
+        _Transcoder(events, output.write, indent).run()
+    except MigrationError:
+        raise
+    except yaml.YAMLError as e:
+        raise MigrationError(f"YAML syntax error: {e}") from e
+
+
+class _Transcoder:
+    """Recursive-descent writer over a PyYAML event iterator."""
+
+    def __init__(
+        self, events: Iterator[Event], write: Callable[[str], Any], indent: int | None
+    ) -> None:
+        self._events = events
+        self._write = write
+        self._indent = " " * indent if indent is not None else None
+        self._item_separator = "," if indent is not None else ", "
+        self._anchors: dict[str, list[Event]] = {}
+        self._recorders: list[list[Event]] = []
+        self._replaying = 0
+
+    def run(self) -> None:
+        """Transcode the first (and only) document of the event stream."""
+        self._next()  # StreamStartEvent
+        event = self._next()
+        if isinstance(event, StreamEndEvent):
+            self._write("null")
+            return
+
+        if not isinstance(event, DocumentStartEvent):
+            raise MigrationError(f"Unexpected YAML event: {event}")
+
+        self._node(self._next(), 0)
+
+        self._next()  # DocumentEndEvent
+        event = self._next()
+        if not isinstance(event, StreamEndEvent):
+            raise MigrationError(
+                "Expected a single document in the YAML stream, but found another document"
+            )
+
+    def _next(self) -> Event:
+        event = next(self._events)
+        if self._recorders and not isinstance(event, AliasEvent):
+            for recorder in self._recorders:
+                recorder.append(event)
+        return event
+
+    def _node(self, event: Event, depth: int) -> None:
+        if isinstance(event, AliasEvent):
+            self._alias(event, depth)
+            return
+
+        anchor = getattr(event, "anchor", None)
+        if anchor is None or self._replaying:
+            self._emit(event, depth)
+            return
+
+        recorder: list[Event] = [event]
+        self._recorders.append(recorder)
+        try:
+            self._emit(event, depth)
+        finally:
+            self._recorders.pop()
+        self._anchors[anchor] = recorder
+
+    def _recorded(self, event: AliasEvent) -> list[Event]:
+        recorded = self._anchors.get(event.anchor or "")
+        if recorded is None:
+            raise MigrationError(f"Found undefined alias: {event.anchor}")
+        return recorded
+
+    def _alias(self, event: AliasEvent, depth: int) -> None:
+        recorded = self._recorded(event)
+        saved = self._events
+        self._events = iter(recorded)
+        self._replaying += 1
+        try:
+            self._node(self._next(), depth)
+        finally:
+            self._replaying -= 1
+            self._events = saved
+
+    def _emit(self, event: Event, depth: int) -> None:
+        if isinstance(event, ScalarEvent):
+            self._write(_encode_value(_scalar_value(event)))
+        elif isinstance(event, MappingStartEvent):
+            _check_collection_tag(event.tag, _MAPPING_TAGS)
+            self._mapping(depth)
+        elif isinstance(event, SequenceStartEvent):
+            _check_collection_tag(event.tag, _SEQUENCE_TAGS)
+            self._sequence(depth)
+        else:
+            raise MigrationError(f"Unexpected YAML event: {event}")
+
+    def _mapping(self, depth: int) -> None:
+        first = True
+        while True:
+            event = self._next()
+            if isinstance(event, MappingEndEvent):
+                break
+            self._open_item("{", first, depth)
+            first = False
+            self._write(self._key(event))
+            self._write(": ")
+            self._node(self._next(), depth + 1)
+        self._close("{}", first, depth)
+
+    def _sequence(self, depth: int) -> None:
+        first = True
+        while True:
+            event = self._next()
+            if isinstance(event, SequenceEndEvent):
+                break
+            self._open_item("[", first, depth)
+            first = False
+            self._node(event, depth + 1)
+        self._close("[]", first, depth)
+
+    def _open_item(self, opener: str, first: bool, depth: int) -> None:
+        if first:
+            self._write(opener)
+        else:
+            self._write(self._item_separator)
+        if self._indent is not None:
+            self._write("\n" + self._indent * (depth + 1))
+
+    def _close(self, brackets: str, empty: bool, depth: int) -> None:
+        if empty:
+            self._write(brackets)
+        elif self._indent is not None:
+            self._write("\n" + self._indent * depth + brackets[1])
+        else:
+            self._write(brackets[1])
+
+    def _key(self, event: Event) -> str:
+        if isinstance(event, AliasEvent):
+            recorded = self._recorded(event)
+            event = recorded[0]
+            if len(recorded) != 1:
+                raise UnsupportedYAMLError("Complex mapping keys cannot be converted to JSON")
+
+        if not isinstance(event, ScalarEvent):
+            raise UnsupportedYAMLError("Complex mapping keys cannot be converted to JSON")
+
+        if event.anchor is not None and not self._replaying:
+            self._anchors[event.anchor] = [event]
+
+        tag = _resolve_tag(event)
+        if tag == _MERGE_TAG:
+            raise UnsupportedYAMLError(
+                "Merge keys (<<) are not supported by the streaming transcoder"
+            )
+
+        return _encode_key(_scalar_value(event, tag))
+
+
+def _resolve_tag(event: ScalarEvent) -> str:
+    if event.tag is None or event.tag == "!":
+        tag: str = _RESOLVER.resolve(  # type: ignore[no-untyped-call]
+            ScalarNode, event.value, event.implicit
+        )
+        return tag
+    return str(event.tag)
+
+
+def _scalar_value(event: ScalarEvent, tag: str | None = None) -> Any:
+    if tag is None:
+        tag = _resolve_tag(event)
+    if tag == _STR_TAG:
+        return event.value
+
+    constructors: dict[str | None, Callable[..., Any]] = SafeConstructor.yaml_constructors
+    constructor = constructors.get(tag, constructors[None])
+    try:
+        value = constructor(_CONSTRUCTOR, ScalarNode(tag, event.value, style=event.style))
+    except yaml.YAMLError as e:
+        raise MigrationError(f"Cannot convert YAML scalar {event.value!r}: {e}") from e
+
+    if value is None or isinstance(value, str | int | float):
+        return value
+    # Timestamps, binary and other non-JSON scalars keep their source text
+    return event.value
+
+
+def _check_collection_tag(tag: str | None, allowed: set[str]) -> None:
+    if tag is not None and tag != "!" and tag not in allowed:
+        raise MigrationError(f"Cannot convert YAML node with tag {tag}")
+
+
+def _encode_value(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _encode_key(value: Any) -> str:
+    # Mirror json.dumps' coercion of non-string dict keys
+    if isinstance(value, str):
+        key = value
+    elif value is True:
+        key = "true"
+    elif value is False:
+        key = "false"
+    elif value is None:
+        key = "null"
+    elif isinstance(value, float):
+        key = json.dumps(value)
+    else:
+        key = str(value)
+    return json.dumps(key, ensure_ascii=False)
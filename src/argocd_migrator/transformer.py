@@ -40,7 +40,7 @@ def transform_to_generator_config(argocd_app: dict[str, Any]) -> dict[str, Any]:
         # Transform syncPolicy to boolean
         config["enableSyncPolicy"] = _transform_sync_policy(spec.get("syncPolicy"))
 
-        logger.debug(f"Transformed {config['metadata'].get('name', 'unknown')} to generator config")
+        logger.debug("Transformed %s to generator config", config["metadata"].get("name"))
         return config
 
     except Exception as e:
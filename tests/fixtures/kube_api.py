@@ -0,0 +1,161 @@
+"""Local stand-in for a Kubernetes API server that replays recorded list responses."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+LIST_PREFIX = "/apis/argoproj.io/v1alpha1"
+
+
+def application(namespace: str, name: str, replicas: int = 1) -> dict[str, Any]:
+    """Return an Application as the API server lists it."""
+    return {
+        "apiVersion": "argoproj.io/v1alpha1",
+        "kind": "Application",
+        "metadata": {
+            "name": name,
+            "namespace": namespace,
+            "uid": f"uid-{namespace}-{name}",
+            "resourceVersion": "1234",
+            "annotations": {"argocd.argoproj.io/sync-wave": "1"},
+        },
+        "spec": {
+            "project": "default",
+            "source": {
+                "repoURL": "https://github.com/example/repo.git",
+                "targetRevision": "main",
+                "path": f"apps/{name}",
+                "helm": {"valuesObject": {"replicas": replicas}},
+            },
+            "destination": {"server": "https://kubernetes.default.svc", "namespace": name},
+        },
+        "status": {"sync": {"status": "Synced"}},
+    }
+
+
+def record_pages(apps: list[dict[str, Any]], page_size: int, scope: str) -> list[dict[str, Any]]:
+    """Split Applications into ApplicationList pages linked by continue tokens."""
+    pages = []
+    for start in range(0, max(len(apps), 1), page_size):
+        index = len(pages)
+        more = start + page_size < len(apps)
+        pages.append(
+            {
+                "apiVersion": "argoproj.io/v1alpha1",
+                "kind": "ApplicationList",
+                "metadata": {"continue": f"{scope}:{index + 1}" if more else ""},
+                "items": apps[start:start + page_size],
+            }
+        )
+    return pages
+
+
+class KubeApiStandIn:
+    """
+    HTTP/1.1 keep-alive server answering Application list requests.
+
+    ``responses`` maps a namespace (or ``""`` for the cluster-wide listing) to its
+    recorded pages. Requests, connections and the ``limit`` values seen are
+    recorded. ``token`` makes the server require that bearer token.
+    """
+
+    def __init__(
+        self,
+        responses: dict[str, list[dict[str, Any]]],
+        token: str | None = None,
+        delay: float = 0.0,
+    ) -> None:
+        self.responses = responses
+        self.token = token
+        self.delay = delay
+        self.requests: list[str] = []
+        self.limits: set[str] = set()
+        self.connections = 0
+        self.active = 0
+        self.max_active = 0
+        self.close_after: int | None = None
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, args=(0.01,), daemon=True
+        )
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "KubeApiStandIn":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self) -> None:
+                super().setup()
+                with stand_in._lock:
+                    stand_in.connections += 1
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                with stand_in._lock:
+                    stand_in.requests.append(self.path)
+                    stand_in.active += 1
+                    stand_in.max_active = max(stand_in.max_active, stand_in.active)
+                try:
+                    self._answer()
+                finally:
+                    with stand_in._lock:
+                        stand_in.active -= 1
+
+            def _answer(self) -> None:
+                if stand_in.delay:
+                    time.sleep(stand_in.delay)
+                if stand_in.token and (
+                    self.headers.get("Authorization") != f"Bearer {stand_in.token}"
+                ):
+                    return self._send(401, {"kind": "Status", "message": "Unauthorized"})
+
+                url = urlsplit(self.path)
+                query = parse_qs(url.query)
+                stand_in.limits.update(query.get("limit", []))
+                scope = ""
+                if url.path.startswith(f"{LIST_PREFIX}/namespaces/"):
+                    scope = url.path.split("/")[5]
+                if scope not in stand_in.responses or not url.path.endswith("/applications"):
+                    return self._send(404, {"kind": "Status", "message": "not found"})
+
+                token = query.get("continue", [f"{scope}:0"])[0]
+                index = int(token.rpartition(":")[2])
+                self._send(200, stand_in.responses[scope][index])
+                with stand_in._lock:
+                    if stand_in.close_after is not None and len(stand_in.requests) >= (
+                        stand_in.close_after
+                    ):
+                        # Drop the keep-alive connection without telling the client
+                        stand_in.close_after = None
+                        self.close_connection = True
+
+            def _send(self, status: int, body: dict[str, Any]) -> None:
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
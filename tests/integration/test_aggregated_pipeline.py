@@ -198,3 +198,157 @@ def test_aggregated_pipeline_skip_validation():
 
         assert result.successful == 1
         assert output_file.exists()
+
+
+def test_aggregated_pipeline_per_file_output():
+    """Test pipeline writes per-file JSON next to the aggregated output."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        source_dir = tmp_path / "apps"
+        (source_dir / "team-a").mkdir(parents=True)
+        (source_dir / "app1.yaml").write_text(VALID_APP_YAML)
+        (source_dir / "team-a" / "app2.yaml").write_text(VALID_APP_WITH_DIRECTORY_YAML)
+
+        output_file = tmp_path / "config.json"
+        per_file_dir = tmp_path / "per-file"
+        result = run_pipeline(source_dir, output_file, per_file_dir=per_file_dir)
+
+        assert result.output_file == output_file
+        assert len(result.per_file_results) == 2
+        assert all(w.success for w in result.per_file_results)
+
+        with open(output_file) as f:
+            aggregated = json.load(f)
+        with open(per_file_dir / "app1.json") as f:
+            assert json.load(f) == aggregated[0]
+        with open(per_file_dir / "team-a" / "app2.json") as f:
+            assert json.load(f) == aggregated[1]
+
+
+def test_aggregated_pipeline_per_file_name_collision():
+    """Test sources mapping to the same per-file JSON path are reported, not overwritten."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        source_dir = tmp_path / "apps"
+        source_dir.mkdir()
+        (source_dir / "app.yaml").write_text(VALID_APP_YAML)
+        (source_dir / "app.yml").write_text(VALID_APP_WITH_DIRECTORY_YAML)
+        (source_dir / "other.yaml").write_text(VALID_APP_YAML)
+
+        per_file_dir = tmp_path / "per-file"
+        result = run_pipeline(source_dir, tmp_path / "config.json", per_file_dir=per_file_dir)
+
+        assert result.successful == 3
+        assert [w.success for w in result.per_file_results] == [False, False, True]
+        assert "several sources" in (result.per_file_results[0].error or "")
+        assert sorted(p.name for p in per_file_dir.iterdir()) == ["other.json"]
+
+
+def test_aggregated_pipeline_parallel_matches_serial():
+    """Test parallel execution produces the same output and result order as serial."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        source_dir = tmp_path / "apps"
+        source_dir.mkdir()
+        for i in range(12):
+            app_yaml = VALID_APP_YAML.replace("integration-test-app", f"app-{i:02d}")
+            (source_dir / f"app-{i:02d}.yaml").write_text(app_yaml)
+        (source_dir / "app-05b.yaml").write_text(INVALID_APP_YAML)
+
+        serial = run_pipeline(source_dir, tmp_path / "serial.json", jobs=1)
+        for backend in ("thread", "process"):
+            parallel = run_pipeline(
+                source_dir, tmp_path / f"{backend}.json", jobs=3, backend=backend
+            )
+
+            assert [r.source_file for r in parallel.results] == [
+                r.source_file for r in serial.results
+            ]
+            assert [r.error for r in parallel.results] == [r.error for r in serial.results]
+            assert parallel.failed == serial.failed == 1
+
+        (source_dir / "app-05b.yaml").unlink()
+        serial = run_pipeline(source_dir, tmp_path / "serial.json", jobs=1)
+        parallel = run_pipeline(source_dir, tmp_path / "process.json", jobs=4)
+
+        assert serial.successful == parallel.successful == 12
+        assert (tmp_path / "serial.json").read_bytes() == (tmp_path / "process.json").read_bytes()
+
+
+def test_aggregated_pipeline_serialize_in_workers_is_byte_identical():
+    """Test worker-side serialization produces byte-identical output."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        source_dir = tmp_path / "apps"
+        source_dir.mkdir()
+        (source_dir / "app1.yaml").write_text(VALID_APP_YAML)
+        (source_dir / "app2.yaml").write_text(VALID_APP_WITH_DIRECTORY_YAML)
+
+        serial = run_pipeline(source_dir, tmp_path / "serial.json", keep_configs=True)
+        fragments = run_pipeline(
+            source_dir,
+            tmp_path / "fragments.json",
+            jobs=2,
+            serialize_in_workers=True,
+            per_file_dir=tmp_path / "per-file",
+        )
+
+        assert fragments.successful == serial.successful == 2
+        assert all(r.transformed_config is None for r in fragments.results)
+        assert all(r.config_digest for r in fragments.results)
+        assert [r.app_name for r in fragments.results] == [
+            "integration-test-app",
+            "app-with-directory",
+        ]
+        assert (tmp_path / "fragments.json").read_bytes() == (tmp_path / "serial.json").read_bytes()
+        with open(tmp_path / "per-file" / "app2.json") as f:
+            assert json.load(f) == serial.results[1].transformed_config
+
+
+def test_aggregated_pipeline_releases_written_configs():
+    """Test results drop their configs once written unless asked to keep them."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        source_dir = tmp_path / "apps"
+        source_dir.mkdir()
+        (source_dir / "app1.yaml").write_text(VALID_APP_YAML)
+
+        released = run_pipeline(source_dir, tmp_path / "released.json")
+        kept = run_pipeline(source_dir, tmp_path / "kept.json", keep_configs=True)
+
+        assert released.successful == kept.successful == 1
+        assert released.results[0].transformed_config is None
+        assert released.results[0].app_name == "integration-test-app"
+        assert kept.results[0].transformed_config is not None
+        with open(tmp_path / "released.json") as f:
+            assert json.load(f) == [kept.results[0].transformed_config]
+
+
+def test_aggregated_pipeline_size_schedule_matches_fifo_on_skewed_corpus():
+    """Test largest-first scheduling gives byte-identical output to scan order."""
+    from argocd_migrator.corpus import CorpusSpec, generate_corpus
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        source_dir = tmp_path / "apps"
+        generate_corpus(
+            source_dir,
+            CorpusSpec(apps=60, seed=3, large_values_rate=0.1, large_values_keys=2000),
+        )
+
+        for serialize_in_workers in (False, True):
+            outputs = {}
+            for schedule in ("fifo", "size"):
+                output = tmp_path / f"{schedule}-{serialize_in_workers}.json"
+                result = run_pipeline(
+                    source_dir,
+                    output,
+                    jobs=3,
+                    backend="thread",
+                    serialize_in_workers=serialize_in_workers,
+                    schedule=schedule,
+                )
+                assert result.successful == 60
+                outputs[schedule] = (output.read_bytes(), [r.source_file for r in result.results])
+
+            assert outputs["size"] == outputs["fifo"]
@@ -0,0 +1,162 @@
+"""Integration tests for batch job mode."""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from argocd_migrator.batch import load_batch_file, run_batch
+from argocd_migrator.cache import get_content_cache
+from argocd_migrator.cli import app
+from argocd_migrator.exceptions import BatchConfigError
+from argocd_migrator.executor import create_executor
+from argocd_migrator.pipeline import run_pipeline
+
+APP_YAML = """
+apiVersion: argoproj.io/v1alpha1
+kind: Application
+metadata:
+  name: app-{index}
+spec:
+  project: default
+  source:
+    repoURL: https://github.com/example/repo.git
+    targetRevision: main
+  destination:
+    server: https://kubernetes.default.svc
+    namespace: default
+"""
+
+BATCH_TOML = """
+workers = 2
+executor = "thread"
+
+[defaults]
+on_error = "continue"
+
+[[job]]
+name = "team-a"
+input_path = "a"
+output_file = "out/a.json"
+
+[[job]]
+input_path = "b"
+output_file = "out/b.json"
+validate = false
+"""
+
+
+def _write_corpus(directory: Path, apps: int, broken: tuple[int, ...] = ()) -> None:
+    directory.mkdir()
+    for i in range(apps):
+        content = "kind: [unclosed" if i in broken else APP_YAML.format(index=i)
+        (directory / f"app-{i:02d}.yaml").write_text(content)
+
+
+def test_load_batch_file():
+    """Test that jobs inherit defaults and resolve paths against the batch file."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        batch_path = Path(tmpdir) / "jobs.toml"
+        batch_path.write_text(BATCH_TOML)
+
+        batch = load_batch_file(batch_path)
+
+        assert batch.workers == 2
+        assert batch.executor == "thread"
+        assert [job.name for job in batch.jobs] == ["team-a", "b"]
+        assert batch.jobs[0].input_path == Path(tmpdir) / "a"
+        assert batch.jobs[1].output_file == Path(tmpdir) / "out" / "b.json"
+        assert all(str(job.policy) == "continue" for job in batch.jobs)
+        assert batch.jobs[1].validate is False
+
+
+@pytest.mark.parametrize(
+    ("content", "message"),
+    [
+        ("[[job]]\ninput_path = 'a'\n", "missing required key: output_file"),
+        ("[[job]]\ninput_path = 'a'\noutput_file = 'o'\ncolour = 1\n", "Unknown keys"),
+        ("[[job]]\ninput_path = 'a'\noutput_file = 'o'\non_error = 'maybe'\n", "job 1"),
+        ("workers = 0\n[[job]]\ninput_path = 'a'\noutput_file = 'o'\n", "workers"),
+        ("[defaults]\nvalidate = true\n", "no \\[\\[job\\]\\]"),
+        (
+            "[[job]]\ninput_path = 'a'\noutput_file = 'o'\n"
+            "[[job]]\ninput_path = 'b'\noutput_file = 'o'\n",
+            "share output files",
+        ),
+        ("[[job]\n", "Invalid TOML"),
+    ],
+)
+def test_load_batch_file_rejects_invalid_files(content, message):
+    """Test that malformed batch files raise BatchConfigError."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        batch_path = Path(tmpdir) / "jobs.toml"
+        batch_path.write_text(content)
+
+        with pytest.raises(BatchConfigError, match=message):
+            load_batch_file(batch_path)
+
+
+def test_batch_output_matches_single_runs_and_reuses_cache():
+    """Test that batch jobs match standalone runs and share the content cache."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        _write_corpus(root / "a", 5)
+        _write_corpus(root / "b", 5)
+        (root / "jobs.toml").write_text(BATCH_TOML)
+        batch = load_batch_file(root / "jobs.toml")
+        cache = get_content_cache()
+        cache.clear()
+
+        with create_executor("thread", 2) as pool:
+            outcomes = list(run_batch(batch.jobs, pool))
+
+        assert [o.success for o in outcomes] == [True, True]
+        # The second job's files are identical to the first job's
+        assert cache.hits == 5
+
+        expected = run_pipeline(root / "a", root / "expected.json")
+        assert expected.output_file is not None
+        assert (root / "out" / "a.json").read_bytes() == expected.output_file.read_bytes()
+        assert (root / "out" / "b.json").read_bytes() == expected.output_file.read_bytes()
+
+
+def test_batch_reports_failed_jobs_and_continues():
+    """Test that a failing job does not stop the remaining jobs."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        _write_corpus(root / "b", 3, broken=(1,))
+        (root / "jobs.toml").write_text(BATCH_TOML)
+        batch = load_batch_file(root / "jobs.toml")
+
+        with create_executor("serial", 1) as pool:
+            outcomes = list(run_batch(batch.jobs, pool))
+
+        assert outcomes[0].result is None
+        assert "not a directory" in (outcomes[0].error or "")
+        assert outcomes[1].result is not None
+        assert outcomes[1].result.failed == 1
+        assert not outcomes[1].success
+        assert (root / "out" / "b.json").exists()
+
+
+def test_batch_cli():
+    """Test the batch command's summary and exit code."""
+    runner = CliRunner()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        _write_corpus(root / "a", 2)
+        _write_corpus(root / "b", 2)
+        (root / "jobs.toml").write_text(BATCH_TOML)
+
+        result = runner.invoke(app, ["batch", str(root / "jobs.toml"), "--executor", "serial"])
+
+        assert result.exit_code == 0, result.output
+        assert "✓ team-a: 2/2 succeeded" in result.output
+        assert "All 2 jobs succeeded" in result.output
+
+        (root / "b" / "app-00.yaml").write_text("kind: [unclosed")
+        result = runner.invoke(app, ["batch", str(root / "jobs.toml"), "--executor", "serial"])
+
+        assert result.exit_code == 1
+        assert "✗ b: 1/2 succeeded, 1 failed" in result.output
@@ -0,0 +1,220 @@
+"""Integration tests for the migration daemon and its client."""
+
+import json
+import socket
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from argocd_migrator.cli import app
+from argocd_migrator.client import request
+from argocd_migrator.daemon import MigrationDaemon, serve
+from argocd_migrator.exceptions import DaemonError
+from argocd_migrator.executor import create_executor
+from argocd_migrator.pipeline import run_pipeline
+
+APP_YAML = """
+apiVersion: argoproj.io/v1alpha1
+kind: Application
+metadata:
+  name: app-{index}
+spec:
+  project: default
+  source:
+    repoURL: https://github.com/example/repo.git
+  destination:
+    server: https://kubernetes.default.svc
+    namespace: default
+"""
+
+
+@pytest.fixture
+def daemon_dir():
+    """Start a daemon on a serial executor in a background thread."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        source = root / "apps"
+        source.mkdir()
+        for i in range(3):
+            (source / f"app-{i}.yaml").write_text(APP_YAML.format(index=i))
+
+        socket_path = root / "daemon.sock"
+        executor = create_executor("serial")
+        thread = threading.Thread(target=serve, args=(socket_path, executor), daemon=True)
+        thread.start()
+        deadline = time.monotonic() + 5
+        while not socket_path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        yield root
+        if thread.is_alive():
+            request(socket_path, "shutdown")
+        thread.join(timeout=5)
+        assert not socket_path.exists()
+
+
+def test_socket_is_private(daemon_dir):
+    """Test that only the owner can connect to the daemon."""
+    assert (daemon_dir / "daemon.sock").stat().st_mode & 0o777 == 0o600
+
+
+def test_migrate_matches_run_pipeline(daemon_dir):
+    """Test that a daemon migration writes the same output as run_pipeline."""
+    result = request(
+        daemon_dir / "daemon.sock",
+        "migrate",
+        {"input_path": str(daemon_dir / "apps"), "output_file": str(daemon_dir / "out.json")},
+    )
+
+    assert (result["total"], result["successful"], result["failed"]) == (3, 3, 0)
+    expected = run_pipeline(daemon_dir / "apps", daemon_dir / "expected.json")
+    assert expected.output_file is not None
+    assert (daemon_dir / "out.json").read_bytes() == expected.output_file.read_bytes()
+
+
+def test_validate_reports_failures_without_writing(daemon_dir):
+    """Test that validate reports broken files and writes nothing."""
+    (daemon_dir / "apps" / "broken.yaml").write_text("kind: [unclosed")
+
+    params = {"input_path": str(daemon_dir / "apps")}
+    result = request(daemon_dir / "daemon.sock", "validate", params)
+
+    assert (result["successful"], result["failed"]) == (3, 1)
+    assert result["failures"][0]["file"].endswith("broken.yaml")
+    assert result["output_file"] is None
+
+
+def test_diff_detects_changes(daemon_dir):
+    """Test that diff compares a fresh migration with the existing output."""
+    socket_path = daemon_dir / "daemon.sock"
+    params = {"input_path": str(daemon_dir / "apps"), "output_file": str(daemon_dir / "out.json")}
+    request(socket_path, "migrate", params)
+
+    assert request(socket_path, "diff", params)["changed"] is False
+
+    (daemon_dir / "apps" / "app-1.yaml").write_text(APP_YAML.format(index="renamed"))
+    result = request(socket_path, "diff", params)
+
+    assert result["changed"] is True
+    assert '+      "name": "app-renamed",' in result["diff"]
+
+
+@pytest.mark.parametrize(
+    ("command", "params", "message"),
+    [
+        ("migrate", {"input_path": "apps", "output_file": "/tmp/o.json"}, "absolute path"),
+        ("migrate", {"input_path": "/nonexistent"}, "not a directory"),
+        ("migrate", {"input_path": "/"}, "Missing required parameter: output_file"),
+        ("explode", {}, "Unknown command"),
+        ("migrate", {"input_path": "/", "output_file": "/o.json", "validate": "false"}, "boolean"),
+    ],
+)
+def test_request_errors(daemon_dir, command, params, message):
+    """Test that invalid requests return errors without stopping the daemon."""
+    with pytest.raises(DaemonError, match=message):
+        request(daemon_dir / "daemon.sock", command, params)
+
+    assert request(daemon_dir / "daemon.sock", "ping")["requests"] == 2
+
+
+def test_malformed_request(daemon_dir):
+    """Test that a non-JSON request gets an error response."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(daemon_dir / "daemon.sock"))
+        sock.sendall(b"not json\n")
+        response = json.loads(sock.makefile("rb").readline())
+
+    assert response["ok"] is False
+    assert "Invalid request" in response["error"]
+
+
+def test_second_daemon_on_same_socket_is_rejected(daemon_dir):
+    """Test that a live daemon's socket is not taken over."""
+    with pytest.raises(DaemonError, match="already listening"):
+        serve(daemon_dir / "daemon.sock", create_executor("serial"))
+
+
+def test_stale_socket_is_replaced():
+    """Test that a socket file left by a dead daemon is replaced."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        socket_path = Path(tmpdir) / "daemon.sock"
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(socket_path))
+        stale.close()
+
+        thread = threading.Thread(target=serve, args=(socket_path, create_executor("serial")))
+        thread.start()
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            try:
+                request(socket_path, "shutdown", timeout=1)
+                break
+            except DaemonError:
+                time.sleep(0.01)
+        thread.join(timeout=5)
+
+        assert not thread.is_alive()
+        assert not socket_path.exists()
+
+
+def test_non_socket_path_is_not_replaced():
+    """Test that an existing regular file at the socket path is left alone."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        socket_path = Path(tmpdir) / "daemon.sock"
+        socket_path.write_text("keep me")
+
+        with pytest.raises(DaemonError, match="is not a socket"):
+            serve(socket_path, create_executor("serial"))
+
+        assert socket_path.read_text() == "keep me"
+
+
+def test_unexpected_error_is_returned(monkeypatch):
+    """Test that an unexpected exception becomes an error response."""
+    daemon = MigrationDaemon(create_executor("serial"))
+
+    def explode(params):
+        raise KeyError("boom")
+
+    monkeypatch.setitem(daemon._handlers, "ping", explode)
+    response = daemon.handle({"command": "ping"})
+
+    assert response["ok"] is False
+    assert "KeyError" in response["error"]
+
+
+def test_client_cli(daemon_dir, monkeypatch):
+    """Test the client commands against a running daemon."""
+    monkeypatch.chdir(daemon_dir)
+    runner = CliRunner()
+    env = {"ARGOCD_MIGRATOR_SOCKET": str(daemon_dir / "daemon.sock")}
+
+    result = runner.invoke(app, ["client", "migrate", "-i", "apps", "-o", "out.json"], env=env)
+    assert result.exit_code == 0, result.output
+    assert "3/3 succeeded" in result.output
+    assert (daemon_dir / "out.json").exists()
+
+    result = runner.invoke(app, ["client", "diff", "-i", "apps", "-o", "out.json"], env=env)
+    assert result.exit_code == 0, result.output
+
+    (daemon_dir / "apps" / "app-0.yaml").write_text(APP_YAML.format(index="changed"))
+    result = runner.invoke(app, ["client", "diff", "-i", "apps", "-o", "out.json"], env=env)
+    assert result.exit_code == 1
+    assert "app-changed" in result.output
+
+    result = runner.invoke(app, ["client", "ping"], env=env)
+    assert result.exit_code == 0
+    assert "daemon (pid" in result.output
+
+
+def test_client_without_daemon():
+    """Test that the client reports an unreachable daemon."""
+    runner = CliRunner()
+    result = runner.invoke(app, ["client", "ping", "--socket", "/nonexistent/daemon.sock"])
+
+    assert result.exit_code == 1
+    assert "Cannot reach daemon" in result.output
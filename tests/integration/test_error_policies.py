@@ -0,0 +1,212 @@
+"""Integration tests for pipeline error policies."""
+
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from argocd_migrator.async_pipeline import run_staged_pipeline_sync
+from argocd_migrator.pipeline import run_pipeline
+from argocd_migrator.policy import ExecutionPolicy
+
+VALID_APP_YAML = """
+apiVersion: argoproj.io/v1alpha1
+kind: Application
+metadata:
+  name: {name}
+spec:
+  project: default
+  source:
+    repoURL: https://github.com/example/repo.git
+  destination:
+    server: https://kubernetes.default.svc
+    namespace: default
+"""
+
+INVALID_APP_YAML = """
+apiVersion: v1
+kind: ConfigMap
+metadata:
+  name: not-an-app
+"""
+
+
+def _write_corpus(directory: Path) -> None:
+    """Write 20 apps where files 03, 07 and 11 are invalid."""
+    directory.mkdir()
+    for i in range(20):
+        content = INVALID_APP_YAML if i in (3, 7, 11) else VALID_APP_YAML.format(name=f"app-{i}")
+        (directory / f"app-{i:02d}.yaml").write_text(content)
+
+
+@pytest.mark.parametrize("jobs, backend", [(1, "serial"), (2, "thread"), (2, "process")])
+def test_fail_fast_cancels_outstanding_work(jobs, backend):
+    """Test fail-fast stops at the first error and writes nothing."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        _write_corpus(tmp_path / "apps")
+        output_file = tmp_path / "config.json"
+
+        result = run_pipeline(
+            tmp_path / "apps",
+            output_file,
+            jobs=jobs,
+            backend=backend,
+            policy=ExecutionPolicy.parse("fail-fast"),
+        )
+
+        assert result.total == 20
+        assert result.failed == 1
+        assert result.results[-1].source_file.name == "app-03.yaml"
+        assert result.skipped == 16
+        assert result.output_file is None
+        assert not output_file.exists()
+
+
+def test_fail_fast_sees_late_failure_under_size_schedule():
+    """Test a large failing file late in scan order cancels the chunks still queued."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        source = tmp_path / "apps"
+        source.mkdir()
+        for i in range(400):
+            (source / f"app-{i:03d}.yaml").write_text(VALID_APP_YAML.format(name=f"app-{i}"))
+        # Largest file, so it runs first; the tab fails parsing straight away
+        (source / "zz_bad.yaml").write_text("kind: Application\n\tbroken: tab\n" + "#\n" * 500_000)
+
+        result = run_pipeline(
+            source,
+            tmp_path / "config.json",
+            jobs=2,
+            backend="thread",
+            schedule="size",
+            policy=ExecutionPolicy.parse("fail-fast"),
+        )
+
+        assert result.total == 401
+        assert result.failed == 1
+        assert result.skipped > 0
+        names = [r.source_file.name for r in result.results]
+        assert names == sorted(names)
+        assert names[-1] == "zz_bad.yaml"
+        assert result.output_file is None
+
+
+def test_max_errors_stops_after_n_errors():
+    """Test max-errors=N stops once N files have failed."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        _write_corpus(tmp_path / "apps")
+
+        result = run_pipeline(
+            tmp_path / "apps",
+            tmp_path / "config.json",
+            policy=ExecutionPolicy.parse("max-errors=2"),
+        )
+
+        assert result.failed == 2
+        assert len(result.results) == 8
+        assert result.skipped == 12
+        assert result.output_file is None
+
+
+def test_continue_writes_partial_output_and_report():
+    """Test continue writes successful configs and an error report."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        _write_corpus(tmp_path / "apps")
+        output_file = tmp_path / "config.json"
+
+        result = run_pipeline(
+            tmp_path / "apps", output_file, policy=ExecutionPolicy.parse("continue")
+        )
+
+        assert result.successful == 17
+        assert result.failed == 3
+        assert result.output_file == output_file
+        assert result.error_report == tmp_path / "config.errors.json"
+
+        with open(output_file) as f:
+            assert len(json.load(f)) == 17
+        with open(result.error_report) as f:
+            report = json.load(f)
+        assert report["total"] == 20
+        assert [Path(e["source_file"]).name for e in report["errors"]] == [
+            "app-03.yaml",
+            "app-07.yaml",
+            "app-11.yaml",
+        ]
+
+
+def test_staged_pipeline_honours_policies():
+    """Test the staged engine applies the same policies."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        _write_corpus(tmp_path / "apps")
+
+        fail_fast = run_staged_pipeline_sync(
+            tmp_path / "apps",
+            tmp_path / "fail-fast.json",
+            policy=ExecutionPolicy.parse("fail-fast"),
+            queue_size=1,
+        )
+        partial = run_staged_pipeline_sync(
+            tmp_path / "apps",
+            tmp_path / "partial.json",
+            policy=ExecutionPolicy.parse("continue"),
+            error_report=tmp_path / "report.json",
+        )
+        sequential = run_pipeline(
+            tmp_path / "apps",
+            tmp_path / "sequential.json",
+            policy=ExecutionPolicy.parse("continue"),
+        )
+
+        assert fail_fast.failed == 1
+        assert fail_fast.skipped > 0
+        assert fail_fast.output_file is None
+        assert not (tmp_path / "fail-fast.json").exists()
+
+        assert partial.error_report == tmp_path / "report.json"
+        assert partial.successful == sequential.successful == 17
+        assert (tmp_path / "partial.json").read_bytes() == (
+            tmp_path / "sequential.json"
+        ).read_bytes()
+
+
+@pytest.mark.parametrize("serialize_in_workers", [False, True])
+def test_invalid_config_fails_only_its_file(monkeypatch, serialize_in_workers):
+    """Test a config failing validation is one failed file on both serialization paths."""
+    from argocd_migrator import pipeline
+
+    original = pipeline.transform_to_generator_config
+
+    def drop_project(app):
+        config = original(app)
+        if config["metadata"]["name"] == "app-5":
+            del config["project"]
+        return config
+
+    monkeypatch.setattr(pipeline, "transform_to_generator_config", drop_project)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        source_dir = tmp_path / "apps"
+        source_dir.mkdir()
+        for i in range(8):
+            (source_dir / f"app-{i}.yaml").write_text(VALID_APP_YAML.format(name=f"app-{i}"))
+        output_file = tmp_path / "config.json"
+
+        result = run_pipeline(
+            source_dir,
+            output_file,
+            serialize_in_workers=serialize_in_workers,
+            policy=ExecutionPolicy.parse("continue"),
+        )
+
+        assert (result.successful, result.failed) == (7, 1)
+        failure = next(r for r in result.results if not r.success)
+        assert failure.source_file.name == "app-5.yaml"
+        assert failure.error == "Config 'app-5' missing required field: project"
+        assert len(json.loads(output_file.read_text())) == 7
@@ -0,0 +1,122 @@
+"""Integration tests for externalized helm/kustomize blocks."""
+
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from argocd_migrator.cli import app
+from argocd_migrator.pipeline import merge_shards, run_pipeline
+from argocd_migrator.sharding import Shard
+from argocd_migrator.sidecar import REF_KEY, BlockStore, load_configs
+
+SHARED_VALUES = "".join(f"        setting{i}: value-{i}\n" for i in range(200))
+
+APP_YAML = """
+apiVersion: argoproj.io/v1alpha1
+kind: Application
+metadata:
+  name: {name}
+spec:
+  project: default
+  source:
+    repoURL: https://github.com/example/charts.git
+    targetRevision: main
+    path: charts/{name}
+    helm:
+      values: |
+{values}
+  destination:
+    server: https://kubernetes.default.svc
+    namespace: {name}
+"""
+
+runner = CliRunner()
+
+
+def _write_tree(root: Path, apps: int = 12) -> Path:
+    source = root / "apps"
+    source.mkdir()
+    for i in range(apps):
+        values = SHARED_VALUES if i % 3 else "        replicas: 1\n"
+        name = f"app-{i:02d}"
+        (source / f"{name}.yaml").write_text(APP_YAML.format(name=name, values=values))
+    return source
+
+
+def test_pipeline_externalizes_and_expands_byte_identically():
+    """Test shared blocks are written once and expand back to the inline output."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        source = _write_tree(root)
+        run_pipeline(source, root / "inline.json")
+        store = BlockStore.for_output(root / "config.json")
+
+        result = run_pipeline(source, root / "config.json", blocks=store)
+
+        assert result.successful == 12
+        assert (store.refs, store.blocks_written) == (8, 1)
+        configs = json.loads((root / "config.json").read_text())
+        refs = {c["source"]["helm"].get(REF_KEY) for c in configs}
+        assert len(refs - {None}) == 1
+        assert "replicas" in configs[0]["source"]["helm"]["values"]
+        assert (root / "config.json").stat().st_size * 4 < (root / "inline.json").stat().st_size
+        assert load_configs(root / "config.json") == json.loads((root / "inline.json").read_text())
+
+        expanded = runner.invoke(
+            app, ["expand", str(root / "config.json"), "-o", str(root / "full.json")]
+        )
+        assert expanded.exit_code == 0
+        assert (root / "full.json").read_bytes() == (root / "inline.json").read_bytes()
+
+
+def test_merge_externalizes_blocks():
+    """Test merging shards can externalize blocks like a single-node run."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        source = _write_tree(root)
+        single = root / "single" / "config.json"
+        run_pipeline(source, single, blocks=BlockStore.for_output(single))
+        partials = []
+        for i in (1, 2):
+            run_pipeline(source, root / f"part-{i}.json", shard=Shard(i, 2))
+            partials.append(root / f"part-{i}.json")
+
+        output = root / "merged" / "config.json"
+        merge_shards(partials, output, blocks=BlockStore.for_output(output))
+
+        assert output.read_bytes() == single.read_bytes()
+
+
+def test_blocks_need_configs_not_fragments():
+    """Test blocks cannot be combined with serialization in workers."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        with pytest.raises(ValueError, match="serialized fragments"):
+            run_pipeline(
+                _write_tree(root, apps=1),
+                root / "config.json",
+                serialize_in_workers=True,
+                blocks=BlockStore.for_output(root / "config.json"),
+            )
+
+
+def test_cli_externalize_blocks():
+    """Test migrate --externalize-blocks writes the sidecar next to the output."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        source = _write_tree(root, apps=3)
+
+        result = runner.invoke(
+            app,
+            [
+                "migrate", "-i", str(source), "-o", str(root / "config.json"),
+                "--externalize-blocks", "--block-threshold", "512", "-j", "1",
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "Externalized 2 blocks" in result.output
+        assert len(list((root / "config.blocks").iterdir())) == 1
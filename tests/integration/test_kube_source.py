@@ -0,0 +1,106 @@
+"""Integration tests for migrating Applications listed from a Kubernetes API server."""
+
+import io
+import json
+import tempfile
+from pathlib import Path
+
+import yaml
+from typer.testing import CliRunner
+
+from argocd_migrator.cli import app
+from argocd_migrator.kube import KubeSource
+from argocd_migrator.pipeline import run_pipeline
+from argocd_migrator.policy import ExecutionPolicy
+from argocd_migrator.streaming import iter_cluster
+from tests.fixtures.kube_api import KubeApiStandIn, application, record_pages
+
+NAMESPACES = ("team-a", "team-b", "team-c")
+
+
+def _responses() -> dict[str, list[dict]]:
+    return {
+        ns: record_pages([application(ns, f"{ns}-{i}", i) for i in range(5)], 2, ns)
+        for ns in NAMESPACES
+    }
+
+
+def test_cluster_output_matches_exported_directory_run():
+    """Test listing from the API gives the same config.json as exporting to disk first."""
+    responses = _responses()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # The old workflow: export every Application to a file, then migrate the directory
+        export = Path(tmpdir) / "export"
+        for ns in NAMESPACES:
+            (export / ns).mkdir(parents=True)
+            for page in responses[ns]:
+                for item in page["items"]:
+                    name = item["metadata"]["name"]
+                    (export / ns / f"{name}.yaml").write_text(yaml.safe_dump(item))
+        expected = Path(tmpdir) / "expected.json"
+        run_pipeline(export, expected)
+
+        output_file = Path(tmpdir) / "config.json"
+        ndjson = io.BytesIO()
+        with KubeApiStandIn(responses) as server:
+            stream = iter_cluster(
+                KubeSource(server.url, namespaces=list(NAMESPACES), page_size=2),
+                output_file,
+                ndjson,
+            )
+            list(stream)
+
+        assert output_file.read_bytes() == expected.read_bytes()
+        assert len(ndjson.getvalue().splitlines()) == 15
+        assert stream.result is not None
+        assert stream.result.successful == 15
+        assert server.connections <= 3
+
+
+def test_invalid_applications_are_reported_by_name():
+    """Test Applications that fail validation are labelled with namespace and name."""
+    responses = _responses()
+    del responses["team-b"][1]["items"][0]["spec"]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with KubeApiStandIn(responses) as server:
+            stream = iter_cluster(
+                KubeSource(server.url, namespaces=list(NAMESPACES)),
+                Path(tmpdir) / "config.json",
+                policy=ExecutionPolicy.parse("continue"),
+            )
+            list(stream)
+
+        assert stream.result is not None
+        assert stream.result.failed == 1
+        assert stream.result.results[0].source_file == Path("k8s:team-b/team-b-2")
+
+
+def test_cli_migrates_from_kube_server(monkeypatch):
+    """Test migrate --kube-server writes NDJSON and requires exactly one input."""
+    monkeypatch.setenv("ARGOCD_MIGRATOR_KUBE_TOKEN", "s3cret")
+    with KubeApiStandIn(_responses(), token="s3cret") as server:
+        result = CliRunner().invoke(
+            app,
+            [
+                "migrate",
+                "--kube-server",
+                server.url,
+                "-N",
+                "team-c",
+                "-N",
+                "team-a",
+                "--kube-page-size",
+                "3",
+                "-o",
+                "-",
+                "-q",
+            ],
+        )
+
+    assert result.exit_code == 0, result.output
+    names = [json.loads(line)["metadata"]["name"] for line in result.stdout.splitlines()]
+    assert names == [f"{ns}-{i}" for ns in ("team-c", "team-a") for i in range(5)]
+    assert server.limits == {"3"}
+
+    result = CliRunner().invoke(app, ["migrate", "-o", "-"])
+    assert result.exit_code == 2
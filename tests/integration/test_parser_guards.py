@@ -0,0 +1,163 @@
+"""Integration tests for per-file resource guards."""
+
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from argocd_migrator import pipeline
+from argocd_migrator.executor import create_executor
+from argocd_migrator.pipeline import run_pipeline
+from argocd_migrator.policy import ExecutionPolicy
+
+APP_YAML = """
+apiVersion: argoproj.io/v1alpha1
+kind: Application
+metadata:
+  name: app-{index}
+spec:
+  project: default
+  source:
+    repoURL: https://github.com/example/repo.git
+  destination:
+    server: https://kubernetes.default.svc
+    namespace: default
+"""
+
+ALIAS_BOMB = "a: &a [x, x, x, x, x, x, x, x, x, x]\n" + "".join(
+    f"{name}: &{name} [{', '.join([f'*{previous}'] * 10)}]\n"
+    for previous, name in zip("abcdefgh", "bcdefghi", strict=True)
+)
+
+
+def test_pathological_files_fail_and_run_continues():
+    """Test that alias bombs and oversized files become per-file failures."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source = Path(tmpdir) / "apps"
+        source.mkdir()
+        (source / "app-0.yaml").write_text(APP_YAML.format(index=0))
+        (source / "bomb.yaml").write_text(ALIAS_BOMB)
+        with open(source / "huge.yaml", "wb") as f:
+            f.truncate(64 * 1024 * 1024)
+        (source / "app-1.yaml").write_text(APP_YAML.format(index=1))
+
+        result = run_pipeline(
+            source, Path(tmpdir) / "config.json", policy=ExecutionPolicy.parse("continue")
+        )
+
+        assert result.successful == 2
+        errors = {r.source_file.name: r.error or "" for r in result.results if not r.success}
+        assert "exceeds parser limits" in errors["bomb.yaml"]
+        assert "byte limit" in errors["huge.yaml"]
+        assert result.output_file is not None
+
+
+def test_slow_file_times_out(monkeypatch):
+    """Test that a file exceeding the per-file timeout fails without stalling the run."""
+    original = pipeline.parse_yaml_content
+
+    def slow_parse(content, file_path):
+        if Path(file_path).name == "app-1.yaml":
+            time.sleep(30)
+        return original(content, file_path)
+
+    monkeypatch.setattr(pipeline, "parse_yaml_content", slow_parse)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source = Path(tmpdir) / "apps"
+        source.mkdir()
+        for i in range(3):
+            (source / f"app-{i}.yaml").write_text(APP_YAML.format(index=i))
+
+        start = time.perf_counter()
+        with create_executor("serial", timeout=0.2) as executor:
+            result = run_pipeline(source, Path(tmpdir) / "config.json", executor=executor)
+
+        assert time.perf_counter() - start < 10
+        assert (result.successful, result.failed) == (2, 1)
+        failure = next(r for r in result.results if not r.success)
+        assert failure.source_file.name == "app-1.yaml"
+        assert "timed out after 0.2s" in (failure.error or "")
+
+
+def test_run_pipeline_timeout_applies_to_own_executor(monkeypatch):
+    """Test that run_pipeline passes its timeout to the executor it creates."""
+    original = pipeline.parse_yaml_content
+
+    def slow_parse(content, file_path):
+        if Path(file_path).name == "app-1.yaml":
+            time.sleep(30)
+        return original(content, file_path)
+
+    monkeypatch.setattr(pipeline, "parse_yaml_content", slow_parse)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source = Path(tmpdir) / "apps"
+        source.mkdir()
+        for i in range(3):
+            (source / f"app-{i}.yaml").write_text(APP_YAML.format(index=i))
+
+        start = time.perf_counter()
+        result = run_pipeline(source, Path(tmpdir) / "config.json", timeout=0.2)
+
+        assert time.perf_counter() - start < 10
+        assert (result.successful, result.failed) == (2, 1)
+        failure = next(r for r in result.results if not r.success)
+        assert "timed out after 0.2s" in (failure.error or "")
+
+
+def test_run_pipeline_rejects_timeout_with_existing_executor():
+    """Test that a timeout cannot be combined with a caller-owned executor."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with create_executor("serial") as executor:
+            with pytest.raises(ValueError, match="timeout"):
+                run_pipeline(tmpdir, Path(tmpdir) / "config.json", executor=executor, timeout=1)
+
+
+def test_timeout_escaping_transform_fails_only_that_file(monkeypatch):
+    """Test that a timeout raised outside the per-file error handling fails one file."""
+    from argocd_migrator.exceptions import FileTimeoutError
+
+    original = pipeline.transform_file
+
+    def late_alarm(source_file, **kwargs):
+        result = original(source_file, **kwargs)
+        if source_file.name == "app-1.yaml":
+            raise FileTimeoutError("Processing timed out after 0.2s")
+        return result
+
+    monkeypatch.setattr(pipeline, "transform_file", late_alarm)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source = Path(tmpdir) / "apps"
+        source.mkdir()
+        for i in range(3):
+            (source / f"app-{i}.yaml").write_text(APP_YAML.format(index=i))
+
+        result = run_pipeline(source, Path(tmpdir) / "config.json", jobs=1)
+
+        assert (result.successful, result.failed) == (2, 1)
+        failure = next(r for r in result.results if not r.success)
+        assert failure.source_file.name == "app-1.yaml"
+        assert "timed out" in (failure.error or "")
+
+
+def test_cli_warns_when_thread_workers_ignore_timeout():
+    """Test an explicit --file-timeout with thread workers prints a warning."""
+    from typer.testing import CliRunner
+
+    from argocd_migrator.cli import app
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source = Path(tmpdir) / "apps"
+        source.mkdir()
+        (source / "app-0.yaml").write_text(APP_YAML.format(index=0))
+
+        result = CliRunner().invoke(app, [
+            "migrate", "-i", str(source), "-o", str(Path(tmpdir) / "config.json"),
+            "--executor", "thread", "-j", "2", "--file-timeout", "5",
+        ])
+
+        assert result.exit_code == 0, result.output
+        assert "--file-timeout is not enforced" in result.output
@@ -0,0 +1,224 @@
+"""Integration tests for pipeline run metrics, traces and memory profiles."""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from argocd_migrator.async_pipeline import run_staged_pipeline_sync
+from argocd_migrator.executor import create_executor
+from argocd_migrator.memory import MemoryProfiler
+from argocd_migrator.pipeline import run_pipeline, transform_file
+from argocd_migrator.policy import ExecutionPolicy
+from argocd_migrator.tracing import TraceRecorder
+
+APP_YAML = """
+apiVersion: argoproj.io/v1alpha1
+kind: Application
+metadata:
+  name: app-{index}
+spec:
+  project: default
+  source:
+    repoURL: https://github.com/example/repo.git
+  destination:
+    server: https://kubernetes.default.svc
+    namespace: default
+"""
+
+
+def _write_corpus(directory: Path, apps: int) -> None:
+    directory.mkdir()
+    for i in range(apps):
+        (directory / f"app-{i:02d}.yaml").write_text(APP_YAML.format(index=i))
+
+
+@pytest.mark.parametrize("serialize_in_workers", [False, True])
+def test_run_pipeline_reports_metrics(serialize_in_workers):
+    """Test run_pipeline reports per-stage timings, bytes and throughput."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source_dir = Path(tmpdir) / "apps"
+        _write_corpus(source_dir, 12)
+        output_file = Path(tmpdir) / "config.json"
+
+        result = run_pipeline(
+            source_dir, output_file, serialize_in_workers=serialize_in_workers
+        )
+
+        metrics = result.metrics
+        assert metrics is not None
+        assert metrics.files == 12
+        assert metrics.successful == 12
+        assert metrics.bytes_read == sum(p.stat().st_size for p in source_dir.iterdir())
+        assert metrics.bytes_written == output_file.stat().st_size
+        for stage in ("scan", "read", "parse", "transform", "validate", "serialize", "write"):
+            assert metrics.stages[stage].calls > 0, stage
+        assert metrics.stages["parse"].calls == 12
+        assert metrics.file_latency.count == 12
+        assert metrics.wall_seconds > 0
+        assert metrics.files_per_second > 0
+
+
+def test_run_pipeline_times_failed_files():
+    """Test failed files still contribute their stage timings."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source_dir = Path(tmpdir) / "apps"
+        _write_corpus(source_dir, 3)
+        (source_dir / "broken.yaml").write_text("kind: [unclosed")
+
+        result = run_pipeline(source_dir, Path(tmpdir) / "config.json")
+
+        assert result.metrics is not None
+        assert result.metrics.failed == 1
+        assert result.metrics.stages["parse"].calls == 4
+
+
+def test_live_process_pool_reports_worker_rss():
+    """Test workers report their peak RSS while the pool is still running."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source_dir = Path(tmpdir) / "apps"
+        _write_corpus(source_dir, 6)
+
+        with create_executor("process", 2) as pool:
+            result = run_pipeline(source_dir, Path(tmpdir) / "config.json", executor=pool)
+
+        assert result.metrics is not None
+        # A live interpreter with the migrator imported is well over 10 MiB
+        assert result.metrics.peak_worker_rss_bytes > 10 * 2**20
+
+
+def test_staged_pipeline_reports_metrics():
+    """Test the staged engine reports the same metrics shape."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source_dir = Path(tmpdir) / "apps"
+        _write_corpus(source_dir, 12)
+        output_file = Path(tmpdir) / "config.json"
+
+        result = run_staged_pipeline_sync(source_dir, output_file)
+
+        metrics = result.metrics
+        assert metrics is not None
+        assert metrics.files == 12
+        assert metrics.bytes_written == output_file.stat().st_size
+        assert metrics.stages["parse"].calls == 12
+        assert metrics.stages["write"].calls == 13  # One per fragment plus the commit
+        assert metrics.file_latency.count == 12
+
+
+def _file_spans(trace: TraceRecorder) -> dict[str, set[str]]:
+    stages: dict[str, set[str]] = {}
+    for event in trace.to_chrome_trace()["traceEvents"]:
+        if event["ph"] == "X" and "args" in event:
+            stages.setdefault(Path(event["args"]["path"]).name, set()).add(event["name"])
+    return stages
+
+
+@pytest.mark.parametrize("jobs, backend", [(1, "serial"), (2, "process")])
+def test_run_pipeline_records_trace(jobs, backend):
+    """Test every file gets a span per stage, including from worker processes."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source_dir = Path(tmpdir) / "apps"
+        _write_corpus(source_dir, 6)
+        (source_dir / "broken.yaml").write_text("kind: [unclosed")
+        trace = TraceRecorder()
+
+        run_pipeline(
+            source_dir,
+            Path(tmpdir) / "config.json",
+            jobs=jobs,
+            backend=backend,
+            policy=ExecutionPolicy.parse("continue"),
+            trace=trace,
+        )
+
+        stages = _file_spans(trace)
+        assert stages["app-00.yaml"] == {
+            "read", "parse", "transform", "validate", "serialize", "write"
+        }
+        assert stages["broken.yaml"] == {"read", "parse"}
+        assert len(stages) == 7
+
+
+def test_staged_pipeline_records_trace():
+    """Test the staged engine records the same per-file spans."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source_dir = Path(tmpdir) / "apps"
+        _write_corpus(source_dir, 6)
+        trace = TraceRecorder()
+
+        run_staged_pipeline_sync(source_dir, Path(tmpdir) / "config.json", trace=trace)
+
+        stages = _file_spans(trace)
+        assert len(stages) == 6
+        assert stages["app-05.yaml"] == {
+            "read", "parse", "transform", "validate", "serialize", "write"
+        }
+
+
+def test_tracing_disabled_by_default():
+    """Test workers collect no spans unless tracing is enabled."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source_dir = Path(tmpdir) / "apps"
+        _write_corpus(source_dir, 2)
+
+        result = transform_file(source_dir / "app-00.yaml")
+
+        assert result.stats is not None
+        assert result.stats.spans is None
+        assert "parse" in result.stats.timings
+
+
+def test_run_pipeline_releases_recorded_stats():
+    """Test per-file stats are dropped from results once the run has recorded them."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source_dir = Path(tmpdir) / "apps"
+        _write_corpus(source_dir, 3)
+        trace = TraceRecorder()
+
+        result = run_pipeline(source_dir, Path(tmpdir) / "config.json", trace=trace)
+
+        assert result.metrics.file_latency.count == 3
+        assert len(_file_spans(trace)) == 3
+        assert all(r.stats is None for r in result.results)
+
+
+def test_run_pipeline_memory_profile():
+    """Test each pipeline stage is measured when memory profiling is active."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source_dir = Path(tmpdir) / "apps"
+        _write_corpus(source_dir, 12)
+
+        with MemoryProfiler() as memory:
+            result = run_pipeline(
+                source_dir,
+                Path(tmpdir) / "config.json",
+                per_file_dir=Path(tmpdir) / "per-file",
+                memory=memory,
+            )
+
+        assert result.successful == 12
+        assert [s.name for s in memory.stages] == ["scan", "transform", "write", "per-file"]
+        transform = memory.stages[1]
+        assert transform.retained_bytes > 0
+        assert transform.peak_bytes >= transform.end_bytes
+
+
+def test_cli_memory_profile_runs_serially():
+    """Test --memory-profile falls back to serial execution instead of a process pool."""
+    from typer.testing import CliRunner
+
+    from argocd_migrator.cli import app
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source_dir = Path(tmpdir) / "apps"
+        _write_corpus(source_dir, 4)
+        memory_file = Path(tmpdir) / "memory.json"
+
+        result = CliRunner().invoke(app, [
+            "migrate", "-i", str(source_dir), "-o", str(Path(tmpdir) / "config.json"),
+            "-j", "2", "--memory-profile", str(memory_file),
+        ])
+
+        assert result.exit_code == 0, result.output
+        assert "running serially" in result.output
+        assert memory_file.exists()
@@ -0,0 +1,127 @@
+"""Integration tests for checkpoint journals and resumed runs."""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from argocd_migrator.journal import load_journal
+from argocd_migrator.pipeline import run_pipeline
+
+APP_YAML = """
+apiVersion: argoproj.io/v1alpha1
+kind: Application
+metadata:
+  name: {name}
+  namespace: argocd
+spec:
+  project: default
+  source:
+    repoURL: https://github.com/example/repo.git
+    targetRevision: main
+    path: apps/{name}
+  destination:
+    server: https://kubernetes.default.svc
+    namespace: {name}
+"""
+
+INVALID_APP_YAML = """
+apiVersion: v1
+kind: ConfigMap
+metadata:
+  name: not-an-app
+"""
+
+
+def _write_tree(root: Path, apps: int = 30) -> Path:
+    source = root / "apps"
+    for i in range(apps):
+        path = source / f"team-{i % 3}" / f"app-{i:03d}.yaml"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(APP_YAML.format(name=f"app-{i:03d}"))
+    return source
+
+
+def _interrupt(journal: Path, keep: int) -> None:
+    """Cut the journal back to its header and ``keep`` records plus a torn one."""
+    lines = journal.read_bytes().splitlines(keepends=True)
+    journal.write_bytes(b"".join(lines[: keep + 1]) + lines[keep + 1][:20])
+
+
+@pytest.mark.parametrize("serialize_in_workers", [False, True])
+def test_resume_after_interruption_is_byte_identical(serialize_in_workers):
+    """Test a resumed run reuses journaled files and writes the same config."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        source = _write_tree(root)
+        run_pipeline(source, root / "clean.json")
+        journal = root / "run.journal.ndjson"
+        run_pipeline(
+            source, root / "out.json", journal=journal, serialize_in_workers=serialize_in_workers
+        )
+        assert len(load_journal(journal)) == 30
+        _interrupt(journal, keep=12)
+        (root / "out.json").unlink()
+
+        result = run_pipeline(
+            source,
+            root / "out.json",
+            journal=journal,
+            resume=True,
+            serialize_in_workers=serialize_in_workers,
+        )
+
+        assert (result.resumed, result.successful) == (12, 30)
+        assert (root / "out.json").read_bytes() == (root / "clean.json").read_bytes()
+        assert len(load_journal(journal)) == 30
+
+
+def test_resume_reprocesses_changed_files():
+    """Test files whose content changed since they were journaled run again."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        source = _write_tree(root, apps=5)
+        journal = root / "run.journal.ndjson"
+        run_pipeline(source, root / "out.json", journal=journal)
+        changed = source / "team-0" / "app-000.yaml"
+        changed.write_text(APP_YAML.format(name="renamed"))
+
+        result = run_pipeline(source, root / "out.json", journal=journal, resume=True)
+
+        assert result.resumed == 4
+        assert load_journal(journal)["team-0/app-000.yaml"].config["metadata"]["name"] == (
+            "renamed"
+        )
+        assert "renamed" in (root / "out.json").read_text()
+
+
+def test_journaled_failures_are_reused():
+    """Test failed files are journaled with their error and count as failures on resume."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        source = _write_tree(root, apps=3)
+        (source / "broken.yaml").write_text(INVALID_APP_YAML)
+        journal = root / "run.journal.ndjson"
+        first = run_pipeline(source, root / "out.json", journal=journal)
+
+        result = run_pipeline(source, root / "out.json", journal=journal, resume=True)
+
+        assert first.failed == result.failed == 1
+        assert result.resumed == 4
+        assert result.output_file is None
+        failure = next(r for r in result.results if not r.success)
+        assert failure.error == load_journal(journal)["broken.yaml"].error
+
+
+def test_resume_without_journal_starts_fresh():
+    """Test --resume with no journal yet processes everything and creates it."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        source = _write_tree(root, apps=4)
+        journal = root / "nested" / "run.journal.ndjson"
+
+        result = run_pipeline(source, root / "out.json", journal=journal, resume=True)
+
+        assert result.resumed == 0
+        assert result.successful == 4
+        assert len(load_journal(journal)) == 4
@@ -0,0 +1,147 @@
+"""Integration tests for sharded runs and the merge step."""
+
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from argocd_migrator.exceptions import ShardError
+from argocd_migrator.pipeline import merge_shards, run_pipeline
+from argocd_migrator.policy import ExecutionPolicy
+from argocd_migrator.sharding import Shard
+
+APP_YAML = """
+apiVersion: argoproj.io/v1alpha1
+kind: Application
+metadata:
+  name: {name}
+  namespace: argocd
+spec:
+  project: default
+  source:
+    repoURL: https://github.com/example/repo.git
+    targetRevision: main
+    path: apps/{name}
+    helm:
+      values: |
+        replicas: {index}
+  destination:
+    server: https://kubernetes.default.svc
+    namespace: {name}
+"""
+
+INVALID_APP_YAML = """
+apiVersion: v1
+kind: ConfigMap
+metadata:
+  name: not-an-app
+"""
+
+
+def _write_tree(root: Path, apps: int = 40, invalid: int = 0) -> Path:
+    source = root / "apps"
+    for i in range(apps):
+        path = source / f"team-{i % 4}" / f"app-{i:03d}.yaml"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(APP_YAML.format(name=f"app-{i:03d}", index=i))
+    for i in range(invalid):
+        (source / f"broken-{i}.yml").write_text(INVALID_APP_YAML)
+    return source
+
+
+def test_shards_run_as_processes_merge_to_single_node_output():
+    """Test N shard processes plus merge are byte-identical to a single-node run."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        source = _write_tree(root)
+        run_pipeline(source, root / "single.json")
+
+        shards = [
+            subprocess.Popen(
+                [
+                    sys.executable, "-m", "argocd_migrator", "migrate",
+                    "-i", str(source), "-o", str(root / f"part-{i}.json"),
+                    "--shard", f"{i}/3", "-j", "1", "-q",
+                ],
+            )
+            for i in (1, 2, 3)
+        ]
+        assert [proc.wait() for proc in shards] == [0, 0, 0]
+        merged = subprocess.run(
+            [
+                sys.executable, "-m", "argocd_migrator", "merge",
+                *(str(root / f"part-{i}.json") for i in (3, 1, 2)),
+                "-o", str(root / "merged.json"), "-q",
+            ],
+        )
+
+        assert merged.returncode == 0
+        assert (root / "merged.json").read_bytes() == (root / "single.json").read_bytes()
+        sizes = [len(json.loads((root / f"part-{i}.json").read_text())["files"]) for i in (1, 2, 3)]
+        assert sum(sizes) == 40 and all(sizes)
+
+
+def test_merge_applies_failure_policy_across_shards():
+    """Test failures recorded by shards block the merge unless the policy is continue."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        source = _write_tree(root, apps=10, invalid=3)
+        partials = []
+        for i in (1, 2):
+            shard = run_pipeline(source, root / f"part-{i}.json", shard=Shard(i, 2))
+            assert shard.output_file == root / f"part-{i}.json"
+            partials.append(shard.output_file)
+
+        blocked = merge_shards(partials, root / "merged.json")
+        assert blocked.failed == 3
+        assert blocked.output_file is None
+        assert not (root / "merged.json").exists()
+
+        single = run_pipeline(
+            source, root / "single.json", policy=ExecutionPolicy.parse("continue")
+        )
+        result = merge_shards(
+            partials, root / "merged.json", policy=ExecutionPolicy.parse("continue")
+        )
+
+        assert (result.total, result.successful, result.failed) == (13, 10, 3)
+        assert (root / "merged.json").read_bytes() == (root / "single.json").read_bytes()
+        assert result.error_report is not None and single.error_report is not None
+        assert result.error_report.read_bytes() == single.error_report.read_bytes()
+
+
+def test_merge_validates_aggregated_structure():
+    """Test merged configs are validated like a single-node run."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        source = _write_tree(root, apps=4)
+        partial = root / "part.json"
+        run_pipeline(source, partial, shard=Shard(1, 1))
+        document = json.loads(partial.read_text())
+        del document["files"][0]["config"]["destination"]
+        partial.write_text(json.dumps(document))
+
+        result = merge_shards([partial], root / "merged.json")
+
+        assert result.output_file is None
+        assert not (root / "merged.json").exists()
+
+
+def test_empty_shard_writes_partial():
+    """Test a shard that selects no files still writes a mergeable partial."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        source = _write_tree(root, apps=1)
+        partials = [root / f"part-{i}.json" for i in range(1, 9)]
+        for i, partial in enumerate(partials, 1):
+            run_pipeline(source, partial, shard=Shard(i, 8))
+
+        result = merge_shards(partials, root / "merged.json")
+
+        assert result.successful == 1
+        assert len(json.loads((root / "merged.json").read_text())) == 1
+        with pytest.raises(ShardError, match="Missing shard"):
+            merge_shards(partials[1:], root / "merged.json")
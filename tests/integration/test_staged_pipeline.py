@@ -0,0 +1,152 @@
+"""Integration tests for the asyncio staged pipeline."""
+
+import asyncio
+import tempfile
+from pathlib import Path
+
+from argocd_migrator.async_pipeline import run_staged_pipeline, run_staged_pipeline_sync
+from argocd_migrator.executor import create_executor
+from argocd_migrator.pipeline import run_pipeline
+
+APP_TEMPLATE = """
+apiVersion: argoproj.io/v1alpha1
+kind: Application
+metadata:
+  name: {name}
+  labels:
+    team: platform
+spec:
+  project: default
+  source:
+    repoURL: https://github.com/example/repo.git
+    targetRevision: main
+    path: apps/{name}
+  destination:
+    server: https://kubernetes.default.svc
+    namespace: {name}
+"""
+
+INVALID_APP_YAML = """
+apiVersion: v1
+kind: ConfigMap
+metadata:
+  name: not-an-app
+"""
+
+
+def _write_apps(directory: Path, count: int) -> None:
+    for i in range(count):
+        target = directory / f"team-{i % 3}" / f"app-{i:03d}.yaml"
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(APP_TEMPLATE.format(name=f"app-{i:03d}"))
+
+
+def test_staged_pipeline_matches_sequential_output():
+    """Test staged output is byte-identical to the sequential pipeline."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        source_dir = tmp_path / "apps"
+        _write_apps(source_dir, 40)
+
+        sequential = run_pipeline(source_dir, tmp_path / "sequential.json")
+        with create_executor("thread", 3) as executor:
+            staged = run_staged_pipeline_sync(
+                source_dir, tmp_path / "staged.json", executor=executor, queue_size=2
+            )
+
+        assert staged.successful == sequential.successful == 40
+        assert [r.source_file for r in staged.results] == [
+            r.source_file for r in sequential.results
+        ]
+        assert (tmp_path / "staged.json").read_bytes() == (
+            tmp_path / "sequential.json"
+        ).read_bytes()
+
+
+def test_staged_pipeline_reports_stage_stats():
+    """Test per-stage statistics are reported and queues stay bounded."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        _write_apps(tmp_path / "apps", 20)
+
+        result = asyncio.run(
+            run_staged_pipeline(tmp_path / "apps", tmp_path / "config.json", queue_size=3)
+        )
+
+        names = [s.name for s in result.stage_stats]
+        assert names == ["scan", "read", "process", "write"]
+        for stats in result.stage_stats:
+            assert stats.items == 20
+            assert stats.max_queue_depth <= 3 + stats.workers
+            assert 0.0 <= stats.utilization <= 1.0
+        assert result.bottleneck() is not None
+        assert {"parse", "transform", "validate", "serialize"} <= set(result.metrics.stages)
+
+
+def test_staged_pipeline_with_invalid_app_writes_nothing():
+    """Test staged pipeline keeps the all-or-nothing output rule."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        source_dir = tmp_path / "apps"
+        _write_apps(source_dir, 5)
+        (source_dir / "broken.yaml").write_text(INVALID_APP_YAML)
+        output_file = tmp_path / "config.json"
+
+        result = run_staged_pipeline_sync(source_dir, output_file)
+
+        assert result.total == 6
+        assert result.failed == 1
+        assert "not an ArgoCD Application" in (result.results[0].error or "")
+        assert result.output_file is None
+        assert not output_file.exists()
+        assert list(tmp_path.iterdir()) == [source_dir]
+
+
+def test_staged_pipeline_empty_directory():
+    """Test staged pipeline writes an empty array for empty input."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        output_file = tmp_path / "out" / "config.json"
+
+        result = run_staged_pipeline_sync(tmp_path, output_file)
+
+        assert result.total == 0
+        assert output_file.read_text() == "[]\n"
+
+
+def test_progress_counts_every_file_for_both_engines():
+    """Test both engines report every file, including failures, with parallel workers."""
+    import io
+
+    from argocd_migrator.progress import ProgressReporter
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        input_dir = Path(tmpdir) / "apps"
+        _write_apps(input_dir, 12)
+        (input_dir / "bad.yaml").write_text(INVALID_APP_YAML)
+
+        with create_executor("thread", 4) as pool:
+            sequential = ProgressReporter(io.StringIO(), interval=0.0)
+            run_pipeline(input_dir, Path(tmpdir) / "seq.json", executor=pool, progress=sequential)
+            staged = ProgressReporter(io.StringIO(), interval=0.0)
+            run_staged_pipeline_sync(
+                input_dir, Path(tmpdir) / "staged.json", executor=pool, progress=staged
+            )
+
+        for reporter in (sequential, staged):
+            assert (reporter.done, reporter.total, reporter.failed) == (13, 13, 1)
+            assert reporter.bytes_read > 0
+            assert reporter.stream.getvalue().splitlines()[-1].startswith("13/13 files")
+
+
+def test_staged_pipeline_leaves_null_progress_untouched():
+    """Test a run without a progress reporter does not count into the shared null one."""
+    from argocd_migrator.progress import NULL_PROGRESS
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        _write_apps(tmp_path / "apps", 5)
+
+        run_staged_pipeline_sync(tmp_path / "apps", tmp_path / "config.json")
+
+        assert NULL_PROGRESS.total == 0
@@ -0,0 +1,93 @@
+"""Start-up budget tests for the CLI."""
+
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Modules that only the commands needing them may import
+LAZY_MODULES = (
+    "yaml",
+    "jsonschema",
+    "asyncio",
+    "multiprocessing",
+    "cProfile",
+    "tracemalloc",
+    "argocd_migrator.pipeline",
+    "argocd_migrator.validator",
+)
+
+# Generous budgets (best of several runs) so slow CI machines do not flake; the
+# regression they catch is a heavy import creeping back in at module level
+IMPORT_BUDGET_SECONDS = 0.25
+VERSION_BUDGET_SECONDS = 0.5
+MIGRATE_BUDGET_SECONDS = 1.0
+RUNS = 3
+
+APP_YAML = """
+apiVersion: argoproj.io/v1alpha1
+kind: Application
+metadata:
+  name: startup-app
+spec:
+  project: default
+  source:
+    repoURL: https://github.com/example/repo.git
+  destination:
+    server: https://kubernetes.default.svc
+"""
+
+
+def _import_times(module: str) -> dict[str, int]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if line.startswith("import time:") and "self [us]" not in line:
+            _, cumulative_us, name = line.removeprefix("import time:").split("|")
+            times[name.strip()] = int(cumulative_us)
+    return times
+
+
+def _best_wall_clock(*args: str) -> float:
+    best = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "argocd_migrator", *args], capture_output=True, check=True
+        )
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def test_cli_import_is_lazy():
+    """Test that importing the CLI does not pull in heavy modules."""
+    times = _import_times("argocd_migrator.cli")
+
+    assert not [name for name in LAZY_MODULES if name in times]
+    best = min(_import_times("argocd_migrator.cli")["argocd_migrator.cli"] for _ in range(RUNS))
+    assert best / 1e6 < IMPORT_BUDGET_SECONDS
+
+
+def test_version_startup_budget():
+    """Test that the version command starts within budget."""
+    assert _best_wall_clock("version") < VERSION_BUDGET_SECONDS
+
+
+def test_trivial_migrate_startup_budget():
+    """Test that migrating a single file finishes within budget."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source = Path(tmpdir) / "apps"
+        source.mkdir()
+        (source / "app.yaml").write_text(APP_YAML)
+
+        elapsed = _best_wall_clock(
+            "migrate", "-i", str(source), "-o", str(Path(tmpdir) / "config.json"), "-j", "1"
+        )
+
+        assert elapsed < MIGRATE_BUDGET_SECONDS
@@ -0,0 +1,307 @@
+"""Integration tests for the streaming pipeline API."""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from argocd_migrator.pipeline import run_pipeline
+from argocd_migrator.policy import ExecutionPolicy
+from argocd_migrator.streaming import iter_pipeline
+
+APP_YAML = """
+apiVersion: argoproj.io/v1alpha1
+kind: Application
+metadata:
+  name: app-{index}
+  annotations:
+    note: "caf\\u00e9 {index}"
+spec:
+  project: default
+  source:
+    repoURL: https://github.com/example/repo.git
+    helm:
+      valuesObject:
+        replicas: {index}
+  destination:
+    server: https://kubernetes.default.svc
+    namespace: default
+"""
+
+
+def _write_corpus(directory: Path, apps: int, broken: tuple[int, ...] = ()) -> None:
+    directory.mkdir()
+    for i in range(apps):
+        content = "kind: [unclosed" if i in broken else APP_YAML.format(index=i)
+        (directory / f"app-{i:02d}.yaml").write_text(content)
+
+
+@pytest.mark.parametrize("serialize_in_workers", [False, True])
+def test_stream_output_matches_run_pipeline(serialize_in_workers):
+    """Test the streamed output is byte-identical to run_pipeline."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source_dir = Path(tmpdir) / "apps"
+        _write_corpus(source_dir, 15)
+        expected = Path(tmpdir) / "expected.json"
+        streamed = Path(tmpdir) / "streamed.json"
+        run_pipeline(source_dir, expected)
+
+        stream = iter_pipeline(
+            source_dir, streamed, serialize_in_workers=serialize_in_workers
+        )
+        names = [r.app_name for r in stream]
+
+        assert names == [f"app-{i}" for i in range(15)]
+        assert streamed.read_bytes() == expected.read_bytes()
+        assert stream.result is not None
+        assert stream.result.successful == 15
+        assert stream.result.output_file == streamed
+        assert stream.result.results == []
+
+
+def test_stream_retains_only_failures():
+    """Test the summary keeps only failed results and configs can be dropped."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source_dir = Path(tmpdir) / "apps"
+        _write_corpus(source_dir, 10, broken=(4,))
+        output_file = Path(tmpdir) / "config.json"
+
+        stream = iter_pipeline(
+            source_dir,
+            output_file,
+            policy=ExecutionPolicy.parse("continue"),
+            keep_configs=False,
+        )
+        results = list(stream)
+
+        assert len(results) == 10
+        assert not hasattr(results[0], "__dict__")  # Slotted results
+        assert all(r.transformed_config is None and r.fragment is None for r in results)
+        assert stream.result is not None
+        assert stream.result.failed == 1
+        assert [r.source_file.name for r in stream.result.results] == ["app-04.yaml"]
+        assert output_file.exists()
+        assert stream.result.error_report is not None
+
+
+def test_stream_collect_policy_writes_nothing_on_failure():
+    """Test the default policy leaves no output when a file fails."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source_dir = Path(tmpdir) / "apps"
+        _write_corpus(source_dir, 5, broken=(2,))
+        output_file = Path(tmpdir) / "config.json"
+
+        stream = iter_pipeline(source_dir, output_file)
+        list(stream)
+
+        assert stream.result is not None
+        assert stream.result.output_file is None
+        assert stream.result.successful == 4
+        assert list(Path(tmpdir).iterdir()) == [source_dir]
+
+
+def test_stream_stopped_early_leaves_no_output():
+    """Test abandoning the stream discards the partial output file."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source_dir = Path(tmpdir) / "apps"
+        _write_corpus(source_dir, 5)
+
+        stream = iter(iter_pipeline(source_dir, Path(tmpdir) / "config.json"))
+        next(stream)
+        stream.close()  # type: ignore[attr-defined]
+
+        assert list(Path(tmpdir).iterdir()) == [source_dir]
+
+
+def test_stream_can_only_be_iterated_once():
+    """Test a stream refuses to run twice."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source_dir = Path(tmpdir) / "apps"
+        _write_corpus(source_dir, 1)
+        stream = iter_pipeline(source_dir, None)
+        list(stream)
+
+        with pytest.raises(RuntimeError):
+            iter(stream)
+
+
+def test_documents_stream_ndjson_and_aggregate_match_directory_run():
+    """Test stdin-style streams produce the same configs as a directory run."""
+    import io
+    import json
+
+    from argocd_migrator.streaming import iter_documents
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        _write_corpus(root / "apps", 5)
+        run_pipeline(root / "apps", root / "expected.json")
+        stream = b"---\n".join(p.read_bytes() for p in sorted((root / "apps").iterdir()))
+
+        ndjson = io.BytesIO()
+        documents = iter_documents(io.BytesIO(stream), root / "config.json", ndjson)
+        labels = [str(r.source_file) for r in documents]
+
+        assert labels == [f"<stdin>#{i}" for i in range(1, 6)]
+        assert documents.result is not None and documents.result.successful == 5
+        expected = (root / "expected.json").read_bytes()
+        assert (root / "config.json").read_bytes() == expected
+        lines = ndjson.getvalue().decode("utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == json.loads(expected)
+
+
+def test_documents_stream_failures_follow_policy():
+    """Test invalid documents fail individually and fail-fast stops the stream."""
+    import io
+
+    from argocd_migrator.streaming import iter_documents
+
+    stream = (
+        APP_YAML.format(index=0) + "---\nkind: ConfigMap\n---\n" + APP_YAML.format(index=2)
+    ).encode()
+
+    collected = iter_documents(io.BytesIO(stream), ndjson=io.BytesIO())
+    assert [r.success for r in collected] == [True, False, True]
+
+    stopped = iter_documents(io.BytesIO(stream), policy=ExecutionPolicy.parse("fail-fast"))
+    assert [r.success for r in stopped] == [True, False]
+    assert stopped.result is not None and stopped.result.failed == 1
+
+
+def test_pipeline_stream_writes_ndjson():
+    """Test a directory stream can emit NDJSON lines instead of an aggregated file."""
+    import io
+    import json
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source = Path(tmpdir) / "apps"
+        _write_corpus(source, 3)
+        ndjson = io.BytesIO()
+
+        stream = iter_pipeline(source, None, ndjson=ndjson, keep_configs=False)
+        for _ in stream:
+            pass
+
+        names = [json.loads(line)["metadata"]["name"] for line in ndjson.getvalue().splitlines()]
+        assert names == ["app-0", "app-1", "app-2"]
+        with pytest.raises(ValueError):
+            iter_pipeline(source, None, ndjson=ndjson, serialize_in_workers=True)
+
+
+def test_cli_reads_stdin_and_writes_ndjson_to_stdout():
+    """Test migrate -i - -o - keeps stdout for NDJSON and reports on stderr."""
+    import json
+
+    from typer.testing import CliRunner
+
+    from argocd_migrator.cli import app
+
+    stream = APP_YAML.format(index=0) + "---\n" + APP_YAML.format(index=1)
+    result = CliRunner().invoke(app, ["migrate", "-i", "-", "-o", "-", "-q"], input=stream)
+
+    assert result.exit_code == 0, result.output
+    assert [json.loads(line)["metadata"]["name"] for line in result.stdout.splitlines()] == [
+        "app-0",
+        "app-1",
+    ]
+
+
+@pytest.mark.parametrize("suffix", [".tar.gz", ".zip"])
+def test_archive_stream_matches_directory_run(suffix, monkeypatch):
+    """Test archive members in sorted order give byte-identical output to the directory."""
+    import tarfile
+    import zipfile
+
+    import argocd_migrator.streaming as streaming
+    from argocd_migrator.executor import ThreadExecutor
+    from argocd_migrator.streaming import iter_archive
+
+    monkeypatch.setattr(streaming, "ARCHIVE_BATCH_SIZE", 4)  # Several batches
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source_dir = Path(tmpdir) / "apps"
+        _write_corpus(source_dir, 10)
+        expected = Path(tmpdir) / "expected.json"
+        run_pipeline(source_dir, expected)
+
+        archive = Path(tmpdir) / f"apps{suffix}"
+        files = sorted(source_dir.iterdir())
+        if suffix == ".zip":
+            with zipfile.ZipFile(archive, "w") as zf:
+                for path in files:
+                    zf.write(path, f"apps/{path.name}")
+        else:
+            with tarfile.open(archive, "w:gz") as tf:
+                for path in files:
+                    tf.add(path, f"apps/{path.name}")
+
+        output_file = Path(tmpdir) / "config.json"
+        with ThreadExecutor(jobs=3) as pool:
+            stream = iter_archive(archive, output_file, executor=pool)
+            labels = [r.source_file for r in stream]
+
+        assert labels == [Path(f"{archive}:apps/{path.name}") for path in files]
+        assert output_file.read_bytes() == expected.read_bytes()
+        assert stream.result is not None
+        assert stream.result.total == 10
+
+
+def test_archive_stream_reports_member_paths(monkeypatch):
+    """Test failed members, including oversized ones, are reported by member path."""
+    import io
+    import tarfile
+
+    import argocd_migrator.streaming as streaming
+    from argocd_migrator.parser import ParserLimits
+    from argocd_migrator.streaming import iter_archive
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        archive = Path(tmpdir) / "apps.tar"
+        members = {
+            "ok.yaml": APP_YAML.format(index=0).encode(),
+            "broken.yaml": b"kind: [unclosed",
+            "huge.yaml": APP_YAML.format(index=1).encode() + b"#" * 4096,
+        }
+        with tarfile.open(archive, "w") as tf:
+            for name, content in members.items():
+                info = tarfile.TarInfo(name)
+                info.size = len(content)
+                tf.addfile(info, io.BytesIO(content))
+
+        monkeypatch.setattr(streaming, "DEFAULT_LIMITS", ParserLimits(max_file_bytes=2048))
+        stream = iter_archive(
+            archive, Path(tmpdir) / "config.json", policy=ExecutionPolicy.parse("continue")
+        )
+        list(stream)
+
+        assert stream.result is not None
+        assert stream.result.successful == 1
+        failures = {r.source_file: r.error for r in stream.result.results}
+        assert set(failures) == {Path(f"{archive}:broken.yaml"), Path(f"{archive}:huge.yaml")}
+        assert f"{archive}:broken.yaml" in failures[Path(f"{archive}:broken.yaml")]
+        assert "over the 2048-byte limit" in failures[Path(f"{archive}:huge.yaml")]
+
+
+def test_cli_migrates_archive():
+    """Test migrate accepts an archive as --input-path and rejects other files."""
+    import zipfile
+
+    from typer.testing import CliRunner
+
+    from argocd_migrator.cli import app
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        archive = Path(tmpdir) / "apps.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("app.yaml", APP_YAML.format(index=0))
+        output_file = Path(tmpdir) / "config.json"
+
+        result = CliRunner().invoke(
+            app, ["migrate", "-i", str(archive), "-o", str(output_file), "-q", "-j", "1"]
+        )
+        assert result.exit_code == 0, result.output
+        assert output_file.exists()
+
+        other = Path(tmpdir) / "notes.txt"
+        other.write_text("hello")
+        result = CliRunner().invoke(app, ["migrate", "-i", str(other)])
+        assert result.exit_code == 2
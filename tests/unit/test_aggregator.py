@@ -6,7 +6,14 @@ from pathlib import Path
 
 import pytest
 
-from argocd_migrator.aggregator import aggregate_configs, validate_aggregated_structure
+from argocd_migrator.aggregator import (
+    aggregate_configs,
+    fragment_to_document,
+    serialize_config_fragment,
+    validate_aggregated_structure,
+    validate_config_structure,
+    write_config_fragments,
+)
 from argocd_migrator.exceptions import MigrationError
 
 VALID_CONFIG_1 = {
@@ -138,3 +145,42 @@ def test_validate_aggregated_structure_item_not_dict():
     """Test validation fails when config items are not dictionaries."""
     with pytest.raises(MigrationError, match="must be a dictionary"):
         validate_aggregated_structure(["not", "dictionaries"])
+
+
+def test_validate_config_structure_names_the_index_kind():
+    """Test error messages say which index a config was validated at."""
+    with pytest.raises(MigrationError, match="Config at scan index 4 metadata missing"):
+        validate_config_structure(
+            {"metadata": {}, "project": "p", "source": {}, "destination": {}}, 4, "scan index"
+        )
+
+
+def test_write_config_fragments_matches_aggregate_configs():
+    """Test fragment-based output is byte-identical to aggregate_configs."""
+    tricky_config = {
+        **VALID_CONFIG_2,
+        "metadata": {"name": "tricky", "annotations": {"note": "multi\nline ✓"}, "labels": {}},
+        "source": {"repoURL": "https://x", "helm": {"values": "a: 1\nb: 2\n", "list": []}},
+    }
+
+    for configs in ([], [VALID_CONFIG_1], [VALID_CONFIG_1, tricky_config, VALID_CONFIG_2]):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            expected = Path(tmpdir) / "expected.json"
+            actual = Path(tmpdir) / "actual.json"
+            aggregate_configs(configs, expected)
+
+            count = write_config_fragments(
+                (serialize_config_fragment(c) for c in configs), actual
+            )
+
+            assert count == len(configs)
+            assert actual.read_bytes() == expected.read_bytes()
+
+
+def test_fragment_to_document_round_trip():
+    """Test fragments convert back to standalone JSON documents."""
+    fragment = serialize_config_fragment(VALID_CONFIG_1)
+
+    document = fragment_to_document(fragment)
+
+    assert document == (json.dumps(VALID_CONFIG_1, indent=2) + "\n").encode("utf-8")
@@ -0,0 +1,112 @@
+"""Tests for the archive input module."""
+
+import io
+import tarfile
+import tempfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from argocd_migrator.archive import is_archive, iter_archive_members, member_label
+from argocd_migrator.exceptions import ScannerError
+
+
+def _add_tar_file(tf: tarfile.TarFile, name: str, content: bytes) -> None:
+    info = tarfile.TarInfo(name)
+    info.size = len(content)
+    tf.addfile(info, io.BytesIO(content))
+
+
+def test_is_archive():
+    """Test archives are recognised by suffix."""
+    assert is_archive("apps.tar")
+    assert is_archive("apps.TAR.GZ")
+    assert is_archive(Path("apps.tgz"))
+    assert is_archive("apps.zip")
+    assert not is_archive("apps.yaml")
+    assert not is_archive("apps.gz")
+
+
+def test_member_label():
+    """Test member labels name the archive and the member."""
+    assert member_label("ci/apps.tar.gz", "team-a/app.yaml") == Path(
+        "ci/apps.tar.gz:team-a/app.yaml"
+    )
+
+
+@pytest.mark.parametrize("name", ["apps.tar", "apps.tar.gz"])
+def test_iter_tar_members_in_archive_order(name):
+    """Test tar members are yielded in archive order, skipping non-YAML entries."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        archive = Path(tmpdir) / name
+        with tarfile.open(archive, "w:gz" if name.endswith(".gz") else "w") as tf:
+            _add_tar_file(tf, "b/app.yaml", b"kind: B\n")
+            _add_tar_file(tf, "README.md", b"# docs\n")
+            directory = tarfile.TarInfo("a")
+            directory.type = tarfile.DIRTYPE
+            tf.addfile(directory)
+            _add_tar_file(tf, "a/app.yml", b"kind: A\n")
+
+        members = list(iter_archive_members(archive))
+
+        assert [(m.name, m.content) for m in members] == [
+            ("b/app.yaml", b"kind: B\n"),
+            ("a/app.yml", b"kind: A\n"),
+        ]
+
+
+def test_iter_zip_members():
+    """Test zip members are read, skipping directories."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        archive = Path(tmpdir) / "apps.zip"
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("team/", b"")
+            zf.writestr("team/app.yaml", b"kind: Application\n")
+
+        members = list(iter_archive_members(archive))
+
+        assert [(m.name, m.size, m.content) for m in members] == [
+            ("team/app.yaml", 18, b"kind: Application\n")
+        ]
+
+
+def test_oversized_members_have_no_content():
+    """Test members over the size limit are yielded without being read."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        archive = Path(tmpdir) / "apps.tar"
+        with tarfile.open(archive, "w") as tf:
+            _add_tar_file(tf, "big.yaml", b"x" * 100)
+            _add_tar_file(tf, "small.yaml", b"x" * 10)
+
+        members = list(iter_archive_members(archive, max_bytes=50))
+
+        assert [(m.name, m.size, m.content) for m in members] == [
+            ("big.yaml", 100, None),
+            ("small.yaml", 10, b"x" * 10),
+        ]
+
+
+def test_corrupt_archive_names_member():
+    """Test a truncated archive raises ScannerError naming the member being read."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        archive = Path(tmpdir) / "apps.tar"
+        with tarfile.open(archive, "w") as tf:
+            _add_tar_file(tf, "first.yaml", b"kind: A\n")
+            _add_tar_file(tf, "second.yaml", b"y" * 4096)
+        archive.write_bytes(archive.read_bytes()[:2048])
+
+        with pytest.raises(ScannerError, match="at member second.yaml"):
+            list(iter_archive_members(archive))
+
+
+def test_missing_and_unsupported_archives():
+    """Test missing archives and unknown suffixes raise ScannerError."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with pytest.raises(ScannerError, match="does not exist"):
+            list(iter_archive_members(Path(tmpdir) / "missing.tar"))
+
+        other = Path(tmpdir) / "apps.rar"
+        other.write_bytes(b"Rar!")
+        with pytest.raises(ScannerError, match="Unsupported archive type"):
+            list(iter_archive_members(other))
@@ -0,0 +1,98 @@
+"""Unit tests for the benchmark suite's baseline comparison."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+_spec = importlib.util.spec_from_file_location(
+    "bench_suite", Path(__file__).parents[2] / "benchmarks" / "bench_suite.py"
+)
+assert _spec is not None and _spec.loader is not None
+bench_suite = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(bench_suite)
+
+TOLERANCES = {"default": 0.2}
+
+
+def _stage(seconds: float, peak_bytes: int | None = None) -> dict:
+    stats: dict = {"seconds": seconds}
+    if peak_bytes is not None:
+        stats["peak_bytes"] = peak_bytes
+    return stats
+
+
+@pytest.mark.parametrize(
+    ("current", "regressed"),
+    [
+        (1.19, False),  # Within the 20% tolerance
+        (1.21, True),  # Beyond it
+        (0.5, False),  # Faster is never a regression
+    ],
+)
+def test_compare_time_tolerance(current, regressed):
+    """Test a stage regresses only when slower than the baseline by more than its tolerance."""
+    regressions = bench_suite.compare(
+        {"1000": {"parse": _stage(current)}},
+        {"1000": {"parse": _stage(1.0)}},
+        TOLERANCES,
+        memory_tolerance=0.2,
+    )
+
+    assert bool(regressions) is regressed
+    if regressed:
+        assert regressions[0].startswith("parse @ 1000 apps: 1.210s vs 1.000s baseline")
+
+
+def test_compare_per_stage_tolerance_and_noise_floor():
+    """Test per-stage tolerances override the default and tiny slowdowns are ignored."""
+    results = {"1000": {"scan": _stage(1.4), "parse": _stage(0.010)}}
+    baseline = {"1000": {"scan": _stage(1.0), "parse": _stage(0.005)}}
+
+    regressions = bench_suite.compare(
+        results, baseline, {"default": 0.2, "scan": 0.5}, memory_tolerance=0.2
+    )
+
+    # scan is 40% slower but allowed 50%; parse doubled but by only 5 ms
+    assert regressions == []
+
+
+@pytest.mark.parametrize(("peak", "regressed"), [(1_190_000, False), (1_210_000, True)])
+def test_compare_memory_tolerance(peak, regressed):
+    """Test peak memory growth beyond the memory tolerance is reported."""
+    regressions = bench_suite.compare(
+        {"1000": {"parse": _stage(1.0, peak)}},
+        {"1000": {"parse": _stage(1.0, 1_000_000)}},
+        TOLERANCES,
+        memory_tolerance=0.2,
+    )
+
+    assert bool(regressions) is regressed
+    if regressed:
+        assert "peak memory 1.2 MB vs 1.0 MB baseline" in regressions[0]
+
+
+def test_compare_missing_and_extra_keys():
+    """Test sizes, stages and memory figures missing on either side are skipped."""
+    results = {
+        "1000": {"parse": _stage(5.0), "scan": _stage(1.0, 9_000_000)},
+        "10000": {"parse": _stage(5.0)},
+    }
+    baseline = {
+        "1000": {"scan": _stage(1.0), "validate": _stage(1.0, 1)},
+        "100000": {"parse": _stage(1.0)},
+    }
+
+    assert bench_suite.compare(results, baseline, TOLERANCES, memory_tolerance=0.2) == []
+
+
+def test_baseline_mismatch():
+    """Test a baseline from another platform or interpreter is reported as not comparable."""
+    stored = {"platform": "Linux-x86_64", "python": "3.12.1"}
+
+    assert bench_suite.baseline_mismatch(stored, dict(stored)) is None
+    message = bench_suite.baseline_mismatch(stored, {**stored, "python": "3.13.5"})
+    assert message is not None
+    assert "python 3.12.1 vs 3.13.5" in message
+    assert "platform" not in message
+    assert bench_suite.baseline_mismatch({}, stored) is not None
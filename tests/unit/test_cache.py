@@ -0,0 +1,67 @@
+"""Unit tests for cache module."""
+
+from argocd_migrator.cache import ContentCache, get_content_cache
+
+
+def test_get_and_put():
+    """Test that stored values are returned and hits/misses are counted."""
+    cache = ContentCache()
+    assert cache.get(b"a") is None
+
+    cache.put(b"a", b"value")
+
+    assert cache.get(b"a") == b"value"
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert len(cache) == 1
+    assert cache.size_bytes == 5
+
+
+def test_evicts_least_recently_used():
+    """Test that the oldest unused entry is evicted when the byte limit is exceeded."""
+    cache = ContentCache(max_bytes=10)
+    cache.put(b"a", b"aaaa")
+    cache.put(b"b", b"bbbb")
+    cache.get(b"a")
+
+    cache.put(b"c", b"cccc")
+
+    assert cache.get(b"b") is None
+    assert cache.get(b"a") == b"aaaa"
+    assert cache.get(b"c") == b"cccc"
+    assert cache.size_bytes == 8
+
+
+def test_replacing_entry_updates_size():
+    """Test that overwriting a key does not count its old value."""
+    cache = ContentCache()
+    cache.put(b"a", b"aaaa")
+    cache.put(b"a", b"aa")
+
+    assert cache.size_bytes == 2
+    assert len(cache) == 1
+
+
+def test_oversized_value_is_not_stored():
+    """Test that a value larger than the whole cache is skipped."""
+    cache = ContentCache(max_bytes=3)
+    cache.put(b"a", b"aaaa")
+
+    assert len(cache) == 0
+    assert cache.size_bytes == 0
+
+
+def test_clear():
+    """Test that clear removes entries and resets statistics."""
+    cache = ContentCache()
+    cache.put(b"a", b"aaaa")
+    cache.get(b"a")
+
+    cache.clear()
+
+    assert len(cache) == 0
+    assert (cache.size_bytes, cache.hits, cache.misses) == (0, 0, 0)
+
+
+def test_get_content_cache_is_shared():
+    """Test that the process-wide cache is created once."""
+    assert get_content_cache() is get_content_cache()
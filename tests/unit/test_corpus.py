@@ -0,0 +1,110 @@
+"""Unit tests for the synthetic corpus generator."""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+import yaml
+
+from argocd_migrator.corpus import CorpusSpec, generate_corpus, parse_mix, parse_range
+from argocd_migrator.exceptions import CorpusError
+from argocd_migrator.parser import parse_yaml_file
+
+
+def _snapshot(root: Path) -> dict[str, bytes]:
+    return {str(p.relative_to(root)): p.read_bytes() for p in sorted(root.rglob("*.yaml"))}
+
+
+def test_same_seed_is_byte_identical():
+    """Test generation is deterministic for a seed and differs across seeds."""
+    spec = CorpusSpec(apps=60, duplicate_rate=0.2, bundle_rate=0.1, noise_rate=0.1)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        generate_corpus(Path(tmpdir) / "a", spec)
+        generate_corpus(Path(tmpdir) / "b", spec)
+        generate_corpus(Path(tmpdir) / "c", CorpusSpec(apps=60, seed=1))
+
+        first = _snapshot(Path(tmpdir) / "a")
+        assert first == _snapshot(Path(tmpdir) / "b")
+        assert first != _snapshot(Path(tmpdir) / "c")
+
+
+def test_clean_corpus_parses_as_applications():
+    """Test every file of a corpus without bundles or noise is a valid Application."""
+    spec = CorpusSpec(apps=40, depth=3, fanout=2, source_mix={"helm": 1, "kustomize": 1})
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir) / "corpus"
+        stats = generate_corpus(root, spec)
+
+        files = sorted(root.rglob("*.yaml"))
+        assert stats.files == stats.applications == len(files) == 40
+        assert stats.expected_failures == 0
+        assert stats.sources["directory"] == 0
+        assert all(len(p.relative_to(root).parts) == 4 for p in files)
+        for path in files:
+            app = parse_yaml_file(path)
+            assert "helm" in app["spec"]["source"] or "kustomize" in app["spec"]["source"]
+
+
+def test_bundles_noise_and_duplicates():
+    """Test bundles hold several documents, noise is not an Application and copies match."""
+    spec = CorpusSpec(
+        apps=100, bundle_rate=0.3, bundle_size=3, noise_rate=0.05, duplicate_rate=0.2
+    )
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir) / "corpus"
+        stats = generate_corpus(root, spec)
+
+        bundles = list(root.rglob("bundle-*.yaml"))
+        noise = list(root.rglob("noise-*.yaml"))
+        assert len(bundles) == stats.bundles > 0
+        assert len(noise) == stats.noise_files == 5
+        assert stats.duplicates > 0
+        assert stats.files == len(list(root.rglob("*.yaml")))
+        for bundle in bundles:
+            documents = list(yaml.safe_load_all(bundle.read_text()))
+            assert 1 <= len(documents) <= 3
+            assert all(doc["kind"] == "Application" for doc in documents)
+        assert all(yaml.safe_load(p.read_text())["kind"] != "Application" for p in noise)
+
+        contents = [p.read_bytes() for p in root.rglob("app-*.yaml")]
+        assert len(set(contents)) <= len(contents) - stats.duplicates
+
+
+def test_large_values_rate():
+    """Test large Helm apps get the configured number of values keys."""
+    spec = CorpusSpec(
+        apps=5, source_mix={"helm": 1}, large_values_rate=1.0, large_values_keys=300
+    )
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir) / "corpus"
+        generate_corpus(root, spec)
+
+        for path in root.rglob("*.yaml"):
+            values = parse_yaml_file(path)["spec"]["source"]["helm"]["valuesObject"]
+            assert len(values) == 300
+
+
+def test_rejects_non_empty_directory_and_bad_spec():
+    """Test existing content and invalid settings are refused."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        (Path(tmpdir) / "keep.txt").write_text("x")
+        with pytest.raises(CorpusError, match="not empty"):
+            generate_corpus(tmpdir, CorpusSpec(apps=1))
+
+        with pytest.raises(CorpusError, match="Unknown source kinds"):
+            generate_corpus(Path(tmpdir) / "new", CorpusSpec(source_mix={"jsonnet": 1}))
+        with pytest.raises(CorpusError, match="between 0 and 1"):
+            generate_corpus(Path(tmpdir) / "new", CorpusSpec(duplicate_rate=2))
+
+
+def test_parse_range_and_mix():
+    """Test range and source mix parsing."""
+    assert parse_range("3") == (3, 3)
+    assert parse_range("2-10") == (2, 10)
+    assert parse_mix("helm=2, directory=1") == {"helm": 2.0, "directory": 1.0}
+    with pytest.raises(CorpusError):
+        parse_range("5-2")
+    with pytest.raises(CorpusError):
+        parse_range("a-b")
+    with pytest.raises(CorpusError):
+        parse_mix("helm")
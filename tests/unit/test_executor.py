@@ -0,0 +1,198 @@
+"""Unit tests for executor backends."""
+
+import time
+
+import pytest
+
+from argocd_migrator.executor import (
+    MIN_CHUNK_BYTES,
+    ExecutorBackend,
+    ProcessExecutor,
+    SerialExecutor,
+    ThreadExecutor,
+    create_executor,
+    plan_chunks,
+)
+
+
+def _square(value: int) -> int:
+    return value * value
+
+
+def test_create_executor_backends():
+    """Test create_executor returns the requested backend."""
+    assert isinstance(create_executor("serial", 4), SerialExecutor)
+    assert isinstance(create_executor("thread", 4), ThreadExecutor)
+    assert isinstance(create_executor(ExecutorBackend.PROCESS, 4), ProcessExecutor)
+
+
+def test_create_executor_single_job_is_serial():
+    """Test a single job always runs serially."""
+    assert isinstance(create_executor("process", 1), SerialExecutor)
+
+
+def test_create_executor_unknown_backend():
+    """Test unknown backends are rejected."""
+    with pytest.raises(ValueError):
+        create_executor("gpu", 2)
+
+
+@pytest.mark.parametrize("backend", ["serial", "thread", "process"])
+def test_map_preserves_input_order(backend):
+    """Test every backend yields results in input order."""
+    items = list(range(50))
+
+    with create_executor(backend, 3) as executor:
+        results = list(executor.map(_square, items, chunksize=4))
+
+    assert results == [i * i for i in items]
+
+
+def test_plan_chunks_largest_first_and_byte_balanced():
+    """Test chunks start with the largest items and shrink toward the tail."""
+    mb = 1024 * 1024
+    sizes = [1000] * 400 + [20 * mb, 5 * mb]
+
+    chunks = plan_chunks(sizes, jobs=4)
+
+    assert chunks[0] == [400]
+    assert chunks[1] == [401]
+    assert sorted(i for chunk in chunks for i in chunk) == list(range(len(sizes)))
+    # Ties keep input order, and small files are batched up to the byte floor
+    small = [chunk for chunk in chunks if chunk[0] < 400]
+    assert small[0][:3] == [0, 1, 2]
+    assert all(len(chunk) <= MIN_CHUNK_BYTES // 1000 + 1 for chunk in small)
+    assert len(small) > 1
+
+
+def test_plan_chunks_empty():
+    """Test no items give no chunks."""
+    assert plan_chunks([], jobs=4) == []
+
+
+@pytest.mark.parametrize("backend", ["serial", "thread", "process"])
+def test_map_by_size_preserves_input_order(backend):
+    """Test size-aware scheduling still yields results in input order."""
+    items = list(range(200))
+    sizes = [(i * 7919) % 100_000 for i in items]
+
+    with create_executor(backend, 3) as executor:
+        results = list(executor.map(_square, items, sizes=sizes))
+
+    assert results == [i * i for i in items]
+
+
+def _record_start(item: tuple[int, list[int]]) -> int:
+    index, started = item
+    started.append(index)
+    time.sleep(0.001)
+    return index
+
+
+def test_map_by_size_starts_largest_items_first():
+    """Test the largest items are handed out before the small ones."""
+    started: list[int] = []
+    items = [(i, started) for i in range(100)]
+    sizes = [1] * 100
+    sizes[97] = sizes[42] = 10 * MIN_CHUNK_BYTES
+
+    with create_executor("thread", 2) as executor:
+        results = list(executor.map(_record_start, items, sizes=sizes))
+
+    assert results == list(range(100))
+    assert set(started[:2]) == {42, 97}
+
+
+@pytest.mark.parametrize("backend", ["serial", "thread", "process"])
+def test_map_completed_yields_every_index_once(backend):
+    """Test map_completed pairs each result with its item's index."""
+    items = list(range(200))
+    sizes = [(i * 7919) % 100_000 for i in items]
+
+    with create_executor(backend, 3) as executor:
+        pairs = list(executor.map_completed(_square, items, sizes=sizes))
+
+    assert sorted(pairs) == [(i, i * i) for i in items]
+
+
+def test_map_completed_yields_large_late_item_first():
+    """Test a large item at the end is reported as soon as its chunk completes."""
+    started: list[int] = []
+    items = [(i, started) for i in range(100)]
+    sizes = [1] * 100
+    sizes[99] = 10 * MIN_CHUNK_BYTES
+
+    with create_executor("thread", 2) as executor:
+        completed = executor.map_completed(_record_start, items, sizes=sizes)
+        assert next(completed) == (99, 99)
+        completed.close()
+
+
+def test_map_by_size_rejects_mismatched_sizes():
+    """Test sizes must line up with items."""
+    with create_executor("thread", 2) as executor:
+        with pytest.raises(ValueError):
+            list(executor.map(_square, [1, 2, 3], sizes=[1]))
+
+
+def test_map_stops_early_without_error():
+    """Test closing the result iterator early cancels remaining chunks."""
+    with create_executor("thread", 2) as executor:
+        results = executor.map(_square, list(range(100)), chunksize=1)
+        assert next(results) == 0
+        results.close()
+
+
+def _sleep_or_timeout(seconds: float) -> str:
+    from argocd_migrator.exceptions import FileTimeoutError
+
+    try:
+        time.sleep(seconds)
+    except FileTimeoutError:
+        return "timeout"
+    return "done"
+
+
+@pytest.mark.parametrize("backend", ["serial", "process"])
+def test_map_enforces_timeout(backend):
+    """Test that calls running past the timeout are interrupted."""
+    start = time.perf_counter()
+    with create_executor(backend, 2, timeout=0.2) as executor:
+        results = list(executor.map(_sleep_or_timeout, [0.0, 30.0, 0.0], chunksize=1))
+
+    assert results == ["done", "timeout", "done"]
+    assert time.perf_counter() - start < 10
+
+
+def test_submit_timeout_raises():
+    """Test that an unhandled timeout surfaces as FileTimeoutError."""
+    from argocd_migrator.exceptions import FileTimeoutError
+
+    future = SerialExecutor(timeout=0.1).submit(time.sleep, 30)
+
+    assert isinstance(future.exception(), FileTimeoutError)
+
+
+def _raise_timeout(value: int) -> int:
+    from argocd_migrator.exceptions import FileTimeoutError
+
+    if value == 2:
+        raise FileTimeoutError("late alarm")
+    return value
+
+
+def _timed_out(value: int, error: Exception) -> int:
+    return -value
+
+
+@pytest.mark.parametrize("backend", ["serial", "thread", "process"])
+@pytest.mark.parametrize("by_size", [False, True])
+def test_map_turns_escaped_timeout_into_item_result(backend, by_size):
+    """Test that a timeout escaping fn fails only its item when on_timeout is given."""
+    sizes = [1, 1, 1, 1] if by_size else None
+    with create_executor(backend, 2) as executor:
+        results = list(
+            executor.map(_raise_timeout, [0, 1, 2, 3], sizes=sizes, on_timeout=_timed_out)
+        )
+
+    assert results == [0, 1, -2, 3]
@@ -0,0 +1,97 @@
+"""Unit tests for the checkpoint journal."""
+
+import hashlib
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from argocd_migrator.exceptions import JournalError
+from argocd_migrator.journal import (
+    JournalEntry,
+    JournalWriter,
+    content_digest,
+    default_journal,
+    load_journal,
+)
+
+
+def test_round_trip_latest_entry_wins():
+    """Test entries read back as written, later records replacing earlier ones."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "run.journal.ndjson"
+        with JournalWriter(path) as writer:
+            writer.record(JournalEntry("a.yaml", "1", config={"metadata": {"name": "ä"}}))
+            writer.record(JournalEntry("b.yaml", "2", error="not an Application"))
+        with JournalWriter(path, append=True) as writer:
+            writer.record(JournalEntry("a.yaml", "3", config={"metadata": {"name": "a2"}}))
+
+        entries = load_journal(path)
+
+        assert entries == {
+            "a.yaml": JournalEntry("a.yaml", "3", config={"metadata": {"name": "a2"}}),
+            "b.yaml": JournalEntry("b.yaml", "2", error="not an Application"),
+        }
+
+
+def test_records_are_flushed_in_batches():
+    """Test records reach the file once a batch is full, not one by one."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "run.journal.ndjson"
+        writer = JournalWriter(path, batch_size=3)
+        for i in range(4):
+            writer.record(JournalEntry(f"{i}.yaml", str(i), config={}))
+
+        # Header plus the first two records made the first batch of three lines
+        assert list(load_journal(path)) == ["0.yaml", "1.yaml"]
+        writer.close()
+        assert len(load_journal(path)) == 4
+
+
+def test_torn_record_is_ignored_and_terminated():
+    """Test a record cut off by a killed run is skipped and does not corrupt appends."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "run.journal.ndjson"
+        with JournalWriter(path) as writer:
+            writer.record(JournalEntry("a.yaml", "1", config={}))
+            writer.record(JournalEntry("b.yaml", "2", config={"key": "value"}))
+        path.write_bytes(path.read_bytes()[:-10])
+
+        assert list(load_journal(path)) == ["a.yaml"]
+
+        with JournalWriter(path, append=True) as writer:
+            writer.record(JournalEntry("c.yaml", "3", config={}))
+        assert list(load_journal(path)) == ["a.yaml", "c.yaml"]
+
+
+def test_new_journal_replaces_old_one():
+    """Test a writer that does not append starts an empty journal."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "run.journal.ndjson"
+        with JournalWriter(path) as writer:
+            writer.record(JournalEntry("a.yaml", "1", config={}))
+        JournalWriter(path).close()
+
+        assert load_journal(path) == {}
+
+
+def test_missing_and_foreign_files():
+    """Test a missing journal is empty and other files raise JournalError."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        assert load_journal(Path(tmpdir) / "missing.ndjson") == {}
+
+        other = Path(tmpdir) / "config.json"
+        other.write_text("[]\n")
+        with pytest.raises(JournalError, match="not a checkpoint journal"):
+            load_journal(other)
+
+
+def test_content_digest_and_default_path():
+    """Test content digests match sha256 and the default journal path."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "app.yaml"
+        path.write_bytes(b"kind: Application\n")
+
+        assert content_digest(path) == hashlib.sha256(b"kind: Application\n").hexdigest()
+        assert content_digest(Path(tmpdir) / "missing.yaml") is None
+    assert default_journal(Path("out/config.json")) == Path("out/config.journal.ndjson")
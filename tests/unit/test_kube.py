@@ -0,0 +1,92 @@
+"""Tests for the Kubernetes API input source."""
+
+import pytest
+
+from argocd_migrator.exceptions import KubeApiError
+from argocd_migrator.kube import ApplicationLister, KubeSource, list_applications
+from tests.fixtures.kube_api import KubeApiStandIn, application, record_pages
+
+
+def _namespace(name: str, apps: int, page_size: int) -> list[dict]:
+    return record_pages([application(name, f"{name}-{i}") for i in range(apps)], page_size, name)
+
+
+def test_pages_follow_continue_tokens_over_one_connection():
+    """Test a listing pages through continue tokens and reuses a keep-alive socket."""
+    with KubeApiStandIn({"team-a": _namespace("team-a", 7, 3)}) as server:
+        lister = ApplicationLister(
+            KubeSource(server.url, namespaces=["team-a"], page_size=3, concurrency=1)
+        )
+        names = [label for label, _ in lister.applications()]
+
+        assert names == [f"k8s:team-a/team-a-{i}" for i in range(7)]
+        assert len(server.requests) == 3
+        assert "continue=team-a%3A1" in server.requests[1]
+        assert server.limits == {"3"}
+        assert server.connections == 1
+        assert lister.pool.connections_opened == 1
+
+
+def test_namespaces_are_listed_concurrently_in_a_stable_order():
+    """Test namespaces are fetched in parallel but yielded in the given order."""
+    responses = {name: _namespace(name, 4, 2) for name in ("a", "b", "c", "d")}
+    with KubeApiStandIn(responses, delay=0.05) as server:
+        source = KubeSource(server.url, namespaces=["d", "b", "a", "c"], page_size=2)
+        labels = [label for label, _ in list_applications(source)]
+
+        assert labels == [f"k8s:{ns}/{ns}-{i}" for ns in "dbac" for i in range(4)]
+        assert server.max_active > 1
+        assert server.connections <= source.concurrency
+
+
+def test_cluster_wide_listing_and_bearer_token():
+    """Test no namespaces means one cluster-wide listing, authenticated by token."""
+    apps = [application("argocd", "one"), application("other", "two")]
+    for app in apps:
+        del app["apiVersion"], app["kind"]  # List items may omit them
+    with KubeApiStandIn({"": record_pages(apps, 10, "")}, token="s3cret") as server:
+        listed = list(list_applications(KubeSource(server.url, token="s3cret")))
+
+        assert [label for label, _ in listed] == ["k8s:argocd/one", "k8s:other/two"]
+        assert listed[0][1]["kind"] == "Application"
+        assert server.requests[0].startswith("/apis/argoproj.io/v1alpha1/applications?")
+
+
+def test_http_errors_carry_the_status_message():
+    """Test non-200 responses raise KubeApiError with the server's message."""
+    with KubeApiStandIn({"": record_pages([], 10, "")}, token="s3cret") as server:
+        with pytest.raises(KubeApiError, match="HTTP 401: Unauthorized"):
+            list(list_applications(KubeSource(server.url, token="wrong")))
+
+        with pytest.raises(KubeApiError, match="HTTP 404"):
+            source = KubeSource(server.url, token="s3cret", namespaces=["missing"])
+            list(list_applications(source))
+
+
+def test_stale_pooled_connection_is_retried():
+    """Test a keep-alive connection closed by the server is replaced transparently."""
+    with KubeApiStandIn({"a": _namespace("a", 6, 2)}) as server:
+        server.close_after = 1
+        source = KubeSource(server.url, namespaces=["a"], page_size=2, concurrency=1)
+        labels = [label for label, _ in list_applications(source)]
+
+        assert len(labels) == 6
+        assert server.connections == 2
+
+
+def test_closing_the_generator_stops_fetchers():
+    """Test abandoning the listing early returns without fetching every page."""
+    with KubeApiStandIn({"a": _namespace("a", 40, 2)}) as server:
+        applications = list_applications(KubeSource(server.url, namespaces=["a"], page_size=2))
+        next(applications)
+        applications.close()
+
+        assert len(server.requests) < 20
+
+
+def test_invalid_sources():
+    """Test invalid URLs and settings are rejected."""
+    with pytest.raises(KubeApiError, match="Invalid API server URL"):
+        ApplicationLister(KubeSource("localhost:6443"))
+    with pytest.raises(KubeApiError, match="page_size"):
+        ApplicationLister(KubeSource("https://localhost:6443", page_size=0))
@@ -0,0 +1,66 @@
+"""Unit tests for per-stage memory profiling."""
+
+import json
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+from argocd_migrator.memory import NULL_MEMORY_PROFILER, MemoryProfiler, iter_memory_report
+
+
+def _allocate(blocks: int) -> list[bytes]:
+    return [bytes(1024) for _ in range(blocks)]
+
+
+def test_stage_records_retained_and_peak():
+    """Test a stage reports retained memory, peak memory and the allocating line."""
+    with MemoryProfiler() as profiler:
+        with profiler.stage("retain"):
+            kept = _allocate(1000)
+        with profiler.stage("transient"):
+            del _allocate(2000)[:]
+
+    retain, transient = profiler.stages
+    assert retain.retained_bytes >= 1000 * 1024
+    assert retain.top_sites[0].site.endswith("test_memory.py:12")
+    assert retain.top_sites[0].count_diff >= 1000
+    assert transient.peak_increase_bytes >= 2000 * 1024
+    assert transient.retained_bytes < 100 * 1024
+    assert profiler.peak_bytes >= transient.peak_bytes
+    assert not tracemalloc.is_tracing()
+    assert len(kept) == 1000
+
+
+def test_stage_without_tracing_is_ignored():
+    """Test stages outside an active profiler record nothing."""
+    profiler = MemoryProfiler()
+    with profiler.stage("scan"):
+        pass
+    with NULL_MEMORY_PROFILER.stage("scan"):
+        pass
+
+    assert profiler.stages == []
+    assert NULL_MEMORY_PROFILER.stages == []
+
+
+def test_report_and_json():
+    """Test the text summary and JSON report cover every stage."""
+    with MemoryProfiler(top=2) as profiler:
+        with profiler.stage("parse"):
+            data = _allocate(100)
+
+    lines = list(iter_memory_report(profiler))
+    assert lines[1].startswith("parse")
+    assert lines[-1].startswith("peak traced memory")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        report = Path(tmpdir) / "memory.json"
+        profiler.write_json(report)
+
+        content = json.loads(report.read_text())
+        (stage,) = content["stages"]
+        assert stage["name"] == "parse"
+        assert stage["retained_bytes"] >= 100 * 1024
+        assert len(stage["top_sites"]) <= 2
+        assert content["tracemalloc_overhead_bytes"] > 0
+    assert len(data) == 100
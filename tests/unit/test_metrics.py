@@ -0,0 +1,113 @@
+"""Unit tests for pipeline metrics."""
+
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from argocd_migrator.metrics import LatencyHistogram, PipelineMetrics, timed, worker_peak_rss
+
+
+def test_histogram_percentiles_are_close():
+    """Test histogram percentiles are within the bucket resolution."""
+    histogram = LatencyHistogram()
+    for ms in range(1, 1001):
+        histogram.record(ms / 1000)
+
+    assert histogram.count == 1000
+    assert histogram.max == 1.0
+    assert histogram.percentile(0.5) == pytest.approx(0.5, rel=0.1)
+    assert histogram.percentile(0.95) == pytest.approx(0.95, rel=0.1)
+    assert histogram.percentile(0.99) == pytest.approx(0.99, rel=0.1)
+    assert histogram.percentile(1.0) == 1.0
+
+
+def test_histogram_empty():
+    """Test an empty histogram reports zero."""
+    assert LatencyHistogram().percentile(0.99) == 0.0
+
+
+def test_timed_records_on_failure():
+    """Test timed records the stage even when the call raises."""
+    timings: dict[str, tuple[float, float]] = {}
+
+    def fail() -> None:
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        timed(timings, "parse", fail)
+
+    assert "parse" in timings
+
+
+def test_record_file_aggregates_stages_and_slowest():
+    """Test per-file timings accumulate into stages, latency and slowest files."""
+    metrics = PipelineMetrics()
+    for i in range(15):
+        metrics.record_file(f"app-{i}.yaml", {"read": (0.001, 0.0), "parse": (i, i)}, 100)
+
+    assert metrics.stages["parse"].calls == 15
+    assert metrics.stages["parse"].wall_seconds == sum(range(15))
+    assert metrics.bytes_read == 1500
+    assert metrics.file_latency.count == 15
+    slowest = metrics.to_dict()["slowest_files"]
+    assert len(slowest) == 10
+    assert slowest[0]["source"] == "app-14.yaml"
+
+
+def test_throughput_uses_wall_time():
+    """Test throughput figures are derived from wall-clock time."""
+    metrics = PipelineMetrics(files=100, bytes_read=2_000_000, wall_seconds=2.0)
+
+    assert metrics.files_per_second == 50
+    assert metrics.megabytes_per_second == 1.0
+    assert PipelineMetrics().files_per_second == 0.0
+
+
+def test_prometheus_output():
+    """Test Prometheus text output contains stage and summary metrics."""
+    metrics = PipelineMetrics(successful=3, failed=1)
+    metrics.record_file("a.yaml", {"parse": (0.5, 0.25)})
+
+    text = metrics.to_prometheus()
+
+    assert '# TYPE argocd_migrator_stage_wall_seconds gauge' in text
+    assert 'argocd_migrator_stage_wall_seconds{stage="parse"} 0.5' in text
+    assert 'argocd_migrator_files{status="failed"} 1' in text
+    assert 'argocd_migrator_file_latency_seconds{quantile="0.99"}' in text
+    assert "argocd_migrator_file_latency_seconds_count 1" in text
+    assert text.endswith("\n")
+
+
+def test_write_json_and_prometheus():
+    """Test metrics files are written and leave no temporary files behind."""
+    metrics = PipelineMetrics()
+    metrics.start()
+    metrics.finish()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        json_file = Path(tmpdir) / "out" / "metrics.json"
+        prom_file = Path(tmpdir) / "out" / "migrator.prom"
+
+        metrics.write_json(json_file)
+        metrics.write_prometheus(prom_file)
+
+        data = json.loads(json_file.read_text())
+        assert set(data["stages"]) >= {"scan", "read", "parse", "write"}
+        assert data["peak_rss_bytes"] > 0
+        assert prom_file.read_text().startswith("# HELP")
+        assert sorted(p.name for p in json_file.parent.iterdir()) == [
+            "metrics.json", "migrator.prom"
+        ]
+
+
+def test_worker_rss_is_the_maximum_reported():
+    """Test the worker peak RSS is the largest value reported with any file."""
+    metrics = PipelineMetrics()
+    metrics.record_file("a.yaml", {}, worker_rss_bytes=30)
+    metrics.record_file("b.yaml", {}, worker_rss_bytes=50)
+    metrics.record_file("c.yaml", {})
+
+    assert metrics.peak_worker_rss_bytes == 50
+    assert worker_peak_rss() == 0  # Not a pool worker
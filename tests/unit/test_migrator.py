@@ -4,7 +4,7 @@ import json
 import tempfile
 from pathlib import Path
 
-from argocd_migrator.migrator import convert_yaml_to_json, migrate_to_json
+from argocd_migrator.migrator import convert_yaml_to_json, migrate_many_to_json, migrate_to_json
 
 
 def test_convert_yaml_to_json():
@@ -81,3 +81,38 @@ def test_migrate_preserves_nested_structures():
             loaded = json.load(f)
 
         assert loaded == data
+
+
+def test_migrate_many_to_json_writes_all_files():
+    """Test bulk migration writes every file and reports results in order."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        items = [
+            ({"name": f"app-{i}"}, tmp_path / f"team-{i % 3}" / f"app-{i}.json")
+            for i in range(20)
+        ]
+
+        results = migrate_many_to_json(iter(items), max_workers=4, fsync=True)
+
+        assert [r.output_file for r in results] == [path for _, path in items]
+        assert all(r.success for r in results)
+        for data, path in items:
+            with open(path) as f:
+                assert json.load(f) == data
+
+
+def test_migrate_many_to_json_reports_failures():
+    """Test bulk migration reports per-file failures without aborting."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        blocker = tmp_path / "blocker"
+        blocker.write_text("not a directory")
+
+        results = migrate_many_to_json([
+            ({"a": 1}, tmp_path / "ok.json"),
+            ({"b": 2}, blocker / "nested.json"),
+            ({"c": 3}, tmp_path / "also-ok.json"),
+        ])
+
+        assert [r.success for r in results] == [True, False, True]
+        assert results[1].error is not None
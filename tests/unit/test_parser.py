@@ -104,3 +104,106 @@ def test_parse_nonexistent_file():
     """Test that parser raises error for non-existent files."""
     with pytest.raises(ParserError, match="does not exist"):
         parse_yaml_file("/nonexistent/file.yaml")
+
+
+ALIAS_BOMB = "a: &a [x, x, x, x, x, x, x, x, x, x]\n" + "".join(
+    f"{name}: &{name} [{', '.join([f'*{previous}'] * 10)}]\n"
+    for previous, name in zip("abcdefgh", "bcdefghi", strict=True)
+)
+
+
+@pytest.mark.parametrize(
+    ("content", "message"),
+    [
+        (ALIAS_BOMB, "aliases expand to more than"),
+        ("a: &a [*a]\n", "recursive alias"),
+        ("a: " + "[" * 200 + "]" * 200 + "\n", "nesting deeper than"),
+    ],
+)
+def test_parse_rejects_pathological_yaml(content, message):
+    """Test that alias bombs, recursive aliases and deep nesting fail fast."""
+    from argocd_migrator.parser import parse_yaml_content
+
+    with pytest.raises(ParserError, match=message):
+        parse_yaml_content(content, "bomb.yaml")
+
+
+def test_parse_alias_limit():
+    """Test that the number of aliases is bounded."""
+    from argocd_migrator.parser import ParserLimits, parse_yaml_content
+
+    content = VALID_APP + "  annotations: {a: &x 1, b: *x, c: *x}\n"
+
+    with pytest.raises(ParserError, match="more than 1 aliases"):
+        parse_yaml_content(content, "app.yaml", ParserLimits(max_aliases=1))
+
+
+def test_parse_rejects_oversized_file():
+    """Test that files over the size limit are rejected before parsing."""
+    from argocd_migrator.parser import ParserLimits
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "app.yaml"
+        path.write_text(VALID_APP)
+
+        with pytest.raises(ParserError, match="byte limit"):
+            parse_yaml_file(path, ParserLimits(max_file_bytes=16))
+
+
+def test_iter_yaml_documents_expands_lists():
+    """Test multi-document streams are split and kubectl List items are expanded."""
+    import io
+
+    from argocd_migrator.parser import iter_yaml_documents
+
+    stream = io.BytesIO(
+        b"apiVersion: v1\n"
+        b"items:\n"
+        b"- {kind: Application, metadata: {name: a}}\n"
+        b"- &b {kind: Application, metadata: {name: b}}\n"
+        b"kind: List\n"
+        b"---\n"
+        b"kind: Application\n"
+        b"metadata: &m {name: c}\n"
+        b"copy: *m\n"
+        b"---\n"
+    )
+
+    documents = list(iter_yaml_documents(stream, "apps.yaml"))
+
+    assert documents == [
+        ("apps.yaml#1.items[0]", {"kind": "Application", "metadata": {"name": "a"}}),
+        ("apps.yaml#1.items[1]", {"kind": "Application", "metadata": {"name": "b"}}),
+        (
+            "apps.yaml#2",
+            {"kind": "Application", "metadata": {"name": "c"}, "copy": {"name": "c"}},
+        ),
+    ]
+
+
+def test_iter_yaml_documents_is_incremental():
+    """Test documents are yielded before a later syntax error is read."""
+    import io
+
+    from argocd_migrator.parser import iter_yaml_documents
+
+    documents = iter_yaml_documents(io.BytesIO(b"a: 1\n---\nb: [unclosed\n"))
+
+    assert next(documents) == ("<stdin>#1", {"a": 1})
+    with pytest.raises(ParserError, match="YAML syntax error in <stdin>"):
+        next(documents)
+
+
+def test_iter_yaml_documents_applies_limits_per_document():
+    """Test alias limits are counted per document, not per stream."""
+    import io
+
+    from argocd_migrator.parser import ParserLimits, iter_yaml_documents
+
+    document = b"a: &x 1\nb: *x\n"
+    limits = ParserLimits(max_aliases=1)
+
+    stream = io.BytesIO(document + b"---\n" + document)
+    assert len(list(iter_yaml_documents(stream, "s", limits))) == 2
+    with pytest.raises(ParserError, match="s#1 exceeds parser limits"):
+        list(iter_yaml_documents(io.BytesIO(b"a: &x 1\nb: *x\nc: *x\n"), "s", limits))
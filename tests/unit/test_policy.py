@@ -0,0 +1,43 @@
+"""Unit tests for execution policies."""
+
+import pytest
+
+from argocd_migrator.policy import ErrorMode, ExecutionPolicy
+
+
+def test_parse_simple_policies():
+    """Test parsing policies without arguments."""
+    assert ExecutionPolicy.parse("collect") == ExecutionPolicy()
+    assert ExecutionPolicy.parse("fail-fast").mode is ErrorMode.FAIL_FAST
+    assert ExecutionPolicy.parse("continue").mode is ErrorMode.CONTINUE
+
+
+def test_parse_max_errors():
+    """Test parsing max-errors=N."""
+    policy = ExecutionPolicy.parse("max-errors=3")
+
+    assert policy.mode is ErrorMode.MAX_ERRORS
+    assert policy.max_errors == 3
+    assert str(policy) == "max-errors=3"
+
+
+@pytest.mark.parametrize("value", ["explode", "max-errors", "max-errors=0", "fail-fast=2"])
+def test_parse_invalid_policies(value):
+    """Test invalid policies are rejected."""
+    with pytest.raises(ValueError):
+        ExecutionPolicy.parse(value)
+
+
+def test_should_stop():
+    """Test each policy's stopping rule."""
+    assert not ExecutionPolicy.parse("collect").should_stop(100)
+    assert not ExecutionPolicy.parse("continue").should_stop(100)
+    assert ExecutionPolicy.parse("fail-fast").should_stop(1)
+    assert not ExecutionPolicy.parse("max-errors=3").should_stop(2)
+    assert ExecutionPolicy.parse("max-errors=3").should_stop(3)
+
+
+def test_writes_partial_output():
+    """Test only the continue policy writes partial output."""
+    assert ExecutionPolicy.parse("continue").writes_partial_output
+    assert not ExecutionPolicy.parse("fail-fast").writes_partial_output
@@ -0,0 +1,104 @@
+"""Unit tests for profiling support."""
+
+import pstats
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from argocd_migrator.executor import create_executor
+from argocd_migrator.profiling import (
+    PipelineProfiler,
+    function_label,
+    iter_collapsed_stacks,
+    iter_top_functions,
+)
+
+
+def _busy(n: int) -> int:
+    return sum(i * i for i in range(n))
+
+
+def _names(stats: pstats.Stats) -> set[str]:
+    return {key[2] for key in stats.stats}  # type: ignore[attr-defined]
+
+
+def test_profiles_calling_thread():
+    """Test work in the calling thread is profiled."""
+    profiler = PipelineProfiler()
+    try:
+        with profiler:
+            _busy(1000)
+
+        assert "_busy" in _names(profiler.stats())
+        assert profiler.worker_profiles == []
+    finally:
+        profiler.cleanup()
+
+
+@pytest.mark.parametrize("backend", ["thread", "process"])
+def test_merges_worker_profiles(backend):
+    """Test profiles dumped by pool workers are merged into the result."""
+    expected = [_busy(2000)] * 8
+    profiler = PipelineProfiler()
+    try:
+        with create_executor(backend, 2) as executor, profiler:
+            profiler.attach(executor)
+            results = list(executor.map(_busy, [2000] * 8))
+
+        assert results == expected
+
+        assert profiler.worker_profiles
+        stats = profiler.stats()
+        assert "_busy" in _names(stats)
+        busy = next(v for k, v in stats.stats.items() if k[2] == "_busy")  # type: ignore[attr-defined]
+        assert busy[1] == 8  # Primitive calls across all workers
+    finally:
+        profiler.cleanup()
+
+
+def test_top_functions_and_collapsed_stacks():
+    """Test the hot-function table and collapsed stacks cover profiled code."""
+    profiler = PipelineProfiler()
+    try:
+        with profiler:
+            _busy(20000)
+        stats = profiler.stats()
+
+        top = list(iter_top_functions(stats, 5))
+        assert top[0].split() == ["calls", "self", "s", "cum", "s", "function"]
+        assert len(top) <= 6
+
+        stacks = list(iter_collapsed_stacks(stats))
+        assert stacks
+        for line in stacks:
+            frames, _, count = line.rpartition(" ")
+            assert frames and int(count) > 0
+        assert any("_busy (test_profiling.py:" in line for line in stacks)
+    finally:
+        profiler.cleanup()
+
+
+def test_write_profile_files():
+    """Test pstats and collapsed-stack files are written and readable."""
+    profiler = PipelineProfiler()
+    try:
+        with profiler:
+            _busy(1000)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pstats_file = Path(tmpdir) / "run.pstats"
+            collapsed_file = Path(tmpdir) / "run.collapsed.txt"
+            profiler.write_pstats(pstats_file)
+            profiler.write_collapsed(collapsed_file)
+
+            assert "_busy" in _names(pstats.Stats(str(pstats_file)))
+            assert collapsed_file.read_text().strip()
+    finally:
+        profiler.cleanup()
+
+
+def test_function_label():
+    """Test function labels use the file basename and show built-ins by name."""
+    assert function_label(("/src/pkg/mod.py", 12, "run")) == "run (mod.py:12)"
+    assert function_label(("~", 0, "<built-in method len>")) == "<built-in method len>"
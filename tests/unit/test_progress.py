@@ -0,0 +1,103 @@
+"""Unit tests for progress reporting."""
+
+import io
+
+from argocd_migrator.progress import (
+    DEFAULT_INTERVAL,
+    NON_TTY_INTERVAL,
+    NULL_PROGRESS,
+    ProgressReporter,
+    format_duration,
+)
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeTTY(io.StringIO):
+    """StringIO that claims to be a terminal."""
+
+    def isatty(self) -> bool:
+        return True
+
+
+def test_format_duration():
+    """Test durations are formatted compactly."""
+    assert format_duration(0.4) == "0s"
+    assert format_duration(42) == "42s"
+    assert format_duration(185) == "3m05s"
+    assert format_duration(3720) == "1h02m"
+
+
+def test_interval_depends_on_tty():
+    """Test terminals update often and other streams rarely."""
+    assert ProgressReporter(FakeTTY()).interval == DEFAULT_INTERVAL
+    assert ProgressReporter(io.StringIO()).interval == NON_TTY_INTERVAL
+    assert ProgressReporter(io.StringIO(), interval=1.0).interval == 1.0
+
+
+def test_format_line_reports_throughput_and_eta():
+    """Test the line shows counts, files/s, MB/s and ETA."""
+    clock = FakeClock()
+    reporter = ProgressReporter(io.StringIO(), clock=clock)
+    reporter.start(100)
+    for _ in range(25):
+        reporter.advance(bytes_read=40_000)
+    reporter.advance(failed=True)
+    clock.now += 2.0
+
+    line = reporter.format_line(clock.now)
+
+    assert line == "26/100 files (1 failed) | 13.0 files/s | 0.5 MB/s | ETA 6s"
+
+
+def test_advance_is_throttled():
+    """Test at most one update is written per interval."""
+    clock = FakeClock()
+    stream = io.StringIO()
+    reporter = ProgressReporter(stream, interval=0.25, clock=clock)
+    reporter.start(1000)
+
+    for _ in range(1000):
+        reporter.advance(bytes_read=100)
+        clock.now += 0.001
+    reporter.finish()
+
+    lines = stream.getvalue().splitlines()
+    # One update on the first file, one per 0.25s of the 1s run, plus the final line
+    assert 4 <= len(lines) <= 6
+    assert lines[-1].startswith("1000/1000 files")
+    assert "done in 1s" in lines[-1]
+
+
+def test_tty_redraws_in_place():
+    """Test terminal output rewrites a single line and ends with a newline."""
+    clock = FakeClock()
+    stream = FakeTTY()
+    reporter = ProgressReporter(stream, clock=clock)
+    reporter.start(2)
+    reporter.advance()
+    clock.now += 1.0
+    reporter.advance()
+    reporter.finish()
+
+    output = stream.getvalue()
+    assert output.startswith("\r1/2 files")
+    assert output.count("\n") == 1
+    assert output.endswith("\n")
+
+
+def test_null_progress_writes_nothing():
+    """Test the disabled reporter ignores updates."""
+    assert not NULL_PROGRESS.enabled
+    NULL_PROGRESS.start(3)
+    NULL_PROGRESS.advance(10)
+    NULL_PROGRESS.finish()
+    assert NULL_PROGRESS.done == 0
@@ -6,7 +6,7 @@ from pathlib import Path
 import pytest
 
 from argocd_migrator.exceptions import ScannerError
-from argocd_migrator.scanner import scan_directory
+from argocd_migrator.scanner import iter_yaml_files, scan_directory
 
 
 def test_scan_directory_finds_yaml_files():
@@ -66,3 +66,21 @@ def test_scan_directory_sorts_results():
         names = [f.name for f in results]
 
         assert names == sorted(names)
+
+
+def test_iter_yaml_files_matches_scan_directory():
+    """Test lazy scanning yields the same files in the same order."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        for relative in ["b.yaml", "a/z.yml", "a.yaml", "a-b/c.yaml", "a/b/c.yaml", "c.txt"]:
+            target = tmp_path / relative
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text("test")
+
+        assert list(iter_yaml_files(tmp_path)) == scan_directory(tmp_path)
+
+
+def test_iter_yaml_files_nonexistent_directory():
+    """Test lazy scanning raises for a missing directory."""
+    with pytest.raises(ScannerError, match="does not exist"):
+        list(iter_yaml_files("/nonexistent/path"))
@@ -0,0 +1,115 @@
+"""Unit tests for sharded execution."""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from argocd_migrator.exceptions import ShardError
+from argocd_migrator.sharding import (
+    Shard,
+    ShardEntry,
+    ShardPartial,
+    combine_partials,
+    read_partial,
+    shard_of,
+    write_partial,
+)
+
+
+def test_parse_shard():
+    """Test parsing i/N."""
+    assert Shard.parse("2/4") == Shard(2, 4)
+    assert str(Shard.parse(" 1/1 ")) == "1/1"
+
+
+@pytest.mark.parametrize("value", ["2", "0/4", "5/4", "1/0", "a/b", "-1/4"])
+def test_parse_invalid_shards(value):
+    """Test invalid shards are rejected."""
+    with pytest.raises(ValueError):
+        Shard.parse(value)
+
+
+def test_shard_of_is_stable_and_balanced():
+    """Test shard assignment depends only on the relative path and spreads files."""
+    paths = [f"team-{i % 7}/app-{i}.yaml" for i in range(1000)]
+    counts = [0, 0, 0, 0]
+    for path in paths:
+        counts[shard_of(path, 4) - 1] += 1
+
+    assert shard_of("team-a/app.yaml", 4) == shard_of(Path("team-a") / "app.yaml", 4)
+    assert shard_of("team-a/app.yaml", 1) == 1
+    assert min(counts) > 200
+
+
+def test_select_partitions_files():
+    """Test the shards of a run are disjoint and together cover the scan."""
+    root = Path("/checkout/apps")
+    files = sorted(root / f"team-{i % 3}" / f"app-{i}.yaml" for i in range(50))
+
+    selected = [Shard(i, 3).select(files, root) for i in (1, 2, 3)]
+
+    assert sorted(f for part in selected for f in part) == sorted(files)
+    assert all(part == sorted(part) for part in selected)
+
+
+def test_partial_round_trip():
+    """Test a partial reads back as written."""
+    partial = ShardPartial(
+        Shard(2, 3),
+        "apps",
+        5,
+        [
+            ShardEntry("a/app.yaml", config={"metadata": {"name": "ä"}}),
+            ShardEntry("b/bad.yaml", error="not an Application"),
+        ],
+        skipped=1,
+    )
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "out" / "shard-2.json"
+        write_partial(partial, path)
+
+        assert read_partial(path) == partial
+        assert [p.name for p in path.parent.iterdir()] == ["shard-2.json"]
+
+
+def test_read_partial_rejects_other_files():
+    """Test files that are not partials raise ShardError."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config = Path(tmpdir) / "config.json"
+        config.write_text("[]\n")
+
+        with pytest.raises(ShardError, match="is not a shard partial"):
+            read_partial(config)
+        with pytest.raises(ShardError, match="Error reading"):
+            read_partial(Path(tmpdir) / "missing.json")
+
+
+def test_combine_partials_restores_scan_order():
+    """Test entries of all shards come back sorted like the scan."""
+    first = ShardPartial(Shard(1, 2), "apps", 3, [ShardEntry("b.yaml"), ShardEntry("d/a.yaml")])
+    second = ShardPartial(Shard(2, 2), "apps", 3, [ShardEntry("c.yaml")])
+
+    source, entries = combine_partials([second, first])
+
+    assert source == Path("apps")
+    assert [e.path for e in entries] == ["b.yaml", "c.yaml", "d/a.yaml"]
+
+
+def test_combine_partials_checks_completeness():
+    """Test missing, duplicate and mismatched shards are rejected."""
+    one = ShardPartial(Shard(1, 2), "apps", 2, [ShardEntry("a.yaml")])
+    two = ShardPartial(Shard(2, 2), "apps", 2, [ShardEntry("b.yaml")])
+
+    with pytest.raises(ShardError, match="Missing shard"):
+        combine_partials([one])
+    with pytest.raises(ShardError, match="more than once"):
+        combine_partials([one, one, two])
+    with pytest.raises(ShardError, match="2-way run"):
+        combine_partials([one, ShardPartial(Shard(2, 3), "apps", 2)])
+    with pytest.raises(ShardError, match="same tree"):
+        combine_partials([one, ShardPartial(Shard(2, 2), "apps", 4, [ShardEntry("b.yaml")])])
+    with pytest.raises(ShardError, match="cover 1 files"):
+        combine_partials([one, ShardPartial(Shard(2, 2), "apps", 2)])
+    with pytest.raises(ShardError, match="No shard partials"):
+        combine_partials([])
@@ -0,0 +1,87 @@
+"""Unit tests for externalized sidecar blocks."""
+
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from argocd_migrator.exceptions import MigrationError
+from argocd_migrator.sidecar import (
+    REF_KEY,
+    BlockStore,
+    default_blocks_dir,
+    load_configs,
+    resolve_config,
+)
+
+LARGE_VALUES = {"values": "\n".join(f"key{i}: value{i}" for i in range(100))}
+
+
+def _config(name: str, helm: dict | None = None) -> dict:
+    source: dict = {"repoURL": "https://github.com/example/repo.git"}
+    if helm is not None:
+        source["helm"] = helm
+    return {"metadata": {"name": name}, "source": source}
+
+
+def test_large_blocks_are_stored_once_by_content():
+    """Test identical large blocks share one sidecar file and small ones stay inline."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = BlockStore.for_output(Path(tmpdir) / "config.json", threshold=100)
+        original = _config("a", dict(LARGE_VALUES))
+
+        first = store.externalize(original)
+        second = store.externalize(_config("b", dict(LARGE_VALUES)))
+        small = store.externalize(_config("c", {"releaseName": "c"}))
+
+        ref = first["source"]["helm"][REF_KEY]
+        assert ref.startswith("config.blocks/") and ref.endswith(".json")
+        assert second["source"]["helm"] == {REF_KEY: ref}
+        assert small["source"]["helm"] == {"releaseName": "c"}
+        assert original["source"]["helm"] == LARGE_VALUES
+        assert (store.blocks_written, store.refs) == (1, 2)
+        assert json.loads((Path(tmpdir) / ref).read_text()) == LARGE_VALUES
+
+
+def test_existing_blocks_are_not_rewritten():
+    """Test a later store reuses blocks already in the sidecar directory."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        output = Path(tmpdir) / "config.json"
+        BlockStore.for_output(output, threshold=100).externalize(_config("a", LARGE_VALUES))
+
+        store = BlockStore.for_output(output, threshold=100)
+        store.externalize(_config("a", LARGE_VALUES))
+
+        assert (store.blocks_written, store.refs) == (0, 1)
+        assert len(list(default_blocks_dir(output).iterdir())) == 1
+
+
+def test_load_configs_round_trip():
+    """Test load_configs inlines every reference with an independent copy per config."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        output = Path(tmpdir) / "out" / "config.json"
+        store = BlockStore(Path(tmpdir) / "blocks", output.parent, threshold=100)
+        configs = [_config("a", LARGE_VALUES), _config("b", LARGE_VALUES), _config("c")]
+        output.parent.mkdir()
+        output.write_text(json.dumps([store.externalize(c) for c in configs]))
+
+        loaded = load_configs(output)
+
+        assert loaded == configs
+        assert loaded[0]["source"]["helm"] is not loaded[1]["source"]["helm"]
+        loaded[0]["source"]["helm"]["values"] = "changed"
+        assert loaded[1]["source"]["helm"] == LARGE_VALUES
+
+
+def test_corrupt_and_invalid_references():
+    """Test tampered blocks and references outside the sidecar format are rejected."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = BlockStore.for_output(Path(tmpdir) / "config.json", threshold=100)
+        ref = store.externalize(_config("a", LARGE_VALUES))["source"]["helm"][REF_KEY]
+        (Path(tmpdir) / ref).write_text('{"values": "tampered"}')
+
+        with pytest.raises(MigrationError, match="does not match its content hash"):
+            resolve_config(_config("a", {REF_KEY: ref}), tmpdir)
+        with pytest.raises(MigrationError, match="Invalid sidecar reference"):
+            resolve_config(_config("a", {REF_KEY: "../../etc/passwd"}), tmpdir)
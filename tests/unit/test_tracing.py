@@ -0,0 +1,68 @@
+"""Unit tests for trace recording."""
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from argocd_migrator.tracing import NULL_RECORDER, TraceRecorder, current_span
+
+
+def test_chrome_trace_events():
+    """Test spans are exported as complete events relative to the first span."""
+    recorder = TraceRecorder()
+    start = time.perf_counter()
+    recorder.add(("parse", start + 0.5, 0.25, 4242, 7), "b.yaml")
+    recorder.add(current_span("scan", start, 0.1))
+
+    trace = recorder.to_chrome_trace()
+    events = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+    names = {e["pid"]: e["args"]["name"] for e in trace["traceEvents"] if e["ph"] == "M"}
+
+    assert [e["name"] for e in events] == ["scan", "parse"]
+    assert events[0]["ts"] == 0
+    assert events[1]["ts"] == 500000
+    assert events[1]["dur"] == 250000
+    assert events[1]["tid"] == 7
+    assert events[1]["args"] == {"path": "b.yaml"}
+    assert "args" not in events[0]
+    assert names == {os.getpid(): "main", 4242: "worker 4242"}
+
+
+def test_span_context_manager():
+    """Test the span context manager records work in the calling thread."""
+    recorder = TraceRecorder()
+
+    with recorder.span("write", Path("app.yaml")):
+        pass
+
+    (event,) = [e for e in recorder.to_chrome_trace()["traceEvents"] if e["ph"] == "X"]
+    assert event["name"] == "write"
+    assert event["pid"] == os.getpid()
+    assert event["args"]["path"] == "app.yaml"
+
+
+def test_null_recorder_records_nothing():
+    """Test the disabled recorder ignores spans."""
+    with NULL_RECORDER.span("scan"):
+        pass
+    NULL_RECORDER.add(("parse", 0.0, 1.0, 1, 1))
+    NULL_RECORDER.add_spans([("parse", 0.0, 1.0, 1, 1)], "a.yaml")
+
+    assert not NULL_RECORDER.enabled
+    assert len(NULL_RECORDER) == 0
+
+
+def test_write_trace_file():
+    """Test the trace file is valid JSON."""
+    recorder = TraceRecorder()
+    recorder.add(current_span("scan", time.perf_counter(), 0.001))
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        trace_file = Path(tmpdir) / "trace.json"
+        recorder.write(trace_file)
+
+        data = json.loads(trace_file.read_text())
+        assert data["displayTimeUnit"] == "ms"
+        assert any(e["name"] == "scan" for e in data["traceEvents"])
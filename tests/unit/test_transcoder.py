@@ -0,0 +1,150 @@
+"""Unit tests for the streaming YAML-to-JSON transcoder."""
+
+import io
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+import yaml
+
+from argocd_migrator.exceptions import MigrationError
+from argocd_migrator.migrator import convert_yaml_to_json, migrate_yaml_file_to_json
+from argocd_migrator.transcoder import UnsupportedYAMLError, transcode_yaml_to_json
+
+APP_WITH_HELM = """
+apiVersion: argoproj.io/v1alpha1
+kind: Application
+metadata:
+  name: helm-app
+  labels: {}
+  annotations:
+    argocd.argoproj.io/sync-wave: "10"
+spec:
+  project: default
+  source:
+    repoURL: https://charts.example.com
+    chart: nginx
+    helm:
+      values: |
+        replicaCount: 3
+        image: "nginx:1.25"
+      parameters:
+        - name: service.port
+          value: "8080"
+        - name: enabled
+          value: true
+  destination:
+    server: https://kubernetes.default.svc
+    namespace: web
+  syncPolicy:
+    automated:
+      prune: yes
+    retry:
+      limit: 5
+      backoff: {duration: 5s, factor: 2.5}
+  ignoreDifferences: []
+"""
+
+SCALARS = """
+plain: text
+quoted: "123"
+integer: 42
+octal: 0o14
+hex: 0x1F
+float: 1.5e3
+infinity: .inf
+boolean: false
+null_value: ~
+empty:
+unicode: "héllo ✓"
+escaped: "line\\nbreak \\"quoted\\""
+7: int key
+true: bool key
+"""
+
+ANCHORS = """
+defaults: &defaults
+  repoURL: https://github.com/example/repo
+  targetRevision: main
+apps:
+  - source: *defaults
+  - source: *defaults
+name: &name shared
+copy: *name
+"""
+
+
+def _transcode(text: str, indent: int | None = 2) -> str:
+    out = io.StringIO()
+    transcode_yaml_to_json(text, out, indent=indent)
+    return out.getvalue()
+
+
+@pytest.mark.parametrize("document", [APP_WITH_HELM, SCALARS, ANCHORS])
+def test_transcode_matches_load_and_dump(document):
+    """Test transcoder output is byte-identical to safe_load + json.dumps."""
+    expected = json.dumps(yaml.safe_load(document), indent=2, ensure_ascii=False)
+
+    assert _transcode(document) == expected
+
+
+def test_transcode_compact_output():
+    """Test transcoder supports compact output without indentation."""
+    expected = json.dumps(yaml.safe_load(APP_WITH_HELM), ensure_ascii=False)
+
+    assert _transcode(APP_WITH_HELM, indent=None) == expected
+
+
+def test_transcode_empty_collections_and_documents():
+    """Test empty mappings, sequences and streams."""
+    assert _transcode("a: {}\nb: []\n") == '{\n  "a": {},\n  "b": []\n}'
+    assert _transcode("") == "null"
+
+
+def test_transcode_timestamp_keeps_source_text():
+    """Test timestamps are emitted as their original scalar text."""
+    assert json.loads(_transcode("created: 2024-01-15\n")) == {"created": "2024-01-15"}
+
+
+def test_transcode_rejects_merge_keys():
+    """Test merge keys raise UnsupportedYAMLError."""
+    with pytest.raises(UnsupportedYAMLError, match="Merge keys"):
+        _transcode("base: &b {a: 1}\nchild:\n  <<: *b\n  c: 2\n")
+
+
+def test_transcode_rejects_multiple_documents():
+    """Test multi-document streams are rejected like yaml.safe_load."""
+    with pytest.raises(MigrationError, match="single document"):
+        _transcode("a: 1\n---\nb: 2\n")
+
+
+def test_transcode_malformed_yaml():
+    """Test malformed YAML raises MigrationError."""
+    with pytest.raises(MigrationError, match="YAML syntax error"):
+        _transcode("key: [unclosed\n")
+
+
+def test_convert_yaml_to_json_accepts_raw_yaml():
+    """Test convert_yaml_to_json transcodes raw YAML text."""
+    assert json.loads(convert_yaml_to_json(APP_WITH_HELM)) == yaml.safe_load(APP_WITH_HELM)
+
+
+def test_convert_yaml_to_json_falls_back_for_merge_keys():
+    """Test raw YAML with merge keys falls back to a full load."""
+    result = convert_yaml_to_json("base: &b {a: 1}\nchild:\n  <<: *b\n  c: 2\n")
+
+    assert json.loads(result)["child"] == {"a": 1, "c": 2}
+
+
+def test_migrate_yaml_file_to_json():
+    """Test streaming a YAML file straight to a JSON file."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source = Path(tmpdir) / "app.yaml"
+        source.write_text(APP_WITH_HELM)
+        output = Path(tmpdir) / "out" / "app.json"
+
+        migrate_yaml_file_to_json(source, output)
+
+        expected = json.dumps(yaml.safe_load(APP_WITH_HELM), indent=2, ensure_ascii=False)
+        assert output.read_text(encoding="utf-8") == expected + "\n"